@@ -3,26 +3,64 @@ API Key Management System
 
 Comprehensive per-project API key management with scopes, expiration,
 and audit trail.
+
+Lookup: every key stores a plaintext ``key_prefix`` (first 8 chars after
+``cmp_``), so validation verifies a single bcrypt hash instead of trying
+every stored key. Successfully verified tokens are remembered for a short
+TTL (``API_KEY_VERIFY_CACHE_TTL``, default 60s) and dropped on
+revoke/delete/rotate.
+
+Usage accounting: successful validations only bump ``usage_count`` /
+``last_used_at`` in memory and record the pending increment. The JSON file
+is updated by :meth:`APIKeyManager.flush_usage`, which the usage flusher
+(:mod:`core.key_usage`) calls on an interval and at shutdown, so the auth
+hot path never touches disk.
+
+Multiple workers: every worker holds its own copy of the store. Writes
+(create, revoke, delete, usage flush) take an exclusive lock on
+``<storage>.lock``, re-read the file, apply their change plus this
+worker's pending usage increments on top, and replace the file
+atomically, so one worker never writes back another's stale view. Key
+changes are published on the ``api_key`` invalidation channel
+(:mod:`core.shared_state`); other workers reload the file and drop their
+cached verifications for that key.
 """
 
+import asyncio
+import contextlib
 import hashlib
 import hmac
 import json
 import logging
 import os
 import secrets
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import bcrypt
 
+from core.shared_state import publish_invalidation, subscribe_invalidation
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process only
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
 # Valid scope values
 VALID_SCOPES = ["read", "write", "admin"]
 
+# Key format constants
+KEY_PREFIX_TAG = "cmp_"
+KEY_PREFIX_LEN = 8  # chars after "cmp_" stored for indexed lookup
+
+# How long a successfully verified token skips bcrypt (seconds)
+_VERIFY_CACHE_TTL_SECONDS = float(os.getenv("API_KEY_VERIFY_CACHE_TTL", "60"))
+
 # Scope can be single ("read") or multiple space-separated ("read write admin")
 Scope = str
 
@@ -79,6 +117,8 @@ class APIKey:
         usage_count: Number of times used
         description: Optional description
         revoked: Whether the key has been revoked
+        key_prefix: First chars of the raw key after ``cmp_`` (lookup index;
+            None for keys created before the index existed)
     """
 
     key_id: str
@@ -91,6 +131,7 @@ class APIKey:
     usage_count: int = 0
     description: str | None = None
     revoked: bool = False
+    key_prefix: str | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -124,6 +165,7 @@ class APIKeyManager:
     - Key rotation and revocation
     - Usage tracking
     - Expiration support
+    - Prefix-indexed lookup with a short-TTL verified-token cache
     """
 
     def __init__(self, storage_path: str = "data/api_keys.json"):
@@ -135,6 +177,12 @@ class APIKeyManager:
         """
         self.storage_path = Path(storage_path)
         self.keys: dict[str, APIKey] = {}
+        # key_prefix -> key_ids (a prefix collision is possible, just unlikely)
+        self._prefix_index: dict[str, set[str]] = {}
+        # sha256(raw token) -> (key_id, verified_at)
+        self._verified: dict[str, tuple[str, float]] = {}
+        # key_id -> (uses, last_used_at) not yet written to the file
+        self._usage_pending: dict[str, tuple[int, str]] = {}
 
         # Ensure storage directory exists (with graceful fallback)
         try:
@@ -171,17 +219,66 @@ class APIKeyManager:
         except Exception as e:
             logger.error(f"Failed to load keys: {e}")
             self.keys = {}
+        self._rebuild_index()
 
     def _save_keys(self) -> None:
-        """Save keys to storage file."""
+        """Save keys to storage file (atomically; includes pending usage)."""
         try:
             data = {key_id: key.to_dict() for key_id, key in self.keys.items()}
-            with open(self.storage_path, "w") as f:
+            tmp = self.storage_path.with_name(self.storage_path.name + ".tmp")
+            with open(tmp, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp, self.storage_path)
+            self._usage_pending.clear()
             logger.debug(f"Saved {len(self.keys)} keys to storage")
         except Exception as e:
             logger.error(f"Failed to save keys: {e}")
 
+    @contextlib.contextmanager
+    def _store_lock(self):
+        """Exclusive cross-process lock for a read-modify-write of the file."""
+        if fcntl is None:
+            yield
+            return
+        lock_path = self.storage_path.with_name(self.storage_path.name + ".lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def reload_keys(self, key_id: str | None = None) -> None:
+        """Re-read the storage file, keeping this worker's unflushed usage.
+
+        Called before every write (under :meth:`_store_lock`) and when
+        another worker publishes an ``api_key`` invalidation. If the file
+        cannot be parsed the in-memory store is kept.
+
+        Args:
+            key_id: Key that changed; its cached verifications are dropped
+        """
+        if key_id is not None:
+            self._invalidate_verified(key_id)
+        try:
+            raw = self.storage_path.read_text() if self.storage_path.exists() else ""
+            data = json.loads(raw) if raw.strip() else {}
+            keys = {kid: APIKey.from_dict(key_data) for kid, key_data in data.items()}
+        except Exception as e:
+            logger.error(f"Failed to reload keys, keeping in-memory store: {e}")
+            return
+        for kid, (uses, last_used_at) in self._usage_pending.items():
+            key = keys.get(kid)
+            if key is not None:
+                key.usage_count += uses
+                key.last_used_at = max(key.last_used_at or "", last_used_at)
+        self.keys = keys
+        self._prefix_index = {}
+        for key in keys.values():
+            self._index_key(key)
+        for digest in [d for d, (kid, _) in self._verified.items() if kid not in keys]:
+            del self._verified[digest]
+
     def _hash_key(self, api_key: str) -> str:
         """Hash API key for storage using bcrypt."""
         return bcrypt.hashpw(api_key.encode(), bcrypt.gensalt()).decode()
@@ -233,14 +330,126 @@ class APIKeyManager:
         if self._is_bcrypt_hash(key.key_hash):
             return False
         try:
-            key.key_hash = self._hash_key(api_key)
-            self._save_keys()
+            key_hash = self._hash_key(api_key)
+            with self._store_lock():
+                self.reload_keys()
+                stored = self.keys.get(key.key_id)
+                if stored is None:
+                    return False
+                stored.key_hash = key.key_hash = key_hash
+                self._save_keys()
+            publish_invalidation("api_key", key.key_id)
             logger.info("Upgraded legacy SHA-256 key hash %s to bcrypt", key.key_id)
             return True
         except Exception as exc:  # pragma: no cover — defensive
             logger.warning("Failed to upgrade legacy hash for key %s: %s", key.key_id, exc)
             return False
 
+    # ------------------------------------------------------------------
+    # Lookup index + verified-token cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _token_prefix(api_key: str) -> str | None:
+        """Return the indexed prefix of a raw ``cmp_`` token, or None."""
+        if not api_key.startswith(KEY_PREFIX_TAG):
+            return None
+        prefix = api_key[len(KEY_PREFIX_TAG) : len(KEY_PREFIX_TAG) + KEY_PREFIX_LEN]
+        return prefix if len(prefix) == KEY_PREFIX_LEN else None
+
+    @staticmethod
+    def _token_digest(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def _rebuild_index(self) -> None:
+        self._prefix_index = {}
+        for key_id, key in self.keys.items():
+            if key.key_prefix:
+                self._prefix_index.setdefault(key.key_prefix, set()).add(key_id)
+        self._verified.clear()
+
+    def _index_key(self, key: APIKey) -> None:
+        if key.key_prefix:
+            self._prefix_index.setdefault(key.key_prefix, set()).add(key.key_id)
+
+    def _unindex_key(self, key: APIKey) -> None:
+        if key.key_prefix:
+            ids = self._prefix_index.get(key.key_prefix)
+            if ids is not None:
+                ids.discard(key.key_id)
+                if not ids:
+                    del self._prefix_index[key.key_prefix]
+
+    def _invalidate_verified(self, key_id: str) -> None:
+        """Drop cached verifications for ``key_id`` (revoke/delete/rotate)."""
+        stale = [d for d, (kid, _) in self._verified.items() if kid == key_id]
+        for digest in stale:
+            del self._verified[digest]
+
+    def _candidates(self, api_key: str) -> list[APIKey]:
+        """Keys whose hash could match ``api_key``.
+
+        Indexed keys sharing the token prefix, plus any legacy entries
+        without a stored prefix (those are backfilled on first match, so
+        this tail shrinks to zero over time).
+        """
+        prefix = self._token_prefix(api_key)
+        indexed = self._prefix_index.get(prefix, set()) if prefix else set()
+        candidates = [self.keys[key_id] for key_id in indexed if key_id in self.keys]
+        candidates.extend(key for key in self.keys.values() if not key.key_prefix)
+        return candidates
+
+    def _cached_key(self, api_key: str) -> APIKey | None:
+        digest = self._token_digest(api_key)
+        cached = self._verified.get(digest)
+        if cached is None:
+            return None
+        key_id, verified_at = cached
+        key = self.keys.get(key_id)
+        if key is None or time.monotonic() - verified_at >= _VERIFY_CACHE_TTL_SECONDS:
+            del self._verified[digest]
+            return None
+        return key
+
+    def _remember(self, api_key: str, key: APIKey) -> APIKey:
+        """Record a successful verification (and backfill legacy metadata)."""
+        # F.8: opportunistically upgrade legacy SHA-256 hashes to bcrypt
+        # the moment they validate successfully.
+        self._upgrade_legacy_hash(key, api_key)
+        key = self.keys.get(key.key_id, key)
+        prefix = self._token_prefix(api_key)
+        if not key.key_prefix and prefix:
+            with self._store_lock():
+                self.reload_keys()
+                stored = self.keys.get(key.key_id)
+                if stored is not None:
+                    stored.key_prefix = prefix
+                    self._index_key(stored)
+                    self._save_keys()
+                    key = stored
+        self._verified[self._token_digest(api_key)] = (key.key_id, time.monotonic())
+        return key
+
+    def _resolve_token(self, api_key: str) -> APIKey | None:
+        """Find the stored key for a raw token (bcrypt runs inline)."""
+        key = self._cached_key(api_key)
+        if key is not None:
+            return key
+        for key in self._candidates(api_key):
+            if self._verify_key(api_key, key.key_hash):
+                return self._remember(api_key, key)
+        return None
+
+    async def _resolve_token_async(self, api_key: str) -> APIKey | None:
+        """Same as :meth:`_resolve_token` but bcrypt runs in a worker thread."""
+        key = self._cached_key(api_key)
+        if key is not None:
+            return key
+        for key in self._candidates(api_key):
+            if await asyncio.to_thread(self._verify_key, api_key, key.key_hash):
+                return self._remember(api_key, key)
+        return None
+
     def create_key(
         self,
         project_id: str,
@@ -290,11 +499,16 @@ class APIKeyManager:
             created_at=datetime.now().isoformat(),
             expires_at=expires_at,
             description=description,
+            key_prefix=self._token_prefix(api_key),
         )
 
         # Store and save
-        self.keys[key_id] = key
-        self._save_keys()
+        with self._store_lock():
+            self.reload_keys()
+            self.keys[key_id] = key
+            self._index_key(key)
+            self._save_keys()
+        publish_invalidation("api_key", key_id)
 
         logger.info(
             f"Created API key {key_id} for project {project_id} " f"with scope '{normalized_scope}'"
@@ -327,65 +541,92 @@ class APIKeyManager:
         Returns:
             Optional[str]: key_id if valid, None otherwise
         """
-        # Find key by verifying against stored hash (bcrypt or legacy SHA-256)
-        for key_id, key in self.keys.items():
-            if not self._verify_key(api_key, key.key_hash):
-                continue
-            # F.8: opportunistically upgrade legacy SHA-256 hashes to bcrypt
-            # the moment they validate successfully.
-            self._upgrade_legacy_hash(key, api_key)
-
-            # Check if valid (not revoked, not expired)
-            if not key.is_valid():
-                logger.warning(
-                    f"Key {key_id} is invalid "
-                    f"(revoked={key.revoked}, expired={key.is_expired()})"
-                )
-                return None
-
-            # Check project access (unless skipped for unified tools)
-            if not skip_project_check:
-                if key.project_id != "*" and key.project_id != project_id:
-                    logger.warning(f"Key {key_id} does not have access to project {project_id}")
-                    return None
-
-            # Check scope: key must have required_scope or higher
-            # Scope hierarchy: admin > write > read
-            scope_hierarchy = {"read": 0, "write": 1, "admin": 2}
-            key_scopes = key.scope.split()
-
-            # Check if required_scope is directly present
-            if required_scope in key_scopes:
-                # Update usage tracking
-                key.last_used_at = datetime.now().isoformat()
-                key.usage_count += 1
-                self._save_keys()
-
-                logger.debug(f"Key {key_id} validated successfully (scope: {key.scope})")
-                return key_id
-
-            # Check if key has higher scope (e.g., admin covers write and read)
-            key_level = max(scope_hierarchy.get(s, 0) for s in key_scopes)
-            required_level = scope_hierarchy.get(required_scope, 0)
+        key = self._resolve_token(api_key)
+        return self._check_access(key, project_id, required_scope, skip_project_check)
 
-            if key_level >= required_level:
-                # Update usage tracking
-                key.last_used_at = datetime.now().isoformat()
-                key.usage_count += 1
-                self._save_keys()
+    async def validate_key_async(
+        self,
+        api_key: str,
+        project_id: str,
+        required_scope: Scope = "read",
+        skip_project_check: bool = False,
+    ) -> str | None:
+        """Async :meth:`validate_key` that keeps bcrypt off the event loop."""
+        key = await self._resolve_token_async(api_key)
+        return self._check_access(key, project_id, required_scope, skip_project_check)
 
-                logger.debug(f"Key {key_id} validated successfully (scope: {key.scope})")
-                return key_id
+    def _check_access(
+        self,
+        key: APIKey | None,
+        project_id: str,
+        required_scope: Scope,
+        skip_project_check: bool,
+    ) -> str | None:
+        """Apply validity, project and scope checks to a resolved key."""
+        if key is not None:
+            # A reload from another worker may have replaced the object
+            key = self.keys.get(key.key_id)
+        if key is None:
+            logger.warning("No matching API key found")
+            return None
+        key_id = key.key_id
 
+        # Check if valid (not revoked, not expired)
+        if not key.is_valid():
             logger.warning(
-                f"Key {key_id} has insufficient scope "
-                f"({key.scope} does not include {required_scope})"
+                f"Key {key_id} is invalid " f"(revoked={key.revoked}, expired={key.is_expired()})"
             )
             return None
 
-        logger.warning("No matching API key found")
+        # Check project access (unless skipped for unified tools)
+        if not skip_project_check:
+            if key.project_id != "*" and key.project_id != project_id:
+                logger.warning(f"Key {key_id} does not have access to project {project_id}")
+                return None
+
+        # Check scope: key must have required_scope or higher
+        # Scope hierarchy: admin > write > read
+        scope_hierarchy = {"read": 0, "write": 1, "admin": 2}
+        key_scopes = key.scope.split()
+
+        # Directly present, or covered by a higher scope (admin covers write and read)
+        key_level = max(scope_hierarchy.get(s, 0) for s in key_scopes)
+        required_level = scope_hierarchy.get(required_scope, 0)
+
+        if required_scope in key_scopes or key_level >= required_level:
+            # Update usage tracking (persisted by flush_usage)
+            key.last_used_at = datetime.now().isoformat()
+            key.usage_count += 1
+            uses, _ = self._usage_pending.get(key_id, (0, ""))
+            self._usage_pending[key_id] = (uses + 1, key.last_used_at)
+
+            logger.debug(f"Key {key_id} validated successfully (scope: {key.scope})")
+            return key_id
+
+        logger.warning(
+            f"Key {key_id} has insufficient scope "
+            f"({key.scope} does not include {required_scope})"
+        )
         return None
 
+    def flush_usage(self) -> bool:
+        """
+        Persist usage counters accumulated since the last save.
+
+        The file is re-read first and this worker's increments are added to
+        the stored counters, so keys created, revoked or deleted by other
+        workers are kept as they are on disk.
+
+        Returns:
+            True if the storage file was rewritten
+        """
+        if not self._usage_pending:
+            return False
+        with self._store_lock():
+            self.reload_keys()
+            self._save_keys()
+        return not self._usage_pending
+
     def get_key_by_token(self, api_key: str) -> APIKey | None:
         """
         Get API key object by token (without project validation).
@@ -400,15 +641,21 @@ class APIKeyManager:
         Returns:
             Optional[APIKey]: The APIKey object if found, None otherwise
         """
-        for key_id, key in self.keys.items():
-            if self._verify_key(api_key, key.key_hash):
-                # F.8: upgrade legacy SHA-256 hashes on first successful match.
-                self._upgrade_legacy_hash(key, api_key)
-                logger.debug(f"Found API key {key_id} by token")
-                return key
-
-        logger.debug("No API key found for provided token")
-        return None
+        key = self._resolve_token(api_key)
+        if key is None:
+            logger.debug("No API key found for provided token")
+            return None
+        logger.debug(f"Found API key {key.key_id} by token")
+        return key
+
+    async def get_key_by_token_async(self, api_key: str) -> APIKey | None:
+        """Async :meth:`get_key_by_token` that keeps bcrypt off the event loop."""
+        key = await self._resolve_token_async(api_key)
+        if key is None:
+            logger.debug("No API key found for provided token")
+            return None
+        logger.debug(f"Found API key {key.key_id} by token")
+        return key
 
     def revoke_key(self, key_id: str) -> bool:
         """
@@ -420,12 +667,16 @@ class APIKeyManager:
         Returns:
             bool: True if revoked successfully
         """
-        if key_id not in self.keys:
-            logger.warning(f"Key {key_id} not found")
-            return False
+        with self._store_lock():
+            self.reload_keys()
+            if key_id not in self.keys:
+                logger.warning(f"Key {key_id} not found")
+                return False
 
-        self.keys[key_id].revoked = True
-        self._save_keys()
+            self.keys[key_id].revoked = True
+            self._invalidate_verified(key_id)
+            self._save_keys()
+        publish_invalidation("api_key", key_id)
 
         logger.info(f"Revoked API key {key_id}")
         return True
@@ -440,12 +691,16 @@ class APIKeyManager:
         Returns:
             bool: True if deleted successfully
         """
-        if key_id not in self.keys:
-            logger.warning(f"Key {key_id} not found")
-            return False
+        with self._store_lock():
+            self.reload_keys()
+            if key_id not in self.keys:
+                logger.warning(f"Key {key_id} not found")
+                return False
 
-        del self.keys[key_id]
-        self._save_keys()
+            self._unindex_key(self.keys.pop(key_id))
+            self._invalidate_verified(key_id)
+            self._save_keys()
+        publish_invalidation("api_key", key_id)
 
         logger.info(f"Deleted API key {key_id}")
         return True
@@ -563,3 +818,11 @@ def get_api_key_manager() -> APIKeyManager:
         storage_path = os.getenv("API_KEYS_STORAGE", "data/api_keys.json")
         _api_key_manager = APIKeyManager(storage_path)
     return _api_key_manager
+
+
+def _on_key_changed(key_id: str) -> None:
+    if _api_key_manager is not None:
+        _api_key_manager.reload_keys(key_id)
+
+
+subscribe_invalidation("api_key", _on_key_changed)
@@ -7,18 +7,50 @@ Tracks tool calls, authentication attempts, and system events.
 Features:
 - Structured JSON logging
 - Log rotation support
-- Query and filter capabilities
+- Query and filter capabilities (indexed SQLite store, see
+  :mod:`core.audit_store`)
 - Export to JSON/CSV
 - GDPR-compliant (no sensitive data in logs)
+- Group-commit background writer (entries never hit disk on the caller's
+  thread)
+
+Writes: ``log_*`` methods only serialize the entry and hand it to
+:class:`AuditLogWriter`, a daemon thread that drains its queue in batches and
+appends each batch with a single ``write()`` on a persistent file handle.
+Worker processes share the file: each batch is written under an exclusive
+``flock`` on ``<log file>.lock``, and the rotation decision uses the real
+file size (one ``fstat()`` per batch, not per entry). A writer whose file
+was rotated by another worker reopens the new one. Durability is set by
+``AUDIT_LOG_FSYNC``: ``never`` (leave it to the OS), ``interval`` (default,
+fsync at most every ``AUDIT_LOG_FSYNC_INTERVAL`` seconds) or ``batch``
+(fsync after every batch). The queue is bounded (``AUDIT_LOG_QUEUE_SIZE``);
+when it is full new entries are dropped and counted rather than stalling
+the event loop. Reads never wait for the writer (they run on the event loop
+too), so an entry logged a moment ago may still be queued; call
+:meth:`AuditLogger.flush` where read-after-write matters.
 """
 
+import atexit
+import contextlib
 import json
 import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from core.audit_store import AuditLogStore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process only
+    fcntl = None
+
 
 class LogLevel(Enum):
     """Log severity levels."""
@@ -39,6 +71,257 @@ class EventType(Enum):
     SYSTEM = "system"
 
 
+FSYNC_POLICIES = ("never", "interval", "batch")
+
+
+@contextlib.contextmanager
+def _log_lock(log_file: Path):
+    """Exclusive cross-process lock for writing, rotating or backfilling ``log_file``."""
+    if fcntl is None:
+        yield
+        return
+    with open(log_file.with_name(log_file.name + ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_QUEUE_SIZE = int(os.getenv("AUDIT_LOG_QUEUE_SIZE", "10000"))
+_BATCH_MAX = int(os.getenv("AUDIT_LOG_BATCH_MAX", "512"))
+_FSYNC_POLICY = os.getenv("AUDIT_LOG_FSYNC", "interval").lower()
+_FSYNC_INTERVAL_SECONDS = float(os.getenv("AUDIT_LOG_FSYNC_INTERVAL", "1.0"))
+
+
+class AuditLogWriter:
+    """
+    Background group-commit writer for one audit log file.
+
+    The thread starts lazily on the first entry and can be restarted after
+    :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        max_file_size: int,
+        backup_count: int,
+        queue_size: int = _QUEUE_SIZE,
+        batch_max: int = _BATCH_MAX,
+        fsync_policy: str = _FSYNC_POLICY,
+        fsync_interval: float = _FSYNC_INTERVAL_SECONDS,
+        open_store: Callable[[], AuditLogStore | None] | None = None,
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Invalid fsync policy '{fsync_policy}'. Must be one of: {FSYNC_POLICIES}"
+            )
+        self.log_file = log_file
+        self.max_file_size = max_file_size
+        self.backup_count = backup_count
+        self.batch_max = max(1, batch_max)
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.open_store = open_store
+        self.logger = logging.getLogger("AuditLogger")
+
+        # Items are (JSON line, entry dict for the indexed store); None stops the thread
+        self._queue: queue.Queue[tuple[str, dict[str, Any] | None] | None] = queue.Queue(
+            maxsize=max(1, queue_size)
+        )
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._done = threading.Condition()
+        self._fh = None
+        self._last_fsync = 0.0
+
+        # Counters (exposed via stats())
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.rotations = 0
+
+    # --- Producer side -----------------------------------------------------
+
+    def submit(self, line: str, entry: dict[str, Any] | None = None) -> bool:
+        """Queue one serialized JSON line. Returns False if it was dropped."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((line, entry))
+        except queue.Full:
+            with self._done:
+                self.dropped += 1
+            return False
+        with self._done:
+            self.enqueued += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every entry queued so far has been written (or failed)."""
+        with self._done:
+            target = self.enqueued
+            return self._done.wait_for(
+                lambda: self.written + self.failed >= target
+                or self._thread is None
+                or not self._thread.is_alive(),
+                timeout=timeout,
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the queue, stop the thread and close the file handle."""
+        with self._start_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                self.logger.warning("Audit log queue full at shutdown; closing anyway")
+            thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queued": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "fsync_policy": self.fsync_policy,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    # --- Writer thread -----------------------------------------------------
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            batch: list[tuple[str, dict[str, Any] | None]] = []
+            if first is None:
+                stopping = True
+            else:
+                batch.append(first)
+            while len(batch) < self.batch_max:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    continue
+                batch.append(item)
+            if batch:
+                self._write_batch(batch)
+        self._close_file()
+        with self._done:
+            self._done.notify_all()
+
+    def _write_batch(self, batch: list[tuple[str, dict[str, Any] | None]]) -> None:
+        data = "".join(line for line, _ in batch).encode("utf-8")
+        # Opened (and backfilled) before this batch reaches the file
+        store = self.open_store() if self.open_store is not None else None
+        try:
+            with _log_lock(self.log_file):
+                size = self._current_size()
+                if size > 0 and size + len(data) > self.max_file_size:
+                    self._rotate()
+                self._fh.write(data)
+                self._fh.flush()
+                self._maybe_fsync()
+            ok = True
+        except Exception as e:
+            self.logger.error(f"Failed to write audit log: {e}", exc_info=True)
+            self._close_file()
+            ok = False
+        if ok and store is not None:
+            try:
+                store.insert_batch(entry for _, entry in batch if entry is not None)
+            except Exception as e:
+                self.logger.error(f"Failed to index audit log batch: {e}", exc_info=True)
+        with self._done:
+            if ok:
+                self.written += len(batch)
+                self.batches += 1
+            else:
+                self.failed += len(batch)
+            self._done.notify_all()
+
+    def _maybe_fsync(self) -> None:
+        if self.fsync_policy == "never":
+            return
+        now = time.monotonic()
+        if self.fsync_policy == "batch" or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._fh.fileno())
+            self._last_fsync = now
+
+    def _open_file(self) -> None:
+        self._fh = open(self.log_file, "ab")  # noqa: SIM115 - persistent handle
+
+    def _current_size(self) -> int:
+        """Size of the live log file, reopening it if another worker rotated it.
+
+        Called under :func:`_log_lock`.
+        """
+        if self._fh is not None:
+            try:
+                rotated = os.stat(self.log_file).st_ino != os.fstat(self._fh.fileno()).st_ino
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self._close_file()
+        if self._fh is None:
+            self._open_file()
+        return os.fstat(self._fh.fileno()).st_size
+
+    def _close_file(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.flush()
+                if self.fsync_policy != "never":
+                    os.fsync(fh.fileno())
+                fh.close()
+            except Exception:
+                pass
+
+    def _rotate(self) -> None:
+        """Shift ``file.N`` backups up by one and start a fresh file (under the lock)."""
+        self._close_file()
+        log_dir = self.log_file.parent
+        for i in range(self.backup_count - 1, 0, -1):
+            old_backup = log_dir / f"{self.log_file.name}.{i}"
+            new_backup = log_dir / f"{self.log_file.name}.{i + 1}"
+            if old_backup.exists():
+                if new_backup.exists():
+                    new_backup.unlink()  # Delete oldest if at limit
+                old_backup.rename(new_backup)
+
+        backup = log_dir / f"{self.log_file.name}.1"
+        if backup.exists():
+            backup.unlink()
+        if self.log_file.exists():
+            self.log_file.rename(backup)
+        self.rotations += 1
+        self.logger.info(f"Log rotated: {self.log_file}")
+        self._open_file()
+
+
 class AuditLogger:
     """
     Audit logging system for MCP operations.
@@ -65,6 +348,9 @@ class AuditLogger:
         """
         # Setup Python logger for internal logging
         self.logger = logging.getLogger("AuditLogger")
+        self._store: AuditLogStore | None = None
+        self._store_opened = False
+        self._store_lock = threading.Lock()
 
         # Try to create log directory, fallback to /tmp if permission denied
         self.log_dir = Path(log_dir)
@@ -90,57 +376,105 @@ class AuditLogger:
             self.log_file = self.log_dir / log_file
             self.max_file_size = max_file_size_mb * 1024 * 1024  # Convert to bytes
             self.backup_count = backup_count
+            self._index_path = self.log_dir / f"{self.log_file.name}.index.db"
+            self.writer: AuditLogWriter | None = AuditLogWriter(
+                self.log_file, self.max_file_size, self.backup_count, open_store=self._get_store
+            )
             self.logger.info(f"Audit logger initialized: {self.log_file}")
         else:
             self.log_file = None
             self.max_file_size = 0
             self.backup_count = 0
+            self.writer = None
             self.logger.warning("Audit logging to file is disabled due to permission errors")
 
-    def _rotate_logs_if_needed(self) -> None:
-        """Rotate log files if size exceeds limit."""
-        if not self.log_file or not self.log_file.exists():
-            return
+    def _segment_paths(self) -> list[Path]:
+        """Log file segments, oldest backup first and the active file last."""
+        backups = [
+            self.log_dir / f"{self.log_file.name}.{i}" for i in range(self.backup_count, 0, -1)
+        ]
+        return [*backups, self.log_file]
 
-        if self.log_file.stat().st_size >= self.max_file_size:
-            # Rotate existing backup files
-            for i in range(self.backup_count - 1, 0, -1):
-                old_backup = self.log_dir / f"{self.log_file.name}.{i}"
-                new_backup = self.log_dir / f"{self.log_file.name}.{i + 1}"
-
-                if old_backup.exists():
-                    if new_backup.exists():
-                        new_backup.unlink()  # Delete oldest if at limit
-                    old_backup.rename(new_backup)
-
-            # Move current log to .1
-            backup = self.log_dir / f"{self.log_file.name}.1"
-            if backup.exists():
-                backup.unlink()
-            self.log_file.rename(backup)
+    def _get_store(self, create: bool = True) -> AuditLogStore | None:
+        """
+        The indexed store, opened on first use.
 
-            self.logger.info(f"Log rotated: {self.log_file}")
+        Like the log file, the index database is only created by the first
+        write; with ``create=False`` (read paths) it is opened only if there
+        is something on disk to read.
+        """
+        if self._store_opened:
+            return self._store
+        if not create and not (self._index_path.exists() or self.log_file.exists()):
+            return None
+        with self._store_lock:
+            if not self._store_opened:
+                self._store = self._open_store()
+                self._store_opened = True
+        return self._store
+
+    @property
+    def store(self) -> AuditLogStore | None:
+        """The indexed store for reads, or None if nothing has been logged yet."""
+        if self.log_dir is None:
+            return None
+        return self._get_store(create=False)
+
+    def _open_store(self) -> AuditLogStore | None:
+        """Open the indexed store, backfilling it from existing log files once."""
+        try:
+            store = AuditLogStore(self._index_path)
+            # Under the log lock so that workers starting together backfill once
+            with _log_lock(self.log_file):
+                if len(store) == 0:
+                    store.backfill(self._segment_paths())
+            return store
+        except Exception as e:
+            self.logger.error(f"Audit log index unavailable, falling back to file scans: {e}")
+            return None
 
     def _write_log_entry(self, entry: dict[str, Any]) -> None:
         """
-        Write a log entry to file.
+        Queue a log entry for the background writer.
 
         Args:
             entry: Log entry dictionary
         """
         # Skip if logging is disabled
-        if not self.log_file:
+        if not self.writer:
             return
 
-        self._rotate_logs_if_needed()
-
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                # Write as JSON line
-                json.dump(entry, f, ensure_ascii=False)
-                f.write("\n")
+            line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
         except Exception as e:
-            self.logger.error(f"Failed to write audit log: {e}", exc_info=True)
+            self.logger.error(f"Failed to serialize audit log entry: {e}", exc_info=True)
+            return
+        self.writer.submit(line, entry)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all queued entries are on disk.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        if not self.writer:
+            return True
+        return self.writer.flush(timeout)
+
+    def close(self) -> None:
+        """Drain pending entries and release the file handle."""
+        if self.writer:
+            self.writer.close()
+
+    def get_writer_stats(self) -> dict[str, Any]:
+        """Background writer counters (queue depth, written, dropped ...)."""
+        if not self.writer:
+            return {}
+        return self.writer.stats()
 
     def log_tool_call(
         self,
@@ -326,8 +660,24 @@ class AuditLogger:
             limit: Maximum number of entries to return
 
         Returns:
-            List of log entries matching filters
+            The newest ``limit`` matching entries, in chronological order
         """
+        if self.store is not None:
+            try:
+                rows = self.store.query(
+                    event_type=event_type.value if event_type else None,
+                    level=level.value if level else None,
+                    project_id=project_id,
+                    tool_name=tool_name,
+                    success=success_only,
+                    start_time=start_time,
+                    end_time=end_time,
+                    limit=limit,
+                )
+                return [entry for _, entry in reversed(rows)]
+            except Exception as e:
+                self.logger.error(f"Error querying audit index: {e}", exc_info=True)
+
         if not self.log_file or not self.log_file.exists():
             return []
 
@@ -383,6 +733,63 @@ class AuditLogger:
 
         return results
 
+    def query_logs(
+        self,
+        event_type: EventType | None = None,
+        level: LogLevel | None = None,
+        project_id: str | None = None,
+        tool_name: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        cursor: int | None = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """
+        Page through audit logs newest first.
+
+        Pagination is keyed on the store's entry id, so pages stay stable
+        while new entries arrive and across log file rotation.
+
+        Args:
+            event_type: Filter by event type
+            level: Filter by log level
+            project_id: Filter by project
+            tool_name: Filter by tool name
+            start_time: Start of time range
+            end_time: End of time range
+            cursor: ``next_cursor`` from the previous page (None for the first)
+            limit: Page size
+
+        Returns:
+            Dict with ``entries`` (newest first) and ``next_cursor`` (None on
+            the last page)
+        """
+        if self.store is None:
+            entries = self.get_logs(
+                event_type=event_type,
+                start_time=start_time,
+                end_time=end_time,
+                level=level,
+                project_id=project_id,
+                tool_name=tool_name,
+                limit=limit,
+            )
+            return {"entries": list(reversed(entries)), "next_cursor": None}
+
+        rows = self.store.query(
+            event_type=event_type.value if event_type else None,
+            level=level.value if level else None,
+            project_id=project_id,
+            tool_name=tool_name,
+            start_time=start_time,
+            end_time=end_time,
+            before_id=cursor,
+            limit=limit + 1,
+        )
+        page = rows[:limit]
+        next_cursor = page[-1][0] if len(rows) > limit else None
+        return {"entries": [entry for _, entry in page], "next_cursor": next_cursor}
+
     def export_logs(self, output_path: str, format: str = "json", **filter_kwargs) -> bool:
         """
         Export logs to a file.
@@ -438,6 +845,14 @@ class AuditLogger:
         Returns:
             List of recent log entries (newest first)
         """
+        if self.store is not None:
+            try:
+                return [
+                    self._format_recent_entry(entry) for _, entry in self.store.query(limit=limit)
+                ]
+            except Exception as e:
+                self.logger.error(f"Error querying audit index: {e}", exc_info=True)
+
         if not self.log_file or not self.log_file.exists():
             return []
 
@@ -455,23 +870,7 @@ class AuditLogger:
 
                 try:
                     entry = json.loads(line)
-
-                    # Format the entry for display
-                    formatted_entry = {
-                        "timestamp": entry.get("timestamp", ""),
-                        "event_type": entry.get("event_type", "unknown"),
-                        "level": entry.get("level", "INFO"),
-                        "message": self._format_log_message(entry),
-                        "metadata": {
-                            "project_id": entry.get("project_id"),
-                            "tool_name": entry.get("tool_name"),
-                            "site": entry.get("site"),
-                            "duration_ms": entry.get("duration_ms"),
-                            "success": entry.get("success"),
-                        },
-                    }
-
-                    entries.append(formatted_entry)
+                    entries.append(self._format_recent_entry(entry))
 
                     if len(entries) >= limit:
                         break
@@ -484,6 +883,22 @@ class AuditLogger:
 
         return entries
 
+    def _format_recent_entry(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Shape a raw entry for the dashboard activity feeds."""
+        return {
+            "timestamp": entry.get("timestamp", ""),
+            "event_type": entry.get("event_type", "unknown"),
+            "level": entry.get("level", "INFO"),
+            "message": self._format_log_message(entry),
+            "metadata": {
+                "project_id": entry.get("project_id"),
+                "tool_name": entry.get("tool_name"),
+                "site": entry.get("site"),
+                "duration_ms": entry.get("duration_ms"),
+                "success": entry.get("success"),
+            },
+        }
+
     def _format_log_message(self, entry: dict[str, Any]) -> str:
         """Format a log entry into a human-readable message."""
         event_type = entry.get("event_type", "")
@@ -514,10 +929,22 @@ class AuditLogger:
         Returns:
             Dictionary with statistics
         """
+        if self.store is not None:
+            try:
+                return self._statistics_from_store()
+            except Exception as e:
+                self.logger.error(f"Error reading audit counters: {e}", exc_info=True)
+
         all_logs = self.get_logs(limit=10000)  # Get recent logs
 
         if not all_logs:
-            return {"total_entries": 0, "by_type": {}, "by_level": {}, "success_rate": 0.0}
+            return {
+                "total_entries": 0,
+                "by_type": {},
+                "by_level": {},
+                "success_rate": 0.0,
+                "writer": self.get_writer_stats(),
+            }
 
         # Count by type
         by_type = {}
@@ -544,19 +971,35 @@ class AuditLogger:
             (successful / total_with_success_field * 100) if total_with_success_field > 0 else 0.0
         )
 
-        # Calculate log file size
-        log_file_size_mb = 0
-        if self.log_file and self.log_file.exists():
-            log_file_size_mb = round(self.log_file.stat().st_size / (1024 * 1024), 2)
-
         return {
             "total_entries": len(all_logs),
             "by_type": by_type,
             "by_level": by_level,
             "success_rate": round(success_rate, 2),
-            "log_file_size_mb": log_file_size_mb,
+            "log_file_size_mb": self._log_file_size_mb(),
+            "writer": self.get_writer_stats(),
         }
 
+    def _statistics_from_store(self) -> dict[str, Any]:
+        """Statistics from the store's precomputed counters (no entry scan)."""
+        counters = self.store.counters()
+        successes = counters["success"].get("1", 0)
+        with_success = successes + counters["success"].get("0", 0)
+        success_rate = (successes / with_success * 100) if with_success > 0 else 0.0
+        return {
+            "total_entries": len(self.store),
+            "by_type": counters["event_type"],
+            "by_level": counters["level"],
+            "success_rate": round(success_rate, 2),
+            "log_file_size_mb": self._log_file_size_mb(),
+            "writer": self.get_writer_stats(),
+        }
+
+    def _log_file_size_mb(self) -> float:
+        if self.log_file and self.log_file.exists():
+            return round(self.log_file.stat().st_size / (1024 * 1024), 2)
+        return 0
+
 
 # Global audit logger instance
 _audit_logger: AuditLogger | None = None
@@ -567,4 +1010,6 @@ def get_audit_logger() -> AuditLogger:
     global _audit_logger
     if _audit_logger is None:
         _audit_logger = AuditLogger()
+        # Drain queued entries on interpreter exit
+        atexit.register(_audit_logger.close)
     return _audit_logger
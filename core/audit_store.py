@@ -0,0 +1,292 @@
+"""Indexed SQLite store for audit log entries.
+
+The JSON-lines audit file (``logs/audit.log`` plus rotated ``.1``…``.N``
+backups) stays the human-readable, exportable record. Queries, however,
+used to re-read and JSON-decode that file on every dashboard load and never
+looked at the backups.
+
+:class:`AuditLogStore` keeps a copy of every entry in a small SQLite
+database next to the log file (``audit.log.index.db``), written by the audit
+writer thread in the same batch as the file append. It provides:
+
+- indexes on time, ``event_type``, ``project_id`` and ``tool_name``;
+- reverse-chronological tail reads and ``id``-based cursor pagination that
+  are independent of file rotation;
+- precomputed counters (by type / level / success) so statistics are O(1);
+- bounded retention (``AUDIT_LOG_INDEX_MAX_ROWS``, default 200000), checked
+  against the table's ``COUNT(*)`` so it holds for all workers together.
+
+The database is created by the first audit write, like the log file
+itself. On first use the store is backfilled from any existing log files,
+oldest backup first, so history written before the store existed is
+queryable.
+
+Inserts run on the audit writer thread, which has no event loop, hence a
+plain ``sqlite3`` connection.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_ROWS = int(os.getenv("AUDIT_LOG_INDEX_MAX_ROWS", "200000"))
+
+_SCHEMA_SQL = """\
+CREATE TABLE IF NOT EXISTS audit_entries (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL NOT NULL,
+    event_type  TEXT,
+    level       TEXT,
+    project_id  TEXT,
+    tool_name   TEXT,
+    success     INTEGER,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_entries(ts);
+CREATE INDEX IF NOT EXISTS idx_audit_event_type ON audit_entries(event_type, id);
+CREATE INDEX IF NOT EXISTS idx_audit_project ON audit_entries(project_id, id);
+CREATE INDEX IF NOT EXISTS idx_audit_tool ON audit_entries(tool_name, id);
+
+CREATE TABLE IF NOT EXISTS audit_counters (
+    kind    TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    count   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+);
+"""
+
+
+def _epoch(value: Any) -> float:
+    """ISO timestamp (or datetime) -> epoch seconds; naive values are UTC."""
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value))
+        except ValueError:
+            return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
+def _success_value(entry: dict[str, Any]) -> int | None:
+    success = entry.get("success")
+    if success is None:
+        return None
+    return 1 if success else 0
+
+
+class AuditLogStore:
+    """SQLite-backed, indexed copy of the audit log."""
+
+    def __init__(self, db_path: Path, max_rows: int = MAX_ROWS):
+        self.db_path = Path(db_path)
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA_SQL)
+        self._conn.commit()
+
+    # --- Writes -------------------------------------------------------------
+
+    def insert_batch(self, entries: Iterable[dict[str, Any]]) -> int:
+        """Insert entries and update counters in one transaction."""
+        rows = []
+        counters: dict[tuple[str, str], int] = {}
+        for entry in entries:
+            success = _success_value(entry)
+            rows.append(
+                (
+                    _epoch(entry.get("timestamp", "")),
+                    entry.get("event_type"),
+                    entry.get("level"),
+                    entry.get("project_id"),
+                    entry.get("tool_name"),
+                    success,
+                    json.dumps(entry, ensure_ascii=False, default=str),
+                )
+            )
+            for kind, key in (
+                ("event_type", entry.get("event_type") or "unknown"),
+                ("level", entry.get("level") or "unknown"),
+                ("success", None if success is None else str(success)),
+            ):
+                if key is not None:
+                    counters[(kind, key)] = counters.get((kind, key), 0) + 1
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO audit_entries "
+                "(ts, event_type, level, project_id, tool_name, success, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._bump_counters(counters)
+            # Other workers insert into the same table: count what is really
+            # there (inside this write transaction) and prune in chunks so the
+            # DELETE does not run on every batch.
+            if self.max_rows > 0 and self._over(int(self.max_rows * 1.1)):
+                self._prune_locked()
+        return len(rows)
+
+    def backfill(self, paths: Iterable[Path], batch_size: int = 1000) -> int:
+        """Import JSON-lines files (pass them oldest first)."""
+        total = 0
+        for path in paths:
+            if not path.exists():
+                continue
+            batch: list[dict[str, Any]] = []
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            batch.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue
+                        if len(batch) >= batch_size:
+                            total += self.insert_batch(batch)
+                            batch = []
+                total += self.insert_batch(batch)
+            except OSError as e:
+                logger.warning(f"Audit store backfill skipped {path}: {e}")
+        if total:
+            logger.info(f"Audit store backfilled {total} entries")
+        return total
+
+    def _bump_counters(self, counters: dict[tuple[str, str], int]) -> None:
+        self._conn.executemany(
+            "INSERT INTO audit_counters (kind, key, count) VALUES (?, ?, ?) "
+            "ON CONFLICT(kind, key) DO UPDATE SET count = count + excluded.count",
+            [(kind, key, n) for (kind, key), n in counters.items()],
+        )
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM audit_entries").fetchone()[0]
+
+    def _over(self, limit: int) -> bool:
+        """True if the table holds more than ``limit`` rows.
+
+        The id span is an upper bound read from the ends of the rowid index;
+        the full ``COUNT(*)`` only runs once that bound passes ``limit``.
+        """
+        span = self._conn.execute(
+            "SELECT COALESCE((SELECT MAX(id) FROM audit_entries)"
+            " - (SELECT MIN(id) FROM audit_entries) + 1, 0)"
+        ).fetchone()[0]
+        return span > limit and self._count() > limit
+
+    def _prune_locked(self) -> None:
+        """Drop the oldest rows beyond ``max_rows`` and keep counters in step.
+
+        Runs inside the caller's write transaction.
+        """
+        cutoff = self._conn.execute(
+            "SELECT id FROM audit_entries ORDER BY id DESC LIMIT 1 OFFSET ?",
+            (self.max_rows,),
+        ).fetchone()
+        if cutoff is None:
+            return
+        cutoff_id = cutoff[0]
+        removed: dict[tuple[str, str], int] = {}
+        for kind in ("event_type", "level"):
+            for key, n in self._conn.execute(
+                f"SELECT COALESCE({kind}, 'unknown'), COUNT(*) FROM audit_entries "
+                f"WHERE id <= ? GROUP BY 1",
+                (cutoff_id,),
+            ):
+                removed[(kind, key)] = -n
+        for key, n in self._conn.execute(
+            "SELECT success, COUNT(*) FROM audit_entries "
+            "WHERE id <= ? AND success IS NOT NULL GROUP BY 1",
+            (cutoff_id,),
+        ):
+            removed[("success", str(key))] = -n
+        self._bump_counters(removed)
+        cursor = self._conn.execute("DELETE FROM audit_entries WHERE id <= ?", (cutoff_id,))
+        logger.debug(f"Audit store pruned {cursor.rowcount} entries")
+
+    # --- Reads --------------------------------------------------------------
+
+    def query(
+        self,
+        event_type: str | None = None,
+        level: str | None = None,
+        project_id: str | None = None,
+        tool_name: str | None = None,
+        success: bool | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        before_id: int | None = None,
+        limit: int = 100,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Return ``(id, entry)`` pairs newest first, optionally below a cursor."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("event_type", event_type),
+            ("level", level),
+            ("project_id", project_id),
+            ("tool_name", tool_name),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(1 if success else 0)
+        if start_time is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch(start_time))
+        if end_time is not None:
+            clauses.append("ts <= ?")
+            params.append(_epoch(end_time))
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+
+        sql = "SELECT id, data FROM audit_entries"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(max(0, int(limit)))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(row["id"], json.loads(row["data"])) for row in rows]
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        """Precomputed counts grouped by kind (``event_type``/``level``/``success``)."""
+        result: dict[str, dict[str, int]] = {"event_type": {}, "level": {}, "success": {}}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, key, count FROM audit_counters WHERE count > 0"
+            ).fetchall()
+        for row in rows:
+            result.setdefault(row["kind"], {})[row["key"]] = row["count"]
+        return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -52,11 +52,29 @@ class _ProbeCache:
             return None
         return payload
 
+    def expires_in(self, site_id: str) -> float | None:
+        """Seconds until the cached payload expires, or ``None`` if absent."""
+        entry = self._entries.get(site_id)
+        if entry is None:
+            return None
+        return max(0.0, entry[0] - time.time())
+
     def set(self, site_id: str, payload: dict[str, Any]) -> None:
         self._entries[site_id] = (time.time() + self._ttl, payload)
+        # Probe results gate tool prerequisites → tools/list visibility.
+        _bump_tools_list_version(site_id)
 
     def invalidate(self, site_id: str) -> bool:
-        return self._entries.pop(site_id, None) is not None
+        removed = self._entries.pop(site_id, None) is not None
+        if removed:
+            _bump_tools_list_version(site_id)
+        return removed
+
+
+def _bump_tools_list_version(site_id: str) -> None:
+    from core.tools_list_cache import bump_site_version
+
+    bump_site_version(site_id)
 
 
 _cache = _ProbeCache()
@@ -5,9 +5,13 @@ Stores request-level information using contextvars for thread-safe access
 across async operations.
 """
 
+from collections.abc import Callable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
+from core.tool_meta import ToolMeta, get_tool_meta
+
 # Context variable for storing API key info during request processing
 # This allows unified handlers to check project access permissions
 _api_key_context: ContextVar[dict[str, Any] | None] = ContextVar("api_key_context", default=None)
@@ -41,3 +45,79 @@ def get_api_key_context() -> dict[str, Any] | None:
 def clear_api_key_context() -> None:
     """Clear API key context (for cleanup)."""
     _api_key_context.set(None)
+
+
+# === Tool-call request context ===
+
+
+@dataclass(slots=True)
+class ToolCallContext:
+    """Per-call facts shared by every tool-call middleware.
+
+    Built once at the front of the chain by :func:`get_tool_call_context`
+    so later middleware don't re-read headers or re-parse the tool name.
+    """
+
+    message: Any
+    tool_name: str
+    arguments: dict[str, Any]
+    auth_header: str | None
+    meta: ToolMeta
+
+    @property
+    def bearer_token(self) -> str | None:
+        """Token from ``Authorization: Bearer <token>``, if present."""
+        if self.auth_header and self.auth_header.startswith("Bearer "):
+            return self.auth_header.removeprefix("Bearer ").strip()
+        return None
+
+
+_tool_call_context: ContextVar[ToolCallContext | None] = ContextVar(
+    "tool_call_context", default=None
+)
+
+
+def _read_tool_call(message: Any) -> tuple[str, dict[str, Any]]:
+    """Tool name and arguments from a ``CallToolRequestParams`` message."""
+    source = message
+    if not hasattr(message, "name"):
+        # Older FastMCP versions wrapped the params in ``message.params``.
+        source = getattr(message, "params", None)
+    name = getattr(source, "name", None) or "unknown"
+    arguments = getattr(source, "arguments", None) or {}
+    return name, arguments
+
+
+def _read_auth_header() -> str | None:
+    from fastmcp.server.dependencies import get_http_headers
+
+    try:
+        return get_http_headers().get("authorization")
+    except Exception:  # noqa: BLE001 — no active HTTP request (e.g. stdio)
+        return None
+
+
+def get_tool_call_context(
+    context: Any,
+    read_auth_header: Callable[[], str | None] = _read_auth_header,
+) -> ToolCallContext:
+    """Return the :class:`ToolCallContext` for a middleware invocation.
+
+    The first middleware to ask builds it; later ones get the same object
+    back as long as they see the same ``context.message``.
+    """
+    message = getattr(context, "message", None)
+    current = _tool_call_context.get()
+    if current is not None and current.message is message:
+        return current
+
+    tool_name, arguments = _read_tool_call(message)
+    current = ToolCallContext(
+        message=message,
+        tool_name=tool_name,
+        arguments=arguments,
+        auth_header=read_auth_header(),
+        meta=get_tool_meta(tool_name),
+    )
+    _tool_call_context.set(current)
+    return current
@@ -0,0 +1,237 @@
+"""Bounded worker pool for CPU-heavy work off the event loop.
+
+Image optimization (Pillow decode, resize, WebP/AVIF encode) used to run
+inside async tool handlers, so one large photo stalled every other request
+on the server. :class:`CpuPool` runs such calls in a process pool instead:
+
+- at most ``MCPHUB_CPU_WORKERS`` calls run at once (default
+  ``min(2, cpu_count)``);
+- at most ``MCPHUB_CPU_QUEUE`` calls wait (default 32); beyond that
+  :class:`CpuPoolBusyError` is raised rather than queueing without bound;
+- waiting calls are started round-robin across users, so one user's batch
+  upload cannot starve everyone else;
+- queue wait and run time are recorded as latency histograms
+  (:meth:`CpuPool.stats`).
+
+``MCPHUB_CPU_POOL=thread`` uses threads instead of processes (Pillow releases
+the GIL for most of its work); functions must be picklable module-level
+callables either way.
+
+Usage::
+
+    from core.cpu_pool import CpuPoolBusyError, get_cpu_pool
+
+    data, mime = await get_cpu_pool().run(optimize, data, mime, user=user_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from core.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+MAX_WORKERS = int(os.environ.get("MCPHUB_CPU_WORKERS", str(min(2, os.cpu_count() or 1))))
+MAX_QUEUE = int(os.environ.get("MCPHUB_CPU_QUEUE", "32"))
+POOL_MODE = os.environ.get("MCPHUB_CPU_POOL", "process").strip().lower()
+
+
+class CpuPoolBusyError(Exception):
+    """Raised when the wait queue is full."""
+
+    def __init__(self, queued: int, limit: int) -> None:
+        super().__init__(f"CPU pool queue is full ({queued}/{limit} waiting)")
+        self.queued = queued
+        self.limit = limit
+
+
+def _timed_call(fn: Callable[..., Any], args: tuple, kwargs: dict) -> tuple[Any, float]:
+    """Run ``fn`` in the worker and report how long it took."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _histogram_summary(hist: LatencyHistogram) -> dict[str, float]:
+    return {
+        "count": hist.count,
+        "average_ms": round(hist.mean, 2),
+        "p50_ms": round(hist.percentile(50), 2),
+        "p95_ms": round(hist.percentile(95), 2),
+        "max_ms": round(hist.max, 2),
+    }
+
+
+class CpuPool:
+    """Process (or thread) pool with a bounded, per-user fair wait queue."""
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        max_queue: int = MAX_QUEUE,
+        mode: str = POOL_MODE,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue
+        self.mode = "thread" if mode == "thread" else "process"
+        self._executor: Executor | None = None
+        # user -> waiting turn futures; users are served round-robin
+        self._queues: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._queued = 0
+        self._running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_wait = LatencyHistogram()
+        self.run_time = LatencyHistogram()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "thread":
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="mcphub-cpu"
+                )
+            else:
+                # spawn: forking a process with a running event loop and
+                # threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+        return self._executor
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, user: str | None = None, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` in the pool and return its result.
+
+        Raises:
+            CpuPoolBusyError: If ``max_queue`` calls are already waiting
+        """
+        if self._queued >= self.max_queue:
+            self.rejected += 1
+            raise CpuPoolBusyError(self._queued, self.max_queue)
+
+        loop = asyncio.get_running_loop()
+        key = user or ""
+        turn = loop.create_future()
+        self._queues.setdefault(key, deque()).append(turn)
+        self._queued += 1
+        enqueued = time.perf_counter()
+        self._dispatch()
+        try:
+            await turn
+        except BaseException:
+            if turn.done() and not turn.cancelled():
+                self._release()  # Granted a slot just as we were cancelled
+            else:
+                self._forget(key, turn)
+            raise
+        self.queue_wait.record((time.perf_counter() - enqueued) * 1000)
+
+        try:
+            job = self._get_executor().submit(_timed_call, fn, args, kwargs)
+        except BaseException:
+            self._release()
+            raise
+        # The slot is held until the worker is done with the job, not until
+        # this caller stops waiting: a cancelled caller leaves it running.
+        job.add_done_callback(lambda _job: self._release_threadsafe(loop))
+
+        try:
+            result, seconds = await asyncio.wrap_future(job)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool next time
+            logger.warning("CPU pool worker died; restarting the pool on next use")
+            self.failed += 1
+            self._executor = None
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        self.run_time.record(seconds * 1000)
+        return result
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting calls, one user at a time."""
+        while self._running < self.max_workers and self._queues:
+            key, waiting = next(iter(self._queues.items()))
+            turn = waiting.popleft()
+            self._queued -= 1
+            if waiting:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            if turn.done():
+                continue  # Cancelled while waiting
+            self._running += 1
+            turn.set_result(None)
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._dispatch()
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Release a slot from the executor's callback thread."""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # Loop already closed; nothing left to dispatch to
+
+    def _forget(self, key: str, turn: asyncio.Future) -> None:
+        waiting = self._queues.get(key)
+        if waiting is None or turn not in waiting:
+            return
+        waiting.remove(turn)
+        self._queued -= 1
+        if not waiting:
+            del self._queues[key]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers,
+            "running": self._running,
+            "queued": self._queued,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "queue_wait": _histogram_summary(self.queue_wait),
+            "run_time": _histogram_summary(self.run_time),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers (pending calls are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_pool: CpuPool | None = None
+
+
+def get_cpu_pool() -> CpuPool:
+    global _pool
+    if _pool is None:
+        _pool = CpuPool()
+    return _pool
+
+
+def set_cpu_pool(pool: CpuPool | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _pool
+    _pool = pool
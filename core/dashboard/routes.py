@@ -2491,12 +2491,9 @@ def get_cached_health_status(project_id: str) -> dict:
         else:
             status = "healthy"
 
-        # Get last check time from metrics history
-        last_check = None
-        if project_id in health_monitor.metrics_history:
-            history = health_monitor.metrics_history[project_id]
-            if history:
-                last_check = history[-1].timestamp.isoformat()
+        # Get last check time from the most recent recorded request
+        last_request = health_monitor.last_request_at(project_id)
+        last_check = last_request.isoformat() if last_request else None
 
         return {
             "status": status,
@@ -3836,16 +3833,29 @@ def get_basic_health_data() -> dict:
 def get_cached_projects_health() -> dict:
     """
     Get cached health status for all projects without live checks.
-    Uses stored metrics to determine status.
+    Uses the last fleet sweep (shared with the background loop) and falls
+    back to stored metrics for sites it does not cover.
     """
+    from core.health import get_health_monitor
     from core.site_manager import get_site_manager
 
     projects_health = {}
     healthy_count = 0
     unhealthy_count = 0
     warning_count = 0
+    alerts: list = []
 
     try:
+        health_monitor = get_health_monitor()
+        fleet = (
+            health_monitor.get_cached_fleet_health(max_age_seconds=float("inf"))
+            if health_monitor
+            else None
+        )
+        swept = fleet["projects"] if fleet else {}
+        if fleet:
+            alerts = fleet.get("alerts", [])
+
         site_manager = get_site_manager()
         sites = site_manager.list_all_sites()
 
@@ -3856,7 +3866,7 @@ def get_cached_projects_health() -> dict:
             # Convert to format expected by template
             projects_health[full_id] = {
                 "healthy": cached["status"] == "healthy",
-                "response_time_ms": 0,  # Not available from cache
+                "response_time_ms": swept.get(full_id, {}).get("response_time_ms", 0),
                 "error_rate_percent": cached["error_rate"],
                 "last_check": cached["last_check"] or "",
                 "status": cached["status"],
@@ -3891,7 +3901,7 @@ def get_cached_projects_health() -> dict:
             "healthy": healthy_count,
             "unhealthy": unhealthy_count + warning_count,
         },
-        "alerts": [],  # No alerts from cached data
+        "alerts": alerts,
     }
 
 
@@ -4153,16 +4163,13 @@ def get_registered_plugins() -> list:
     try:
         from plugins import registry as plugin_registry
 
-        # Use _plugin_classes dict and get_registered_types() method
         for name in plugin_registry.get_registered_types():
-            plugin_cls = plugin_registry._plugin_classes.get(name)
-            if plugin_cls:
-                plugins.append(
-                    {
-                        "name": name,
-                        "description": _PLUGIN_DESCRIPTIONS.get(name, "Plugin"),
-                    }
-                )
+            plugins.append(
+                {
+                    "name": name,
+                    "description": _PLUGIN_DESCRIPTIONS.get(name, "Plugin"),
+                }
+            )
     except Exception as e:
         logger.warning(f"Error getting plugins: {e}")
 
@@ -5601,8 +5608,9 @@ async def get_service_page_data(plugin_type: str) -> dict | None:
     # Fallback: get from plugin specs directly if registry had no tools
     if not tools:
         try:
-            plugin_class = plugin_registry._plugin_classes[plugin_type]
-            specs = plugin_class.get_tool_specifications()
+            from core.tool_manifest import get_tool_specs
+
+            specs = get_tool_specs(plugin_type)
             for spec in specs:
                 tools.append(
                     {
@@ -7,6 +7,11 @@ with WAL mode and foreign key enforcement.
 This module is only for user-registered sites on the Live Platform.
 Admin endpoints continue to use env var sites via SiteManager.
 
+aiosqlite connections can only be awaited from the event loop, so stores
+with synchronous callers keep their own stdlib ``sqlite3`` database
+instead (:mod:`core.audit_store`, :mod:`core.oauth.storage`,
+:mod:`core.shared_state`).
+
 Usage:
     db = await initialize_database()
     user = await db.create_user(
@@ -37,7 +42,7 @@ logger = logging.getLogger(__name__)
 _DEFAULT_DATA_DIR = "/app/data" if Path("/app").exists() else "./data"
 
 # Schema version — increment when adding migrations
-SCHEMA_VERSION = 14
+SCHEMA_VERSION = 15
 
 # Initial schema DDL
 _SCHEMA_SQL = """\
@@ -156,6 +161,19 @@ CREATE TABLE IF NOT EXISTS site_provider_keys (
 );
 CREATE INDEX IF NOT EXISTS idx_site_provider_keys_site
     ON site_provider_keys(site_id);
+
+-- Content-addressed media index: uploaded bytes -> existing attachment
+CREATE TABLE IF NOT EXISTS media_dedupe (
+    site            TEXT NOT NULL,
+    sha256          TEXT NOT NULL,
+    variant         TEXT NOT NULL,
+    media_id        INTEGER NOT NULL,
+    created_at      TEXT NOT NULL,
+    last_used       TEXT,
+    PRIMARY KEY (site, sha256, variant)
+);
+CREATE INDEX IF NOT EXISTS idx_media_dedupe_media
+    ON media_dedupe(site, media_id);
 """
 
 # Migration registry: version -> SQL string
@@ -298,6 +316,21 @@ _MIGRATIONS: dict[int, str] = {
         "SET scopes = 'read editor settings install write admin' "
         "WHERE scopes IN ('read write admin', 'read write', 'admin');\n"
     ),
+    15: (
+        # Content-addressed media index (core/media_dedupe.py): re-uploads
+        # of identical bytes resolve to the existing attachment.
+        "CREATE TABLE IF NOT EXISTS media_dedupe (\n"
+        "    site            TEXT NOT NULL,\n"
+        "    sha256          TEXT NOT NULL,\n"
+        "    variant         TEXT NOT NULL,\n"
+        "    media_id        INTEGER NOT NULL,\n"
+        "    created_at      TEXT NOT NULL,\n"
+        "    last_used       TEXT,\n"
+        "    PRIMARY KEY (site, sha256, variant)\n"
+        ");\n"
+        "CREATE INDEX IF NOT EXISTS idx_media_dedupe_media "
+        "ON media_dedupe(site, media_id);\n"
+    ),
 }
 
 
@@ -690,6 +723,7 @@ class Database:
             "DELETE FROM sites WHERE id = ? AND user_id = ?",
             (site_id, user_id),
         )
+        _bump_tools_list_version(site_id)
         return cursor.rowcount > 0
 
     async def update_site_status(
@@ -744,6 +778,7 @@ class Database:
             "UPDATE sites SET url = ?, credentials = ?, status = 'pending' WHERE id = ? AND user_id = ?",
             (url, credentials, site_id, user_id),
         )
+        _bump_tools_list_version(site_id)
         return cursor.rowcount > 0
 
     async def get_site_by_alias(self, user_id: str, alias: str) -> dict[str, Any] | None:
@@ -927,6 +962,20 @@ class Database:
             (_utc_now(), key_id),
         )
 
+    async def update_api_key_usage_batch(self, updates: list[tuple[str, int, str]]) -> None:
+        """Apply accumulated usage for several API keys in one transaction.
+
+        Args:
+            updates: ``(key_id, uses, last_used)`` tuples; ``uses`` is added
+                to ``use_count`` and ``last_used`` replaces the timestamp.
+        """
+        if not updates:
+            return
+        await self.executemany(
+            "UPDATE user_api_keys SET use_count = use_count + ?, last_used = ? WHERE id = ?",
+            [(uses, last_used, key_id) for key_id, uses, last_used in updates],
+        )
+
     # ------------------------------------------------------------------
     # Site tool toggles & tool_scope (F.7b)
     # ------------------------------------------------------------------
@@ -973,6 +1022,7 @@ class Database:
             "enabled = excluded.enabled, reason = excluded.reason, updated_at = excluded.updated_at",
             (toggle_id, site_id, tool_name, 1 if enabled else 0, reason, now),
         )
+        _bump_tools_list_version(site_id)
 
     async def delete_site_tool_toggle(self, site_id: str, tool_name: str) -> bool:
         """Delete a site's toggle for a tool (reverts to the default).
@@ -988,6 +1038,7 @@ class Database:
             "DELETE FROM site_tool_toggles WHERE site_id = ? AND tool_name = ?",
             (site_id, tool_name),
         )
+        _bump_tools_list_version(site_id)
         return cursor.rowcount > 0
 
     async def bulk_set_site_tool_toggles(
@@ -1020,6 +1071,7 @@ class Database:
             "enabled = excluded.enabled, reason = excluded.reason, updated_at = excluded.updated_at",
             rows,
         )
+        _bump_tools_list_version(site_id)
         return len(rows)
 
     async def get_site_tool_scope(self, site_id: str) -> str:
@@ -1059,6 +1111,7 @@ class Database:
             "key_ciphertext = excluded.key_ciphertext, created_at = excluded.created_at",
             (key_id, site_id, provider, key_ciphertext, now),
         )
+        _bump_tools_list_version(site_id)
         row = await self.fetchone(
             "SELECT id, site_id, provider, created_at, last_used FROM site_provider_keys "
             "WHERE site_id = ? AND provider = ?",
@@ -1089,6 +1142,7 @@ class Database:
             "DELETE FROM site_provider_keys WHERE site_id = ? AND provider = ?",
             (site_id, provider),
         )
+        _bump_tools_list_version(site_id)
         return cursor.rowcount > 0
 
     async def touch_site_provider_key(self, site_id: str, provider: str) -> None:
@@ -1139,6 +1193,7 @@ class Database:
             "UPDATE sites SET tool_scope = ? WHERE id = ?",
             (scope, site_id),
         )
+        _bump_tools_list_version(site_id)
 
 
 # ======================================================================
@@ -1151,6 +1206,13 @@ def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _bump_tools_list_version(site_id: str) -> None:
+    """Invalidate memoized ``tools/list`` payloads after a visibility write."""
+    from core.tools_list_cache import bump_site_version
+
+    bump_site_version(site_id)
+
+
 # Singleton instance
 _database: Database | None = None
 
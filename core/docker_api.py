@@ -0,0 +1,258 @@
+"""Docker Engine API client over the local daemon socket.
+
+WP-CLI support used to shell out to the ``docker`` binary for every tool
+call: ``docker version``, ``docker ps --filter`` and ``docker exec`` each
+forked a process that opened its own connection to the daemon. This client
+speaks the Engine API directly over one pooled keep-alive connector:
+
+- ``MCPHUB_DOCKER_SOCKET`` (default ``/var/run/docker.sock``), or
+- ``DOCKER_HOST`` when set to ``unix://...`` or ``tcp://host:port``
+  (plain HTTP; TLS daemons are not supported).
+
+Like :mod:`core.http_transport`, the session is bound to the event loop it
+was created on and rebuilt if the running loop changes. Close it from the
+server lifespan via :func:`close_docker_client`.
+
+Usage::
+
+    from core.docker_api import get_docker_client
+
+    result = await get_docker_client().exec("wordpress-1", ["wp", "--version"])
+    if result.exit_code == 0:
+        print(result.stdout)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import struct
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import quote
+
+import aiohttp
+
+# --- Config ----------------------------------------------------------------
+
+DOCKER_SOCKET = os.environ.get("MCPHUB_DOCKER_SOCKET", "/var/run/docker.sock")
+POOL_LIMIT = int(os.environ.get("MCPHUB_DOCKER_POOL_LIMIT", "10"))
+REQUEST_TIMEOUT = float(os.environ.get("MCPHUB_DOCKER_TIMEOUT_SEC", "10"))
+
+# Multiplexed exec stream: 8-byte frame header (stream id, 3 pad bytes,
+# big-endian payload length)
+_FRAME_HEADER = struct.Struct(">BxxxL")
+_STDERR = 2
+
+
+class DockerAPIError(Exception):
+    """Docker daemon unreachable or returned an error status."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class ExecResult:
+    """Outcome of one ``exec`` in a container."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def _resolve_endpoint() -> tuple[str | None, str]:
+    """Return ``(unix_socket_path, base_url)`` for the configured daemon."""
+    if "MCPHUB_DOCKER_SOCKET" not in os.environ:
+        docker_host = os.environ.get("DOCKER_HOST", "")
+        if docker_host.startswith("tcp://"):
+            return None, "http://" + docker_host[len("tcp://") :].rstrip("/")
+        if docker_host.startswith("unix://"):
+            return docker_host[len("unix://") :], "http://docker"
+    return DOCKER_SOCKET, "http://docker"
+
+
+def _demux(payload: bytes) -> tuple[bytes, bytes]:
+    """Split a multiplexed exec stream into ``(stdout, stderr)``."""
+    out: list[bytes] = []
+    err: list[bytes] = []
+    pos = 0
+    while pos + _FRAME_HEADER.size <= len(payload):
+        stream, size = _FRAME_HEADER.unpack_from(payload, pos)
+        pos += _FRAME_HEADER.size
+        chunk = payload[pos : pos + size]
+        pos += size
+        (err if stream == _STDERR else out).append(chunk)
+    return b"".join(out), b"".join(err)
+
+
+class DockerClient:
+    """Minimal async Docker Engine API client (version, containers, exec)."""
+
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        *,
+        base_url: str | None = None,
+        limit: int = POOL_LIMIT,
+    ) -> None:
+        if socket_path is None and base_url is None:
+            socket_path, base_url = _resolve_endpoint()
+        self.socket_path = socket_path
+        self.base_url = base_url or "http://docker"
+        self.limit = limit
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.requests = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self.socket_path is not None:
+                connector: aiohttp.BaseConnector = aiohttp.UnixConnector(
+                    path=self.socket_path, limit=self.limit
+                )
+            else:
+                connector = aiohttp.TCPConnector(limit=self.limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        json_data: dict[str, Any] | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> tuple[int, bytes]:
+        """Send one API request and return ``(status, body)``.
+
+        Raises:
+            DockerAPIError: If the daemon is unreachable or replies >= 400
+            TimeoutError: If no complete reply arrives within ``timeout``
+        """
+        self.requests += 1
+        try:
+            async with self._get_session().request(
+                method,
+                self.base_url + path,
+                params=params,
+                json=json_data,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                body = await resp.read()
+                status = resp.status
+        except aiohttp.ClientError as e:
+            where = self.socket_path or self.base_url
+            raise DockerAPIError(f"Docker daemon not reachable at {where}: {e}") from e
+        if status >= 400:
+            raise DockerAPIError(_error_message(body, status), status)
+        return status, body
+
+    async def version(self) -> dict[str, Any]:
+        """``GET /version`` — also a cheap liveness check of the daemon."""
+        _, body = await self._request("GET", "/version")
+        return _json(body)
+
+    async def inspect_container(self, name: str) -> dict[str, Any] | None:
+        """Container details, or None if no container has that name."""
+        try:
+            _, body = await self._request("GET", f"/containers/{quote(name, safe='')}/json")
+        except DockerAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+        return _json(body)
+
+    async def container_names(self) -> list[str]:
+        """Names of all containers (running or not)."""
+        _, body = await self._request("GET", "/containers/json", params={"all": "1"})
+        names: list[str] = []
+        for entry in _json(body) or []:
+            names.extend(n.lstrip("/") for n in entry.get("Names") or [])
+        return names
+
+    async def exec(self, container: str, cmd: list[str], *, timeout: float = 30.0) -> ExecResult:
+        """Run ``cmd`` in ``container`` and collect its output and exit code.
+
+        Three API calls on pooled connections (create, start, inspect)
+        instead of a ``docker exec`` subprocess.
+
+        Raises:
+            DockerAPIError: If the container is missing or the daemon fails
+            TimeoutError: If the command does not finish within ``timeout``
+        """
+        _, body = await self._request(
+            "POST",
+            f"/containers/{quote(container, safe='')}/exec",
+            json_data={"AttachStdout": True, "AttachStderr": True, "Tty": False, "Cmd": cmd},
+        )
+        exec_id = _json(body)["Id"]
+        _, stream = await self._request(
+            "POST",
+            f"/exec/{exec_id}/start",
+            json_data={"Detach": False, "Tty": False},
+            timeout=timeout,
+        )
+        _, body = await self._request("GET", f"/exec/{exec_id}/json")
+        exit_code = _json(body).get("ExitCode")
+        stdout, stderr = _demux(stream)
+        return ExecResult(
+            exit_code=exit_code if isinstance(exit_code, int) else -1,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def close(self) -> None:
+        """Close pooled connections. Safe to call more than once."""
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "endpoint": self.socket_path or self.base_url,
+            "active": self._session is not None and not self._session.closed,
+            "requests": self.requests,
+        }
+
+
+def _json(body: bytes) -> Any:
+    return json.loads(body) if body else {}
+
+
+def _error_message(body: bytes, status: int) -> str:
+    try:
+        message = _json(body).get("message")
+    except (ValueError, AttributeError):
+        message = None
+    return message or body.decode("utf-8", errors="replace").strip() or f"HTTP {status}"
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_client: DockerClient | None = None
+
+
+def get_docker_client() -> DockerClient:
+    global _client
+    if _client is None:
+        _client = DockerClient()
+    return _client
+
+
+def set_docker_client(client: DockerClient | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _client
+    _client = client
+
+
+async def close_docker_client() -> None:
+    """Close the pooled daemon connection. Register in server lifespan shutdown."""
+    if _client is not None:
+        await _client.close()
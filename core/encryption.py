@@ -12,17 +12,32 @@ Usage:
         site_id="site_abc123",
     )
     credentials = encryption.decrypt_credentials(cipherdata, site_id="site_abc123")
+
+Caching: HKDF-derived keys and decrypted plaintexts are kept in memory for
+``MCPHUB_CREDENTIAL_CACHE_TTL_SEC`` seconds (default 60, ``0`` disables) so
+bursts of tool calls against the same site skip key derivation and AES-GCM.
+Plaintext entries are keyed by a SHA-256 of the ciphertext, so a changed
+row can never return stale credentials; :func:`invalidate_credential_cache`
+purges a site early. Cached material is held in ``bytearray`` buffers that
+are overwritten with zeros on eviction (best effort — ``str``/``dict``
+copies handed to callers are ordinary Python objects).
 """
 
 import base64
+import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
+from core.shared_state import subscribe_invalidation
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -31,6 +46,75 @@ _KEY_LENGTH = 32  # 256-bit key
 _HKDF_SALT = b"mcphub-v1"
 _FORMAT_VERSION = b"\x01"  # Wire format version for future migration support
 
+# In-memory cache of derived keys / decrypted plaintexts
+_CACHE_TTL_SECONDS = float(os.getenv("MCPHUB_CREDENTIAL_CACHE_TTL_SEC", "60"))
+_CACHE_MAX_ENTRIES = int(os.getenv("MCPHUB_CREDENTIAL_CACHE_SIZE", "512"))
+
+
+def _zeroize(buf: bytearray) -> None:
+    buf[:] = bytes(len(buf))
+
+
+class _SecretCache:
+    """Small TTL + LRU cache of ``bytearray`` secrets, zeroized on eviction."""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[bytearray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> bytes | None:
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            buf, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                _zeroize(buf)
+                return None
+            self._entries.move_to_end(key)
+            return bytes(buf)
+
+    def put(self, key: tuple[str, str], value: bytes) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                _zeroize(old[0])
+            self._entries[key] = (bytearray(value), time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                _, (buf, _) = self._entries.popitem(last=False)
+                _zeroize(buf)
+
+    def discard(self, predicate) -> int:
+        """Evict every entry whose scope (first key element) matches ``predicate``."""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key[0])]
+            for key in stale:
+                buf, _ = self._entries.pop(key)
+                _zeroize(buf)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            for buf, _ in self._entries.values():
+                _zeroize(buf)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _site_scope_matcher(site_id: str):
+    """Match the bare site scope and its ``site_provider:{site_id}:*`` scopes."""
+    provider_prefix = f"site_provider:{site_id}:"
+    return lambda scope: scope == site_id or scope.startswith(provider_prefix)
+
 
 class CredentialEncryption:
     """AES-256-GCM encryption with per-site HKDF-derived keys.
@@ -73,6 +157,10 @@ class CredentialEncryption:
                 f"got {len(self._master_key)} bytes."
             )
 
+        # scope -> derived key; (scope, sha256(cipherdata)) -> plaintext
+        self._key_cache = _SecretCache(_CACHE_TTL_SECONDS, _CACHE_MAX_ENTRIES)
+        self._plaintext_cache = _SecretCache(_CACHE_TTL_SECONDS, _CACHE_MAX_ENTRIES)
+
         logger.info("Credential encryption initialized")
 
     def _derive_key(self, site_id: str) -> bytes:
@@ -84,13 +172,35 @@ class CredentialEncryption:
         Returns:
             32-byte derived key for the given site.
         """
+        cached = self._key_cache.get((site_id, ""))
+        if cached is not None:
+            return cached
         hkdf = HKDF(
             algorithm=hashes.SHA256(),
             length=_KEY_LENGTH,
             salt=_HKDF_SALT,
             info=site_id.encode("utf-8"),
         )
-        return hkdf.derive(self._master_key)
+        derived = hkdf.derive(self._master_key)
+        self._key_cache.put((site_id, ""), derived)
+        return derived
+
+    def invalidate(self, site_id: str) -> int:
+        """Drop cached keys and plaintexts for a site (incl. its provider keys).
+
+        Args:
+            site_id: Site identifier.
+
+        Returns:
+            Number of cache entries evicted.
+        """
+        matches = _site_scope_matcher(site_id)
+        return self._key_cache.discard(matches) + self._plaintext_cache.discard(matches)
+
+    def clear_cache(self) -> None:
+        """Zeroize and drop every cached key and plaintext."""
+        self._key_cache.clear()
+        self._plaintext_cache.clear()
 
     def encrypt(self, plaintext: str, site_id: str) -> bytes:
         """Encrypt a plaintext string for a specific site.
@@ -138,12 +248,18 @@ class CredentialEncryption:
                 f"Expected {_FORMAT_VERSION!r}."
             )
 
+        cache_key = (site_id, hashlib.sha256(cipherdata).hexdigest())
+        cached = self._plaintext_cache.get(cache_key)
+        if cached is not None:
+            return cached.decode("utf-8")
+
         nonce = cipherdata[1 : 1 + _NONCE_LENGTH]
         ciphertext_with_tag = cipherdata[1 + _NONCE_LENGTH :]
 
         derived_key = self._derive_key(site_id)
         aesgcm = AESGCM(derived_key)
         plaintext_bytes = aesgcm.decrypt(nonce, ciphertext_with_tag, None)
+        self._plaintext_cache.put(cache_key, plaintext_bytes)
         return plaintext_bytes.decode("utf-8")
 
     def encrypt_credentials(self, credentials: dict, site_id: str) -> bytes:
@@ -229,6 +345,15 @@ def initialize_credential_encryption(
     return _credential_encryption
 
 
+def invalidate_credential_cache(site_id: str) -> None:
+    """Purge cached keys/plaintexts for a site, if encryption is initialized."""
+    if _credential_encryption is not None:
+        _credential_encryption.invalidate(site_id)
+
+
+subscribe_invalidation("credentials", invalidate_credential_cache)
+
+
 def get_credential_encryption() -> CredentialEncryption:
     """Get the global credential encryption instance.
 
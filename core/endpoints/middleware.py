@@ -151,7 +151,7 @@ class EndpointAuthMiddleware(Middleware):
 
         elif token.startswith("cmp_"):
             # Project API key
-            key = self.api_key_manager.get_key_by_token(token)
+            key = await self.api_key_manager.get_key_by_token_async(token)
             if not key:
                 raise ToolError("Invalid API key")
 
@@ -2,9 +2,10 @@
 Enhanced Health Monitoring System for MCP Server
 
 This module provides comprehensive health monitoring capabilities including:
-- Response time tracking
+- Response time tracking (log-bucketed histograms, p50/p95/p99)
 - Error rate monitoring
-- Historical metrics storage
+- Rolling-window metrics per project, tool and plugin in constant memory
+  (see :mod:`core.metrics`)
 - Alert thresholds
 - Dependency health checks
 - System uptime tracking
@@ -15,18 +16,28 @@ Author: MCP Hub Team
 import asyncio
 import json
 import logging
+import os
 import time
 from collections import defaultdict, deque
 from dataclasses import asdict, dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from core.audit_log import AuditLogger
+from core.http_transport import pooled_session
+from core.metrics import RequestStats, RollingWindow, TieredWindow
+from core.shared_state import get_shared_state
 from core.site_manager import SiteManager
 
 logger = logging.getLogger(__name__)
 
+# Fleet health sweep settings
+HEALTH_CHECK_CONCURRENCY = int(os.environ.get("MCPHUB_HEALTH_CHECK_CONCURRENCY", "10"))
+HEALTH_CHECK_HOST_TIMEOUT = float(os.environ.get("MCPHUB_HEALTH_CHECK_HOST_TIMEOUT_SEC", "12"))
+HEALTH_CHECK_DEADLINE = float(os.environ.get("MCPHUB_HEALTH_CHECK_DEADLINE_SEC", "20"))
+HEALTH_CHECK_CACHE_TTL = float(os.environ.get("MCPHUB_HEALTH_CHECK_CACHE_TTL_SEC", "30"))
+
 
 @dataclass
 class HealthMetric:
@@ -60,6 +71,13 @@ class SystemMetrics:
     average_response_time_ms: float
     error_rate_percent: float
     requests_per_minute: float
+    p50_response_time_ms: float = 0.0
+    p95_response_time_ms: float = 0.0
+    p99_response_time_ms: float = 0.0
+    audit_log_dropped: int = 0
+    audit_log_queued: int = 0
+    # Worker processes included in the request counters.
+    workers: int = 1
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -122,7 +140,8 @@ class HealthMonitor:
     - Real-time health checks
     - Response time tracking
     - Error rate monitoring
-    - Historical metrics (last 24 hours)
+    - Historical metrics (last 24 hours) as rolling-window histograms
+      per project, tool and plugin
     - Alert thresholds
     - System uptime tracking
     """
@@ -140,7 +159,8 @@ class HealthMonitor:
         Args:
             audit_logger: Optional audit logger for logging health events
             metrics_retention_hours: Hours to retain historical metrics
-            max_metrics_per_project: Maximum metrics to store per project
+            max_metrics_per_project: Ignored; metrics memory no longer grows
+                with traffic (kept for API compatibility)
             site_manager: SiteManager for site discovery
         """
         self.site_manager = site_manager
@@ -148,19 +168,19 @@ class HealthMonitor:
         self.metrics_retention_hours = metrics_retention_hours
         self.max_metrics_per_project = max_metrics_per_project
 
-        # Metrics storage (in-memory)
-        # Using deque for efficient FIFO operations
-        self.metrics_history: dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=max_metrics_per_project)
-        )
+        # Rolling-window histograms keyed by (scope, key); scope is
+        # "project", "tool", "plugin" or "system"
+        self._series: dict[tuple[str, str], TieredWindow] = {}
+        self._recent_errors: dict[str, deque] = defaultdict(lambda: deque(maxlen=5))
+        self._last_request: dict[str, float] = {}
 
         # Request counters
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
 
-        # Response time tracking
-        self.response_times: deque = deque(maxlen=1000)  # Last 1000 requests
+        # Per-second request counts for requests/minute
+        self._rate = RollingWindow(1, 60)
 
         # System start time
         self.start_time = time.time()
@@ -169,8 +189,13 @@ class HealthMonitor:
         self.alert_thresholds: dict[str, list[AlertThreshold]] = defaultdict(list)
         self._setup_default_thresholds()
 
-        # Request rate tracking (for requests per minute)
-        self.request_timestamps: deque = deque(maxlen=1000)
+        # Fleet sweep settings and shared result cache
+        self.check_concurrency = HEALTH_CHECK_CONCURRENCY
+        self.check_host_timeout = HEALTH_CHECK_HOST_TIMEOUT
+        self.check_deadline = HEALTH_CHECK_DEADLINE
+        # Keyed by ``include_metrics``: the two sweeps return different payloads
+        self._fleet_cache: dict[bool, tuple[float, dict[str, Any]]] = {}
+        self._fleet_checks: dict[bool, asyncio.Task] = {}
 
         # Active background checks
         self.latest_health_status: dict[str, ProjectHealthStatus] = {}
@@ -243,6 +268,8 @@ class HealthMonitor:
         response_time_ms: float,
         success: bool,
         error_message: str | None = None,
+        tool_name: str | None = None,
+        plugin_type: str | None = None,
     ):
         """
         Record a request metric.
@@ -252,55 +279,60 @@ class HealthMonitor:
             response_time_ms: Response time in milliseconds
             success: Whether request succeeded
             error_message: Error message if failed
+            tool_name: Tool that was called (for per-tool metrics)
+            plugin_type: Plugin that served the call (for per-plugin metrics)
         """
-        # Create metric
-        metric = HealthMetric(
-            timestamp=datetime.now(UTC),
-            project_id=project_id,
-            response_time_ms=response_time_ms,
-            success=success,
-            error_message=error_message,
-        )
-
-        # Store in history
-        self.metrics_history[project_id].append(metric)
+        now = time.time()
 
-        # Update counters
         self.total_requests += 1
         if success:
             self.successful_requests += 1
         else:
             self.failed_requests += 1
 
-        # Track response time
-        self.response_times.append(response_time_ms)
-
-        # Track request timestamp for rate calculation
-        self.request_timestamps.append(time.time())
-
-        # Log to audit if available
-        if self.audit_logger:
-            self.audit_logger.log_system_event(
-                event="health_metric_recorded",
-                details={
-                    "project_id": project_id,
-                    "response_time_ms": response_time_ms,
-                    "success": success,
-                    "error_message": error_message,
-                },
-            )
+        self._rate.record(response_time_ms, success, now)
+        self._series_for("system", "*").record(response_time_ms, success, now)
+        self._series_for("project", project_id).record(response_time_ms, success, now)
+        if tool_name:
+            self._series_for("tool", tool_name).record(response_time_ms, success, now)
+        if plugin_type:
+            self._series_for("plugin", plugin_type).record(response_time_ms, success, now)
+        self._last_request[project_id] = now
+
+        if not success:
+            if error_message:
+                self._recent_errors[project_id].append((now, error_message))
+            # Only failures go to the audit log; successful calls are already
+            # covered by the tool-call audit entry.
+            if self.audit_logger:
+                self.audit_logger.log_system_event(
+                    event="health_metric_recorded",
+                    details={
+                        "project_id": project_id,
+                        "response_time_ms": response_time_ms,
+                        "success": success,
+                        "error_message": error_message,
+                    },
+                )
 
-    def _cleanup_old_metrics(self, project_id: str):
-        """Remove metrics older than retention period."""
-        if project_id not in self.metrics_history:
-            return
+    def _series_for(self, scope: str, key: str) -> TieredWindow:
+        series = self._series.get((scope, key))
+        if series is None:
+            series = TieredWindow(retention_hours=self.metrics_retention_hours)
+            self._series[(scope, key)] = series
+        return series
 
-        cutoff_time = datetime.now(UTC) - timedelta(hours=self.metrics_retention_hours)
-        metrics = self.metrics_history[project_id]
+    def _window_stats(self, scope: str, key: str, hours: float) -> RequestStats | None:
+        series = self._series.get((scope, key))
+        if series is None:
+            return None
+        hours = min(hours, self.metrics_retention_hours)
+        return series.snapshot(hours * 3600, time.time())
 
-        # Remove old metrics from the front of deque
-        while metrics and metrics[0].timestamp < cutoff_time:
-            metrics.popleft()
+    def last_request_at(self, project_id: str) -> datetime | None:
+        """Time of the most recent recorded request for a project."""
+        ts = self._last_request.get(project_id)
+        return datetime.fromtimestamp(ts, tz=UTC) if ts is not None else None
 
     def get_project_metrics(self, project_id: str, hours: int = 1) -> dict[str, Any]:
         """
@@ -313,48 +345,63 @@ class HealthMonitor:
         Returns:
             Dictionary with metrics
         """
-        self._cleanup_old_metrics(project_id)
-
-        if project_id not in self.metrics_history:
+        stats = self._window_stats("project", project_id, hours)
+        if stats is None:
             return {"project_id": project_id, "total_requests": 0, "error": "No metrics available"}
 
-        # Filter metrics by time window
-        cutoff_time = datetime.now(UTC) - timedelta(hours=hours)
-        metrics = [m for m in self.metrics_history[project_id] if m.timestamp >= cutoff_time]
-
-        if not metrics:
+        if not stats.requests:
             return {"project_id": project_id, "total_requests": 0, "time_window_hours": hours}
 
-        # Calculate statistics
-        total_requests = len(metrics)
-        successful = sum(1 for m in metrics if m.success)
-        failed = total_requests - successful
-        error_rate = (failed / total_requests * 100) if total_requests > 0 else 0.0
-
-        # Response time statistics
-        response_times = [m.response_time_ms for m in metrics]
-        avg_response = sum(response_times) / len(response_times) if response_times else 0.0
-        min_response = min(response_times) if response_times else 0.0
-        max_response = max(response_times) if response_times else 0.0
-
-        # Recent errors (last 5)
-        recent_errors = [m.error_message for m in metrics if not m.success and m.error_message][-5:]
+        cutoff = time.time() - hours * 3600
+        recent_errors = [msg for ts, msg in self._recent_errors.get(project_id, ()) if ts >= cutoff]
 
         return {
             "project_id": project_id,
             "time_window_hours": hours,
-            "total_requests": total_requests,
-            "successful_requests": successful,
-            "failed_requests": failed,
-            "error_rate_percent": round(error_rate, 2),
-            "response_time": {
-                "average_ms": round(avg_response, 2),
-                "min_ms": round(min_response, 2),
-                "max_ms": round(max_response, 2),
-            },
+            **self._summarize(stats, hours),
             "recent_errors": recent_errors,
         }
 
+    def get_tool_metrics(self, tool_name: str, hours: int = 1) -> dict[str, Any]:
+        """Latency/error metrics for one tool across all sites."""
+        stats = self._window_stats("tool", tool_name, hours) or RequestStats()
+        return {"tool_name": tool_name, "time_window_hours": hours, **self._summarize(stats, hours)}
+
+    def get_plugin_metrics(self, plugin_type: str, hours: int = 1) -> dict[str, Any]:
+        """Latency/error metrics for one plugin across all sites and tools."""
+        stats = self._window_stats("plugin", plugin_type, hours) or RequestStats()
+        return {
+            "plugin_type": plugin_type,
+            "time_window_hours": hours,
+            **self._summarize(stats, hours),
+        }
+
+    def get_metrics_breakdown(self, scope: str = "tool", hours: int = 1) -> dict[str, Any]:
+        """
+        Metrics for every key in a scope ("project", "tool" or "plugin").
+
+        Args:
+            scope: Which dimension to break down by
+            hours: Number of hours of history to analyze
+
+        Returns:
+            Mapping of key -> metrics (keys with no traffic in the window omitted)
+        """
+        result = {}
+        for series_scope, key in list(self._series):
+            if series_scope != scope:
+                continue
+            stats = self._window_stats(scope, key, hours)
+            if stats is not None and stats.requests:
+                result[key] = self._summarize(stats, hours)
+        return result
+
+    @staticmethod
+    def _summarize(stats: RequestStats, hours: float) -> dict[str, Any]:
+        summary = stats.summary()
+        summary["requests_per_minute"] = round(stats.requests / (hours * 60), 2) if hours else 0.0
+        return summary
+
     def _check_alerts(self, project_id: str, metrics: dict[str, Any]) -> list[str]:
         """
         Check if any alert thresholds are exceeded.
@@ -572,7 +619,7 @@ class HealthMonitor:
                     )
                     auth_check_url = f"{config.url}/wp-json/wp/v2/users/me"
 
-                async with aiohttp.ClientSession(auth=auth) as session:
+                async with pooled_session(auth=auth) as session:
                     async with session.get(
                         auth_check_url,
                         timeout=aiohttp.ClientTimeout(total=10),
@@ -599,7 +646,7 @@ class HealthMonitor:
             return {"healthy": False, "message": "No URL configured for site"}
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session() as session:
                 async with session.get(
                     url, timeout=aiohttp.ClientTimeout(total=10), ssl=False
                 ) as resp:
@@ -630,27 +677,89 @@ class HealthMonitor:
         except Exception as e:
             return {"healthy": False, "error_type": "unknown", "message": f"Connection failed: {e}"}
 
-    async def check_all_projects_health(self, include_metrics: bool = True) -> dict[str, Any]:
+    async def check_all_projects_health(
+        self,
+        include_metrics: bool = True,
+        max_age_seconds: float | None = None,
+    ) -> dict[str, Any]:
         """
         Check health of all projects.
 
+        Sites are checked concurrently (at most ``HEALTH_CHECK_CONCURRENCY``
+        at a time), each bounded by ``HEALTH_CHECK_HOST_TIMEOUT`` and the
+        whole sweep by ``HEALTH_CHECK_DEADLINE``. Sites that have not
+        answered by the deadline are reported with their last known status
+        (``details.stale``) or as unhealthy, and ``summary.timed_out``
+        counts them.
+
+        The result is cached for ``HEALTH_CHECK_CACHE_TTL`` seconds and shared
+        with the background loop and :meth:`get_cached_fleet_health`;
+        concurrent callers join the sweep already in flight. Sweeps with and
+        without metrics are cached and joined separately.
+
         Args:
             include_metrics: Whether to include historical metrics
+            max_age_seconds: Accept a cached sweep up to this old (defaults to
+                the cache TTL; 0 forces a fresh sweep)
 
         Returns:
             Dictionary with overall health status
         """
-        health_statuses = {}
+        max_age = HEALTH_CHECK_CACHE_TTL if max_age_seconds is None else max_age_seconds
+        cached = self.get_cached_fleet_health(max_age, include_metrics)
+        if cached is not None:
+            return cached
+
+        check = self._fleet_checks.get(include_metrics)
+        if check is None or check.done():
+            check = asyncio.create_task(self._run_fleet_check(include_metrics))
+            self._fleet_checks[include_metrics] = check
+        return await asyncio.shield(check)
+
+    def get_cached_fleet_health(
+        self, max_age_seconds: float = HEALTH_CHECK_CACHE_TTL, include_metrics: bool = True
+    ) -> dict[str, Any] | None:
+        """Return the last fleet sweep if it is at most ``max_age_seconds`` old."""
+        entry = self._fleet_cache.get(include_metrics)
+        if entry is None:
+            return None
+        checked_at, result = entry
+        if time.monotonic() - checked_at > max_age_seconds:
+            return None
+        return result
 
+    async def _run_fleet_check(self, include_metrics: bool) -> dict[str, Any]:
         # Collect all known site IDs from SiteManager
         all_project_ids = set()
         if self.site_manager:
             for site_info in self.site_manager.list_all_sites():
                 all_project_ids.add(site_info["full_id"])
+        project_ids = sorted(all_project_ids)
+
+        semaphore = asyncio.Semaphore(max(1, self.check_concurrency))
+
+        async def _check(project_id: str) -> ProjectHealthStatus:
+            async with semaphore:
+                return await self._check_with_timeout(project_id, include_metrics)
 
-        # Check each project
-        for project_id in sorted(all_project_ids):
-            status = await self.check_project_health(project_id, include_metrics)
+        tasks = {asyncio.create_task(_check(pid)): pid for pid in project_ids}
+        timed_out: list[str] = []
+        if tasks:
+            _done, pending = await asyncio.wait(tasks, timeout=self.check_deadline)
+            for task in pending:
+                task.cancel()
+                timed_out.append(tasks[task])
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        health_statuses = {}
+        for task, project_id in tasks.items():
+            if project_id in timed_out:
+                status = self._deadline_status(project_id)
+            elif task.exception() is not None:
+                status = self._failed_status(project_id, 0.0, str(task.exception()))
+            else:
+                status = task.result()
             health_statuses[project_id] = status.to_dict()
 
         # Calculate summary
@@ -663,7 +772,7 @@ class HealthMonitor:
         for status in health_statuses.values():
             all_alerts.extend(status.get("alerts", []))
 
-        return {
+        result = {
             "timestamp": datetime.now(UTC).isoformat(),
             "status": (
                 "healthy"
@@ -674,10 +783,76 @@ class HealthMonitor:
                 "total_projects": total_projects,
                 "healthy": healthy_projects,
                 "unhealthy": unhealthy_projects,
+                "timed_out": len(timed_out),
+                "complete": not timed_out,
             },
             "alerts": all_alerts,
             "projects": health_statuses,
         }
+        self._fleet_cache[include_metrics] = (time.monotonic(), result)
+        return result
+
+    async def _check_with_timeout(
+        self, project_id: str, include_metrics: bool
+    ) -> ProjectHealthStatus:
+        """``check_project_health`` bounded by the per-host timeout."""
+        start_time = time.time()
+        try:
+            return await asyncio.wait_for(
+                self.check_project_health(project_id, include_metrics),
+                timeout=self.check_host_timeout,
+            )
+        except TimeoutError:
+            response_time_ms = (time.time() - start_time) * 1000
+            error_msg = f"Health check timed out after {self.check_host_timeout:g}s"
+            self.record_request(
+                project_id=project_id,
+                response_time_ms=response_time_ms,
+                success=False,
+                error_message=error_msg,
+            )
+            status = self._failed_status(project_id, response_time_ms, error_msg)
+            self.latest_health_status[project_id] = status
+            return status
+
+    @staticmethod
+    def _failed_status(
+        project_id: str, response_time_ms: float, error_msg: str
+    ) -> ProjectHealthStatus:
+        return ProjectHealthStatus(
+            project_id=project_id,
+            healthy=False,
+            last_check=datetime.now(UTC),
+            response_time_ms=response_time_ms,
+            error_rate_percent=100.0,
+            recent_errors=[error_msg],
+            alerts=[f"CRITICAL: Health check failed - {error_msg}"],
+        )
+
+    def _deadline_status(self, project_id: str) -> ProjectHealthStatus:
+        """Partial result for a site that did not answer before the sweep deadline."""
+        previous = self.latest_health_status.get(project_id)
+        if previous is not None:
+            return ProjectHealthStatus(
+                project_id=project_id,
+                healthy=previous.healthy,
+                last_check=previous.last_check,
+                response_time_ms=previous.response_time_ms,
+                error_rate_percent=previous.error_rate_percent,
+                recent_errors=previous.recent_errors,
+                alerts=[*previous.alerts, "WARNING: Health check still running at deadline"],
+                details={**previous.details, "stale": True},
+            )
+        return ProjectHealthStatus(
+            project_id=project_id,
+            healthy=False,
+            last_check=datetime.now(UTC),
+            response_time_ms=0.0,
+            error_rate_percent=0.0,
+            recent_errors=["Health check did not finish before the deadline"],
+            alerts=["WARNING: Health check still running at deadline"],
+            details={"stale": True, "timed_out": True},
+        )
 
     def get_system_metrics(self) -> SystemMetrics:
         """
@@ -689,31 +864,49 @@ class HealthMonitor:
         # Calculate uptime
         uptime_seconds = time.time() - self.start_time
 
-        # Calculate average response time
-        avg_response_time = (
-            sum(self.response_times) / len(self.response_times) if self.response_times else 0.0
-        )
+        # Latency over the last hour (this worker only)
+        now = time.time()
+        latency = self._series_for("system", "*").snapshot(3600, now).latency
+
+        # Request counters, summed over all workers in multi-worker mode
+        counters: dict[str, Any] = self.metrics_snapshot()
+        shared = get_shared_state()
+        if shared is not None:
+            counters = shared.aggregate_metrics("health", counters)
+        total_requests = counters["total_requests"]
 
         # Calculate error rate
         error_rate = (
-            (self.failed_requests / self.total_requests * 100) if self.total_requests > 0 else 0.0
+            (counters["failed_requests"] / total_requests * 100) if total_requests > 0 else 0.0
         )
 
-        # Calculate requests per minute
-        now = time.time()
-        one_minute_ago = now - 60
-        recent_requests = sum(1 for ts in self.request_timestamps if ts >= one_minute_ago)
+        writer_stats = self.audit_logger.get_writer_stats() if self.audit_logger else {}
 
         return SystemMetrics(
             uptime_seconds=uptime_seconds,
-            total_requests=self.total_requests,
-            successful_requests=self.successful_requests,
-            failed_requests=self.failed_requests,
-            average_response_time_ms=round(avg_response_time, 2),
+            total_requests=total_requests,
+            successful_requests=counters["successful_requests"],
+            failed_requests=counters["failed_requests"],
+            average_response_time_ms=round(latency.mean, 2),
             error_rate_percent=round(error_rate, 2),
-            requests_per_minute=recent_requests,
+            requests_per_minute=counters["requests_per_minute"],
+            p50_response_time_ms=round(latency.percentile(50), 2),
+            p95_response_time_ms=round(latency.percentile(95), 2),
+            p99_response_time_ms=round(latency.percentile(99), 2),
+            audit_log_dropped=writer_stats.get("dropped", 0),
+            audit_log_queued=writer_stats.get("queued", 0),
+            workers=counters.get("workers", 1),
         )
 
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Request counters of this process (summed across workers in metrics)."""
+        return {
+            "total_requests": self.total_requests,
+            "successful_requests": self.successful_requests,
+            "failed_requests": self.failed_requests,
+            "requests_per_minute": self._rate.snapshot(60, time.time()).requests,
+        }
+
     def get_uptime(self) -> dict[str, Any]:
         """
         Get system uptime information.
@@ -774,14 +967,16 @@ class HealthMonitor:
             "system_metrics": self.get_system_metrics().to_dict(),
             "uptime": self.get_uptime(),
             "projects": {},
+            "tools": self.get_metrics_breakdown("tool", hours=24),
+            "plugins": self.get_metrics_breakdown("plugin", hours=24),
         }
 
         # Add per-project metrics
-        for project_id in self.metrics_history.keys():
-            export_data["projects"][project_id] = {
-                "metrics": self.get_project_metrics(project_id, hours=24),
-                "history": [m.to_dict() for m in self.metrics_history[project_id]],
-            }
+        for scope, project_id in list(self._series):
+            if scope == "project":
+                export_data["projects"][project_id] = {
+                    "metrics": self.get_project_metrics(project_id, hours=24),
+                }
 
         # Write to file
         output_file = Path(output_path)
@@ -795,13 +990,15 @@ class HealthMonitor:
 
     def reset_metrics(self):
         """Reset all metrics (use with caution)."""
-        self.metrics_history.clear()
+        self._series.clear()
+        self._recent_errors.clear()
+        self._last_request.clear()
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
-        self.response_times.clear()
-        self.request_timestamps.clear()
+        self._rate.clear()
         self.latest_health_status.clear()
+        self._fleet_cache.clear()
         logger.warning("All metrics have been reset")
 
     async def start_background_checks(self, interval_seconds: int = 60):
@@ -817,7 +1014,7 @@ class HealthMonitor:
             await asyncio.sleep(5)
             while self._is_running:
                 try:
-                    await self.check_all_projects_health(include_metrics=True)
+                    await self.check_all_projects_health(include_metrics=True, max_age_seconds=0)
                 except Exception as e:
                     logger.error(f"Error in background health check loop: {e}")
 
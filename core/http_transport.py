@@ -0,0 +1,156 @@
+"""Shared upstream HTTP transport.
+
+Every plugin client used to open a brand-new ``aiohttp.ClientSession`` per
+call, which meant a fresh DNS lookup plus TCP/TLS handshake on every tool
+call (and on every retry). This module owns one process-wide
+``aiohttp.TCPConnector`` so all clients share per-host keep-alive pools, a
+DNS cache and per-host connection caps.
+
+Call sites keep their ``async with ... as session`` shape — they just ask
+for a session bound to the shared connector::
+
+    from core.http_transport import pooled_session
+
+    async with pooled_session(timeout=timeout) as session:
+        async with session.get(url) as resp:
+            ...
+
+The session itself is a thin per-call wrapper (it does not own the
+connector), so per-call options such as ``timeout`` or ``auth`` still work
+and closing it leaves pooled connections alive. The connector is closed
+from the server lifespan via :func:`close_http_transport`.
+
+Connectors are bound to the event loop they were created on; if the
+running loop changes (tests, stdio re-runs) a fresh connector is created
+for the new loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# --- Config ----------------------------------------------------------------
+
+POOL_LIMIT = int(os.environ.get("MCPHUB_HTTP_POOL_LIMIT", "100"))
+POOL_LIMIT_PER_HOST = int(os.environ.get("MCPHUB_HTTP_POOL_LIMIT_PER_HOST", "20"))
+DNS_CACHE_TTL = int(os.environ.get("MCPHUB_HTTP_DNS_TTL_SEC", "300"))
+KEEPALIVE_TIMEOUT = float(os.environ.get("MCPHUB_HTTP_KEEPALIVE_SEC", "30"))
+
+
+class HttpTransport:
+    """Process-wide pooled connector for upstream HTTP calls."""
+
+    def __init__(
+        self,
+        *,
+        limit: int = POOL_LIMIT,
+        limit_per_host: int = POOL_LIMIT_PER_HOST,
+        ttl_dns_cache: int = DNS_CACHE_TTL,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._connector: aiohttp.TCPConnector | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.sessions_opened = 0
+        self.connectors_created = 0
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Return the shared connector for the running loop, creating it lazily."""
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._loop is not loop:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._loop = loop
+            self.connectors_created += 1
+            logger.debug(
+                "Created shared HTTP connector (limit=%d, per_host=%d, dns_ttl=%ds)",
+                self.limit,
+                self.limit_per_host,
+                self.ttl_dns_cache,
+            )
+        return self._connector
+
+    def session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        """Build a ``ClientSession`` that borrows the shared connector.
+
+        Accepts the usual ``ClientSession`` keyword arguments (``timeout``,
+        ``auth``, ``headers`` ...). ``connector``/``connector_owner`` are
+        always overridden.
+        """
+        kwargs["connector"] = self.connector()
+        kwargs["connector_owner"] = False
+        self.sessions_opened += 1
+        return aiohttp.ClientSession(**kwargs)
+
+    async def close(self) -> None:
+        """Close pooled connections. Safe to call more than once."""
+        connector, self._connector = self._connector, None
+        self._loop = None
+        if connector is not None and not connector.closed:
+            await connector.close()
+            logger.info("Shared HTTP connector closed")
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters for diagnostics."""
+        connector = self._connector
+        open_hosts = 0
+        idle_connections = 0
+        if connector is not None and not connector.closed:
+            conns = getattr(connector, "_conns", {}) or {}
+            open_hosts = len(conns)
+            idle_connections = sum(len(v) for v in conns.values())
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "dns_cache_ttl": self.ttl_dns_cache,
+            "keepalive_timeout": self.keepalive_timeout,
+            "active": connector is not None and not connector.closed,
+            "pooled_hosts": open_hosts,
+            "idle_connections": idle_connections,
+            "sessions_opened": self.sessions_opened,
+            "connectors_created": self.connectors_created,
+        }
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_transport: HttpTransport | None = None
+
+
+def get_http_transport() -> HttpTransport:
+    global _transport
+    if _transport is None:
+        _transport = HttpTransport()
+    return _transport
+
+
+def set_http_transport(transport: HttpTransport | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _transport
+    _transport = transport
+
+
+def pooled_session(**kwargs: Any) -> aiohttp.ClientSession:
+    """Shortcut for ``get_http_transport().session(**kwargs)``."""
+    return get_http_transport().session(**kwargs)
+
+
+async def close_http_transport() -> None:
+    """Close the shared connector. Register in server lifespan shutdown."""
+    if _transport is not None:
+        await _transport.close()
@@ -0,0 +1,89 @@
+"""Import-time report for server startup.
+
+Runs ``python -X importtime -c "import server"`` in a subprocess and lists
+the modules with the highest cumulative import time, to spot heavy imports
+that should be deferred. Exposed as ``mcphub --import-report``::
+
+    $ mcphub --import-report
+    cumulative(ms)   self(ms)  module
+            3525.2     1123.8  server
+            2051.4        6.3  fastmcp
+             567.1        1.7  docket
+    ...
+
+Before plugins were loaded on demand, ``plugins`` itself showed up here at
+about 400-450 ms (all eight plugins plus the AI image providers); it is now
+about 3 ms.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportTiming:
+    """One ``-X importtime`` line (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` stderr; non-timing lines are skipped."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        timings.append(ImportTiming(stripped, self_us, cumulative_us, depth))
+    return timings
+
+
+def measure(module: str = "server") -> list[ImportTiming]:
+    """Import ``module`` in a fresh interpreter and return its import timings."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    timings = parse_importtime(proc.stderr)
+    if proc.returncode != 0 and not timings:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return timings
+
+
+def format_report(timings: list[ImportTiming], top: int = 30) -> str:
+    """Table of the ``top`` slowest imports by cumulative time."""
+    ranked = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+    total = max((t.cumulative_us for t in timings if t.depth == 0), default=0)
+    lines = [f"{'cumulative(ms)':>14} {'self(ms)':>10}  module"]
+    for t in ranked:
+        lines.append(f"{t.cumulative_us / 1000:14.1f} {t.self_us / 1000:10.1f}  {t.module}")
+    lines.append(f"{len(timings)} modules imported, slowest top-level import {total / 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def print_report(module: str = "server", top: int = 30) -> None:
+    print(format_report(measure(module), top))
+
+
+if __name__ == "__main__":
+    print_report(*sys.argv[1:2])
@@ -0,0 +1,87 @@
+"""Batched API-key usage accounting.
+
+Both key managers count successful validations in memory instead of
+writing on every request:
+
+- :class:`core.api_keys.APIKeyManager` bumps ``usage_count`` /
+  ``last_used_at`` on the in-memory key and marks the JSON store dirty.
+- :class:`core.user_keys.UserKeyManager` accumulates ``(uses, last_used)``
+  per key id.
+
+:class:`UsageFlushTask` persists both every ``MCPHUB_KEY_USAGE_FLUSH_SEC``
+seconds (default 15) and once more when stopped, so the dashboard lags by
+at most one interval and nothing is lost on a clean shutdown.
+
+Usage::
+
+    from core.key_usage import UsageFlushTask
+
+    usage_flush = UsageFlushTask()
+    await usage_flush.start()
+    ...
+    await usage_flush.stop()  # final flush
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+FLUSH_INTERVAL_SECONDS = float(os.environ.get("MCPHUB_KEY_USAGE_FLUSH_SEC", "15"))
+
+
+async def flush_key_usage() -> None:
+    """Flush pending usage from every key manager. Errors are logged, not raised."""
+    try:
+        from core.api_keys import get_api_key_manager
+
+        get_api_key_manager().flush_usage()
+    except Exception as e:  # noqa: BLE001
+        logger.warning("API key usage flush error: %s", e)
+
+    try:
+        from core.user_keys import get_user_key_manager
+
+        await get_user_key_manager().flush_usage()
+    except RuntimeError:
+        pass  # UserKeyManager not initialized (e.g. stdio mode)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("User API key usage flush error: %s", e)
+
+
+class UsageFlushTask:
+    """Periodically persists key usage counters. Register in server lifespan."""
+
+    def __init__(self, interval_seconds: float = FLUSH_INTERVAL_SECONDS) -> None:
+        self.interval = interval_seconds
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="key-usage-flush")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+        await flush_key_usage()
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+            except TimeoutError:
+                await flush_key_usage()
@@ -1,7 +1,9 @@
 """F.5a.6.4 — Audit-log emission for media uploads.
 
 One ``media.upload`` entry is written per **successful** upload regardless
-of source (base64 / url / chunked / ai:<provider>). Failures are intentionally
+of source (base64 / url / chunked / ai:<provider>), including uploads that
+reused an existing attachment (``deduplicated``) since those can still
+attach media or set a featured image. Failures are intentionally
 NOT logged here — they surface to the caller as typed ``UploadError`` JSON
 and to the dashboard via the existing tool-call audit emitted by the
 ToolRouter wrapper. Logging failures twice would double-count error rates.
@@ -26,6 +28,7 @@ def log_media_upload(
     source: str,
     media_id: int | None,
     cost_usd: float | None = None,
+    deduplicated: bool = False,
 ) -> None:
     """Emit a single ``media.upload`` audit entry. Best-effort — never raises.
 
@@ -37,6 +40,8 @@ def log_media_upload(
         source: One of ``"base64"``, ``"url"``, ``"chunked"``, ``"ai:<provider>"``.
         media_id: WordPress media library id of the resulting attachment.
         cost_usd: Provider cost in USD for AI-generated uploads only.
+        deduplicated: True when an existing attachment was reused instead
+            of uploading (``size_bytes`` is then the received byte count).
     """
     try:
         from core.audit_log import get_audit_logger
@@ -54,6 +59,8 @@ def log_media_upload(
     }
     if cost_usd is not None:
         params["cost_usd"] = round(float(cost_usd), 6)
+    if deduplicated:
+        params["deduplicated"] = True
 
     try:
         audit.log_tool_call(
@@ -0,0 +1,111 @@
+"""Content-addressed media index: sha256 of uploaded bytes -> attachment id.
+
+Agents retry uploads and re-send the same product photos over and over;
+without an index every call created another attachment (``photo-7.jpg``).
+Upload handlers hash the payload they received, look it up here per site
+and, on a hit, reuse the existing attachment instead of uploading again.
+
+Rows are keyed by ``(site, sha256, variant)``. ``variant`` names the
+optimizer settings applied before upload (``raw``, ``opt:``, ``opt:webp``),
+since the same input produces different attachments under different
+settings. Entries are not trusted blindly: callers confirm the attachment
+still exists on the site before reusing it and :meth:`forget` stale rows.
+
+Set ``MCPHUB_MEDIA_DEDUPE=0`` to disable.
+
+Usage::
+
+    index = get_media_dedupe_index()
+    media_id = await index.lookup(site_url, digest, "raw")
+    ...
+    await index.record(site_url, digest, "raw", media["id"])
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import UTC, datetime
+
+from core.database import Database, get_database
+
+logger = logging.getLogger(__name__)
+
+DEDUPE_ENABLED = os.environ.get("MCPHUB_MEDIA_DEDUPE", "1").strip().lower() not in (
+    "0",
+    "false",
+    "no",
+    "off",
+)
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+class MediaDedupeIndex:
+    """Per-site ``sha256 -> media id`` rows in the ``media_dedupe`` table."""
+
+    def __init__(self, *, db: Database | None = None) -> None:
+        self._db = db
+
+    @property
+    def db(self) -> Database:
+        return self._db or get_database()
+
+    async def lookup(self, site: str, sha256: str, variant: str) -> int | None:
+        """Return the attachment id previously uploaded for this content."""
+        row = await self.db.fetchone(
+            "SELECT media_id FROM media_dedupe WHERE site = ? AND sha256 = ? AND variant = ?",
+            (site, sha256, variant),
+        )
+        return int(row["media_id"]) if row else None
+
+    async def record(self, site: str, sha256: str, variant: str, media_id: int) -> None:
+        """Remember that ``media_id`` holds this content (replaces older rows)."""
+        await self.db.execute(
+            "INSERT INTO media_dedupe (site, sha256, variant, media_id, created_at) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(site, sha256, variant) DO UPDATE SET "
+            "media_id = excluded.media_id, created_at = excluded.created_at, last_used = NULL",
+            (site, sha256, variant, media_id, _now()),
+        )
+
+    async def touch(self, site: str, sha256: str, variant: str) -> None:
+        """Stamp ``last_used`` after an upload was served from the index."""
+        await self.db.execute(
+            "UPDATE media_dedupe SET last_used = ? WHERE site = ? AND sha256 = ? AND variant = ?",
+            (_now(), site, sha256, variant),
+        )
+
+    async def forget(self, site: str, sha256: str, variant: str) -> None:
+        """Drop a row whose attachment no longer exists."""
+        await self.db.execute(
+            "DELETE FROM media_dedupe WHERE site = ? AND sha256 = ? AND variant = ?",
+            (site, sha256, variant),
+        )
+
+    async def forget_media(self, site: str, media_id: int) -> int:
+        """Drop every row pointing at a deleted attachment. Returns the count."""
+        cursor = await self.db.execute(
+            "DELETE FROM media_dedupe WHERE site = ? AND media_id = ?", (site, media_id)
+        )
+        return cursor.rowcount
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_index: MediaDedupeIndex | None = None
+
+
+def get_media_dedupe_index() -> MediaDedupeIndex:
+    global _index
+    if _index is None:
+        _index = MediaDedupeIndex()
+    return _index
+
+
+def set_media_dedupe_index(index: MediaDedupeIndex | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _index
+    _index = index
@@ -69,6 +69,7 @@ MEDIA_ERROR_CODES: frozenset[str] = frozenset(
         "PROVIDER_UNAVAILABLE",
         "PROVIDER_UNKNOWN",
         # --- Rate / policy -----------------------------------------------
+        "OPTIMIZE_BUSY",
         "TOOL_RATE_LIMITED",
         # --- Catchall ----------------------------------------------------
         "INTERNAL",
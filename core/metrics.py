@@ -0,0 +1,202 @@
+"""Fixed-memory request metrics.
+
+Building blocks for :class:`core.health.HealthMonitor`:
+
+- :class:`LatencyHistogram` — log-bucketed latency histogram (8 buckets
+  per power of two, ~9% relative error) stored sparsely. Histograms merge
+  by adding bucket counts, so per-slot, per-project, per-tool and
+  per-plugin views all come from the same data.
+- :class:`RequestStats` — a histogram plus request/error counters.
+- :class:`RollingWindow` — a ring of time slots, each holding a
+  :class:`RequestStats`. Recording is O(1); a window query merges at most
+  ``num_slots`` slots, i.e. O(slots x buckets), independent of traffic.
+- :class:`TieredWindow` — minute-resolution last hour plus a coarse ring
+  spanning the retention period.
+
+Memory per window is bounded by ``num_slots x MAX_BUCKETS`` counters, no
+matter how many requests are recorded.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# Bucket layout: bucket 0 holds everything <= MIN_TRACKABLE_MS, bucket i
+# (i >= 1) holds (MIN * 2**((i-1)/B), MIN * 2**(i/B)].
+BUCKETS_PER_OCTAVE = 8
+MIN_TRACKABLE_MS = 0.01
+MAX_TRACKABLE_MS = 3_600_000.0  # one hour; larger values share the top bucket
+MAX_BUCKETS = (
+    int(math.ceil(math.log2(MAX_TRACKABLE_MS / MIN_TRACKABLE_MS) * BUCKETS_PER_OCTAVE)) + 1
+)
+
+
+def bucket_index(value_ms: float) -> int:
+    """Bucket for a latency value in milliseconds."""
+    if value_ms <= MIN_TRACKABLE_MS:
+        return 0
+    idx = int(math.ceil(math.log2(value_ms / MIN_TRACKABLE_MS) * BUCKETS_PER_OCTAVE))
+    return min(idx, MAX_BUCKETS - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Inclusive upper bound (ms) of a bucket."""
+    return MIN_TRACKABLE_MS * 2 ** (index / BUCKETS_PER_OCTAVE)
+
+
+class LatencyHistogram:
+    """Sparse log-bucketed latency histogram."""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(0.0, float(value_ms))
+        idx = bucket_index(value_ms)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for idx, n in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Approximate ``q``-th percentile (0-100), clamped to the observed range."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen >= rank:
+                return min(max(bucket_upper_bound(idx), self.min), self.max)
+        return self.max
+
+
+class RequestStats:
+    """Request/error counters plus a latency histogram."""
+
+    __slots__ = ("latency", "errors")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.errors = 0
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    def record(self, value_ms: float, success: bool) -> None:
+        self.latency.record(value_ms)
+        if not success:
+            self.errors += 1
+
+    def merge(self, other: RequestStats) -> None:
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+
+    @property
+    def error_rate_percent(self) -> float:
+        return self.errors / self.requests * 100 if self.requests else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Counts, error rate and latency percentiles (ms, rounded)."""
+        hist = self.latency
+        return {
+            "total_requests": self.requests,
+            "successful_requests": self.requests - self.errors,
+            "failed_requests": self.errors,
+            "error_rate_percent": round(self.error_rate_percent, 2),
+            "response_time": {
+                "average_ms": round(hist.mean, 2),
+                "min_ms": round(hist.min if hist.count else 0.0, 2),
+                "max_ms": round(hist.max, 2),
+                "p50_ms": round(hist.percentile(50), 2),
+                "p95_ms": round(hist.percentile(95), 2),
+                "p99_ms": round(hist.percentile(99), 2),
+            },
+        }
+
+
+class RollingWindow:
+    """Ring of ``num_slots`` time slots of ``slot_seconds`` each."""
+
+    __slots__ = ("slot_seconds", "num_slots", "_slots")
+
+    def __init__(self, slot_seconds: float, num_slots: int) -> None:
+        self.slot_seconds = slot_seconds
+        self.num_slots = num_slots
+        # Each entry is (absolute slot number, stats) or None
+        self._slots: list[tuple[int, RequestStats] | None] = [None] * num_slots
+
+    @property
+    def span_seconds(self) -> float:
+        return self.slot_seconds * self.num_slots
+
+    def record(self, value_ms: float, success: bool, now: float) -> None:
+        slot_no = int(now // self.slot_seconds)
+        pos = slot_no % self.num_slots
+        entry = self._slots[pos]
+        if entry is not None and entry[0] > slot_no:
+            return  # older than the ring span; the slot already holds newer data
+        if entry is None or entry[0] != slot_no:
+            entry = (slot_no, RequestStats())
+            self._slots[pos] = entry
+        entry[1].record(value_ms, success)
+
+    def snapshot(self, window_seconds: float, now: float) -> RequestStats:
+        """Merge every slot that overlaps the last ``window_seconds``."""
+        current = int(now // self.slot_seconds)
+        slots_back = min(self.num_slots, max(1, math.ceil(window_seconds / self.slot_seconds)))
+        oldest = current - slots_back + 1
+        merged = RequestStats()
+        for entry in self._slots:
+            if entry is not None and oldest <= entry[0] <= current:
+                merged.merge(entry[1])
+        return merged
+
+    def clear(self) -> None:
+        self._slots = [None] * self.num_slots
+
+
+class TieredWindow:
+    """A fine (1-minute slots, last hour) and a coarse (retention-wide) window.
+
+    Short queries are answered at minute resolution; anything longer than
+    the fine span falls back to the coarse ring.
+    """
+
+    __slots__ = ("fine", "coarse")
+
+    def __init__(self, retention_hours: float = 24, coarse_slots: int = 96) -> None:
+        self.fine = RollingWindow(60, 60)
+        self.coarse = RollingWindow(max(60.0, retention_hours * 3600 / coarse_slots), coarse_slots)
+
+    def record(self, value_ms: float, success: bool, now: float) -> None:
+        self.fine.record(value_ms, success, now)
+        self.coarse.record(value_ms, success, now)
+
+    def snapshot(self, window_seconds: float, now: float) -> RequestStats:
+        if window_seconds <= self.fine.span_seconds:
+            return self.fine.snapshot(window_seconds, now)
+        return self.coarse.snapshot(window_seconds, now)
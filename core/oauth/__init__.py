@@ -27,7 +27,7 @@ from .schemas import (
 from .server import OAuthError, OAuthServer, get_oauth_server
 
 # Storage
-from .storage import BaseStorage, JSONStorage, get_storage
+from .storage import BaseStorage, JSONStorage, SQLiteStorage, get_storage
 
 # Token Manager
 from .token_manager import SecurityError, TokenManager, get_token_manager
@@ -47,6 +47,7 @@ __all__ = [
     # Storage
     "BaseStorage",
     "JSONStorage",
+    "SQLiteStorage",
     "get_storage",
     # Client Registry
     "ClientRegistry",
@@ -1,11 +1,15 @@
 """
 OAuth 2.1 Token Storage
-Supports JSON files (default) and Redis (optional)
+Supports SQLite (default), JSON files (legacy) and Redis (future)
 """
 
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -45,6 +49,15 @@ class BaseStorage:
         raise NotImplementedError
 
     def revoke_refresh_token(self, token: str) -> bool:
+        """Revoke a refresh token; True only if this call revoked it.
+
+        Storage failures raise instead of returning False, so a failed write
+        is never mistaken for a token that was already revoked.
+        """
+        raise NotImplementedError
+
+    def revoke_client_refresh_tokens(self, client_id: str) -> int:
+        """Revoke every refresh token issued to ``client_id``; return how many."""
         raise NotImplementedError
 
 
@@ -183,12 +196,26 @@ class JSONStorage(BaseStorage):
         """Revoke refresh token"""
         tokens = self._read_json(self.refresh_tokens_file)
 
-        if token in tokens:
+        if token in tokens and not tokens[token].get("revoked"):
             tokens[token]["revoked"] = True
-            return self._write_json(self.refresh_tokens_file, tokens)
+            if not self._write_json(self.refresh_tokens_file, tokens):
+                raise OSError(f"Could not write {self.refresh_tokens_file}")
+            return True
 
         return False
 
+    def revoke_client_refresh_tokens(self, client_id: str) -> int:
+        """Revoke all refresh tokens of a client"""
+        tokens = self._read_json(self.refresh_tokens_file)
+        revoked = 0
+        for data in tokens.values():
+            if data.get("client_id") == client_id and not data.get("revoked"):
+                data["revoked"] = True
+                revoked += 1
+        if revoked and not self._write_json(self.refresh_tokens_file, tokens):
+            return 0
+        return revoked
+
     def cleanup_expired(self):
         """Cleanup expired tokens (run periodically)"""
         # Cleanup authorization codes
@@ -205,17 +232,295 @@ class JSONStorage(BaseStorage):
         logger.info(f"Cleaned up {len(tokens) - len(cleaned_tokens)} expired access tokens")
 
 
+_SQLITE_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS oauth_codes (
+    code        TEXT PRIMARY KEY,
+    expires_at  REAL NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_oauth_codes_expires ON oauth_codes(expires_at);
+
+CREATE TABLE IF NOT EXISTS oauth_access_tokens (
+    token       TEXT PRIMARY KEY,
+    expires_at  REAL NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_oauth_access_expires ON oauth_access_tokens(expires_at);
+
+CREATE TABLE IF NOT EXISTS oauth_refresh_tokens (
+    token       TEXT PRIMARY KEY,
+    expires_at  REAL NOT NULL,
+    revoked     INTEGER NOT NULL DEFAULT 0,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_oauth_refresh_expires ON oauth_refresh_tokens(expires_at);
+"""
+
+# Expired rows deleted per table on each write (incremental cleanup).
+_PURGE_BATCH = int(os.getenv("OAUTH_STORAGE_PURGE_BATCH", "100"))
+
+_TABLES = ("oauth_codes", "oauth_access_tokens", "oauth_refresh_tokens")
+
+_INSERT_CODE = "INSERT OR REPLACE INTO oauth_codes VALUES (?, ?, ?)"
+_INSERT_ACCESS = "INSERT OR REPLACE INTO oauth_access_tokens VALUES (?, ?, ?)"
+_INSERT_REFRESH = "INSERT OR REPLACE INTO oauth_refresh_tokens VALUES (?, ?, ?, ?)"
+
+
+def _expiry(value: datetime) -> float:
+    """Epoch seconds for an expiry; naive values are UTC (see ``is_expired``)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    SQLite storage for OAuth tokens.
+
+    Each record is a row keyed by its code / token with an indexed
+    ``expires_at`` column, so lookups, saves and revocations touch one row
+    instead of parsing and rewriting a whole JSON file. Refresh-token
+    revocation is a conditional ``UPDATE`` so only one concurrent rotation
+    can claim a token. Every write also deletes up to ``_PURGE_BATCH``
+    expired rows from the table it touched, replacing periodic full
+    rewrites.
+
+    Storage structure:
+        data/oauth.db   - codes, access tokens and refresh tokens
+
+    Existing ``oauth_*.json`` files in the same directory are imported
+    once, the first time the database is created.
+
+    ``TokenManager`` reads and revokes tokens synchronously in the middle of
+    a rotation, so the connection is a lock-guarded ``sqlite3`` one.
+    """
+
+    def __init__(self, data_dir: str | None = None):
+        self.data_dir = Path(data_dir or _DEFAULT_DATA_DIR)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.data_dir / "oauth.db"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self._import_json_files()
+            self._conn.execute("PRAGMA user_version = 1")
+        self._conn.commit()
+
+    def _import_json_files(self) -> None:
+        """Copy records from the legacy JSON files (one-time migration)."""
+        sources = [
+            ("oauth_codes.json", AuthorizationCode, self._code_row, _INSERT_CODE),
+            ("oauth_access_tokens.json", AccessToken, self._access_row, _INSERT_ACCESS),
+            ("oauth_refresh_tokens.json", RefreshToken, self._refresh_row, _INSERT_REFRESH),
+        ]
+        for filename, model, to_row, insert_sql in sources:
+            path = self.data_dir / filename
+            if not path.exists():
+                continue
+            try:
+                with open(path) as f:
+                    records = json.load(f)
+                rows = [to_row(model(**data)) for data in records.values()]
+            except Exception as e:
+                logger.error(f"Skipping OAuth import from {path}: {e}")
+                continue
+            self._conn.executemany(insert_sql, rows)
+            logger.info(f"Imported {len(rows)} records from {path} into {self.db_path}")
+
+    @staticmethod
+    def _code_row(code: AuthorizationCode) -> tuple:
+        return (code.code, _expiry(code.expires_at), code.model_dump_json())
+
+    @staticmethod
+    def _access_row(token: AccessToken) -> tuple:
+        return (token.token, _expiry(token.expires_at), token.model_dump_json())
+
+    @staticmethod
+    def _refresh_row(token: RefreshToken) -> tuple:
+        return (
+            token.token,
+            _expiry(token.expires_at),
+            1 if token.revoked else 0,
+            token.model_dump_json(),
+        )
+
+    def _write(self, sql: str, params: tuple, table: str) -> int:
+        """Like :meth:`_write_or_raise`, but log errors and return 0."""
+        try:
+            return self._write_or_raise(sql, params, table)
+        except sqlite3.Error as e:
+            logger.error(f"Error writing {table}: {e}")
+            return 0
+
+    def _write_or_raise(self, sql: str, params: tuple, table: str) -> int:
+        """Run one write plus an incremental purge of ``table``; return rowcount."""
+        with self._lock:
+            try:
+                cursor = self._conn.execute(sql, params)
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} WHERE expires_at < ? LIMIT ?)",
+                    (time.time(), _PURGE_BATCH),
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+            return cursor.rowcount
+
+    def _read(self, sql: str, params: tuple) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def save_authorization_code(self, code_data: AuthorizationCode) -> bool:
+        """Save authorization code"""
+        return (
+            self._write(
+                _INSERT_CODE,
+                self._code_row(code_data),
+                "oauth_codes",
+            )
+            > 0
+        )
+
+    def get_authorization_code(self, code: str) -> AuthorizationCode | None:
+        """Get authorization code"""
+        row = self._read("SELECT data FROM oauth_codes WHERE code = ?", (code,))
+        if row is None:
+            return None
+
+        auth_code = AuthorizationCode.model_validate_json(row[0])
+        if auth_code.is_expired():
+            self.delete_authorization_code(code)
+            return None
+
+        return auth_code
+
+    def update_authorization_code(self, code: str, code_data: AuthorizationCode) -> bool:
+        """Update authorization code (e.g., mark as used)"""
+        return self.save_authorization_code(code_data)
+
+    def delete_authorization_code(self, code: str) -> bool:
+        """Delete authorization code"""
+        return self._write("DELETE FROM oauth_codes WHERE code = ?", (code,), "oauth_codes") > 0
+
+    def save_access_token(self, token_data: AccessToken) -> bool:
+        """Save access token"""
+        return (
+            self._write(
+                _INSERT_ACCESS,
+                self._access_row(token_data),
+                "oauth_access_tokens",
+            )
+            > 0
+        )
+
+    def get_access_token(self, token: str) -> AccessToken | None:
+        """Get access token"""
+        row = self._read("SELECT data FROM oauth_access_tokens WHERE token = ?", (token,))
+        if row is None:
+            return None
+
+        access_token = AccessToken.model_validate_json(row[0])
+        if access_token.is_expired():
+            self._write(
+                "DELETE FROM oauth_access_tokens WHERE token = ?", (token,), "oauth_access_tokens"
+            )
+            return None
+
+        return access_token
+
+    def save_refresh_token(self, token_data: RefreshToken) -> bool:
+        """Save refresh token"""
+        return (
+            self._write(
+                _INSERT_REFRESH,
+                self._refresh_row(token_data),
+                "oauth_refresh_tokens",
+            )
+            > 0
+        )
+
+    def get_refresh_token(self, token: str, include_revoked: bool = False) -> RefreshToken | None:
+        """Get refresh token.
+
+        Args:
+            token: Refresh token string
+            include_revoked: If True, return revoked tokens (for reuse detection)
+        """
+        row = self._read("SELECT data, revoked FROM oauth_refresh_tokens WHERE token = ?", (token,))
+        if row is None:
+            return None
+
+        refresh_token = RefreshToken.model_validate_json(row[0])
+        refresh_token.revoked = bool(row[1])
+
+        if refresh_token.is_expired():
+            return None
+
+        if refresh_token.revoked and not include_revoked:
+            return None
+
+        return refresh_token
+
+    def revoke_refresh_token(self, token: str) -> bool:
+        """Revoke refresh token (``sqlite3.Error`` propagates)"""
+        return (
+            self._write_or_raise(
+                "UPDATE oauth_refresh_tokens SET revoked = 1 WHERE token = ? AND revoked = 0",
+                (token,),
+                "oauth_refresh_tokens",
+            )
+            > 0
+        )
+
+    def revoke_client_refresh_tokens(self, client_id: str) -> int:
+        """Revoke all refresh tokens of a client (a full scan; only run on token reuse)"""
+        return self._write(
+            "UPDATE oauth_refresh_tokens SET revoked = 1 "
+            "WHERE revoked = 0 AND json_extract(data, '$.client_id') = ?",
+            (client_id,),
+            "oauth_refresh_tokens",
+        )
+
+    def cleanup_expired(self):
+        """Delete every expired row (indexed range delete)."""
+        now = time.time()
+        with self._lock:
+            counts = {
+                table: self._conn.execute(
+                    f"DELETE FROM {table} WHERE expires_at < ?", (now,)
+                ).rowcount
+                for table in _TABLES
+            }
+            self._conn.commit()
+
+        logger.info(f"Cleaned up expired OAuth records: {counts}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 def get_storage() -> BaseStorage:
     """
     Get storage instance based on environment.
 
     Environment Variables:
-        OAUTH_STORAGE_TYPE: "json" (default) | "redis"
-        OAUTH_STORAGE_PATH: Path for JSON files (default: /app/data)
+        OAUTH_STORAGE_TYPE: "sqlite" (default) | "json" | "redis"
+        OAUTH_STORAGE_PATH: Directory for the database / JSON files (default: /app/data)
     """
-    storage_type = os.getenv("OAUTH_STORAGE_TYPE", "json")
+    storage_type = os.getenv("OAUTH_STORAGE_TYPE", "sqlite")
+
+    if storage_type == "sqlite":
+        storage_path = os.getenv("OAUTH_STORAGE_PATH", _DEFAULT_DATA_DIR)
+        return SQLiteStorage(storage_path)
 
-    if storage_type == "json":
+    elif storage_type == "json":
         storage_path = os.getenv("OAUTH_STORAGE_PATH", _DEFAULT_DATA_DIR)
         return JSONStorage(storage_path)
 
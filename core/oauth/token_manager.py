@@ -8,7 +8,7 @@ import os
 import secrets
 import time
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, NoReturn
 
 import jwt
 
@@ -209,6 +209,7 @@ class TokenManager:
         Raises:
             ValueError: Invalid/expired refresh token
             SecurityError: Refresh token reuse detected
+            sqlite3.Error / OSError: The storage could not revoke the old token
         """
         # Get refresh token (include revoked for reuse detection)
         token_data = self.storage.get_refresh_token(refresh_token, include_revoked=True)
@@ -218,33 +219,22 @@ class TokenManager:
 
         # Check if revoked (reuse detection!)
         if token_data.revoked:
-            logger.critical(
-                f"Refresh token reuse detected for client {client_id}! "
-                f"Revoking all tokens for this client."
-            )
-
-            # Log security event
-            try:
-                from core.audit_log import LogLevel, get_audit_logger
-
-                audit_logger = get_audit_logger()
-                audit_logger.log_system_event(
-                    event=f"SECURITY: Refresh token reuse detected: {client_id}",
-                    details={"client_id": client_id, "token": refresh_token[:20] + "..."},
-                    level=LogLevel.CRITICAL,
-                )
-            except (ImportError, Exception):
-                # Audit logging not available or failed
-                pass
-
-            # Revoke all tokens for this client (TODO: implement)
-            # For now, just raise error
-            raise SecurityError("Refresh token reuse detected - all tokens revoked")
+            self._raise_reuse(refresh_token, token_data.client_id)
 
         # Validate client_id match
         if token_data.client_id != client_id:
             raise ValueError("Client ID mismatch")
 
+        # Revoke old refresh token before issuing new ones. Revocation only
+        # succeeds once, so a concurrent rotation of the same token is
+        # treated as reuse instead of minting two token pairs. Storage errors
+        # propagate from revoke_refresh_token and never count as reuse.
+        if not self.storage.revoke_refresh_token(refresh_token):
+            current = self.storage.get_refresh_token(refresh_token, include_revoked=True)
+            if current is not None and current.revoked:
+                self._raise_reuse(refresh_token, token_data.client_id)
+            raise ValueError("Invalid or expired refresh token")
+
         # Get scope from old access token (if available)
         scope = "read"  # Default
         if token_data.access_token:
@@ -266,9 +256,6 @@ class TokenManager:
             client_id=client_id, access_token=new_access_token
         )
 
-        # Revoke old refresh token
-        self.storage.revoke_refresh_token(refresh_token)
-
         # Increment rotation count
         token_data.rotation_count += 1
 
@@ -299,6 +286,38 @@ class TokenManager:
             "scope": scope,
         }
 
+    def _raise_reuse(self, refresh_token: str, client_id: str) -> NoReturn:
+        """Revoke the client's refresh tokens, log the reuse and raise :class:`SecurityError`.
+
+        ``client_id`` is the client the reused token was issued to. Access
+        tokens are stateless JWTs and stay valid until they expire.
+        """
+        revoked = self.storage.revoke_client_refresh_tokens(client_id)
+        logger.critical(
+            f"Refresh token reuse detected for client {client_id}! "
+            f"Revoked {revoked} refresh tokens for this client."
+        )
+
+        # Log security event
+        try:
+            from core.audit_log import LogLevel, get_audit_logger
+
+            audit_logger = get_audit_logger()
+            audit_logger.log_system_event(
+                event=f"SECURITY: Refresh token reuse detected: {client_id}",
+                details={
+                    "client_id": client_id,
+                    "token": refresh_token[:20] + "...",
+                    "revoked_refresh_tokens": revoked,
+                },
+                level=LogLevel.CRITICAL,
+            )
+        except (ImportError, Exception):
+            # Audit logging not available or failed
+            pass
+
+        raise SecurityError("Refresh token reuse detected - client refresh tokens revoked")
+
     def revoke_token(self, token: str, token_type: str = "refresh"):
         """
         Revoke token.
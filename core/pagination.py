@@ -0,0 +1,177 @@
+"""Auto-pagination for plugin API clients.
+
+List tools used to return one page and leave paging to the agent, so "all
+products" meant dozens of sequential round-trips through the LLM. Each
+client now exposes an async iterator that knows its API's paging protocol
+and is built on the two primitives here:
+
+- :func:`iter_numbered` for page-number (or offset) APIs. The first page is
+  fetched alone; once it reveals the total (``X-WP-TotalPages``,
+  ``X-Total-Count``, ``Content-Range``) the remaining pages are fetched
+  concurrently, at most ``MCPHUB_PAGINATION_CONCURRENCY`` at a time
+  (default 4), and yielded in order. Without a total, pages are fetched one
+  by one until a short page.
+- :func:`iter_cursor` for cursor APIs (n8n ``nextCursor``), which are
+  inherently sequential.
+
+:func:`collect` drains an iterator into one tool response, stopping at
+``max_items`` or once the JSON-encoded items exceed ``max_bytes``
+(``MCPHUB_PAGINATION_MAX_BYTES``, default 512 KiB), and stops fetching as
+soon as either budget is hit.
+
+Usage::
+
+    from core.pagination import collect
+
+    result = await collect(client.iter_items("posts"), max_items=500)
+    # {"items": [...], "count": 500, "truncated": True, "truncated_reason": "max_items"}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+MAX_CONCURRENCY = int(os.environ.get("MCPHUB_PAGINATION_CONCURRENCY", "4"))
+MAX_ITEMS = int(os.environ.get("MCPHUB_PAGINATION_MAX_ITEMS", "1000"))
+MAX_BYTES = int(os.environ.get("MCPHUB_PAGINATION_MAX_BYTES", str(512 * 1024)))
+
+
+def fetch_all_properties() -> dict[str, Any]:
+    """JSON-schema properties added to list tools that support ``fetch_all``."""
+    return {
+        "fetch_all": {
+            "type": "boolean",
+            "description": "Fetch every page and return all results in one response "
+            "(page/cursor arguments are ignored). Stops at max_items or the response "
+            "size budget; check 'truncated' in the result.",
+            "default": False,
+        },
+        "max_items": {
+            "anyOf": [{"type": "integer", "minimum": 1}, {"type": "null"}],
+            "description": f"With fetch_all: maximum items to return (default {MAX_ITEMS})",
+        },
+    }
+
+
+@dataclass
+class Page:
+    """One fetched page and whatever it reveals about the rest."""
+
+    items: list[Any]
+    total_pages: int | None = None
+    next_cursor: str | None = None
+
+
+def pages_for(total_items: int | str | None, per_page: int) -> int | None:
+    """Page count for a total item count header value (None if unknown)."""
+    try:
+        total = int(total_items)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return max(1, math.ceil(total / per_page)) if total >= 0 else None
+
+
+async def iter_numbered(
+    fetch: Callable[[int], Awaitable[Page]],
+    *,
+    per_page: int,
+    concurrency: int = MAX_CONCURRENCY,
+) -> AsyncIterator[Any]:
+    """Yield items from a 1-based page-number API.
+
+    Args:
+        fetch: Returns page ``n``; ``total_pages`` should be set when known
+        per_page: Requested page size (a shorter page ends an unknown total)
+        concurrency: Max pages in flight once the total is known
+    """
+    first = await fetch(1)
+    for item in first.items:
+        yield item
+
+    if first.total_pages is None:
+        page, items = 1, first.items
+        while len(items) >= per_page:
+            page += 1
+            items = (await fetch(page)).items
+            for item in items:
+                yield item
+        return
+
+    # Total known: keep up to ``concurrency`` pages in flight, yield in order
+    pending = iter(range(2, first.total_pages + 1))
+    in_flight: deque[asyncio.Task[Page]] = deque()
+    try:
+        for page in pending:
+            in_flight.append(asyncio.ensure_future(fetch(page)))
+            if len(in_flight) >= max(1, concurrency):
+                break
+        while in_flight:
+            result = await in_flight.popleft()
+            next_page = next(pending, None)
+            if next_page is not None:
+                in_flight.append(asyncio.ensure_future(fetch(next_page)))
+            for item in result.items:
+                yield item
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+async def iter_cursor(
+    fetch: Callable[[str | None], Awaitable[Page]],
+) -> AsyncIterator[Any]:
+    """Yield items from a cursor API until ``next_cursor`` is empty."""
+    cursor: str | None = None
+    while True:
+        page = await fetch(cursor)
+        for item in page.items:
+            yield item
+        if not page.next_cursor or page.next_cursor == cursor:
+            return
+        cursor = page.next_cursor
+
+
+async def collect(
+    items: AsyncIterator[Any],
+    *,
+    max_items: int | None = MAX_ITEMS,
+    max_bytes: int | None = MAX_BYTES,
+    transform: Callable[[Any], Any] | None = None,
+) -> dict[str, Any]:
+    """Drain ``items`` into a response dict within an item and byte budget.
+
+    ``transform`` is applied to each item before it is measured, so the
+    budget counts what the tool actually returns.
+    """
+    out: list[Any] = []
+    size = 0
+    reason: str | None = None
+    try:
+        async for raw in items:
+            if max_items is not None and len(out) >= max_items:
+                reason = "max_items"
+                break
+            item = transform(raw) if transform else raw
+            item_size = len(json.dumps(item, default=str))
+            if max_bytes is not None and out and size + item_size > max_bytes:
+                reason = "max_bytes"
+                break
+            out.append(item)
+            size += item_size
+    finally:
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return {
+        "items": out,
+        "count": len(out),
+        "truncated": reason is not None,
+        "truncated_reason": reason,
+    }
@@ -0,0 +1,164 @@
+"""Reusable plugin-instance cache.
+
+Tool calls used to build a fresh plugin for every request. For WordPress
+that means ~20 handler objects, an auth header, a site-id hash and an INFO
+log line per call, and per-instance caches such as
+``WPCLIManager.wp_cli_available`` never survived between calls.
+
+This module keeps a bounded LRU of live plugin instances keyed by
+``(plugin_type, site_id, credential fingerprint)``. The fingerprint is a
+SHA-256 over the full config dict, so a credential or URL change always
+misses and builds a new instance; explicit invalidation
+(:meth:`PluginInstanceCache.invalidate_site`) drops stale entries as soon
+as a site is updated or deleted (in every worker, via
+:mod:`core.shared_state`). Entries idle for longer than the idle TTL
+are evicted on the next access.
+
+Usage::
+
+    from core.plugin_cache import get_plugin_instance_cache
+
+    plugin = get_plugin_instance_cache().get_or_create(
+        plugin_type, site_id, config_dict, lambda: plugin_class(config_dict)
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from core.shared_state import subscribe_invalidation
+
+logger = logging.getLogger(__name__)
+
+
+# --- Config ----------------------------------------------------------------
+
+MAX_INSTANCES = int(os.environ.get("MCPHUB_PLUGIN_CACHE_SIZE", "256"))
+IDLE_TTL_SECONDS = float(os.environ.get("MCPHUB_PLUGIN_CACHE_IDLE_SEC", "900"))
+
+
+def config_fingerprint(config: dict[str, Any]) -> str:
+    """Stable SHA-256 over a plugin config dict (never logged or returned)."""
+    payload = json.dumps(config, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PluginInstanceCache:
+    """Bounded LRU of plugin instances with idle eviction."""
+
+    def __init__(
+        self,
+        max_size: int = MAX_INSTANCES,
+        idle_ttl: float = IDLE_TTL_SECONDS,
+    ) -> None:
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        # key -> (instance, last_used)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(
+        self,
+        plugin_type: str,
+        site_id: str,
+        config: dict[str, Any],
+        factory: Callable[[], Any],
+    ) -> Any:
+        """Return the cached instance for this site/config, building it on a miss.
+
+        Exceptions from ``factory`` propagate and nothing is cached.
+        """
+        if self.max_size <= 0:
+            return factory()
+
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        key = (plugin_type, str(site_id), config_fingerprint(config))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], now)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        instance = factory()
+        self._entries[key] = (instance, now)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return instance
+
+    def invalidate_site(self, site_id: str) -> int:
+        """Drop every cached instance for ``site_id`` (any plugin type/config)."""
+        site_id = str(site_id)
+        stale = [key for key in self._entries if key[1] == site_id]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug("Invalidated %d plugin instance(s) for site %s", len(stale), site_id)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "idle_ttl": self.idle_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_idle(self, now: float) -> None:
+        # Entries are kept in least-recently-used order, so idle ones are
+        # always at the front.
+        cutoff = now - self.idle_ttl
+        while self._entries:
+            key, (_, last_used) = next(iter(self._entries.items()))
+            if last_used >= cutoff:
+                break
+            del self._entries[key]
+            self.evictions += 1
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_cache: PluginInstanceCache | None = None
+
+
+def get_plugin_instance_cache() -> PluginInstanceCache:
+    global _cache
+    if _cache is None:
+        _cache = PluginInstanceCache()
+    return _cache
+
+
+def set_plugin_instance_cache(cache: PluginInstanceCache | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _cache
+    _cache = cache
+
+
+def _on_site_invalidated(site_id: str) -> None:
+    if _cache is not None:
+        _cache.invalidate_site(site_id)
+
+
+subscribe_invalidation("plugin_instances", _on_site_invalidated)
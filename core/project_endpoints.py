@@ -0,0 +1,268 @@
+"""Lazily materialized per-project MCP endpoints.
+
+Every discovered site gets a ``/project/{alias}/mcp`` endpoint with its
+plugin's tools locked to that site. Building one means a ``FastMCP``
+instance, a wrapper per tool and an HTTP sub-app with its own session
+manager — for 40 WordPress sites that is thousands of tool objects before
+the server accepts traffic, most of them for endpoints nobody calls.
+
+:class:`LazyProjectEndpoint` is mounted in place of the sub-app. It builds
+the app from a factory on the first request, starts the app's lifespan in a
+task of its own (so the session manager's task group is entered and exited
+by the same task), and serves requests from then on. Endpoints with no
+request in flight for ``MCPHUB_PROJECT_ENDPOINT_IDLE_SEC`` seconds (default
+1800, ``0`` keeps them forever) are closed by
+:class:`ProjectEndpointRegistry` and rebuilt on the next request; clients of
+an evicted endpoint re-initialize their MCP session.
+
+:func:`site_locked_schema` strips the ``site`` parameter from a tool's input
+schema once per tool and shares the result across every project of that
+plugin type.
+
+Usage::
+
+    from core.project_endpoints import LazyProjectEndpoint, get_project_endpoint_registry
+
+    registry = get_project_endpoint_registry()
+    endpoint = registry.add(LazyProjectEndpoint("wordpress_site1", build_app))
+    routes.append(Mount("/project/site1", app=endpoint))
+    ...
+    await registry.start()  # idle eviction; stop() closes every endpoint
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+IDLE_TTL_SECONDS = float(os.environ.get("MCPHUB_PROJECT_ENDPOINT_IDLE_SEC", "1800"))
+SWEEP_INTERVAL_SECONDS = 60.0
+
+
+# --- Shared schemas ----------------------------------------------------------
+
+# tool name -> (source schema, schema without ``site``)
+_site_locked_schemas: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+
+def site_locked_schema(tool_name: str, input_schema: dict[str, Any]) -> dict[str, Any]:
+    """Return ``input_schema`` without the ``site`` parameter.
+
+    Computed once per tool and shared by every project endpoint; nested
+    property schemas are shared with the registry. Callers must not mutate
+    the result.
+    """
+    cached = _site_locked_schemas.get(tool_name)
+    if cached is not None and cached[0] is input_schema:
+        return cached[1]
+    schema = dict(input_schema)
+    if "properties" in schema:
+        schema["properties"] = {k: v for k, v in schema["properties"].items() if k != "site"}
+    if "required" in schema:
+        schema["required"] = [name for name in schema["required"] if name != "site"]
+    _site_locked_schemas[tool_name] = (input_schema, schema)
+    return schema
+
+
+def clear_site_locked_schemas() -> None:
+    """Drop the shared schemas (for testing)."""
+    _site_locked_schemas.clear()
+
+
+# --- Lazy endpoint -----------------------------------------------------------
+
+
+def _lifespan_of(app: Any) -> Any:
+    """The lifespan context factory of a FastMCP / Starlette app, if any."""
+    handler = getattr(app, "lifespan_handler", None)
+    if handler:
+        return handler
+    router = getattr(app, "router", None)
+    return getattr(router, "lifespan_context", None)
+
+
+async def _hold_lifespan(app: Any, started: asyncio.Future, stop: asyncio.Event) -> None:
+    """Enter ``app``'s lifespan, report readiness, and exit it when ``stop`` is set."""
+    lifespan = _lifespan_of(app)
+    try:
+        async with lifespan(app) if lifespan else contextlib.nullcontext():
+            started.set_result(None)
+            await stop.wait()
+    except BaseException as e:
+        if not started.done():
+            started.set_exception(e)
+            return
+        raise
+
+
+class LazyProjectEndpoint:
+    """ASGI app that builds a project's MCP sub-app on first request."""
+
+    def __init__(self, project_id: str, factory: Callable[[], Any]) -> None:
+        self.project_id = project_id
+        self._factory = factory
+        self._app: Any = None
+        self._task: asyncio.Task | None = None
+        self._stop: asyncio.Event | None = None
+        self._lock = asyncio.Lock()
+        self.active_requests = 0
+        self.last_used = 0.0
+        self.materializations = 0
+
+    @property
+    def materialized(self) -> bool:
+        return self._app is not None
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            return  # Started on first request instead
+        app = self._app or await self.materialize()
+        self.active_requests += 1
+        self.last_used = time.monotonic()
+        try:
+            await app(scope, receive, send)
+        finally:
+            self.active_requests -= 1
+            self.last_used = time.monotonic()
+
+    async def materialize(self) -> Any:
+        """Build the sub-app and start its lifespan (no-op if already built)."""
+        async with self._lock:
+            if self._app is not None:
+                return self._app
+            began = time.perf_counter()
+            app = self._factory()
+            started = asyncio.get_running_loop().create_future()
+            stop = asyncio.Event()
+            task = asyncio.create_task(
+                _hold_lifespan(app, started, stop), name=f"project-endpoint-{self.project_id}"
+            )
+            await started
+            self._app, self._task, self._stop = app, task, stop
+            self.last_used = time.monotonic()
+            self.materializations += 1
+            logger.info(
+                "Materialized project endpoint %s in %.1f ms",
+                self.project_id,
+                (time.perf_counter() - began) * 1000,
+            )
+            return app
+
+    async def close(self) -> bool:
+        """Stop the sub-app's lifespan and drop it. Returns False if not built."""
+        async with self._lock:
+            if self._app is None:
+                return False
+            task, stop = self._task, self._stop
+            self._app = self._task = self._stop = None
+            stop.set()
+            try:
+                await task
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Error closing project endpoint %s: %s", self.project_id, e)
+            return True
+
+    def is_idle(self, now: float, idle_ttl: float) -> bool:
+        return (
+            self._app is not None and self.active_requests == 0 and now - self.last_used >= idle_ttl
+        )
+
+
+# --- Registry ----------------------------------------------------------------
+
+
+class ProjectEndpointRegistry:
+    """Tracks lazy project endpoints and evicts idle ones. Register in server lifespan."""
+
+    def __init__(
+        self,
+        idle_ttl: float = IDLE_TTL_SECONDS,
+        sweep_interval: float = SWEEP_INTERVAL_SECONDS,
+    ) -> None:
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self._endpoints: dict[str, LazyProjectEndpoint] = {}
+        self._task: asyncio.Task | None = None
+        self.evictions = 0
+
+    def add(self, endpoint: LazyProjectEndpoint) -> LazyProjectEndpoint:
+        self._endpoints[endpoint.project_id] = endpoint
+        return endpoint
+
+    def get(self, project_id: str) -> LazyProjectEndpoint | None:
+        return self._endpoints.get(project_id)
+
+    async def evict_idle(self) -> int:
+        """Close endpoints idle for longer than ``idle_ttl``."""
+        if self.idle_ttl <= 0:
+            return 0
+        now = time.monotonic()
+        evicted = 0
+        for endpoint in list(self._endpoints.values()):
+            if endpoint.is_idle(now, self.idle_ttl) and await endpoint.close():
+                evicted += 1
+        if evicted:
+            self.evictions += evicted
+            logger.info("Evicted %d idle project endpoint(s)", evicted)
+        return evicted
+
+    async def start(self) -> None:
+        if self._task is not None or self.idle_ttl <= 0:
+            return
+        self._task = asyncio.create_task(self._run(), name="project-endpoint-eviction")
+
+    async def stop(self) -> None:
+        """Stop eviction and close every materialized endpoint."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        for endpoint in self._endpoints.values():
+            await endpoint.close()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Project endpoint eviction error: %s", e)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "registered": len(self._endpoints),
+            "materialized": sum(1 for e in self._endpoints.values() if e.materialized),
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_registry: ProjectEndpointRegistry | None = None
+
+
+def get_project_endpoint_registry() -> ProjectEndpointRegistry:
+    global _registry
+    if _registry is None:
+        _registry = ProjectEndpointRegistry()
+    return _registry
+
+
+def set_project_endpoint_registry(registry: ProjectEndpointRegistry | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _registry
+    _registry = registry
@@ -1,29 +1,59 @@
 """
 Rate Limiting & Throttling for MCP Server (Phase 7.3)
 
-This module implements Token Bucket-based rate limiting to prevent API abuse
-and ensure fair resource usage across all MCP clients.
+This module implements sliding-window-counter rate limiting to prevent API
+abuse and ensure fair resource usage across all MCP clients.
 
 Features:
 - Multi-level rate limits (per minute, hour, day)
-- Per-client tracking with token bucket algorithm
+- Per-client tracking with O(1) state per window (two counters)
+- Clients keyed by a hash of their token, never the raw token
+- Idle clients evicted on a schedule, plus a hard cap on tracked clients
 - Configurable limits per plugin type
 - Statistics and monitoring capabilities
+- Counters shared across worker processes in multi-worker mode
+  (see :mod:`core.shared_state`)
 - Integration with audit logging
 
 Author: Phase 7.3 Implementation
 Date: 2025-01-11
 """
 
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.shared_state import SharedState
 
 logger = logging.getLogger(__name__)
 
+# Idle clients are swept at most this often (seconds).
+SWEEP_INTERVAL_SECONDS = float(os.getenv("RATE_LIMIT_SWEEP_INTERVAL_SEC", "60"))
+# Hard cap on tracked clients; the least recently seen are dropped first.
+MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "100000"))
+
+
+# Rejection reason per window, most restrictive first.
+_WINDOW_MESSAGES = (
+    "Rate limit exceeded: too many requests per minute",
+    "Rate limit exceeded: too many requests per hour",
+    "Rate limit exceeded: daily limit reached",
+)
+
+
+def client_key(client_id: str) -> str:
+    """Return the rate-limit key for a client identifier (e.g. bearer token).
+
+    Only a truncated SHA-256 digest is kept in memory, stats and logs.
+    """
+    return "c_" + hashlib.sha256(client_id.encode("utf-8")).hexdigest()[:16]
+
 
 @dataclass
 class RateLimitConfig:
@@ -112,15 +142,89 @@ class TokenBucket:
         tokens_needed = tokens - self.tokens
         return tokens_needed / self.refill_rate
 
+    def refund(self, tokens: int = 1) -> None:
+        """Return tokens consumed by a request that was rejected later."""
+        self.tokens = min(self.capacity, self.tokens + tokens)
+
+    def is_idle(self) -> bool:
+        """True when the bucket is full, i.e. indistinguishable from a new one."""
+        self.refill()
+        return self.tokens >= self.capacity
+
+
+@dataclass(slots=True)
+class SlidingWindowCounter:
+    """
+    Sliding-window-counter limiter for one time window.
+
+    Keeps the request count of the current and previous fixed window and
+    estimates the rolling count as ``previous * overlap + current``. State
+    is O(1) regardless of request rate. Same interface as
+    :class:`TokenBucket`.
+    """
+
+    capacity: int
+    window: float  # seconds
+    current: int = 0
+    previous: int = 0
+    window_start: float = field(default_factory=time.time)
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self.window_start
+        if elapsed < self.window:
+            return
+        periods = int(elapsed // self.window)
+        self.previous = self.current if periods == 1 else 0
+        self.current = 0
+        self.window_start += periods * self.window
+
+    def _estimate(self, now: float) -> float:
+        self._roll(now)
+        overlap = 1.0 - (now - self.window_start) / self.window
+        return self.previous * overlap + self.current
+
+    def consume(self, tokens: int = 1) -> bool:
+        """Count a request if it fits under the limit."""
+        if self._estimate(time.time()) + tokens > self.capacity:
+            return False
+        self.current += tokens
+        return True
+
+    def refund(self, tokens: int = 1) -> None:
+        """Un-count a request that was rejected by another window."""
+        self.current = max(0, self.current - tokens)
+
+    def get_available_tokens(self) -> int:
+        """Requests still allowed in the rolling window."""
+        return max(0, int(self.capacity - self._estimate(time.time())))
+
+    def get_wait_time(self, tokens: int = 1) -> float:
+        """Seconds until ``tokens`` more requests would be allowed."""
+        now = time.time()
+        if self._estimate(now) + tokens <= self.capacity:
+            return 0.0
+        window_end = self.window_start + self.window
+        room = self.capacity - tokens - self.current
+        if room < 0 or self.previous == 0:
+            # Not before the next window starts.
+            return window_end - now
+        # Wait until the previous window's weight has decayed enough.
+        overlap_needed = room / self.previous
+        return max(0.0, self.window_start + self.window * (1.0 - overlap_needed) - now)
+
+    def is_idle(self) -> bool:
+        """True once both windows are empty (state equals a fresh counter)."""
+        return self._estimate(time.time()) == 0
+
 
 @dataclass
 class ClientRateLimitState:
     """Track rate limit state for a single client."""
 
     client_id: str
-    minute_bucket: TokenBucket
-    hour_bucket: TokenBucket
-    day_bucket: TokenBucket
+    minute_bucket: TokenBucket | SlidingWindowCounter
+    hour_bucket: TokenBucket | SlidingWindowCounter
+    day_bucket: TokenBucket | SlidingWindowCounter
     total_requests: int = 0
     rejected_requests: int = 0
     last_request_time: float = field(default_factory=time.time)
@@ -137,32 +241,42 @@ class ClientRateLimitState:
         if not self.minute_bucket.consume():
             wait_time = self.minute_bucket.get_wait_time()
             self.rejected_requests += 1
-            return False, "Rate limit exceeded: too many requests per minute", wait_time
+            return False, _WINDOW_MESSAGES[0], wait_time
 
         if not self.hour_bucket.consume():
             wait_time = self.hour_bucket.get_wait_time()
             # Refund the minute token since we're rejecting
-            self.minute_bucket.tokens = min(
-                self.minute_bucket.capacity, self.minute_bucket.tokens + 1
-            )
+            self.minute_bucket.refund()
             self.rejected_requests += 1
-            return False, "Rate limit exceeded: too many requests per hour", wait_time
+            return False, _WINDOW_MESSAGES[1], wait_time
 
         if not self.day_bucket.consume():
             wait_time = self.day_bucket.get_wait_time()
             # Refund tokens since we're rejecting
-            self.minute_bucket.tokens = min(
-                self.minute_bucket.capacity, self.minute_bucket.tokens + 1
-            )
-            self.hour_bucket.tokens = min(self.hour_bucket.capacity, self.hour_bucket.tokens + 1)
+            self.minute_bucket.refund()
+            self.hour_bucket.refund()
             self.rejected_requests += 1
-            return False, "Rate limit exceeded: daily limit reached", wait_time
+            return False, _WINDOW_MESSAGES[2], wait_time
 
         # All checks passed
         self.total_requests += 1
         self.last_request_time = time.time()
         return True, "", 0.0
 
+    def is_idle(self) -> bool:
+        """True when every window is back to its initial state."""
+        return (
+            self.minute_bucket.is_idle()
+            and self.hour_bucket.is_idle()
+            and self.day_bucket.is_idle()
+        )
+
+    def apply_config(self, config: RateLimitConfig) -> None:
+        """Update window limits in place (counts are kept)."""
+        self.minute_bucket.capacity = config.per_minute
+        self.hour_bucket.capacity = config.per_hour
+        self.day_bucket.capacity = config.per_day
+
     def get_stats(self) -> dict[str, Any]:
         """Get statistics for this client."""
         now = time.time()
@@ -192,17 +306,44 @@ class ClientRateLimitState:
         }
 
 
+def _window_limits(state: ClientRateLimitState) -> list[tuple[int, float]]:
+    """``(capacity, window)`` of the client's minute, hour and day windows."""
+    windows = (state.minute_bucket, state.hour_bucket, state.day_bucket)
+    return [(w.capacity, w.window) for w in windows]
+
+
 class RateLimiter:
     """
-    Rate limiter using Token Bucket algorithm.
+    Rate limiter using sliding-window counters.
 
     Provides multi-level rate limiting (per minute, hour, day) with
-    per-client tracking and configurable limits.
+    per-client tracking and configurable limits. Client identifiers are
+    hashed with :func:`client_key`; clients whose windows have fully
+    drained are evicted every ``sweep_interval`` seconds, and at most
+    ``max_clients`` are tracked.
+
+    In multi-worker mode the window counts live in the shared store
+    (:func:`core.shared_state.get_shared_state`) under ``namespace`` so all
+    workers enforce one limit; local state then mirrors the shared counts
+    for statistics.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        sweep_interval: float = SWEEP_INTERVAL_SECONDS,
+        max_clients: int = MAX_CLIENTS,
+        namespace: str = "mcp",
+        shared: "SharedState | None" = None,
+    ):
         """Initialize rate limiter with default configuration."""
-        self.clients: dict[str, ClientRateLimitState] = {}
+        from core.shared_state import get_shared_state
+
+        self.namespace = namespace
+        self.shared = shared if shared is not None else get_shared_state()
+        self.clients: OrderedDict[str, ClientRateLimitState] = OrderedDict()
+        self.sweep_interval = sweep_interval
+        self.max_clients = max_clients
+        self._next_sweep = time.time() + sweep_interval
         self.global_stats = {"total_requests": 0, "total_rejected": 0, "start_time": time.time()}
 
         # Load default configuration from environment
@@ -221,89 +362,195 @@ class RateLimiter:
             f"{self.default_config.per_day}/day"
         )
 
+    def _resolve_key(self, client_id: str) -> str:
+        """Accept either a raw client identifier or an already-hashed key."""
+        return client_id if client_id in self.clients else client_key(client_id)
+
     def _get_or_create_client_state(
-        self, client_id: str, plugin_type: str | None = None
+        self,
+        key: str,
+        plugin_type: str | None = None,
+        config: RateLimitConfig | None = None,
+        now: float | None = None,
     ) -> ClientRateLimitState:
-        """Get or create rate limit state for a client."""
-        if client_id not in self.clients:
-            # Determine which config to use
+        """Get or create rate limit state for a hashed client key."""
+        state = self.clients.get(key)
+        if state is not None:
+            self.clients.move_to_end(key)
+            if config is not None:
+                state.apply_config(config)
+            return state
+
+        # Determine which config to use
+        if config is None:
             config = self.plugin_configs.get(plugin_type, self.default_config)
 
-            # Create token buckets for each time window
-            minute_bucket = TokenBucket(
-                capacity=config.per_minute,
-                refill_rate=config.per_minute / 60.0,  # tokens per second
-            )
-            hour_bucket = TokenBucket(
-                capacity=config.per_hour, refill_rate=config.per_hour / 3600.0
-            )
-            day_bucket = TokenBucket(capacity=config.per_day, refill_rate=config.per_day / 86400.0)
+        start = time.time() if now is None else now
+        state = ClientRateLimitState(
+            client_id=key,
+            minute_bucket=SlidingWindowCounter(config.per_minute, 60.0, window_start=start),
+            hour_bucket=SlidingWindowCounter(config.per_hour, 3600.0, window_start=start),
+            day_bucket=SlidingWindowCounter(config.per_day, 86400.0, window_start=start),
+        )
+        self.clients[key] = state
+        while len(self.clients) > self.max_clients:
+            self.clients.popitem(last=False)
 
-            self.clients[client_id] = ClientRateLimitState(
-                client_id=client_id,
-                minute_bucket=minute_bucket,
-                hour_bucket=hour_bucket,
-                day_bucket=day_bucket,
-            )
+        logger.debug(f"Created rate limit state for client: {key}")
+        return state
+
+    def evict_idle(self) -> int:
+        """
+        Drop clients whose windows have fully drained.
 
-            logger.debug(f"Created rate limit state for client: {client_id}")
+        Such state is identical to a fresh client, so eviction never
+        loosens a limit.
 
-        return self.clients[client_id]
+        Returns:
+            Number of clients evicted
+        """
+        idle = [key for key, state in self.clients.items() if state.is_idle()]
+        for key in idle:
+            del self.clients[key]
+        if idle:
+            logger.debug(f"Evicted {len(idle)} idle rate limit clients")
+        return len(idle)
 
     def check_rate_limit(
-        self, client_id: str, tool_name: str | None = None, plugin_type: str | None = None
+        self,
+        client_id: str,
+        tool_name: str | None = None,
+        plugin_type: str | None = None,
+        config: RateLimitConfig | None = None,
     ) -> tuple[bool, str, float]:
         """
         Check if request should be allowed based on rate limits.
 
         Args:
-            client_id: Identifier for the client (e.g., auth token hash)
+            client_id: Identifier for the client (e.g., auth token); hashed
+                before use
             tool_name: Name of the tool being called (for logging)
             plugin_type: Type of plugin (wordpress, woocommerce, etc.)
+            config: Explicit limits for this client, overriding the plugin
+                and default configs (applied to existing state as well)
 
         Returns:
             Tuple of (allowed, message, retry_after_seconds)
         """
-        # Get or create client state
-        client_state = self._get_or_create_client_state(client_id, plugin_type)
+        key, client_state = self._begin_check(client_id, plugin_type, config)
+
+        # Check and consume tokens
+        if self.shared is not None:
+            windows = self.shared.consume_windows(
+                f"{self.namespace}:{key}", _window_limits(client_state)
+            )
+            result = self._apply_shared(client_state, *windows)
+        else:
+            result = client_state.check_and_consume()
+        return self._finish_check(key, client_state, tool_name, result)
+
+    async def check_rate_limit_async(
+        self,
+        client_id: str,
+        tool_name: str | None = None,
+        plugin_type: str | None = None,
+        config: RateLimitConfig | None = None,
+    ) -> tuple[bool, str, float]:
+        """
+        :meth:`check_rate_limit` for request handlers.
+
+        In multi-worker mode the shared-store transaction runs in a worker
+        thread (:meth:`core.shared_state.SharedState.consume_windows_async`)
+        instead of on the event loop.
+        """
+        key, client_state = self._begin_check(client_id, plugin_type, config)
+        if self.shared is not None:
+            windows = await self.shared.consume_windows_async(
+                f"{self.namespace}:{key}", _window_limits(client_state)
+            )
+            result = self._apply_shared(client_state, *windows)
+        else:
+            result = client_state.check_and_consume()
+        return self._finish_check(key, client_state, tool_name, result)
+
+    def _begin_check(
+        self, client_id: str, plugin_type: str | None, config: RateLimitConfig | None
+    ) -> tuple[str, ClientRateLimitState]:
+        """Sweep idle clients if due and return the client's key and state."""
+        now = time.time()
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_interval
+            self.evict_idle()
+
+        key = client_key(client_id)
+        client_state = self._get_or_create_client_state(key, plugin_type, config, now)
 
         # Update global stats
         self.global_stats["total_requests"] += 1
+        return key, client_state
 
-        # Check and consume tokens
-        allowed, message, retry_after = client_state.check_and_consume()
-
+    def _finish_check(
+        self,
+        key: str,
+        client_state: ClientRateLimitState,
+        tool_name: str | None,
+        result: tuple[bool, str, float],
+    ) -> tuple[bool, str, float]:
+        """Record and log the outcome of a check."""
+        allowed, message, retry_after = result
         if not allowed:
             # Track rejection
             client_state.rejected_requests += 1
             self.global_stats["total_rejected"] += 1
 
             logger.warning(
-                f"Rate limit exceeded for client {client_id[:8]}... "
+                f"Rate limit exceeded for client {key} "
                 f"(tool: {tool_name}, reason: {message}, "
                 f"retry_after: {retry_after:.1f}s)"
             )
         else:
-            logger.debug(
-                f"Rate limit check passed for client {client_id[:8]}... " f"(tool: {tool_name})"
-            )
+            logger.debug(f"Rate limit check passed for client {key} (tool: {tool_name})")
 
         return allowed, message, retry_after
 
+    def _apply_shared(
+        self,
+        state: ClientRateLimitState,
+        counters: list[SlidingWindowCounter],
+        rejected: int | None,
+    ) -> tuple[bool, str, float]:
+        """Mirror the cross-worker counters into ``state`` and turn them into a result."""
+        state.minute_bucket, state.hour_bucket, state.day_bucket = counters
+        if rejected is not None:
+            state.rejected_requests += 1
+            return False, _WINDOW_MESSAGES[rejected], counters[rejected].get_wait_time()
+        state.total_requests += 1
+        state.last_request_time = time.time()
+        return True, "", 0.0
+
+    def metrics_snapshot(self) -> dict[str, int]:
+        """Request counters of this process (summed across workers in stats)."""
+        return {
+            "total_requests": self.global_stats["total_requests"],
+            "total_rejected": self.global_stats["total_rejected"],
+            "active_clients": len(self.clients),
+        }
+
     def get_client_stats(self, client_id: str) -> dict[str, Any] | None:
         """
         Get statistics for a specific client.
 
         Args:
-            client_id: Client identifier
+            client_id: Client identifier or hashed key (as shown in stats)
 
         Returns:
             Client statistics or None if client not found
         """
-        if client_id not in self.clients:
+        state = self.clients.get(self._resolve_key(client_id))
+        if state is None:
             return None
 
-        return self.clients[client_id].get_stats()
+        return state.get_stats()
 
     def get_all_stats(self) -> dict[str, Any]:
         """Get global rate limiter statistics."""
@@ -315,16 +562,21 @@ class RateLimiter:
         for _client_id, client_state in self.clients.items():
             client_stats.append(client_state.get_stats())
 
+        totals: dict[str, Any] = self.metrics_snapshot()
+        if self.shared is not None:
+            totals = self.shared.aggregate_metrics("rate_limiter", totals)
+
         return {
             "global": {
-                "total_requests": self.global_stats["total_requests"],
-                "total_rejected": self.global_stats["total_rejected"],
+                "total_requests": totals["total_requests"],
+                "total_rejected": totals["total_rejected"],
                 "rejection_rate": (
-                    self.global_stats["total_rejected"] / self.global_stats["total_requests"]
-                    if self.global_stats["total_requests"] > 0
+                    totals["total_rejected"] / totals["total_requests"]
+                    if totals["total_requests"] > 0
                     else 0.0
                 ),
-                "active_clients": len(self.clients),
+                "active_clients": totals["active_clients"],
+                "workers": totals.get("workers", 1),
                 "uptime_seconds": uptime,
                 "start_time": datetime.fromtimestamp(
                     self.global_stats["start_time"], tz=UTC
@@ -351,14 +603,17 @@ class RateLimiter:
         Reset rate limit state for a specific client.
 
         Args:
-            client_id: Client identifier
+            client_id: Client identifier or hashed key (as shown in stats)
 
         Returns:
             True if client was reset, False if client not found
         """
-        if client_id in self.clients:
-            del self.clients[client_id]
-            logger.info(f"Reset rate limit state for client: {client_id}")
+        key = self._resolve_key(client_id)
+        if self.shared is not None:
+            self.shared.reset_windows(f"{self.namespace}:{key}")
+        if key in self.clients:
+            del self.clients[key]
+            logger.info(f"Reset rate limit state for client: {key}")
             return True
         return False
 
@@ -371,6 +626,8 @@ class RateLimiter:
         """
         count = len(self.clients)
         self.clients.clear()
+        if self.shared is not None:
+            self.shared.reset_windows(f"{self.namespace}:")
         self.global_stats = {"total_requests": 0, "total_rejected": 0, "start_time": time.time()}
         logger.info(f"Reset rate limit state for {count} clients")
         return count
@@ -0,0 +1,476 @@
+"""Cross-process state for multi-worker deployments.
+
+Rate-limit counters, cache invalidations and metrics normally live in
+process memory. That is fine with one uvicorn worker, but with ``--workers
+N`` every limit would be multiplied by N, a revoked key would stay cached in
+the other workers, and each worker would report only its own share of the
+traffic.
+
+When more than one worker is configured (``MCPHUB_WORKERS > 1``, or
+``MCPHUB_SHARED_STATE=true`` to force it) :func:`get_shared_state` returns a
+:class:`SharedState` backed by a small SQLite database in WAL mode
+(``data/shared_state.db``) that every worker on the host opens:
+
+- **Rate-limit windows** — :meth:`SharedState.consume_windows` runs the
+  same sliding-window-counter arithmetic as
+  :class:`core.rate_limiter.SlidingWindowCounter`, but reads and writes the
+  counters in one ``BEGIN IMMEDIATE`` transaction so concurrent workers
+  never double-spend a window.
+- **Invalidation events** — :func:`publish_invalidation` appends
+  ``(channel, key)`` to an event table. Other workers apply events through
+  the handlers registered with :func:`subscribe_invalidation` when they call
+  :func:`poll_invalidations` (throttled to ``MCPHUB_SHARED_POLL_SEC``,
+  default 0.5s, and run in the background by :class:`SharedStateTask`).
+- **Metrics** — each worker writes a counter snapshot per source;
+  :meth:`SharedState.aggregate_metrics` sums the fresh ones.
+
+Writes and reads use separate connections. In WAL mode a reader never
+waits for a writer, so :func:`poll_invalidations` and
+:meth:`SharedState.aggregate_metrics` can run on the event loop while
+another worker holds the write lock. Writes that happen on the loop are
+handed to threads: rate-limit checks via
+:meth:`SharedState.consume_windows_async`, :func:`publish_invalidation`
+via the default executor, and metrics and purging by
+:class:`SharedStateTask`.
+
+With a single worker nothing here is used and every call is a no-op.
+
+Usage::
+
+    from core.shared_state import publish_invalidation, subscribe_invalidation
+
+    subscribe_invalidation("user_key", lambda key_id: cache.purge(key_id))
+    ...
+    publish_invalidation("user_key", key_id)  # other workers purge too
+
+It is a separate database so the write lock held by ``BEGIN IMMEDIATE``
+never stalls writes to the main one, and a plain ``sqlite3`` connection
+because :meth:`core.rate_limiter.RateLimiter.check_rate_limit` and the
+invalidation handlers call it synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.rate_limiter import SlidingWindowCounter
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_DATA_DIR = "/app/data" if Path("/app").exists() else "./data"
+
+WORKERS = int(os.getenv("MCPHUB_WORKERS", "1"))
+POLL_INTERVAL_SECONDS = float(os.getenv("MCPHUB_SHARED_POLL_SEC", "0.5"))
+METRICS_INTERVAL_SECONDS = float(os.getenv("MCPHUB_SHARED_METRICS_SEC", "10"))
+# Invalidation events are kept long enough for a slow worker to catch up.
+EVENT_RETENTION_SECONDS = 300.0
+
+_SCHEMA_SQL = """\
+CREATE TABLE IF NOT EXISTS rate_windows (
+    key           TEXT NOT NULL,
+    window        REAL NOT NULL,
+    window_start  REAL NOT NULL,
+    current       INTEGER NOT NULL DEFAULT 0,
+    previous      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (key, window)
+);
+CREATE INDEX IF NOT EXISTS idx_rate_windows_start ON rate_windows(window_start);
+
+CREATE TABLE IF NOT EXISTS invalidations (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel     TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    origin      TEXT NOT NULL,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_invalidations_created ON invalidations(created_at);
+
+CREATE TABLE IF NOT EXISTS worker_metrics (
+    worker_id   TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    updated_at  REAL NOT NULL,
+    PRIMARY KEY (worker_id, source)
+);
+"""
+
+
+def shared_state_enabled() -> bool:
+    """True when workers must share limiter, cache and metrics state."""
+    forced = os.getenv("MCPHUB_SHARED_STATE", "").lower()
+    if forced in ("1", "true", "yes"):
+        return True
+    if forced in ("0", "false", "no"):
+        return False
+    return WORKERS > 1
+
+
+class SharedState:
+    """SQLite (WAL) store shared by all worker processes on one host."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        metrics_stale_after: float = METRICS_INTERVAL_SECONDS * 3,
+    ) -> None:
+        if db_path is None:
+            db_path = Path(_DEFAULT_DATA_DIR) / "shared_state.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self.metrics_stale_after = metrics_stale_after
+        self.worker_id = f"{os.getpid()}-{time.time_ns()}"
+        # Writes (which may wait for another worker's lock) and reads each
+        # get a connection and lock, so a read never queues behind a write.
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA_SQL)
+        self._read_lock = threading.Lock()
+        self._read_conn = self._connect()
+        # Start after existing events: a new worker has nothing stale to drop.
+        row = self._read_conn.execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()
+        self._last_event_id = row[0]
+        self._next_poll = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            str(self.db_path), timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+
+    # --- Rate-limit windows -------------------------------------------------
+
+    def consume_windows(
+        self, key: str, limits: Sequence[tuple[int, float]], tokens: int = 1
+    ) -> tuple[list[SlidingWindowCounter], int | None]:
+        """Count a request against every ``(capacity, window)`` of ``key``.
+
+        All windows are updated atomically: if one rejects, the others are
+        refunded, like :meth:`core.rate_limiter.ClientRateLimitState.check_and_consume`.
+
+        Returns:
+            ``(counters, rejected_index)`` — the counters as stored after the
+            call, and the index of the first window that rejected the
+            request (``None`` if it was allowed).
+        """
+        from core.rate_limiter import SlidingWindowCounter
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = {
+                    row[0]: row
+                    for row in self._conn.execute(
+                        "SELECT window, window_start, current, previous "
+                        "FROM rate_windows WHERE key = ?",
+                        (key,),
+                    )
+                }
+                counters = []
+                for capacity, window in limits:
+                    row = rows.get(float(window))
+                    if row is None:
+                        counter = SlidingWindowCounter(capacity, window, window_start=now)
+                    else:
+                        _, window_start, current, previous = row
+                        counter = SlidingWindowCounter(
+                            capacity, window, current, previous, window_start
+                        )
+                    counters.append(counter)
+
+                rejected: int | None = None
+                for index, counter in enumerate(counters):
+                    if not counter.consume(tokens):
+                        for earlier in counters[:index]:
+                            earlier.refund(tokens)
+                        rejected = index
+                        break
+
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO rate_windows "
+                    "(key, window, window_start, current, previous) VALUES (?, ?, ?, ?, ?)",
+                    [(key, c.window, c.window_start, c.current, c.previous) for c in counters],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return counters, rejected
+
+    async def consume_windows_async(
+        self, key: str, limits: Sequence[tuple[int, float]], tokens: int = 1
+    ) -> tuple[list[SlidingWindowCounter], int | None]:
+        """:meth:`consume_windows` in a worker thread.
+
+        ``BEGIN IMMEDIATE`` waits up to the 10s busy timeout while another
+        worker holds the write lock; request handlers use this variant so
+        that wait never stalls the event loop.
+        """
+        return await asyncio.to_thread(self.consume_windows, key, limits, tokens)
+
+    def reset_windows(self, prefix: str) -> int:
+        """Delete the counters of every key starting with ``prefix``."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM rate_windows WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+        return cursor.rowcount
+
+    # --- Invalidation events ------------------------------------------------
+
+    def publish(self, channel: str, key: str) -> None:
+        """Record an invalidation for the other workers (a write; may wait for the lock)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO invalidations (channel, key, origin, created_at) VALUES (?, ?, ?, ?)",
+                (channel, key, self.worker_id, time.time()),
+            )
+
+    def poll(self, force: bool = False) -> int:
+        """Apply invalidations published by other workers since the last poll.
+
+        Throttled to one query per ``poll_interval`` unless ``force``. Uses
+        the read connection, so it never waits for a write transaction.
+
+        Returns:
+            Number of events applied.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_poll:
+            return 0
+        self._next_poll = now + self.poll_interval
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                "SELECT id, channel, key, origin FROM invalidations WHERE id > ? ORDER BY id",
+                (self._last_event_id,),
+            ).fetchall()
+            if rows:
+                self._last_event_id = rows[-1][0]
+        applied = 0
+        for _, channel, key, origin in rows:
+            if origin == self.worker_id:
+                continue
+            _dispatch(channel, key)
+            applied += 1
+        return applied
+
+    # --- Metrics ------------------------------------------------------------
+
+    def put_metrics(self, source: str, payload: dict[str, Any]) -> None:
+        """Store this worker's counter snapshot for ``source``."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO worker_metrics (worker_id, source, payload, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.worker_id, source, json.dumps(payload), time.time()),
+            )
+
+    def aggregate_metrics(self, source: str, local: dict[str, Any]) -> dict[str, Any]:
+        """Sum numeric fields of ``source`` over all live workers.
+
+        ``local`` is this worker's current snapshot and is added to the
+        stored snapshots of the other workers, so the total always includes
+        up-to-date local numbers. Read-only: this worker's own snapshot is
+        written by :class:`SharedStateTask`. Snapshots older than
+        ``metrics_stale_after`` (exited workers) are ignored.
+
+        Returns:
+            Summed fields plus ``workers`` (number of snapshots included).
+        """
+        cutoff = time.time() - self.metrics_stale_after
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                "SELECT payload FROM worker_metrics "
+                "WHERE source = ? AND updated_at >= ? AND worker_id != ?",
+                (source, cutoff, self.worker_id),
+            ).fetchall()
+        totals: dict[str, Any] = {}
+        for snapshot in [local, *(json.loads(payload) for (payload,) in rows)]:
+            for name, value in snapshot.items():
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    totals[name] = totals.get(name, 0) + value
+        totals["workers"] = len(rows) + 1
+        return totals
+
+    # --- Maintenance --------------------------------------------------------
+
+    def purge(self) -> None:
+        """Drop drained rate windows, old events and stale metrics."""
+        now = time.time()
+        with self._lock:
+            # A window two periods old has no effect on the rolling estimate.
+            self._conn.execute(
+                "DELETE FROM rate_windows WHERE window_start + 2 * window <= ?", (now,)
+            )
+            self._conn.execute(
+                "DELETE FROM invalidations WHERE created_at < ?", (now - EVENT_RETENTION_SECONDS,)
+            )
+            self._conn.execute(
+                "DELETE FROM worker_metrics WHERE updated_at < ?",
+                (now - self.metrics_stale_after * 10,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        with self._read_lock:
+            self._read_conn.close()
+
+
+# --- Invalidation handlers ---------------------------------------------------
+
+_handlers: dict[str, list[Callable[[str], None]]] = {}
+
+
+def subscribe_invalidation(channel: str, handler: Callable[[str], None]) -> None:
+    """Run ``handler(key)`` when another worker publishes on ``channel``."""
+    _handlers.setdefault(channel, []).append(handler)
+
+
+def _dispatch(channel: str, key: str) -> None:
+    for handler in _handlers.get(channel, ()):
+        try:
+            handler(key)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Invalidation handler for %s failed: %s", channel, e)
+
+
+def publish_invalidation(channel: str, key: str) -> None:
+    """Tell other workers to drop cached state for ``key`` (no-op with one worker).
+
+    Called on the event loop, the write runs in the default executor so the
+    loop never waits for another worker's write lock.
+    """
+    state = get_shared_state()
+    if state is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _publish(state, channel, key)
+    else:
+        loop.run_in_executor(None, _publish, state, channel, key)
+
+
+def _publish(state: SharedState, channel: str, key: str) -> None:
+    try:
+        state.publish(channel, key)
+    except sqlite3.Error as e:
+        logger.warning("Failed to publish %s invalidation: %s", channel, e)
+
+
+def poll_invalidations() -> None:
+    """Apply pending invalidations from other workers (throttled, no-op with one worker)."""
+    state = get_shared_state()
+    if state is None:
+        return
+    try:
+        state.poll()
+    except sqlite3.Error as e:
+        logger.warning("Failed to poll invalidations: %s", e)
+
+
+# --- Background task ---------------------------------------------------------
+
+
+def _local_metrics() -> dict[str, dict[str, Any]]:
+    """This worker's counter snapshots by source (read on the event loop)."""
+    from core.health import get_health_monitor
+    from core.rate_limiter import get_rate_limiter
+
+    snapshots = {"rate_limiter": get_rate_limiter().metrics_snapshot()}
+    hm = get_health_monitor()
+    if hm is not None:
+        snapshots["health"] = hm.metrics_snapshot()
+    return snapshots
+
+
+def _store_metrics_and_purge(state: SharedState, snapshots: dict[str, dict[str, Any]]) -> None:
+    for source, payload in snapshots.items():
+        state.put_metrics(source, payload)
+    state.purge()
+
+
+class SharedStateTask:
+    """Polls invalidations and publishes metrics. Register in server lifespan.
+
+    Polling reads on the loop (handlers touch loop-owned caches); the
+    metrics writes and the purge run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        state: SharedState,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        metrics_interval: float = METRICS_INTERVAL_SECONDS,
+    ) -> None:
+        self.state = state
+        self.poll_interval = poll_interval
+        self.metrics_interval = metrics_interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="shared-state-sync")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        next_metrics = 0.0
+        while True:
+            try:
+                self.state.poll(force=True)
+                now = time.monotonic()
+                if now >= next_metrics:
+                    next_metrics = now + self.metrics_interval
+                    await asyncio.to_thread(_store_metrics_and_purge, self.state, _local_metrics())
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Shared state sync error: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+
+# --- Singleton ---------------------------------------------------------------
+
+_shared_state: SharedState | None = None
+_resolved = False
+
+
+def get_shared_state() -> SharedState | None:
+    """Return the shared store, or ``None`` when running a single worker."""
+    global _shared_state, _resolved
+    if not _resolved:
+        _resolved = True
+        if shared_state_enabled():
+            path = os.getenv("MCPHUB_SHARED_STATE_PATH") or None
+            _shared_state = SharedState(path)
+            logger.info("Shared worker state enabled at %s", _shared_state.db_path)
+    return _shared_state
+
+
+def set_shared_state(state: SharedState | None) -> None:
+    """Override the singleton (used by tests)."""
+    global _shared_state, _resolved
+    _shared_state = state
+    _resolved = True
@@ -17,6 +17,10 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
+from core.plugin_cache import get_plugin_instance_cache
+from core.shared_state import publish_invalidation
+
 logger = logging.getLogger(__name__)
 
 # Fallback used when the settings DB is unavailable at import time
@@ -449,7 +453,7 @@ async def validate_site_connection(
 
     try:
         timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             if method == "POST":
                 async with session.post(check_url, headers=headers) as resp:
                     status_code = resp.status
@@ -621,6 +625,20 @@ async def get_user_site(site_id: str, user_id: str) -> dict[str, Any] | None:
     return result
 
 
+def _invalidate_credentials(site_id: str) -> None:
+    """Drop cached derived keys / decrypted credentials for a site (in every worker)."""
+    from core.encryption import invalidate_credential_cache
+
+    invalidate_credential_cache(site_id)
+    publish_invalidation("credentials", site_id)
+
+
+def _invalidate_plugin_instances(site_id: str) -> None:
+    """Drop cached plugin instances for a site (in every worker)."""
+    get_plugin_instance_cache().invalidate_site(site_id)
+    publish_invalidation("plugin_instances", site_id)
+
+
 async def delete_user_site(site_id: str, user_id: str) -> bool:
     """Delete a user's site.
 
@@ -636,6 +654,8 @@ async def delete_user_site(site_id: str, user_id: str) -> bool:
     db = get_database()
     deleted = await db.delete_site(site_id, user_id)
     if deleted:
+        _invalidate_plugin_instances(site_id)
+        _invalidate_credentials(site_id)
         logger.info("Deleted site %s for user %s", site_id, user_id)
     return deleted
 
@@ -718,6 +738,8 @@ async def update_user_site(
     updated = await db.update_site_credentials(site_id, user_id, url, encrypted)
     if not updated:
         raise RuntimeError(f"Failed to update site {site_id}")
+    _invalidate_plugin_instances(site_id)
+    _invalidate_credentials(site_id)
 
     # Mark active after successful connection test
     status_msg = "Connection verified" if not skip_validation else "Updated (not tested)"
@@ -812,6 +834,7 @@ async def set_site_provider_key(
     )
 
     row = await db.upsert_site_provider_key(site_id, provider, ciphertext)
+    _invalidate_credentials(site_id)
     logger.info("Stored %s provider key for site %s (user %s)", provider, site_id, user_id)
     return row
 
@@ -888,6 +911,7 @@ async def delete_site_provider_key(
 
     deleted = await db.delete_site_provider_key(site_id, provider)
     if deleted:
+        _invalidate_credentials(site_id)
         logger.info(
             "Deleted %s provider key for site %s (user %s)",
             provider,
@@ -10,6 +10,7 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
+from core.plugin_cache import get_plugin_instance_cache
 from core.tool_registry import ToolDefinition
 
 logger = logging.getLogger(__name__)
@@ -124,6 +125,29 @@ class ToolGenerator:
             )
             return []
 
+        return self.generate_tools_from_specs(plugin_type, tool_specs, lambda: plugin_class)
+
+    def generate_tools_from_specs(
+        self,
+        plugin_type: str,
+        tool_specs: list[dict[str, Any]],
+        load_class: Callable[[], type],
+    ) -> list[ToolDefinition]:
+        """
+        Generate tools from already known specifications.
+
+        The plugin class is only resolved (``load_class()``) when a tool is
+        first called, so tools can be registered from the cached manifest
+        (core.tool_manifest) without importing the plugin.
+
+        Args:
+            plugin_type: Plugin type name (e.g., 'wordpress')
+            tool_specs: Tool specifications (as from get_tool_specifications())
+            load_class: Returns the plugin class (e.g., registry.get_plugin_class)
+
+        Returns:
+            List of tool definitions
+        """
         self.logger.info(
             f"Generating tools for {plugin_type} " f"from {len(tool_specs)} specifications"
         )
@@ -131,7 +155,7 @@ class ToolGenerator:
         tools = []
         for spec in tool_specs:
             try:
-                tool = self._create_tool_from_spec(plugin_class, plugin_type, spec)
+                tool = self._create_tool_from_spec(load_class, plugin_type, spec)
                 if tool:
                     tools.append(tool)
             except Exception as e:
@@ -144,13 +168,13 @@ class ToolGenerator:
         return tools
 
     def _create_tool_from_spec(
-        self, plugin_class: type, plugin_type: str, spec: dict[str, Any]
+        self, load_class: Callable[[], type], plugin_type: str, spec: dict[str, Any]
     ) -> ToolDefinition:
         """
         Create a tool definition from a specification.
 
         Args:
-            plugin_class: Plugin class
+            load_class: Returns the plugin class
             plugin_type: Plugin type name
             spec: Tool specification dictionary
 
@@ -196,7 +220,7 @@ class ToolGenerator:
             description = f"[UNIFIED] {description}"
 
         # Create handler with site routing
-        handler = self._create_handler(plugin_class, plugin_type, method_name)
+        handler = self._create_handler(load_class, plugin_type, method_name)
 
         return ToolDefinition(
             name=tool_name,
@@ -283,19 +307,21 @@ class ToolGenerator:
 
         return schema
 
-    def _create_handler(self, plugin_class: type, plugin_type: str, method_name: str) -> Callable:
+    def _create_handler(
+        self, load_class: Callable[[], type], plugin_type: str, method_name: str
+    ) -> Callable:
         """
         Create async handler with site routing.
 
         The handler:
         1. Extracts site from parameters
         2. Gets site configuration
-        3. Creates plugin instance for this request
+        3. Gets (or creates) the cached plugin instance for this site
         4. Calls the specified method
         5. Returns result
 
         Args:
-            plugin_class: Plugin class to instantiate
+            load_class: Returns the plugin class to instantiate (called per request)
             plugin_type: Plugin type name
             method_name: Method name to call on plugin instance
 
@@ -304,7 +330,7 @@ class ToolGenerator:
 
         Examples:
             >>> handler = generator._create_handler(
-            ...     WordPressPlugin, "wordpress", "list_posts"
+            ...     lambda: WordPressPlugin, "wordpress", "list_posts"
             ... )
             >>> result = await handler(site="site1", per_page=10)
         """
@@ -400,7 +426,16 @@ class ToolGenerator:
                 else:
                     config_dict = site_config
 
-                plugin_instance = plugin_class(config_dict)
+                # Imports the plugin module on the first call of any of its tools
+                plugin_class = load_class()
+
+                # Reuse a live instance for this site + credentials when possible
+                plugin_instance = get_plugin_instance_cache().get_or_create(
+                    plugin_type,
+                    site_config.site_id,
+                    config_dict,
+                    lambda: plugin_class(config_dict),
+                )
 
                 # Get the method from plugin instance
                 if not hasattr(plugin_instance, method_name):
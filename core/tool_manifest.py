@@ -0,0 +1,151 @@
+"""Cached manifest of plugin tool specifications.
+
+Registering tools used to import every plugin package — each handler
+module, the AI image providers and their dependencies — only to call the
+static ``get_tool_specifications()``. The specs are plain data, so they are
+kept in a JSON manifest (``plugins/tool_manifest.json``, override with
+``MCPHUB_TOOL_MANIFEST``) and read from there at startup; a plugin's modules
+are imported on its first tool call instead.
+
+The manifest records a fingerprint of the plugin sources (path, size and
+mtime of every ``plugins/**/*.py``). If it is missing or does not match, the
+specs are rebuilt by importing the plugins and the manifest is rewritten —
+best effort, a read-only install just skips the write. Generate it at build
+time with::
+
+    python -m core.tool_manifest
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+PLUGINS_DIR = Path(__file__).resolve().parent.parent / "plugins"
+MANIFEST_PATH = Path(os.environ.get("MCPHUB_TOOL_MANIFEST", PLUGINS_DIR / "tool_manifest.json"))
+
+
+def sources_fingerprint(plugins_dir: Path | None = None) -> str:
+    """Digest of the plugin sources; changes whenever a plugin file does."""
+    plugins_dir = plugins_dir or PLUGINS_DIR
+    digest = hashlib.sha256()
+    for path in sorted(plugins_dir.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        stat = path.stat()
+        relpath = path.relative_to(plugins_dir)
+        digest.update(f"{relpath}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def build_manifest(fingerprint: str | None = None) -> dict[str, Any]:
+    """Import every registered plugin and collect its tool specifications."""
+    from plugins import registry as plugin_registry
+
+    plugins: dict[str, Any] = {}
+    for plugin_type in plugin_registry.get_registered_types():
+        try:
+            plugin_class = plugin_registry.get_plugin_class(plugin_type)
+            plugins[plugin_type] = {
+                "class": plugin_registry.get_class_path(plugin_type),
+                "specs": plugin_class.get_tool_specifications(),
+            }
+        except Exception as e:
+            logger.error(f"Failed to get tool specifications for {plugin_type}: {e}", exc_info=True)
+    return {
+        "version": MANIFEST_VERSION,
+        "fingerprint": fingerprint or sources_fingerprint(),
+        "plugins": plugins,
+    }
+
+
+def write_manifest(manifest: dict[str, Any], path: Path | None = None) -> bool:
+    """Atomically write ``manifest``. Returns False if it could not be written."""
+    path = path or MANIFEST_PATH
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Tool manifest not written to {path}: {e}")
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _read_manifest(path: Path) -> dict[str, Any] | None:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+_manifest: dict[str, Any] | None = None
+
+
+def load_manifest(path: Path | None = None) -> dict[str, Any]:
+    """Return the manifest, rebuilding it when the plugin sources changed."""
+    global _manifest
+    if _manifest is not None:
+        return _manifest
+
+    path = path or MANIFEST_PATH
+    fingerprint = sources_fingerprint()
+    manifest = _read_manifest(path)
+    if manifest is not None and manifest.get("fingerprint") == fingerprint:
+        logger.info(f"Loaded tool manifest from {path}")
+    else:
+        logger.info("Tool manifest missing or stale; importing plugins to rebuild it")
+        manifest = build_manifest(fingerprint)
+        if write_manifest(manifest, path):
+            logger.info(f"Wrote tool manifest to {path}")
+    _manifest = manifest
+    return manifest
+
+
+def get_tool_specs(plugin_type: str) -> list[dict[str, Any]]:
+    """Tool specifications of a plugin type (from the manifest when possible)."""
+    entry = load_manifest()["plugins"].get(plugin_type)
+    if entry is not None:
+        return entry["specs"]
+
+    # Registered after the manifest was built: ask the class directly
+    from plugins import registry as plugin_registry
+
+    return plugin_registry.get_plugin_class(plugin_type).get_tool_specifications()
+
+
+def clear_manifest_cache() -> None:
+    """Forget the loaded manifest (for testing)."""
+    global _manifest
+    _manifest = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the plugin tool manifest")
+    parser.add_argument("--output", type=Path, default=None)
+    opts = parser.parse_args()
+
+    manifest = build_manifest()
+    if not write_manifest(manifest, opts.output):
+        raise SystemExit(f"Could not write {opts.output or MANIFEST_PATH}")
+    total = sum(len(entry["specs"]) for entry in manifest["plugins"].values())
+    print(
+        f"Wrote {total} tool specs for {len(manifest['plugins'])} plugins "
+        f"to {opts.output or MANIFEST_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Tool Metadata Table
+
+Name-derived facts about a tool (plugin type, required scope, system /
+unified flags, project) used by the tool-call middleware chain. They only
+depend on the tool name, so they are computed once — at registration for
+known tools, on first call for anything else — and then looked up.
+
+Usage::
+
+    from core.tool_meta import get_tool_meta
+
+    meta = get_tool_meta("wordpress_list_posts")
+    meta.plugin_type      # "wordpress"
+    meta.required_scope   # "read"
+"""
+
+from dataclasses import dataclass
+
+# Tools that require a global key (matched by suffix so MCP namespace
+# prefixes such as ``mcp__mcp-hub__list_projects`` still match).
+SYSTEM_TOOLS = (
+    "list_projects",
+    "get_project_info",
+    "check_all_projects_health",
+    "get_project_health",
+    "get_system_metrics",
+    "get_system_uptime",
+    "get_rate_limit_stats",
+    "export_health_metrics",
+    "manage_api_keys_list",
+    "manage_api_keys_get_info",
+)
+
+# Prefixes of unified tools (take a ``site`` parameter and check project
+# access at execution time).
+_UNIFIED_PREFIXES = ("wordpress_", "wordpress_specialist_", "woocommerce_", "gitea_")
+
+# Upper bound on memoized names that were never registered (e.g. typos or
+# namespaced variants sent by clients).
+_MAX_UNREGISTERED = 1024
+
+
+def strip_namespace(tool_name: str) -> str:
+    """Remove an MCP namespace prefix (``mcp__{server}__``) if present."""
+    if tool_name.startswith("mcp__") and "__" in tool_name[5:]:
+        return tool_name.split("__", 2)[-1]
+    return tool_name
+
+
+def extract_project_from_tool(tool_name: str) -> str:
+    """
+    Extract project_id from tool name.
+
+    Examples:
+        "wordpress_list_posts" -> "*" (unified tool, project via param)
+        "list_projects" -> "*" (system tool)
+        "get_rate_limit_stats" -> "*" (system tool)
+
+    Returns:
+        "*" for now (project is passed as parameter in unified architecture)
+    """
+    # In unified architecture, project is passed as parameter, not in tool name
+    # So we return "*" to indicate "any project" at this stage
+    # The actual project will be validated when the tool is executed
+    return "*"
+
+
+def extract_plugin_type_from_tool(tool_name: str) -> str | None:
+    """
+    Extract plugin type from tool name for tool visibility filtering.
+
+    Each API key should only see tools related to its plugin type.
+
+    Examples:
+        "wordpress_list_posts" -> "wordpress"
+        "wordpress_specialist_wp_db_size" -> "wordpress_specialist"
+        "wordpress_specialist_wp_bulk_post_update" -> "wordpress_specialist"
+        "gitea_list_repositories" -> "gitea"
+        "list_projects" -> None (system tool)
+        "manage_api_keys_list" -> None (system tool)
+
+    Returns:
+        Plugin type string or None for system tools
+    """
+    clean_name = strip_namespace(tool_name)
+
+    # Check for plugin types (order matters - check more specific first).
+    # The two-word ``wordpress_specialist`` variant must be checked
+    # before the bare ``wordpress_`` prefix. (``wordpress_advanced`` was
+    # sunset in F.19.3.2-.3.)
+    if clean_name.startswith("wordpress_specialist_"):
+        return "wordpress_specialist"
+    elif clean_name.startswith("wordpress_") or clean_name.startswith("woocommerce_"):
+        return "wordpress"
+    elif clean_name.startswith("gitea_"):
+        return "gitea"
+    elif clean_name.startswith("n8n_"):
+        return "n8n"
+    elif clean_name.startswith("supabase_"):
+        return "supabase"
+    elif clean_name.startswith("openpanel_"):
+        return "openpanel"
+    elif clean_name.startswith("ghost_"):
+        return "ghost"
+
+    # System tools (no plugin type)
+    return None
+
+
+def key_plugin_type(api_key_project_id: str) -> str:
+    """
+    Extract plugin type from an API key project_id.
+
+    project_id format: "{plugin_type}_{site_id}" e.g. "wordpress_site1" or
+    "wordpress_specialist_site1".
+    """
+    # IMPORTANT: list multi-word variants BEFORE the bare ``wordpress`` so the
+    # prefix match doesn't claim them as plain wordpress.
+    known_plugin_types = [
+        "wordpress_specialist",
+        "wordpress",
+        "gitea",
+        "n8n",
+        "supabase",
+        "ghost",
+    ]
+
+    for ptype in known_plugin_types:
+        if api_key_project_id.startswith(ptype + "_"):
+            return ptype
+
+    # Fallback: extract first part before underscore
+    if "_" in api_key_project_id:
+        return api_key_project_id.split("_")[0]
+    return api_key_project_id
+
+
+def check_tool_visibility(tool_name: str, api_key_project_id: str) -> bool:
+    """
+    Check if API key has visibility to the requested tool.
+
+    Rules:
+    - Global API keys (project_id="*") see ALL tools
+    - Plugin-specific keys (project_id="wordpress_xxx") see only that plugin's tools
+    - System tools are visible to global keys only
+
+    Args:
+        tool_name: Name of the tool being accessed
+        api_key_project_id: project_id from API key
+
+    Returns:
+        True if tool is visible, False otherwise
+
+    Examples:
+        >>> check_tool_visibility("wordpress_list_posts", "wordpress_site1")
+        True
+        >>> check_tool_visibility("wordpress_specialist_wp_db_size", "wordpress_specialist_site1")
+        True
+        >>> check_tool_visibility("gitea_list_repos", "wordpress_site1")
+        False
+        >>> check_tool_visibility("list_projects", "wordpress_site1")
+        False
+        >>> check_tool_visibility("wordpress_list_posts", "*")
+        True
+    """
+    return get_tool_meta(tool_name).visible_to(api_key_project_id)
+
+
+def determine_required_scope(tool_name: str) -> str:
+    """
+    Determine required scope for a tool.
+
+    Read operations: list, get, check
+    Write operations: create, update, delete, revoke, rotate
+    Admin operations: manage keys, system operations
+
+    Returns:
+        "read", "write", or "admin"
+    """
+    tool_lower = tool_name.lower()
+
+    # Admin operations
+    if any(x in tool_lower for x in ["manage_api_keys", "reset_rate_limit", "export_"]):
+        return "admin"
+
+    # Write operations
+    if any(
+        x in tool_lower
+        for x in ["create", "update", "delete", "revoke", "rotate", "upload", "flush"]
+    ):
+        return "write"
+
+    # Everything else is read
+    return "read"
+
+
+def _per_site_project(tool_name: str) -> tuple[str | None, str | None]:
+    """Project and plugin type of a per-site tool (``wordpress_site1_get_post``)."""
+    parts = tool_name.split("_")
+    if len(parts) >= 2 and parts[1].startswith("site"):
+        return f"{parts[0]}_{parts[1]}", parts[0]
+    return None, None
+
+
+def _rate_limit_plugin_type(tool_name: str, clean_name: str) -> str | None:
+    if clean_name.startswith("wordpress_"):
+        return "wordpress"
+    if tool_name.startswith("woocommerce_"):
+        return "woocommerce"
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ToolMeta:
+    """Precomputed, name-derived facts about one tool."""
+
+    name: str
+    clean_name: str
+    # Plugin type for key visibility (None for system tools).
+    plugin_type: str | None
+    # Plugin type bucket used by the rate limiter.
+    rate_limit_plugin_type: str | None
+    # First ``_``-separated segment, used as a plugin-type guess when
+    # resolving a ``site`` argument.
+    name_prefix: str
+    required_scope: str
+    project_id: str
+    is_system: bool
+    is_unified: bool
+    # Set for legacy per-site tool names (``{plugin}_site{N}_{action}``).
+    per_site_project_id: str | None
+    per_site_plugin_type: str | None
+
+    def visible_to(self, api_key_project_id: str) -> bool:
+        """See :func:`check_tool_visibility`."""
+        if api_key_project_id == "*":
+            return True
+        if self.plugin_type is None:
+            return False
+        return self.plugin_type == key_plugin_type(api_key_project_id)
+
+
+def build_tool_meta(tool_name: str) -> ToolMeta:
+    """Derive :class:`ToolMeta` for ``tool_name`` (uncached)."""
+    clean_name = strip_namespace(tool_name)
+    per_site_project_id, per_site_plugin_type = _per_site_project(tool_name)
+    return ToolMeta(
+        name=tool_name,
+        clean_name=clean_name,
+        plugin_type=extract_plugin_type_from_tool(tool_name),
+        rate_limit_plugin_type=_rate_limit_plugin_type(tool_name, clean_name),
+        name_prefix=tool_name.split("_")[0] if "_" in tool_name else "wordpress",
+        required_scope=determine_required_scope(tool_name),
+        project_id=extract_project_from_tool(tool_name),
+        is_system=tool_name.endswith(SYSTEM_TOOLS),
+        # If the name could not be extracted, assume unified so per-project
+        # keys still work; project access is checked at execution time.
+        is_unified=tool_name == "unknown" or clean_name.startswith(_UNIFIED_PREFIXES),
+        per_site_project_id=per_site_project_id,
+        per_site_plugin_type=per_site_plugin_type,
+    )
+
+
+_registered: dict[str, ToolMeta] = {}
+_unregistered: dict[str, ToolMeta] = {}
+
+
+def register_tool_meta(tool_name: str) -> ToolMeta:
+    """Precompute metadata for a tool at registration time."""
+    meta = _registered.get(tool_name)
+    if meta is None:
+        meta = build_tool_meta(tool_name)
+        _registered[tool_name] = meta
+    return meta
+
+
+def get_tool_meta(tool_name: str) -> ToolMeta:
+    """Return metadata for ``tool_name``, computing it on first use."""
+    meta = _registered.get(tool_name) or _unregistered.get(tool_name)
+    if meta is not None:
+        return meta
+    meta = build_tool_meta(tool_name)
+    if len(_unregistered) >= _MAX_UNREGISTERED:
+        _unregistered.clear()
+    _unregistered[tool_name] = meta
+    return meta
+
+
+def clear_tool_meta() -> None:
+    """Drop all precomputed metadata (for testing)."""
+    _registered.clear()
+    _unregistered.clear()
@@ -6,7 +6,9 @@ Admin / env-fallback callers (``user_id is None``) are exempt.
 
 Intentionally minimal — separate from :mod:`core.rate_limiter` (which is a
 global per-client limiter). This one is scoped to specific tools with
-small hourly caps.
+small hourly caps. In multi-worker mode the hourly count is kept in the
+shared store (:mod:`core.shared_state`) as a one-hour sliding window, so
+the cap holds across workers.
 """
 
 from __future__ import annotations
@@ -15,7 +17,8 @@ import logging
 import threading
 from dataclasses import dataclass
 
-from core.rate_limiter import TokenBucket
+from core.rate_limiter import SlidingWindowCounter, TokenBucket
+from core.shared_state import SharedState, get_shared_state
 
 logger = logging.getLogger(__name__)
 
@@ -62,10 +65,13 @@ class PerToolRateLimiter:
     callers (``user_id`` is None or empty) are exempt.
     """
 
-    def __init__(self, limits: dict[str, int] | None = None) -> None:
+    def __init__(
+        self, limits: dict[str, int] | None = None, shared: SharedState | None = None
+    ) -> None:
         self._limits = dict(limits if limits is not None else DEFAULT_LIMITS)
         self._buckets: dict[tuple[str, str], TokenBucket] = {}
         self._lock = threading.Lock()
+        self._shared = shared if shared is not None else get_shared_state()
 
     def configure(self, tool_name: str, per_hour: int) -> None:
         """Override the per-hour cap for a tool."""
@@ -76,34 +82,85 @@ class PerToolRateLimiter:
     def reset(self) -> None:
         with self._lock:
             self._buckets.clear()
+        if self._shared is not None:
+            self._shared.reset_windows("tool:")
 
     def check(self, tool_name: str, user_id: str | None) -> None:
         """Consume one token for (user_id, tool_name). Exempt when user_id is falsy."""
-        if not user_id:
+        limit = self._limit_for(tool_name, user_id)
+        if limit is None:
+            return
+        if self._shared is not None:
+            windows = self._shared.consume_windows(*self._shared_args(tool_name, user_id, limit))
+            allowed, wait = _shared_result(*windows)
+        else:
+            allowed, wait = self._consume_local(tool_name, user_id, limit)
+        self._raise_if_denied(tool_name, user_id, limit, allowed, wait)
+
+    async def check_async(self, tool_name: str, user_id: str | None) -> None:
+        """:meth:`check` for tool handlers; the shared-store update runs in a worker thread."""
+        limit = self._limit_for(tool_name, user_id)
+        if limit is None:
             return
+        if self._shared is not None:
+            windows = await self._shared.consume_windows_async(
+                *self._shared_args(tool_name, user_id, limit)
+            )
+            allowed, wait = _shared_result(*windows)
+        else:
+            allowed, wait = self._consume_local(tool_name, user_id, limit)
+        self._raise_if_denied(tool_name, user_id, limit, allowed, wait)
+
+    def _limit_for(self, tool_name: str, user_id: str | None) -> int | None:
+        """The hourly cap that applies, or ``None`` when the call is exempt."""
+        if not user_id:
+            return None
         limit = self._limits.get(tool_name)
         if limit is None or limit <= 0:
-            return
+            return None
+        return limit
+
+    @staticmethod
+    def _shared_args(
+        tool_name: str, user_id: str, limit: int
+    ) -> tuple[str, list[tuple[int, float]]]:
+        return f"tool:{user_id}:{tool_name}", [(limit, 3600.0)]
 
+    def _consume_local(self, tool_name: str, user_id: str, limit: int) -> tuple[bool, float]:
         key = (user_id, tool_name)
         with self._lock:
             bucket = self._buckets.get(key)
             if bucket is None:
                 bucket = TokenBucket(capacity=limit, refill_rate=limit / 3600.0)
                 self._buckets[key] = bucket
+        allowed = bucket.consume(1)
+        return allowed, 0.0 if allowed else bucket.get_wait_time(1)
+
+    @staticmethod
+    def _raise_if_denied(
+        tool_name: str, user_id: str, limit: int, allowed: bool, wait: float
+    ) -> None:
+        if allowed:
+            return
+        logger.warning(
+            "Per-tool rate limit hit: user=%s tool=%s limit=%d/h retry_after=%.1fs",
+            user_id,
+            tool_name,
+            limit,
+            wait,
+        )
+        raise ToolRateLimitError(
+            tool_name=tool_name, limit_per_hour=limit, retry_after_seconds=wait
+        )
 
-        if not bucket.consume(1):
-            wait = bucket.get_wait_time(1)
-            logger.warning(
-                "Per-tool rate limit hit: user=%s tool=%s limit=%d/h retry_after=%.1fs",
-                user_id,
-                tool_name,
-                limit,
-                wait,
-            )
-            raise ToolRateLimitError(
-                tool_name=tool_name, limit_per_hour=limit, retry_after_seconds=wait
-            )
+
+def _shared_result(
+    counters: list[SlidingWindowCounter], rejected: int | None
+) -> tuple[bool, float]:
+    """``(allowed, retry_after)`` from :meth:`SharedState.consume_windows` output."""
+    if rejected is None:
+        return True, 0.0
+    return False, counters[0].get_wait_time(1)
 
 
 _limiter: PerToolRateLimiter | None = None
@@ -11,6 +11,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from core.tool_meta import register_tool_meta
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +101,8 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' already registered")
 
         self.tools[tool.name] = tool
+        # Precompute name-derived metadata for the tool-call middleware chain
+        register_tool_meta(tool.name)
         self.logger.debug(f"Registered tool: {tool.name} ({tool.plugin_type})")
 
     def register_many(self, tools: list[ToolDefinition]) -> int:
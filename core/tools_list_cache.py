@@ -0,0 +1,184 @@
+"""Memoized ``tools/list`` payloads for user MCP endpoints.
+
+Building a user endpoint's ``tools/list`` response walks the registry for
+the plugin, reads the site's ``tool_scope`` and toggles, checks provider
+keys and the capability-probe cache, and deep-copies every input schema.
+The result only changes when one of those inputs does, so it is cached
+here as pre-encoded JSON, keyed by ``(site_id, plugin_type, key scopes)``.
+
+Invalidation is version based: every write that can change visibility
+calls :func:`bump_site_version` (site toggles / ``tool_scope`` / provider
+keys in :mod:`core.database`, probe results in
+:mod:`core.capability_probe`, site update / delete). An entry is only
+served while its recorded site version, registry size and probe expiry
+still match, and never for longer than ``MCPHUB_TOOLS_LIST_CACHE_TTL_SEC``
+(default 300 s, ``0`` disables the cache). In multi-worker mode each bump
+is also published to the other workers (:mod:`core.shared_state`).
+
+Usage::
+
+    from core.tools_list_cache import get_tools_list_cache
+
+    cache = get_tools_list_cache()
+    body = cache.get(site_id, plugin_type, key_scopes)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from core.shared_state import publish_invalidation, subscribe_invalidation
+
+TTL_SECONDS = float(os.environ.get("MCPHUB_TOOLS_LIST_CACHE_TTL_SEC", "300"))
+MAX_ENTRIES = int(os.environ.get("MCPHUB_TOOLS_LIST_CACHE_SIZE", "1024"))
+
+CacheKey = tuple[str, str, tuple[str, ...]]
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode ``value`` exactly like :class:`starlette.responses.JSONResponse`."""
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def jsonrpc_result_bytes(req_id: Any, encoded_result: bytes) -> bytes:
+    """Splice a pre-encoded ``result`` into a JSON-RPC 2.0 response body."""
+    return b'{"jsonrpc":"2.0","id":' + encode_json(req_id) + b',"result":' + encoded_result + b"}"
+
+
+@dataclass(slots=True)
+class _Entry:
+    body: bytes
+    site_version: int
+    registry_size: int
+    expires_at: float  # monotonic; min(TTL, probe expiry)
+
+
+class ToolsListCache:
+    """Bounded LRU of encoded ``{"tools": [...]}`` results with per-site versions."""
+
+    def __init__(self, ttl_seconds: float = TTL_SECONDS, max_entries: int = MAX_ENTRIES) -> None:
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(site_id: str, plugin_type: str, key_scopes: list[str]) -> CacheKey:
+        return (site_id, plugin_type, tuple(sorted(set(key_scopes))))
+
+    def site_version(self, site_id: str) -> int:
+        return self._versions.get(site_id, 0)
+
+    def bump_site_version(self, site_id: str) -> None:
+        """Mark every cached payload for ``site_id`` stale."""
+        with self._lock:
+            self._versions[site_id] = self._versions.get(site_id, 0) + 1
+
+    def get(
+        self,
+        site_id: str,
+        plugin_type: str,
+        key_scopes: list[str],
+        registry_size: int,
+    ) -> bytes | None:
+        if self.ttl <= 0:
+            return None
+        key = self.make_key(site_id, plugin_type, key_scopes)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry.site_version != self._versions.get(site_id, 0)
+                or entry.registry_size != registry_size
+                or time.monotonic() >= entry.expires_at
+            ):
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.body
+
+    def put(
+        self,
+        site_id: str,
+        plugin_type: str,
+        key_scopes: list[str],
+        registry_size: int,
+        body: bytes,
+        *,
+        site_version: int,
+        valid_for: float | None = None,
+    ) -> None:
+        """Store an encoded result computed at ``site_version``.
+
+        ``site_version`` must be read *before* computing the payload so a
+        concurrent bump during the computation leaves the entry stale.
+        ``valid_for`` caps the lifetime (e.g. remaining probe TTL).
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        lifetime = self.ttl if valid_for is None else max(0.0, min(self.ttl, valid_for))
+        key = self.make_key(site_id, plugin_type, key_scopes)
+        with self._lock:
+            self._entries[key] = _Entry(
+                body, site_version, registry_size, time.monotonic() + lifetime
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_tools_list_cache: ToolsListCache | None = None
+
+
+def get_tools_list_cache() -> ToolsListCache:
+    """Get the process-wide tools/list cache."""
+    global _tools_list_cache
+    if _tools_list_cache is None:
+        _tools_list_cache = ToolsListCache()
+    return _tools_list_cache
+
+
+def set_tools_list_cache(cache: ToolsListCache | None) -> None:
+    """Replace the global cache (for testing)."""
+    global _tools_list_cache
+    _tools_list_cache = cache
+
+
+def bump_site_version(site_id: str) -> None:
+    """Invalidate cached tools/list payloads for a site (in every worker)."""
+    get_tools_list_cache().bump_site_version(site_id)
+    publish_invalidation("tools_list", site_id)
+
+
+def _on_site_version_bumped(site_id: str) -> None:
+    get_tools_list_cache().bump_site_version(site_id)
+
+
+subscribe_invalidation("tools_list", _on_site_version_bumped)
@@ -8,15 +8,25 @@ quota, per-session byte cap, and a 1h TTL reaped by a background task.
 Chunks are appended sequentially; out-of-order or duplicate indexes raise
 a typed error. Optional full-payload sha256 (supplied at `start`) is
 verified when the session is finalized.
+
+Operations on one session are serialized by a per-session lock (starts
+additionally by a per-user lock for the quota check), so uploads of
+different users and files proceed concurrently. Spill-file I/O runs in a
+worker thread, and the payload sha256 is updated as chunks arrive, so
+finalizing does not re-read the file to hash it. Use
+:meth:`UploadSessionStore.finalized` to upload straight from the spill file
+instead of loading it into memory.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import logging
 import os
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -88,6 +98,48 @@ def _ensure_spill_dir(spill_dir: Path) -> None:
         pass
 
 
+# Blocking file helpers; the store runs them via asyncio.to_thread.
+
+_HASH_BLOCK = 1024 * 1024
+
+
+def _create_spill(spill_dir: Path, spill_path: Path) -> None:
+    """Create an empty spill file with 0600 perms."""
+    _ensure_spill_dir(spill_dir)
+    with open(spill_path, "wb") as f:
+        f.truncate(0)
+    try:
+        os.chmod(spill_path, 0o600)
+    except OSError:
+        pass
+
+
+def _write_chunk(path: Path, offset: int, data: bytes) -> None:
+    """Write ``data`` at ``offset``, dropping anything after it.
+
+    Bytes past ``offset`` can only come from a write whose metadata update
+    never landed (crash, cancelled request); the retried chunk replaces them.
+    """
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.truncate()
+        f.write(data)
+
+
+def _hash_file(path: Path, size: int) -> Any:
+    """sha256 object over the first ``size`` bytes of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = size
+        while remaining > 0:
+            block = f.read(min(_HASH_BLOCK, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest
+
+
 # --- Store -----------------------------------------------------------------
 
 
@@ -107,6 +159,7 @@ class UploadSession:
         "status",
         "created_at",
         "expires_at",
+        "digest",  # hex sha256 of the payload, set by finalize
     )
 
     def __init__(self, **kwargs: Any) -> None:
@@ -159,13 +212,30 @@ class UploadSessionStore:
         self.ttl = ttl
         self.max_session_bytes = max_session_bytes
         self.max_concurrent_per_user = max_concurrent_per_user
-        self._lock = asyncio.Lock()
+        # key -> [lock, holders + waiters]; entries are dropped when unused
+        self._locks: dict[str, list[Any]] = {}
+        # session_id -> (running sha256, bytes hashed)
+        self._hashes: dict[str, tuple[Any, int]] = {}
         _ensure_spill_dir(self.spill_dir)
 
     @property
     def db(self) -> Database:
         return self._db or get_database()
 
+    @contextlib.asynccontextmanager
+    async def _locked(self, key: str) -> AsyncIterator[None]:
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
     # -- start -------------------------------------------------------------
 
     async def start(
@@ -188,15 +258,14 @@ class UploadSessionStore:
 
         session_id = make_session_id(user_id, filename, total_bytes, mime, sha256)
 
-        async with self._lock:
+        async with self._locked(f"user:{user_id}"), self._locked(session_id):
             existing = await self._get_row(session_id)
             if existing is not None:
                 sess = UploadSession.from_row(existing)
                 if sess.status == "open" and sess.expires_at > _utc_now():
                     return sess
                 # Stale/finished — replace
-                await self._delete_row(session_id)
-                _unlink_silent(sess.spill_path)
+                await self._drop(sess)
 
             open_count = await self._count_open_for_user(user_id)
             if open_count >= self.max_concurrent_per_user:
@@ -210,14 +279,8 @@ class UploadSessionStore:
             now = _utc_now()
             expires = now + self.ttl
             spill_path = self.spill_dir / f"{session_id}.part"
-            # Touch an empty spill file with 0600 perms
-            _ensure_spill_dir(self.spill_dir)
-            with open(spill_path, "wb") as f:
-                f.truncate(0)
-            try:
-                os.chmod(spill_path, 0o600)
-            except OSError:
-                pass
+            await asyncio.to_thread(_create_spill, self.spill_dir, spill_path)
+            self._hashes[session_id] = (hashlib.sha256(), 0)
 
             await self.db.execute(
                 "INSERT INTO upload_sessions "
@@ -262,7 +325,7 @@ class UploadSessionStore:
         *,
         chunk_sha256: str | None = None,
     ) -> UploadSession:
-        async with self._lock:
+        async with self._locked(session_id):
             sess = await self._require_open(session_id)
             if index != sess.next_chunk:
                 raise UploadSessionError(
@@ -279,7 +342,7 @@ class UploadSessionStore:
                     {"declared": sess.total_bytes, "would_be": new_size},
                 )
             if chunk_sha256 is not None:
-                actual = hashlib.sha256(data).hexdigest()
+                actual = await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
                 if actual.lower() != chunk_sha256.lower():
                     raise UploadSessionError(
                         "CHUNK_CHECKSUM",
@@ -287,8 +350,10 @@ class UploadSessionStore:
                         {"expected": chunk_sha256, "actual": actual, "index": index},
                     )
 
-            with open(sess.spill_path, "ab") as f:
-                f.write(data)
+            digest = await self._running_hash(sess)
+            await asyncio.to_thread(_write_chunk, sess.spill_path, sess.received_bytes, data)
+            await asyncio.to_thread(digest.update, data)
+            self._hashes[session_id] = (digest, new_size)
             sess.received_bytes = new_size
             sess.next_chunk = index + 1
             await self.db.execute(
@@ -299,13 +364,18 @@ class UploadSessionStore:
 
     # -- finalize ----------------------------------------------------------
 
-    async def finalize(self, session_id: str) -> tuple[UploadSession, bytes]:
-        """Read the full spill file and verify. Returns (session, bytes).
+    @contextlib.asynccontextmanager
+    async def finalized(self, session_id: str) -> AsyncIterator[UploadSession]:
+        """Verify a complete session and yield it with its spill file in place.
 
-        On checksum mismatch the session is kept (status remains 'open') so
-        the caller can retry; on success, the row and spill file are removed.
+        The caller reads ``sess.spill_path`` (e.g. streams it to WordPress)
+        inside the block; ``sess.digest`` holds the payload sha256. The
+        session is locked meanwhile and removed with its spill file when the
+        block exits, whether or not the caller succeeded. On checksum
+        mismatch nothing is yielded and the session is kept (status remains
+        'open') so the caller can retry.
         """
-        async with self._lock:
+        async with self._locked(session_id):
             sess = await self._require_open(session_id)
             if sess.received_bytes != sess.total_bytes:
                 raise UploadSessionError(
@@ -316,31 +386,38 @@ class UploadSessionStore:
                         "total": sess.total_bytes,
                     },
                 )
-            with open(sess.spill_path, "rb") as f:
-                data = f.read()
-            if sess.sha256:
-                actual = hashlib.sha256(data).hexdigest()
-                if actual.lower() != sess.sha256.lower():
-                    raise UploadSessionError(
-                        "CHECKSUM_MISMATCH",
-                        "Assembled sha256 does not match value supplied at start.",
-                        {"expected": sess.sha256, "actual": actual},
-                    )
-            # Success — drop the session
-            await self._delete_row(session_id)
-            _unlink_silent(sess.spill_path)
-            return sess, data
+            sess.digest = (await self._running_hash(sess)).hexdigest()
+            if sess.sha256 and sess.digest != sess.sha256.lower():
+                raise UploadSessionError(
+                    "CHECKSUM_MISMATCH",
+                    "Assembled sha256 does not match value supplied at start.",
+                    {"expected": sess.sha256, "actual": sess.digest},
+                )
+            try:
+                yield sess
+            finally:
+                await self._drop(sess)
+
+    async def finalize(self, session_id: str) -> tuple[UploadSession, bytes]:
+        """Read the full spill file and verify. Returns (session, bytes).
+
+        Loads the whole payload into memory; prefer :meth:`finalized` for
+        large files. On checksum mismatch the session is kept (status remains
+        'open') so the caller can retry; on success, the row and spill file
+        are removed.
+        """
+        async with self.finalized(session_id) as sess:
+            data = await asyncio.to_thread(sess.spill_path.read_bytes)
+        return sess, data
 
     # -- abort -------------------------------------------------------------
 
     async def abort(self, session_id: str) -> bool:
-        async with self._lock:
+        async with self._locked(session_id):
             row = await self._get_row(session_id)
             if row is None:
                 return False
-            sess = UploadSession.from_row(row)
-            await self._delete_row(session_id)
-            _unlink_silent(sess.spill_path)
+            await self._drop(UploadSession.from_row(row))
             return True
 
     # -- get ---------------------------------------------------------------
@@ -359,8 +436,8 @@ class UploadSessionStore:
         reaped = 0
         for row in rows:
             sess = UploadSession.from_row(row)
-            _unlink_silent(sess.spill_path)
-            await self._delete_row(sess.id)
+            async with self._locked(sess.id):
+                await self._drop(sess)
             reaped += 1
         if reaped:
             logger.info("Reaped %d expired upload session(s)", reaped)
@@ -374,6 +451,25 @@ class UploadSessionStore:
     async def _delete_row(self, session_id: str) -> None:
         await self.db.execute("DELETE FROM upload_sessions WHERE id = ?", (session_id,))
 
+    async def _drop(self, sess: UploadSession) -> None:
+        """Delete a session's row, spill file and running hash."""
+        await self._delete_row(sess.id)
+        self._hashes.pop(sess.id, None)
+        await asyncio.to_thread(_unlink_silent, sess.spill_path)
+
+    async def _running_hash(self, sess: UploadSession) -> Any:
+        """The session's running sha256, rebuilt from the spill file if needed.
+
+        Only a restart (or a chunk whose metadata update failed) leaves the
+        in-memory hash missing or out of step with ``received_bytes``.
+        """
+        cached = self._hashes.get(sess.id)
+        if cached is not None and cached[1] == sess.received_bytes:
+            return cached[0]
+        digest = await asyncio.to_thread(_hash_file, sess.spill_path, sess.received_bytes)
+        self._hashes[sess.id] = (digest, sess.received_bytes)
+        return digest
+
     async def _count_open_for_user(self, user_id: str) -> int:
         row = await self.db.fetchone(
             "SELECT COUNT(*) AS c FROM upload_sessions "
@@ -9,7 +9,7 @@ Flow:
     2. Look up user's site from SQLite
     3. Decrypt credentials
     4. For tools/list: return plugin tools (without ``site`` param)
-    5. For tools/call: create plugin instance, call method, return result
+    5. For tools/call: get cached plugin instance, call method, return result
 
 Usage:
     # In server.py route registration:
@@ -19,22 +19,22 @@ Usage:
 
 import json
 import logging
-import time
 from copy import deepcopy
 from typing import Any
 
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
+from core.rate_limiter import RateLimitConfig, RateLimiter
 from core.tool_registry import ToolDefinition
 
 logger = logging.getLogger(__name__)
 
-# In-memory rate limit tracking: user_id -> list of timestamps
-_rate_limits: dict[str, list[float]] = {}
+# Per-user limiter (sliding-window counters, O(1) state per user).
+_user_rate_limiter = RateLimiter(namespace="user")
 
 
-def _check_user_rate_limit(user_id: str) -> tuple[bool, str]:
+async def _check_user_rate_limit(user_id: str) -> tuple[bool, str]:
     """Check per-user rate limits using the live cached settings (DB > ENV > default).
 
     Args:
@@ -48,26 +48,14 @@ def _check_user_rate_limit(user_id: str) -> tuple[bool, str]:
     per_min = get_cached_rate_per_min()
     per_hr = get_cached_rate_per_hr()
 
-    now = time.time()
-    timestamps = _rate_limits.setdefault(user_id, [])
-
-    # Prune old entries (older than 1 hour)
-    cutoff_hr = now - 3600
-    _rate_limits[user_id] = [t for t in timestamps if t > cutoff_hr]
-    timestamps = _rate_limits[user_id]
-
-    # Check per-minute limit
-    cutoff_min = now - 60
-    recent_min = sum(1 for t in timestamps if t > cutoff_min)
-    if recent_min >= per_min:
+    # No separate daily limit: 24 × the hourly limit is never the binding one.
+    config = RateLimitConfig(per_minute=per_min, per_hour=per_hr, per_day=per_hr * 24)
+    allowed, message, _ = await _user_rate_limiter.check_rate_limit_async(user_id, config=config)
+    if allowed:
+        return True, ""
+    if "per minute" in message:
         return False, f"Rate limit exceeded: {per_min} requests/minute"
-
-    # Check per-hour limit
-    if len(timestamps) >= per_hr:
-        return False, f"Rate limit exceeded: {per_hr} requests/hour"
-
-    timestamps.append(now)
-    return True, ""
+    return False, f"Rate limit exceeded: {per_hr} requests/hour"
 
 
 def _tools_to_mcp_schema(
@@ -167,13 +155,51 @@ async def _get_visible_tools_for_site(
     return _tools_to_mcp_schema(tools, configured_providers=configured_providers)
 
 
+async def _get_tools_list_result(
+    site_id: str,
+    key_scopes: list[str],
+    plugin_type: str,
+) -> bytes:
+    """Return the encoded ``{"tools": [...]}`` result, memoized per site + scopes.
+
+    See :mod:`core.tools_list_cache` for the invalidation rules.
+    """
+    from core.capability_probe import get_probe_cache
+    from core.shared_state import poll_invalidations
+    from core.tool_registry import get_tool_registry
+    from core.tools_list_cache import encode_json, get_tools_list_cache
+
+    poll_invalidations()
+    cache = get_tools_list_cache()
+    registry_size = get_tool_registry().get_count()
+    cached = cache.get(site_id, plugin_type, key_scopes, registry_size)
+    if cached is not None:
+        return cached
+
+    # Read the version first: a write racing with the build below bumps it
+    # and leaves this entry stale instead of caching a pre-write payload.
+    site_version = cache.site_version(site_id)
+    tools = await _get_visible_tools_for_site(site_id, key_scopes, plugin_type)
+    body = encode_json({"tools": tools})
+    cache.put(
+        site_id,
+        plugin_type,
+        key_scopes,
+        registry_size,
+        body,
+        site_version=site_version,
+        valid_for=get_probe_cache().expires_in(site_id),
+    )
+    return body
+
+
 async def _execute_tool(
     tool_name: str,
     arguments: dict[str, Any],
     plugin_type: str,
     config_dict: dict[str, Any],
 ) -> Any:
-    """Execute a tool by creating a plugin instance and calling the method.
+    """Execute a tool on the (cached) plugin instance for this site.
 
     Uses the same pattern as unified_handler in tool_generator.py.
     """
@@ -189,10 +215,17 @@ async def _execute_tool(
         method_name = method_name[len(prefix) :]
 
     try:
-        plugin_instance = plugin_registry.create_instance(
+        from core.plugin_cache import get_plugin_instance_cache
+
+        plugin_instance = get_plugin_instance_cache().get_or_create(
             plugin_type,
-            project_id=f"user_{config_dict.get('alias', 'unknown')}",
-            config=config_dict,
+            config_dict.get("site_id", ""),
+            config_dict,
+            lambda: plugin_registry.create_instance(
+                plugin_type,
+                project_id=f"user_{config_dict.get('alias', 'unknown')}",
+                config=config_dict,
+            ),
         )
 
         if not hasattr(plugin_instance, method_name):
@@ -379,7 +412,7 @@ async def user_mcp_handler(request: Request) -> Response:
         )
 
     if not _is_admin_user:
-        allowed, rate_msg = _check_user_rate_limit(user_id)
+        allowed, rate_msg = await _check_user_rate_limit(user_id)
         if not allowed:
             return JSONResponse(
                 _jsonrpc_error(None, -32600, rate_msg),
@@ -459,8 +492,10 @@ async def user_mcp_handler(request: Request) -> Response:
         return Response(status_code=204)
 
     elif method == "tools/list":
-        tools = await _get_visible_tools_for_site(site["id"], key_scopes, site["plugin_type"])
-        return JSONResponse(_jsonrpc_result(req_id, {"tools": tools}))
+        from core.tools_list_cache import jsonrpc_result_bytes
+
+        result = await _get_tools_list_result(site["id"], key_scopes, site["plugin_type"])
+        return Response(jsonrpc_result_bytes(req_id, result), media_type="application/json")
 
     elif method == "tools/call":
         tool_name = params.get("name", "")
@@ -7,6 +7,12 @@ Key format: ``mhu_<32 random urlsafe chars>``
 Lookup: ``key_prefix`` column (first 8 chars after ``mhu_``) for indexed DB lookup,
 then bcrypt verification on the matching row.
 
+Usage (``use_count`` / ``last_used``) is accumulated in memory per key and
+written in one batch by :meth:`UserKeyManager.flush_usage`, driven by the
+usage flusher in :mod:`core.key_usage`. Validation itself never writes.
+In multi-worker mode a deleted key is purged from every worker's
+validation cache (:mod:`core.shared_state`).
+
 Usage:
     from core.user_keys import initialize_user_key_manager, get_user_key_manager
 
@@ -25,6 +31,8 @@ from typing import Any
 
 import bcrypt
 
+from core.shared_state import poll_invalidations, publish_invalidation, subscribe_invalidation
+
 logger = logging.getLogger(__name__)
 
 # Key format constants
@@ -51,6 +59,8 @@ class UserKeyManager:
     def __init__(self) -> None:
         # Cache: raw_key -> (key_id, user_id, scopes, site_id, cached_at)
         self._cache: dict[str, tuple[str, str, str, str | None, float]] = {}
+        # Unflushed usage: key_id -> (uses, last_used ISO timestamp)
+        self._pending_usage: dict[str, tuple[int, str]] = {}
 
     async def create_key(
         self,
@@ -126,21 +136,15 @@ class UserKeyManager:
         if not api_key or not api_key.startswith(KEY_PREFIX_TAG):
             return None
 
+        # Apply key deletions made by other workers before trusting the cache
+        poll_invalidations()
+
         # Check cache first
         cached = self._cache.get(api_key)
         if cached is not None:
             key_id, user_id, scopes, site_id, cached_at = cached
             if time.time() - cached_at < _CACHE_TTL_SECONDS:
-                # Update usage in background (fire-and-forget via DB)
-                try:
-                    import asyncio
-
-                    from core.database import get_database
-
-                    db = get_database()
-                    asyncio.create_task(db.update_api_key_usage(key_id))
-                except Exception:
-                    pass  # Non-critical
+                self._record_usage(key_id)
                 return {"key_id": key_id, "user_id": user_id, "scopes": scopes, "site_id": site_id}
             else:
                 del self._cache[api_key]
@@ -166,8 +170,7 @@ class UserKeyManager:
             if expires < datetime.now(UTC):
                 return None
 
-        # Update usage
-        await db.update_api_key_usage(row["id"])
+        self._record_usage(row["id"])
 
         # Cache the result
         site_id = row.get("site_id")
@@ -198,7 +201,15 @@ class UserKeyManager:
         from core.database import get_database
 
         db = get_database()
-        return await db.get_api_keys_by_user(user_id)
+        keys = await db.get_api_keys_by_user(user_id)
+        # Overlay usage that has not been flushed yet
+        for key in keys:
+            pending = self._pending_usage.get(key.get("id"))
+            if pending is not None:
+                uses, last_used = pending
+                key["use_count"] = (key.get("use_count") or 0) + uses
+                key["last_used"] = last_used
+        return keys
 
     async def delete_key(self, key_id: str, user_id: str) -> bool:
         """Delete an API key.
@@ -219,14 +230,51 @@ class UserKeyManager:
         deleted = await db.delete_api_key(key_id, user_id)
 
         if deleted:
-            # Purge from cache
-            to_remove = [k for k, v in self._cache.items() if v[0] == key_id]
-            for k in to_remove:
-                del self._cache[k]
+            self.purge_key(key_id)
+            self._pending_usage.pop(key_id, None)
+            publish_invalidation("user_key", key_id)
             logger.info("Deleted user API key %s for user %s", key_id, user_id)
 
         return deleted
 
+    def _record_usage(self, key_id: str) -> None:
+        """Count one use of ``key_id`` in memory (flushed by :meth:`flush_usage`)."""
+        uses, _ = self._pending_usage.get(key_id, (0, ""))
+        self._pending_usage[key_id] = (uses + 1, datetime.now(UTC).isoformat())
+
+    async def flush_usage(self) -> int:
+        """Write accumulated usage counters to the database in one batch.
+
+        On failure the counters are merged back so no uses are lost.
+
+        Returns:
+            Number of keys updated.
+        """
+        if not self._pending_usage:
+            return 0
+        pending, self._pending_usage = self._pending_usage, {}
+
+        from core.database import get_database
+
+        try:
+            db = get_database()
+            await db.update_api_key_usage_batch(
+                [(key_id, uses, last_used) for key_id, (uses, last_used) in pending.items()]
+            )
+        except Exception as e:
+            logger.warning("Failed to flush user API key usage: %s", e)
+            for key_id, (uses, last_used) in pending.items():
+                newer_uses, newer_last = self._pending_usage.get(key_id, (0, last_used))
+                self._pending_usage[key_id] = (uses + newer_uses, max(last_used, newer_last))
+            return 0
+        return len(pending)
+
+    def purge_key(self, key_id: str) -> None:
+        """Drop cached validations of ``key_id``."""
+        to_remove = [k for k, v in self._cache.items() if v[0] == key_id]
+        for k in to_remove:
+            del self._cache[k]
+
     def clear_cache(self) -> None:
         """Clear the entire validation cache."""
         self._cache.clear()
@@ -244,6 +292,14 @@ def initialize_user_key_manager() -> UserKeyManager:
     return _manager
 
 
+def _on_key_deleted(key_id: str) -> None:
+    if _manager is not None:
+        _manager.purge_key(key_id)
+
+
+subscribe_invalidation("user_key", _on_key_deleted)
+
+
 def get_user_key_manager() -> UserKeyManager:
     """Get the singleton UserKeyManager.
 
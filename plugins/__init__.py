@@ -16,32 +16,44 @@ v2.3.0 (Phase G): Supabase Self-Hosted Plugin added
 
 Note: Appwrite and Directus plugins are retained in the codebase but are
 no longer registered by default. They require review and testing before
-re-enabling. To restore them, add their imports and registry.register()
-calls below.
+re-enabling. To restore them, add an entry to ``_PLUGIN_CLASSES`` below.
+
+Plugins are registered by import path and only imported when first used
+(see :meth:`PluginRegistry.get_plugin_class`); tool registration reads
+their specs from the cached manifest in :mod:`core.tool_manifest`.
+Importing a plugin class from this package (``from plugins import
+WordPressPlugin``) still works and imports that plugin only.
 """
 
 from plugins.base import BasePlugin, PluginRegistry
-from plugins.coolify.plugin import CoolifyPlugin
-from plugins.gitea.plugin import GiteaPlugin
-from plugins.n8n.plugin import N8nPlugin
-from plugins.openpanel.plugin import OpenPanelPlugin
-from plugins.supabase.plugin import SupabasePlugin
-from plugins.woocommerce.plugin import WooCommercePlugin
-from plugins.wordpress.plugin import WordPressPlugin
-from plugins.wordpress_specialist.plugin import WordPressSpecialistPlugin
+
+# plugin_type -> "module:ClassName" (8 active plugins)
+_PLUGIN_CLASSES = {
+    "wordpress": "plugins.wordpress.plugin:WordPressPlugin",
+    "woocommerce": "plugins.woocommerce.plugin:WooCommercePlugin",
+    "wordpress_specialist": "plugins.wordpress_specialist.plugin:WordPressSpecialistPlugin",
+    "gitea": "plugins.gitea.plugin:GiteaPlugin",
+    "n8n": "plugins.n8n.plugin:N8nPlugin",
+    "supabase": "plugins.supabase.plugin:SupabasePlugin",
+    "openpanel": "plugins.openpanel.plugin:OpenPanelPlugin",
+    "coolify": "plugins.coolify.plugin:CoolifyPlugin",
+}
 
 # Create global registry
 registry = PluginRegistry()
 
-# Register available plugins (8 active plugins)
-registry.register("wordpress", WordPressPlugin)
-registry.register("woocommerce", WooCommercePlugin)
-registry.register("wordpress_specialist", WordPressSpecialistPlugin)
-registry.register("gitea", GiteaPlugin)
-registry.register("n8n", N8nPlugin)
-registry.register("supabase", SupabasePlugin)
-registry.register("openpanel", OpenPanelPlugin)
-registry.register("coolify", CoolifyPlugin)
+for _plugin_type, _class_path in _PLUGIN_CLASSES.items():
+    registry.register_lazy(_plugin_type, _class_path)
+
+_CLASS_NAMES = {path.partition(":")[2]: ptype for ptype, path in _PLUGIN_CLASSES.items()}
+
+
+def __getattr__(name: str):
+    """Import a plugin class on attribute access (``plugins.WordPressPlugin``)."""
+    if name in _CLASS_NAMES:
+        return registry.get_plugin_class(_CLASS_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BasePlugin",
@@ -14,6 +14,7 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.ai_image.providers.base import (
     BaseImageProvider,
     GenerationRequest,
@@ -112,7 +113,7 @@ class OpenAIProvider(BaseImageProvider):
         last_error: str = ""
         delay = 1.0
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             for attempt in range(1, _MAX_RETRIES + 1):
                 try:
                     async with session.post(_API_URL, json=payload, headers=headers) as resp:
@@ -173,7 +174,7 @@ class OpenAIProvider(BaseImageProvider):
 async def _fetch_url(url: str) -> bytes:
     """Fetch a DALL-E URL immediately. URLs expire in ~1h, so no caching."""
     timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    async with pooled_session(timeout=timeout) as session:
         async with session.get(url) as resp:
             if resp.status != 200:
                 raise ProviderError(
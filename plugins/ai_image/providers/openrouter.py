@@ -36,6 +36,7 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.ai_image.providers.base import (
     BaseImageProvider,
     GenerationRequest,
@@ -200,7 +201,7 @@ class OpenRouterProvider(BaseImageProvider):
         last_error: str = ""
         delay = 1.0
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             for attempt in range(1, _MAX_RETRIES + 1):
                 try:
                     async with session.post(_API_URL, json=payload, headers=headers) as resp:
@@ -278,7 +279,7 @@ class OpenRouterProvider(BaseImageProvider):
             headers["Authorization"] = f"Bearer {api_key}"
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with pooled_session(timeout=timeout) as session:
                 async with session.get(_MODELS_URL, headers=headers) as resp:
                     if resp.status != 200:
                         _logger.warning("openrouter /v1/models HTTP %s", resp.status)
@@ -424,7 +425,7 @@ async def _materialise_image(url: str) -> tuple[bytes, str]:
 
     if url.startswith("http://") or url.startswith("https://"):
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             async with session.get(url) as resp:
                 if resp.status != 200:
                     return b"", ""
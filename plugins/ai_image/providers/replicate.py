@@ -14,6 +14,7 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.ai_image.providers.base import (
     BaseImageProvider,
     GenerationRequest,
@@ -105,7 +106,7 @@ class ReplicateProvider(BaseImageProvider):
         delay = 1.0
         last_error = ""
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             for attempt in range(1, _MAX_RETRIES + 1):
                 async with session.post(_PREDICTIONS_URL, json=payload, headers=headers) as resp:
                     if resp.status in (200, 201):
@@ -152,7 +153,7 @@ class ReplicateProvider(BaseImageProvider):
         )
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
         deadline = asyncio.get_event_loop().time() + _POLL_TIMEOUT
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             while True:
                 if asyncio.get_event_loop().time() > deadline:
                     raise ProviderError(
@@ -193,7 +194,7 @@ def _first_url(output: Any) -> str | None:
 
 async def _fetch_url(url: str) -> bytes:
     timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    async with pooled_session(timeout=timeout) as session:
         async with session.get(url) as resp:
             if resp.status != 200:
                 raise ProviderError(
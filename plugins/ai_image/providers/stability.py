@@ -12,6 +12,7 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.ai_image.providers.base import (
     BaseImageProvider,
     GenerationRequest,
@@ -101,7 +102,7 @@ class StabilityProvider(BaseImageProvider):
         last_error: str = ""
         delay = 1.0
         timeout = aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with pooled_session(timeout=timeout) as session:
             for attempt in range(1, _MAX_RETRIES + 1):
                 try:
                     async with session.post(endpoint, data=form, headers=headers) as resp:
@@ -2,35 +2,46 @@
 
 Lookup by name; raises :class:`ProviderError` with code
 ``PROVIDER_UNKNOWN`` if the caller supplies a non-existent provider.
+
+Provider modules are imported, and their singletons created, on first
+lookup, so importing the registry does not pull in every provider.
 """
 
 from __future__ import annotations
 
+import importlib
+
 from plugins.ai_image.providers.base import BaseImageProvider, ProviderError
-from plugins.ai_image.providers.openai import OpenAIProvider
-from plugins.ai_image.providers.openrouter import OpenRouterProvider
-from plugins.ai_image.providers.replicate import ReplicateProvider
-from plugins.ai_image.providers.stability import StabilityProvider
-
-_PROVIDERS: dict[str, BaseImageProvider] = {
-    "openai": OpenAIProvider(),
-    "stability": StabilityProvider(),
-    "replicate": ReplicateProvider(),
-    "openrouter": OpenRouterProvider(),
+
+# name -> "module:ClassName", in registration order
+_PROVIDER_CLASSES: dict[str, str] = {
+    "openai": "plugins.ai_image.providers.openai:OpenAIProvider",
+    "stability": "plugins.ai_image.providers.stability:StabilityProvider",
+    "replicate": "plugins.ai_image.providers.replicate:ReplicateProvider",
+    "openrouter": "plugins.ai_image.providers.openrouter:OpenRouterProvider",
 }
 
+_PROVIDERS: dict[str, BaseImageProvider] = {}
+
 
 def get_provider(name: str) -> BaseImageProvider:
     """Return the registered provider singleton by name."""
+    provider = _PROVIDERS.get(name)
+    if provider is not None:
+        return provider
     try:
-        return _PROVIDERS[name]
+        class_path = _PROVIDER_CLASSES[name]
     except KeyError as exc:
         raise ProviderError(
             "PROVIDER_UNKNOWN",
-            f"Unknown provider '{name}'. Allowed: {', '.join(_PROVIDERS)}.",
+            f"Unknown provider '{name}'. Allowed: {', '.join(_PROVIDER_CLASSES)}.",
         ) from exc
+    module_name, _, class_name = class_path.partition(":")
+    provider = getattr(importlib.import_module(module_name), class_name)()
+    _PROVIDERS[name] = provider
+    return provider
 
 
 def list_providers() -> list[str]:
     """Return all registered provider names in registration order."""
-    return list(_PROVIDERS.keys())
+    return list(_PROVIDER_CLASSES.keys())
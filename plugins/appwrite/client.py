@@ -19,7 +19,7 @@ import base64
 import logging
 from typing import Any
 
-import aiohttp
+from core.http_transport import pooled_session
 
 
 class AppwriteClient:
@@ -127,7 +127,7 @@ class AppwriteClient:
         if isinstance(json_data, dict):
             json_data = self._coerce_json_types(json_data)
 
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session() as session:
             kwargs = {
                 "method": method,
                 "url": url,
@@ -5,6 +5,7 @@ All project plugins must inherit from this base class.
 This ensures consistency across different project types.
 """
 
+import importlib
 import logging
 from abc import ABC, abstractmethod
 from typing import Any
@@ -269,10 +270,15 @@ class BasePlugin(ABC):
 class PluginRegistry:
     """
     Registry for managing available plugin types.
+
+    Plugins can be registered as classes or lazily as ``"module:ClassName"``
+    paths; a lazy plugin's module is imported the first time its class is
+    needed (:meth:`get_plugin_class`).
     """
 
     def __init__(self):
-        self._plugin_classes: dict[str, type] = {}
+        # plugin_type -> class, or "module:ClassName" until first use
+        self._plugin_classes: dict[str, type | str] = {}
         self.logger = logging.getLogger("PluginRegistry")
 
     def register(self, plugin_type: str, plugin_class: type) -> None:
@@ -289,6 +295,43 @@ class PluginRegistry:
         self._plugin_classes[plugin_type] = plugin_class
         self.logger.info(f"Registered plugin type: {plugin_type}")
 
+    def register_lazy(self, plugin_type: str, class_path: str) -> None:
+        """
+        Register a plugin by import path without importing it.
+
+        Args:
+            plugin_type: Type identifier (e.g., 'wordpress')
+            class_path: ``"package.module:ClassName"``
+        """
+        self._plugin_classes[plugin_type] = class_path
+        self.logger.debug(f"Registered lazy plugin type: {plugin_type} ({class_path})")
+
+    def get_plugin_class(self, plugin_type: str) -> type:
+        """
+        Get a plugin class, importing its module on first use.
+
+        Raises:
+            KeyError: If plugin_type is not registered
+        """
+        if plugin_type not in self._plugin_classes:
+            raise KeyError(f"Unknown plugin type: {plugin_type}")
+
+        plugin_class = self._plugin_classes[plugin_type]
+        if isinstance(plugin_class, str):
+            module_name, _, class_name = plugin_class.partition(":")
+            plugin_class = getattr(importlib.import_module(module_name), class_name)
+            self.register(plugin_type, plugin_class)
+        return plugin_class
+
+    def get_class_path(self, plugin_type: str) -> str:
+        """``"module:ClassName"`` of a registered plugin (without importing it)."""
+        plugin_class = self._plugin_classes.get(plugin_type)
+        if plugin_class is None:
+            raise KeyError(f"Unknown plugin type: {plugin_type}")
+        if isinstance(plugin_class, str):
+            return plugin_class
+        return f"{plugin_class.__module__}:{plugin_class.__qualname__}"
+
     def create_instance(
         self, plugin_type: str, project_id: str, config: dict[str, Any]
     ) -> BasePlugin:
@@ -308,10 +351,7 @@ class PluginRegistry:
         Raises:
             KeyError: If plugin_type is not registered
         """
-        if plugin_type not in self._plugin_classes:
-            raise KeyError(f"Unknown plugin type: {plugin_type}")
-
-        plugin_class = self._plugin_classes[plugin_type]
+        plugin_class = self.get_plugin_class(plugin_type)
         # Option B signature: config first, project_id optional
         return plugin_class(config, project_id=project_id)
 
@@ -8,7 +8,7 @@ Separates API communication from business logic.
 import logging
 from typing import Any
 
-import aiohttp
+from core.http_transport import pooled_session
 
 
 class CoolifyClient:
@@ -73,7 +73,7 @@ class CoolifyClient:
         self.logger.debug(f"{method} {url}")
 
         async with (
-            aiohttp.ClientSession() as session,
+            pooled_session() as session,
             session.request(
                 method=method,
                 url=url,
@@ -38,7 +38,7 @@ import json
 import logging
 from typing import Any
 
-import aiohttp
+from core.http_transport import pooled_session
 
 
 def _ensure_list(value: Any) -> list[str]:
@@ -133,7 +133,7 @@ class DirectusClient:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
 
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session() as session:
             kwargs = {
                 "method": method,
                 "url": url,
@@ -7,10 +7,14 @@ Separates API communication from business logic.
 
 import base64
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
+from core.pagination import MAX_CONCURRENCY, Page, iter_numbered, pages_for
+
 
 class GiteaClient:
     """
@@ -66,6 +70,7 @@ class GiteaClient:
         params: dict | None = None,
         json_data: dict | None = None,
         headers_override: dict | None = None,
+        return_headers: bool = False,
     ) -> Any:
         """
         Make authenticated request to Gitea REST API.
@@ -76,6 +81,8 @@ class GiteaClient:
             params: Query parameters
             json_data: JSON body data
             headers_override: Override default headers
+            return_headers: If True, return ``(data, headers)`` with
+                lower-cased header names (used for pagination)
 
         Returns:
             API response (dict, list, or None)
@@ -103,7 +110,7 @@ class GiteaClient:
         self.logger.debug(f"Data: {json_data}")
 
         async with (
-            aiohttp.ClientSession() as session,
+            pooled_session() as session,
             session.request(
                 method=method, url=url, params=params, json=json_data, headers=headers
             ) as response,
@@ -129,8 +136,43 @@ class GiteaClient:
                 error_msg = response_data.get("message", "Unknown error")
                 raise Exception(f"Gitea API error (status {response.status}): {error_msg}")
 
+            if return_headers:
+                return response_data, {k.lower(): v for k, v in response.headers.items()}
             return response_data
 
+    def iter_items(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        limit: int = 50,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every item of a paged list endpoint.
+
+        Uses ``page``/``limit`` and the ``X-Total-Count`` header; pages after
+        the first are fetched concurrently (see core.pagination). Gitea caps
+        ``limit`` at its MAX_RESPONSE_ITEMS setting (50 by default).
+        """
+
+        async def fetch(page: int) -> Page:
+            data, headers = await self.request(
+                "GET",
+                endpoint,
+                params={**(params or {}), "page": page, "limit": limit},
+                return_headers=True,
+            )
+            if isinstance(data, dict):
+                # Search endpoints wrap results: {"ok": true, "data": [...]}
+                data = data.get("data")
+            items = data if isinstance(data, list) else []
+            # A short first page means the server capped ``limit``; page by that
+            served = len(items) if 0 < len(items) < limit else limit
+            return Page(items=items, total_pages=pages_for(headers.get("x-total-count"), served))
+
+        return iter_numbered(fetch, per_page=limit, concurrency=concurrency)
+
     # Repository endpoints
     async def list_repositories(
         self, owner: str | None = None, page: int = 1, limit: int = 30
@@ -144,6 +186,10 @@ class GiteaClient:
         params = {"page": page, "limit": limit}
         return await self.request("GET", endpoint, params=params)
 
+    def iter_repositories(self, owner: str | None = None) -> AsyncIterator[dict]:
+        """Iterate over all repositories of a user/org or the current user"""
+        return self.iter_items(f"users/{owner}/repos" if owner else "user/repos")
+
     async def get_repository(self, owner: str, repo: str) -> dict:
         """Get repository details"""
         return await self.request("GET", f"repos/{owner}/{repo}")
@@ -415,8 +461,6 @@ class GiteaClient:
         multipart body. This bypasses ``self.request`` because that
         helper only understands JSON bodies.
         """
-        import aiohttp
-
         try:
             raw = base64.b64decode(content_b64, validate=True)
         except Exception as exc:  # noqa: BLE001
@@ -436,7 +480,7 @@ class GiteaClient:
             filename=filename,
             content_type="application/octet-stream",
         )
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session() as session:
             async with session.post(
                 url, params={"name": filename}, data=form, headers=headers
             ) as resp:
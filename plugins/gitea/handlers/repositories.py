@@ -3,6 +3,7 @@
 import json
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
 from plugins.gitea.client import GiteaClient
 
 
@@ -40,6 +41,7 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                         "minimum": 1,
                         "maximum": 100,
                     },
+                    **fetch_all_properties(),
                 },
             },
             "scope": "read",
@@ -682,9 +684,29 @@ def get_tool_specifications() -> list[dict[str, Any]]:
 
 
 async def list_repositories(
-    client: GiteaClient, owner: str | None = None, type: str = "all", page: int = 1, limit: int = 30
+    client: GiteaClient,
+    owner: str | None = None,
+    type: str = "all",
+    page: int = 1,
+    limit: int = 30,
+    fetch_all: bool = False,
+    max_items: int | None = None,
 ) -> str:
     """List Gitea repositories"""
+    if fetch_all:
+        collected = await collect(
+            client.iter_repositories(owner=owner), max_items=max_items or MAX_ITEMS
+        )
+        result = {
+            "success": True,
+            "count": collected["count"],
+            "fetch_all": True,
+            "truncated": collected["truncated"],
+            "truncated_reason": collected["truncated_reason"],
+            "repositories": collected["items"],
+        }
+        return json.dumps(result, indent=2)
+
     repos = await client.list_repositories(owner=owner, page=page, limit=limit)
     result = {"success": True, "count": len(repos), "repositories": repos}
     return json.dumps(result, indent=2)
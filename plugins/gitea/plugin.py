@@ -9,6 +9,7 @@ from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.base import BasePlugin
 from plugins.gitea import handlers
 from plugins.gitea.client import GiteaClient
@@ -183,7 +184,7 @@ class GiteaPlugin(BasePlugin):
         headers = self.client._get_headers()
         try:
             timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with pooled_session(timeout=timeout) as session:
                 async with session.get(url, headers=headers) as resp:
                     if resp.status >= 400:
                         body = (await resp.text())[:200]
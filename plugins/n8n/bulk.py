@@ -0,0 +1,139 @@
+"""Bounded-concurrency bulk operations for the n8n plugin.
+
+The bulk admin tools (``delete_executions``, ``delete_tags``,
+``set_variables``) used to await one request after another, so pruning a
+couple of thousand executions took minutes of pure round-trip latency, and a
+revoked API key was discovered once per item. :func:`run_bulk` runs them
+on a small worker pool instead:
+
+- At most ``MCPHUB_N8N_BULK_CONCURRENCY`` (default 8) requests are in flight
+  at once, which is enough to hide latency without flooding the instance.
+- Each item gets its own :class:`ItemResult` (value or error, attempts),
+  reported in input order.
+- Transient failures (connection errors, 429 and 5xx) are retried up to
+  ``RETRIES`` times with exponential backoff starting at ``RETRY_BACKOFF``.
+- An auth error (401/403) aborts the run: no new items are started,
+  requests already in flight finish, and the rest are reported as skipped.
+
+Usage::
+
+    from plugins.n8n.bulk import run_bulk
+
+    report = await run_bulk(execution_ids, client.delete_execution)
+    deleted = [r.key for r in report.succeeded]
+    failed = report.failures()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from plugins.n8n.client import N8nApiError, N8nAuthError, N8nConnectionError
+
+T = TypeVar("T")
+
+CONCURRENCY = int(os.environ.get("MCPHUB_N8N_BULK_CONCURRENCY", "8"))
+RETRIES = 2
+RETRY_BACKOFF = 0.5
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, N8nConnectionError):
+        return True
+    return isinstance(exc, N8nApiError) and exc.status_code in RETRYABLE_STATUSES
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item of a bulk run."""
+
+    key: str
+    ok: bool
+    value: Any = None
+    error: Exception | None = None
+    attempts: int = 0
+
+
+@dataclass
+class BulkReport:
+    """Per-item results of :func:`run_bulk`, in input order."""
+
+    results: list[ItemResult]
+    skipped: list[str] = field(default_factory=list)
+    aborted: N8nAuthError | None = None
+
+    @property
+    def succeeded(self) -> list[ItemResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[ItemResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and all(r.ok for r in self.results)
+
+    def failures(self, key_field: str = "id") -> list[dict[str, Any]] | None:
+        """Failed items as ``[{key_field: ..., "error": ...}]``, or None if there are none."""
+        return [{key_field: r.key, "error": str(r.error)} for r in self.failed] or None
+
+    def abort_info(self) -> dict[str, Any]:
+        """``aborted``/``skipped`` response fields; empty unless the run was aborted."""
+        if self.aborted is None:
+            return {}
+        return {"aborted": self.aborted.to_dict(), "skipped": self.skipped}
+
+
+async def run_bulk(
+    items: Iterable[T],
+    op: Callable[[T], Awaitable[Any]],
+    *,
+    key: Callable[[T], str] = str,
+    concurrency: int | None = None,
+    retries: int = RETRIES,
+) -> BulkReport:
+    """Apply ``op`` to every item with at most ``concurrency`` calls in flight.
+
+    Per-item exceptions are collected in the report rather than raised;
+    ``key`` names each item in it.
+    """
+    items = list(items)
+    results: list[ItemResult | None] = [None] * len(items)
+    pending = iter(range(len(items)))
+    aborted: N8nAuthError | None = None
+
+    async def attempt(item: T) -> ItemResult:
+        nonlocal aborted
+        n = 0
+        while True:
+            n += 1
+            try:
+                return ItemResult(key(item), True, await op(item), attempts=n)
+            except N8nAuthError as exc:
+                aborted = aborted or exc
+                return ItemResult(key(item), False, error=exc, attempts=n)
+            except Exception as exc:
+                if n > retries or aborted is not None or not is_transient(exc):
+                    return ItemResult(key(item), False, error=exc, attempts=n)
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** (n - 1))
+
+    async def worker() -> None:
+        for i in pending:
+            if aborted is not None:
+                return
+            results[i] = await attempt(items[i])
+
+    workers = max(1, min(concurrency or CONCURRENCY, len(items)))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    return BulkReport(
+        results=[r for r in results if r is not None],
+        skipped=[key(item) for item, r in zip(items, results, strict=True) if r is None],
+        aborted=aborted,
+    )
@@ -5,10 +5,14 @@ Separates API communication from business logic.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
+from core.pagination import Page, iter_cursor
+
 
 class N8nApiError(Exception):
     """Base exception for n8n API errors with structured error info."""
@@ -144,7 +148,7 @@ class N8nClient:
 
         try:
             async with (
-                aiohttp.ClientSession() as session,
+                pooled_session() as session,
                 session.request(
                     method=method, url=url, params=params, json=json_data, headers=headers
                 ) as response,
@@ -181,6 +185,27 @@ class N8nClient:
             raise N8nValidationError(message, status_code=status)
         raise N8nApiError(message, error_code="API_ERROR", status_code=status)
 
+    def iter_items(
+        self, endpoint: str, params: dict | None = None, *, limit: int = 250
+    ) -> AsyncIterator[Any]:
+        """Iterate over every item of a list endpoint (``cursor``/``nextCursor``).
+
+        Cursor pages depend on each other, so they are fetched one by one;
+        ``limit`` defaults to n8n's maximum page size.
+        """
+
+        async def fetch(cursor: str | None) -> Page:
+            data = await self.request(
+                "GET", endpoint, params={**(params or {}), "limit": limit, "cursor": cursor}
+            )
+            items = data.get("data") if isinstance(data, dict) else data
+            return Page(
+                items=items if isinstance(items, list) else [],
+                next_cursor=data.get("nextCursor") if isinstance(data, dict) else None,
+            )
+
+        return iter_cursor(fetch)
+
     # =====================
     # WORKFLOW ENDPOINTS
     # =====================
@@ -197,6 +222,12 @@ class N8nClient:
         params = {"active": active, "tags": tags, "name": name, "limit": limit, "cursor": cursor}
         return await self.request("GET", "workflows", params=params)
 
+    def iter_workflows(
+        self, active: bool | None = None, tags: str | None = None, name: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all workflows matching the filters"""
+        return self.iter_items("workflows", {"active": active, "tags": tags, "name": name})
+
     async def get_workflow(self, workflow_id: str) -> dict[str, Any]:
         """Get workflow by ID"""
         return await self.request("GET", f"workflows/{workflow_id}")
@@ -266,6 +297,22 @@ class N8nClient:
         }
         return await self.request("GET", "executions", params=params)
 
+    def iter_executions(
+        self,
+        workflow_id: str | None = None,
+        status: str | None = None,
+        project_id: str | None = None,
+        include_data: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all executions matching the filters."""
+        params = {
+            "workflowId": workflow_id,
+            "status": status,
+            "projectId": project_id,
+            "includeData": str(include_data).lower(),
+        }
+        return self.iter_items("executions", params)
+
     async def get_execution(self, execution_id: str, include_data: bool = True) -> dict[str, Any]:
         """Get execution details"""
         params = {"includeData": str(include_data).lower()}
@@ -462,7 +509,7 @@ class N8nClient:
         """Check n8n instance health."""
         url = f"{self.site_url}/healthz"
         try:
-            async with aiohttp.ClientSession() as session, session.get(url) as response:
+            async with pooled_session() as session, session.get(url) as response:
                 if response.status == 200:
                     return {"healthy": True, "status": "ok"}
                 return {"healthy": False, "status": f"unhealthy (status {response.status})"}
@@ -1,9 +1,12 @@
 """Execution Handler - manages n8n workflow executions."""
 
-import asyncio
 import json
+import time
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
+from plugins.n8n import bulk, waiter
 from plugins.n8n.client import N8nApiError, N8nClient
 
 
@@ -50,6 +53,7 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                         "maximum": 250,
                     },
                     "cursor": {"type": "string", "description": "OPTIONAL: Pagination cursor."},
+                    **fetch_all_properties(),
                 },
             },
             "scope": "read",
@@ -114,6 +118,45 @@ def get_tool_specifications() -> list[dict[str, Any]]:
             },
             "scope": "write",
         },
+        # === DELETE EXECUTIONS BY FILTER (BULK) ===
+        {
+            "name": "delete_executions_by_filter",
+            "method_name": "delete_executions_by_filter",
+            "description": "Bulk delete finished executions that stopped more than N days ago, optionally limited to one workflow and/or status. Running and waiting executions are never deleted. Use dry_run to preview the matching execution IDs first.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "older_than_days": {
+                        "type": "integer",
+                        "description": "Delete executions that stopped over this many days ago",
+                        "minimum": 0,
+                    },
+                    "workflow_id": {
+                        "type": "string",
+                        "description": "OPTIONAL: Only delete executions of this workflow",
+                    },
+                    "status": {
+                        "type": "string",
+                        "enum": ["success", "error", "canceled"],
+                        "description": "OPTIONAL: Only delete executions with this status",
+                    },
+                    "max_items": {
+                        "type": "integer",
+                        "description": "Maximum number of executions to delete in one call",
+                        "default": 1000,
+                        "minimum": 1,
+                        "maximum": 10000,
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Only list the matching execution IDs, delete nothing",
+                        "default": False,
+                    },
+                },
+                "required": ["older_than_days"],
+            },
+            "scope": "admin",
+        },
         # === STOP EXECUTION ===
         {
             "name": "stop_execution",
@@ -172,7 +215,7 @@ def get_tool_specifications() -> list[dict[str, Any]]:
         {
             "name": "wait_for_execution",
             "method_name": "wait_for_execution",
-            "description": "Poll an execution until it completes. Returns final status and output.",
+            "description": "Wait for an execution to complete. Polls status only, backing off on long runs; concurrent waits on the same execution share one poll. Returns final status, plus the run data if include_data is set.",
             "schema": {
                 "type": "object",
                 "properties": {
@@ -190,11 +233,17 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                     },
                     "poll_interval": {
                         "type": "integer",
-                        "description": "Seconds between status checks",
+                        "description": "Seconds before the second status check; the interval then "
+                        f"grows {waiter.BACKOFF:g}x per check (up to {waiter.POLL_MAX:g}s)",
                         "default": 2,
                         "minimum": 1,
                         "maximum": 30,
                     },
+                    "include_data": {
+                        "type": "boolean",
+                        "description": "Fetch the full run data once the execution has finished",
+                        "default": False,
+                    },
                 },
                 "required": ["execution_id"],
             },
@@ -206,6 +255,19 @@ def get_tool_specifications() -> list[dict[str, Any]]:
 # === HANDLER FUNCTIONS ===
 
 
+def _execution_summary(e: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": e.get("id"),
+        "workflow_id": e.get("workflowId"),
+        "workflow_name": e.get("workflowData", {}).get("name"),
+        "status": e.get("status"),
+        "finished": e.get("finished"),
+        "started_at": e.get("startedAt"),
+        "stopped_at": e.get("stoppedAt"),
+        "mode": e.get("mode"),
+    }
+
+
 async def list_executions(
     client: N8nClient,
     workflow_id: str | None = None,
@@ -214,9 +276,32 @@ async def list_executions(
     include_data: bool = False,
     limit: int = 20,
     cursor: str | None = None,
+    fetch_all: bool = False,
+    max_items: int | None = None,
 ) -> str:
     """List workflow executions."""
     try:
+        if fetch_all:
+            collected = await collect(
+                client.iter_executions(
+                    workflow_id=workflow_id,
+                    status=status,
+                    project_id=project_id,
+                    include_data=include_data,
+                ),
+                max_items=max_items or MAX_ITEMS,
+                transform=_execution_summary,
+            )
+            result = {
+                "success": True,
+                "count": collected["count"],
+                "fetch_all": True,
+                "truncated": collected["truncated"],
+                "truncated_reason": collected["truncated_reason"],
+                "executions": collected["items"],
+            }
+            return json.dumps(result, indent=2)
+
         response = await client.list_executions(
             workflow_id=workflow_id,
             status=status,
@@ -232,19 +317,7 @@ async def list_executions(
         result = {
             "success": True,
             "count": len(executions),
-            "executions": [
-                {
-                    "id": e.get("id"),
-                    "workflow_id": e.get("workflowId"),
-                    "workflow_name": e.get("workflowData", {}).get("name"),
-                    "status": e.get("status"),
-                    "finished": e.get("finished"),
-                    "started_at": e.get("startedAt"),
-                    "stopped_at": e.get("stoppedAt"),
-                    "mode": e.get("mode"),
-                }
-                for e in executions
-            ],
+            "executions": [_execution_summary(e) for e in executions],
             "next_cursor": next_cursor,
         }
 
@@ -301,21 +374,15 @@ async def delete_execution(client: N8nClient, execution_id: str) -> str:
 async def delete_executions(client: N8nClient, execution_ids: list[str]) -> str:
     """Bulk delete executions"""
     try:
-        deleted = []
-        failed = []
-
-        for exec_id in execution_ids:
-            try:
-                await client.delete_execution(exec_id)
-                deleted.append(exec_id)
-            except Exception as e:
-                failed.append({"id": exec_id, "error": str(e)})
+        report = await bulk.run_bulk(execution_ids, client.delete_execution)
+        deleted = [r.key for r in report.succeeded]
 
         result = {
-            "success": len(failed) == 0,
+            "success": report.ok,
             "deleted_count": len(deleted),
             "deleted": deleted,
-            "failed": failed if failed else None,
+            "failed": report.failures(),
+            **report.abort_info(),
         }
 
         return json.dumps(result, indent=2)
@@ -324,6 +391,66 @@ async def delete_executions(client: N8nClient, execution_ids: list[str]) -> str:
         return _error_json(e)
 
 
+def _stopped_before(execution: dict[str, Any], cutoff: datetime) -> bool:
+    """True if the execution has finished and stopped before ``cutoff``."""
+    stopped = execution.get("stoppedAt")
+    if not stopped:
+        return False  # still running or waiting
+    try:
+        stopped_at = datetime.fromisoformat(stopped)
+    except ValueError:
+        return False
+    if stopped_at.tzinfo is None:
+        stopped_at = stopped_at.replace(tzinfo=UTC)
+    return stopped_at < cutoff
+
+
+async def delete_executions_by_filter(
+    client: N8nClient,
+    older_than_days: int,
+    workflow_id: str | None = None,
+    status: str | None = None,
+    max_items: int = 1000,
+    dry_run: bool = False,
+) -> str:
+    """Delete finished executions older than ``older_than_days`` matching the filters"""
+    try:
+        cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
+        matched: list[str] = []
+        scanned = 0
+        # Collect ids first: deleting while paging would shift the cursor
+        async for execution in client.iter_executions(workflow_id=workflow_id, status=status):
+            scanned += 1
+            if _stopped_before(execution, cutoff):
+                matched.append(str(execution.get("id")))
+                if len(matched) >= max_items:
+                    break
+
+        result: dict[str, Any] = {
+            "success": True,
+            "dry_run": dry_run,
+            "cutoff": cutoff.isoformat(),
+            "scanned": scanned,
+            "matched": len(matched),
+            "truncated": len(matched) >= max_items,
+        }
+        if dry_run:
+            result["execution_ids"] = matched
+            return json.dumps(result, indent=2)
+
+        report = await bulk.run_bulk(matched, client.delete_execution)
+        result.update(
+            success=report.ok,
+            deleted_count=len(report.succeeded),
+            failed=report.failures(),
+            **report.abort_info(),
+        )
+        return json.dumps(result, indent=2)
+
+    except Exception as e:
+        return _error_json(e)
+
+
 async def stop_execution(client: N8nClient, execution_id: str) -> str:
     """Stop a running execution"""
     try:
@@ -406,37 +533,39 @@ async def get_execution_data(client: N8nClient, execution_id: str) -> str:
 
 
 async def wait_for_execution(
-    client: N8nClient, execution_id: str, timeout_seconds: int = 60, poll_interval: int = 2
+    client: N8nClient,
+    execution_id: str,
+    timeout_seconds: int = 60,
+    poll_interval: int = 2,
+    include_data: bool = False,
 ) -> str:
-    """Wait for execution to complete"""
+    """Wait for execution to complete (status-only polls shared across waiters)"""
     try:
-        elapsed = 0
-        final_status = None
-        execution = None
-
-        while elapsed < timeout_seconds:
-            execution = await client.get_execution(execution_id, include_data=True)
-            status = execution.get("status")
-            finished = execution.get("finished")
-
-            if finished or status in ["success", "error", "crashed"]:
-                final_status = status
-                break
-
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+        started = time.monotonic()
+        outcome = await waiter.wait_for_execution(
+            client, execution_id, timeout=timeout_seconds, poll_interval=poll_interval
+        )
+        elapsed = round(time.monotonic() - started, 1)
+        execution = outcome.execution or {}
 
-        if not final_status:
+        if not outcome.finished:
             return json.dumps(
                 {
                     "success": False,
                     "error": f"Timeout after {timeout_seconds} seconds",
                     "execution_id": execution_id,
-                    "last_status": execution.get("status") if execution else "unknown",
+                    "last_status": execution.get("status") if outcome.execution else "unknown",
+                    "status_checks": outcome.checks,
                 },
                 indent=2,
             )
 
+        final_status = execution.get("status")
+        # Status polls carry no run data; failed runs still report their
+        # error, so they (and include_data callers) get one full fetch
+        if include_data or final_status == "error":
+            execution = await outcome.full_execution()
+
         result = {
             "success": True,
             "execution_id": execution_id,
@@ -445,14 +574,18 @@ async def wait_for_execution(
             "started_at": execution.get("startedAt"),
             "stopped_at": execution.get("stoppedAt"),
             "duration_seconds": elapsed,
+            "status_checks": outcome.checks,
         }
 
         # Include error if failed
         if final_status == "error":
-            exec_data = execution.get("data", {})
+            exec_data = execution.get("data") or {}
             result_data = exec_data.get("resultData", {})
             result["error"] = result_data.get("error")
 
+        if include_data:
+            result["data"] = execution.get("data")
+
         return json.dumps(result, indent=2)
 
     except Exception as e:
@@ -3,6 +3,7 @@
 import json
 from typing import Any
 
+from plugins.n8n import bulk
 from plugins.n8n.client import N8nApiError, N8nClient
 
 
@@ -158,15 +159,14 @@ async def delete_tag(client: N8nClient, tag_id: str) -> str:
 
 async def delete_tags(client: N8nClient, tag_ids: list[str]) -> str:
     try:
-        deleted, failed = [], []
-        for tid in tag_ids:
-            try:
-                await client.delete_tag(tid)
-                deleted.append(tid)
-            except Exception as e:
-                failed.append({"id": tid, "error": str(e)})
+        report = await bulk.run_bulk(tag_ids, client.delete_tag)
         return json.dumps(
-            {"success": len(failed) == 0, "deleted": deleted, "failed": failed if failed else None},
+            {
+                "success": report.ok,
+                "deleted": [r.key for r in report.succeeded],
+                "failed": report.failures(),
+                **report.abort_info(),
+            },
             indent=2,
         )
     except Exception as e:
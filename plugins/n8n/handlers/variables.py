@@ -3,6 +3,7 @@
 import json
 from typing import Any
 
+from plugins.n8n import bulk
 from plugins.n8n.client import N8nApiError, N8nClient
 
 
@@ -169,29 +170,25 @@ async def delete_variable(client: N8nClient, key: str) -> str:
 
 async def set_variables(client: N8nClient, variables: dict[str, str]) -> str:
     try:
-        created, updated, failed = [], [], []
-
-        for key, value in variables.items():
-            try:
-                # Try to get existing variable
-                try:
-                    await client.get_variable(key)
-                    # Variable exists, update it
-                    await client.update_variable(key, value)
-                    updated.append(key)
-                except Exception:
-                    # Variable doesn't exist, create it
-                    await client.create_variable(key, value)
-                    created.append(key)
-            except Exception as e:
-                failed.append({"key": key, "error": str(e)})
-
+        # One listing tells us which keys exist instead of a GET per key
+        existing = {v.get("key") async for v in client.iter_items("variables")}
+
+        async def upsert(item: tuple[str, str]) -> str:
+            key, value = item
+            if key in existing:
+                await client.update_variable(key, value)
+                return "updated"
+            await client.create_variable(key, value)
+            return "created"
+
+        report = await bulk.run_bulk(variables.items(), upsert, key=lambda item: item[0])
         return json.dumps(
             {
-                "success": len(failed) == 0,
-                "created": created,
-                "updated": updated,
-                "failed": failed if failed else None,
+                "success": report.ok,
+                "created": [r.key for r in report.succeeded if r.value == "created"],
+                "updated": [r.key for r in report.succeeded if r.value == "updated"],
+                "failed": report.failures("key"),
+                **report.abort_info(),
             },
             indent=2,
         )
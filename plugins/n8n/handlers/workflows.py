@@ -3,6 +3,8 @@
 import json
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
+from plugins.n8n import bulk
 from plugins.n8n.client import N8nApiError, N8nClient
 
 
@@ -39,7 +41,9 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                     "cursor": {
                         "type": "string",
                         "description": "OPTIONAL: Pagination cursor for next page.",
+                        **fetch_all_properties(),
                     },
+                    **fetch_all_properties(),
                 },
             },
             "scope": "read",
@@ -182,6 +186,52 @@ def get_tool_specifications() -> list[dict[str, Any]]:
             },
             "scope": "write",
         },
+        # === ACTIVATE WORKFLOWS BY TAG (BULK) ===
+        {
+            "name": "activate_workflows_by_tag",
+            "method_name": "activate_workflows_by_tag",
+            "description": "Bulk activate every workflow with the given tag. Workflows that are already active are left alone; workflows without a trigger node are reported as failed.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "tag": {
+                        "type": "string",
+                        "description": "Tag name; every workflow carrying it is activated",
+                        "minLength": 1,
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Only list the workflows that would change",
+                        "default": False,
+                    },
+                },
+                "required": ["tag"],
+            },
+            "scope": "write",
+        },
+        # === DEACTIVATE WORKFLOWS BY TAG (BULK) ===
+        {
+            "name": "deactivate_workflows_by_tag",
+            "method_name": "deactivate_workflows_by_tag",
+            "description": "Bulk deactivate every workflow with the given tag. Workflows that are already inactive are left alone.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "tag": {
+                        "type": "string",
+                        "description": "Tag name; every workflow carrying it is deactivated",
+                        "minLength": 1,
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Only list the workflows that would change",
+                        "default": False,
+                    },
+                },
+                "required": ["tag"],
+            },
+            "scope": "write",
+        },
         # === EXECUTE WORKFLOW ===
         {
             "name": "execute_workflow",
@@ -357,6 +407,17 @@ def _error_json(exc: Exception) -> str:
     return json.dumps({"success": False, "error": str(exc)}, indent=2)
 
 
+def _workflow_summary(w: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": w.get("id"),
+        "name": w.get("name"),
+        "active": w.get("active"),
+        "tags": [t.get("name") for t in w.get("tags", [])],
+        "created_at": w.get("createdAt"),
+        "updated_at": w.get("updatedAt"),
+    }
+
+
 async def list_workflows(
     client: N8nClient,
     active: bool | None = None,
@@ -364,9 +425,27 @@ async def list_workflows(
     name: str | None = None,
     limit: int = 50,
     cursor: str | None = None,
+    fetch_all: bool = False,
+    max_items: int | None = None,
 ) -> str:
     """List all workflows with filters"""
     try:
+        if fetch_all:
+            collected = await collect(
+                client.iter_workflows(active=active, tags=tags, name=name),
+                max_items=max_items or MAX_ITEMS,
+                transform=_workflow_summary,
+            )
+            result = {
+                "success": True,
+                "count": collected["count"],
+                "fetch_all": True,
+                "truncated": collected["truncated"],
+                "truncated_reason": collected["truncated_reason"],
+                "workflows": collected["items"],
+            }
+            return json.dumps(result, indent=2)
+
         response = await client.list_workflows(
             active=active, tags=tags, name=name, limit=limit, cursor=cursor
         )
@@ -377,17 +456,7 @@ async def list_workflows(
         result = {
             "success": True,
             "count": len(workflows),
-            "workflows": [
-                {
-                    "id": w.get("id"),
-                    "name": w.get("name"),
-                    "active": w.get("active"),
-                    "tags": [t.get("name") for t in w.get("tags", [])],
-                    "created_at": w.get("createdAt"),
-                    "updated_at": w.get("updatedAt"),
-                }
-                for w in workflows
-            ],
+            "workflows": [_workflow_summary(w) for w in workflows],
             "next_cursor": next_cursor,
         }
 
@@ -561,6 +630,50 @@ async def deactivate_workflow(client: N8nClient, workflow_id: str) -> str:
         return _error_json(e)
 
 
+async def _set_active_by_tag(client: N8nClient, tag: str, active: bool, dry_run: bool) -> str:
+    try:
+        matched, changes = 0, []
+        async for w in client.iter_workflows(tags=tag):
+            matched += 1
+            if bool(w.get("active")) != active:
+                changes.append({"id": str(w.get("id")), "name": w.get("name")})
+
+        result: dict[str, Any] = {
+            "success": True,
+            "tag": tag,
+            "dry_run": dry_run,
+            "matched": matched,
+            "unchanged_count": matched - len(changes),
+        }
+        if dry_run:
+            result["would_change"] = changes
+            return json.dumps(result, indent=2)
+
+        op = client.activate_workflow if active else client.deactivate_workflow
+        report = await bulk.run_bulk(changes, lambda w: op(w["id"]), key=lambda w: w["id"])
+        done = {r.key for r in report.succeeded}
+        result.update(
+            success=report.ok,
+            changed=[w for w in changes if w["id"] in done],
+            failed=report.failures(),
+            **report.abort_info(),
+        )
+        return json.dumps(result, indent=2)
+
+    except Exception as e:
+        return _error_json(e)
+
+
+async def activate_workflows_by_tag(client: N8nClient, tag: str, dry_run: bool = False) -> str:
+    """Activate every workflow carrying a tag"""
+    return await _set_active_by_tag(client, tag, True, dry_run)
+
+
+async def deactivate_workflows_by_tag(client: N8nClient, tag: str, dry_run: bool = False) -> str:
+    """Deactivate every workflow carrying a tag"""
+    return await _set_active_by_tag(client, tag, False, dry_run)
+
+
 async def execute_workflow(client: N8nClient, workflow_id: str) -> str:
     """Execute a workflow manually"""
     try:
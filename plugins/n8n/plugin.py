@@ -2,7 +2,7 @@
 n8n Plugin - Workflow Automation Management
 
 Complete n8n workflow automation management through REST API.
-Provides 56 tools across 8 categories: workflows, executions,
+Provides 60 tools across 8 categories: workflows, executions,
 credentials, tags, users, projects, variables, and system.
 """
 
@@ -18,8 +18,10 @@ class N8nPlugin(BasePlugin):
     n8n Automation Plugin - Comprehensive workflow management.
 
     Provides complete n8n management capabilities including:
-    - Workflow management (CRUD, activate, deactivate, execute, transfer)
-    - Execution monitoring (list, get, delete, retry, wait, project filter)
+    - Workflow management (CRUD, activate, deactivate, bulk by tag, execute,
+      transfer)
+    - Execution monitoring (list, get, delete, bulk delete by age, retry, wait,
+      project filter)
     - Credential management (get, create, delete, schema, transfer)
     - Tag management (CRUD, bulk delete)
     - User management (CRUD, roles)
@@ -27,7 +29,7 @@ class N8nPlugin(BasePlugin):
     - Variable management (CRUD, bulk set) - Enterprise/Pro
     - System operations (audit, source control, health)
 
-    Total: 57 tools
+    Total: 60 tools
     """
 
     @staticmethod
@@ -64,13 +66,13 @@ class N8nPlugin(BasePlugin):
         with site parameter routing.
 
         Returns:
-            List of tool specification dictionaries (56 tools total)
+            List of tool specification dictionaries (60 tools total)
         """
         specs = []
 
         # Collect specifications from all handlers
-        specs.extend(handlers.workflows.get_tool_specifications())  # 15 tools
-        specs.extend(handlers.executions.get_tool_specifications())  # 8 tools
+        specs.extend(handlers.workflows.get_tool_specifications())  # 17 tools
+        specs.extend(handlers.executions.get_tool_specifications())  # 9 tools
         specs.extend(handlers.credentials.get_tool_specifications())  # 5 tools
         specs.extend(handlers.tags.get_tool_specifications())  # 6 tools
         specs.extend(handlers.users.get_tool_specifications())  # 5 tools
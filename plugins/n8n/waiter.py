@@ -0,0 +1,140 @@
+"""Shared status polling for n8n executions.
+
+``wait_for_execution`` used to fetch the full execution (``includeData=true``)
+every two seconds, so waiting on a data-heavy workflow downloaded its whole
+run payload 30 times a minute, and every concurrent waiter on the same
+execution polled on its own. Waiting now works like this:
+
+- Polls are status-only (``includeData=false``). The interval starts at the
+  caller's ``poll_interval`` and grows by ``BACKOFF`` (1.5x) per check up to
+  ``MCPHUB_N8N_POLL_MAX_SEC`` (default 10), so long runs cost a handful of
+  requests instead of one every two seconds.
+- One poll task runs per (instance URL, API key, execution id). Every
+  waiter awaits the same task with its own timeout; the task is cancelled
+  once the last waiter leaves. Waiters using another API key get their own
+  poll, so status and run data are always fetched with the caller's key.
+- The full execution is fetched once, after completion, and only by
+  waiters that ask for it; concurrent askers share that fetch too.
+
+Connection errors during a poll are retried at the next interval; any other
+API error (404, auth) ends the wait for everyone.
+
+Usage::
+
+    from plugins.n8n.waiter import wait_for_execution
+
+    outcome = await wait_for_execution(client, "123", timeout=60, poll_interval=2)
+    if outcome.finished:
+        full = await outcome.full_execution()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any
+
+from plugins.n8n.client import N8nClient, N8nConnectionError
+
+POLL_MAX = float(os.environ.get("MCPHUB_N8N_POLL_MAX_SEC", "10"))
+BACKOFF = 1.5
+
+# "finished" is only true for successful runs; these statuses are final too
+TERMINAL_STATUSES = frozenset({"success", "error", "crashed", "canceled"})
+
+
+def is_terminal(execution: dict[str, Any]) -> bool:
+    return bool(execution.get("finished")) or execution.get("status") in TERMINAL_STATUSES
+
+
+class _Poll:
+    """One status-polling task shared by every waiter on an execution."""
+
+    def __init__(self, client: N8nClient, execution_id: str, interval: float) -> None:
+        self.client = client
+        self.execution_id = execution_id
+        self.waiters = 0
+        self.checks = 0
+        self.last: dict[str, Any] | None = None
+        self.task: asyncio.Task[dict[str, Any]] = asyncio.ensure_future(self._run(interval))
+        self._full: asyncio.Task[dict[str, Any]] | None = None
+
+    async def _run(self, interval: float) -> dict[str, Any]:
+        delay = interval
+        while True:
+            try:
+                execution = await self.client.get_execution(self.execution_id, include_data=False)
+            except N8nConnectionError:
+                pass  # transient; try again at the next interval
+            else:
+                self.checks += 1
+                self.last = execution
+                if is_terminal(execution):
+                    return execution
+            await asyncio.sleep(delay)
+            delay = min(delay * BACKOFF, max(interval, POLL_MAX))
+
+    def full_execution(self) -> Awaitable[dict[str, Any]]:
+        if self._full is None:
+            self._full = asyncio.ensure_future(
+                self.client.get_execution(self.execution_id, include_data=True)
+            )
+        return asyncio.shield(self._full)
+
+
+@dataclass
+class WaitOutcome:
+    """Result of :func:`wait_for_execution` for one waiter."""
+
+    finished: bool
+    execution: dict[str, Any] | None  # status-only; last seen if not finished
+    checks: int
+    _poll: _Poll = field(repr=False)
+
+    def full_execution(self) -> Awaitable[dict[str, Any]]:
+        """Fetch the execution with its run data (once per shared poll)."""
+        return self._poll.full_execution()
+
+
+_polls: dict[tuple[str, str, str], _Poll] = {}
+
+
+def _poll_key(client: N8nClient, execution_id: str) -> tuple[str, str, str]:
+    credential = hashlib.sha256(client.api_key.encode()).hexdigest()
+    return (client.site_url, credential, str(execution_id))
+
+
+def _forget(key: tuple[str, str, str], poll: _Poll) -> None:
+    if _polls.get(key) is poll:
+        del _polls[key]
+
+
+async def wait_for_execution(
+    client: N8nClient, execution_id: str, *, timeout: float, poll_interval: float = 2
+) -> WaitOutcome:
+    """Wait up to ``timeout`` seconds for an execution to reach a final status.
+
+    Raises:
+        N8nApiError: If polling fails with anything but a connection error
+    """
+    key = _poll_key(client, execution_id)
+    poll = _polls.get(key)
+    if poll is None:
+        poll = _Poll(client, str(execution_id), max(poll_interval, 0.01))
+        _polls[key] = poll
+        poll.task.add_done_callback(lambda _t, p=poll: _forget(key, p))
+
+    poll.waiters += 1
+    try:
+        execution = await asyncio.wait_for(asyncio.shield(poll.task), timeout)
+        return WaitOutcome(True, execution, poll.checks, poll)
+    except TimeoutError:
+        return WaitOutcome(False, poll.last, poll.checks, poll)
+    finally:
+        poll.waiters -= 1
+        if poll.waiters == 0 and not poll.task.done():
+            poll.task.cancel()
+            _forget(key, poll)
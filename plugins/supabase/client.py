@@ -14,9 +14,20 @@ APIs:
 
 import base64
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-import aiohttp
+from core.http_transport import pooled_session
+from core.pagination import MAX_CONCURRENCY, Page, iter_numbered, pages_for
+
+
+def _content_range_total(content_range: str) -> int | None:
+    """Total from a PostgREST ``Content-Range`` (``0-N/TOTAL`` or ``*/TOTAL``)."""
+    if "/" in content_range:
+        total = content_range.split("/")[-1]
+        if total.isdigit():
+            return int(total)
+    return None
 
 
 class SupabaseClient:
@@ -124,7 +135,7 @@ class SupabaseClient:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
 
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session() as session:
             async with session.head(url, params=params or None, headers=headers) as response:
                 # Normalise to lowercase so callers can use consistent keys
                 # (aiohttp CIMultiDictProxy is case-insensitive but dict() is not)
@@ -140,6 +151,7 @@ class SupabaseClient:
         headers_override: dict | None = None,
         use_service_role: bool = False,
         base_url_override: str | None = None,
+        return_headers: bool = False,
     ) -> Any:
         """
         Make authenticated request to Supabase API.
@@ -153,6 +165,8 @@ class SupabaseClient:
             headers_override: Override/add headers
             use_service_role: Use service_role_key
             base_url_override: Override base URL (used for postgres-meta calls)
+            return_headers: If True, return ``(data, headers)`` with
+                lower-cased header names (used for pagination)
 
         Returns:
             API response
@@ -180,7 +194,7 @@ class SupabaseClient:
 
         self.logger.debug(f"{method} {url}")
 
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session() as session:
             kwargs = {
                 "method": method,
                 "url": url,
@@ -228,6 +242,8 @@ class SupabaseClient:
                     error_msg = self._extract_error_message(response_data)
                     raise Exception(f"Supabase API error (status {response.status}): {error_msg}")
 
+                if return_headers:
+                    return response_data, {k.lower(): v for k, v in response.headers.items()}
                 return response_data
 
     def _extract_error_message(self, response_data: Any) -> str:
@@ -426,15 +442,57 @@ class SupabaseClient:
         )
 
         # PostgREST returns count in Content-Range: 0-N/TOTAL or */TOTAL
-        content_range = response_headers.get("content-range", "")
-        if "/" in content_range:
-            try:
-                total = content_range.split("/")[-1]
-                if total != "*":
-                    return int(total)
-            except (ValueError, IndexError):
-                pass
-        return 0
+        return _content_range_total(response_headers.get("content-range", "")) or 0
+
+    def iter_rows(
+        self,
+        table: str,
+        select: str = "*",
+        filters: list[dict] | None = None,
+        order: str | None = None,
+        *,
+        page_size: int = 1000,
+        use_service_role: bool = False,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate over every row matching a query, ``page_size`` rows at a time.
+
+        The first request asks for ``Prefer: count=exact``; once the total is
+        known the remaining offsets are fetched concurrently. Pass ``order``
+        for a stable row order across pages.
+        """
+        base_params: dict[str, Any] = {"select": select}
+        if order:
+            base_params["order"] = order
+        if filters:
+            base_params.update(self._build_filter_params(filters))
+
+        size = page_size
+
+        async def fetch(page: int) -> Page:
+            nonlocal size
+            headers = {"Accept": "application/json"}
+            if page == 1:
+                headers["Prefer"] = "count=exact"
+            rows, response_headers = await self.request(
+                "GET",
+                f"/rest/v1/{table}",
+                params={**base_params, "limit": size, "offset": (page - 1) * size},
+                headers_override=headers,
+                use_service_role=use_service_role,
+                return_headers=True,
+            )
+            rows = rows if isinstance(rows, list) else []
+            if page > 1:
+                return Page(items=rows)
+            total = _content_range_total(response_headers.get("content-range", ""))
+            if rows and total is not None and len(rows) < min(size, total):
+                # The server capped the page (PostgREST max-rows); page by that
+                size = len(rows)
+            return Page(items=rows, total_pages=pages_for(total, size))
+
+        return iter_numbered(fetch, per_page=page_size, concurrency=concurrency)
 
     # =====================
     # POSTGRES-META (Admin)
@@ -3,6 +3,7 @@
 import json
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
 from plugins.supabase.client import SupabaseClient
 
 
@@ -78,6 +79,7 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                         "description": "Use service_role key to bypass RLS policies",
                         "default": False,
                     },
+                    **fetch_all_properties(),
                 },
                 "required": ["table"],
             },
@@ -455,9 +457,36 @@ async def query_table(
     limit: int = 100,
     offset: int = 0,
     use_service_role: bool = False,
+    fetch_all: bool = False,
+    max_items: int | None = None,
 ) -> str:
     """Query data from a table"""
     try:
+        if fetch_all:
+            collected = await collect(
+                client.iter_rows(
+                    table=table,
+                    select=select,
+                    filters=filters,
+                    order=order,
+                    use_service_role=use_service_role,
+                ),
+                max_items=max_items or MAX_ITEMS,
+            )
+            return json.dumps(
+                {
+                    "success": True,
+                    "table": table,
+                    "returned": collected["count"],
+                    "fetch_all": True,
+                    "truncated": collected["truncated"],
+                    "truncated_reason": collected["truncated_reason"],
+                    "data": collected["items"],
+                },
+                indent=2,
+                ensure_ascii=False,
+            )
+
         result = await client.query_table(
             table=table,
             select=select,
@@ -10,10 +10,16 @@ import base64
 import json
 import logging
 import socket
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlencode
 
 import aiohttp
 
+from core.http_transport import pooled_session
+from core.pagination import MAX_CONCURRENCY, Page, iter_numbered, pages_for
+
 
 class ConfigurationError(Exception):
     """Raised when site configuration is invalid or incomplete."""
@@ -74,6 +80,70 @@ _CONNECT_TIMEOUT = 5
 _MAX_RETRIES = 2
 _RETRY_BACKOFF_BASE = 1.0  # seconds
 
+# WordPress 5.6+ batch endpoint (``/wp-json/batch/v1``). Core rejects
+# more than 25 sub-requests per call.
+_BATCH_MAX_REQUESTS = 25
+# Parallel single requests when batching is unavailable
+_BATCH_FALLBACK_CONCURRENCY = 4
+# Sub-request error code for routes that have not opted in to batching
+_BATCH_NOT_ALLOWED = "rest_batch_not_allowed"
+# wp/v2 routes whose core controller sets ``allow_batch`` to false; sending
+# them to batch/v1 only costs a rejected round-trip (attachments: WP 5.9+)
+_BATCH_UNSUPPORTED_ROUTES = frozenset({"media"})
+
+
+def _should_include(v: Any) -> bool:
+    """Check if a param/body value should be included in a request."""
+    if v is None:
+        return False
+    if isinstance(v, str) and v.strip() == "":
+        return False
+    return not (isinstance(v, list) and len(v) == 0)
+
+
+@dataclass
+class BatchRequest:
+    """One write for :meth:`WordPressClient.batch` (endpoint relative to wp/v2)."""
+
+    method: str
+    endpoint: str
+    params: dict | None = None
+    json_data: dict | None = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one :class:`BatchRequest`; ``error`` is set on failure."""
+
+    body: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _batch_entry(req: BatchRequest) -> dict[str, Any]:
+    """Sub-request dict for batch/v1 (params go in the path's query string)."""
+    path = "/wp/v2/" + req.endpoint.lstrip("/")
+    params = {
+        k: (str(v).lower() if isinstance(v, bool) else v)
+        for k, v in (req.params or {}).items()
+        if _should_include(v)
+    }
+    if params:
+        path += "?" + urlencode(params, doseq=True)
+    entry: dict[str, Any] = {"method": req.method.upper(), "path": path}
+    body = {k: v for k, v in (req.json_data or {}).items() if _should_include(v)}
+    if body:
+        entry["body"] = body
+    return entry
+
+
+def _route(endpoint: str) -> str:
+    """Collection a wp/v2 endpoint belongs to (``media/12`` -> ``media``)."""
+    return endpoint.strip("/").split("/", 1)[0]
+
 
 class WordPressClient:
     """
@@ -125,6 +195,12 @@ class WordPressClient:
         token = base64.b64encode(credentials.encode()).decode()
         self.auth_header = f"Basic {token}"
 
+        # batch/v1 availability: None until the first batch call finds out
+        self._batch_supported: bool | None = None
+        # Routes known not to batch (core defaults, plus any whose
+        # sub-requests came back rest_batch_not_allowed)
+        self._batch_denied_routes: set[str] = set(_BATCH_UNSUPPORTED_ROUTES)
+
     async def request(
         self,
         method: str,
@@ -135,7 +211,8 @@ class WordPressClient:
         headers_override: dict | None = None,
         use_custom_namespace: bool = False,
         use_woocommerce: bool = False,
-    ) -> dict[str, Any]:
+        return_headers: bool = False,
+    ) -> Any:
         """
         Make authenticated request to WordPress REST API.
 
@@ -148,6 +225,8 @@ class WordPressClient:
             headers_override: Override default headers
             use_custom_namespace: If True, use wp-json root instead of wp/v2
             use_woocommerce: If True, use WooCommerce API base
+            return_headers: If True, return ``(json, headers)`` with
+                lower-cased header names (used for pagination)
 
         Returns:
             Dict: API response as JSON
@@ -174,20 +253,12 @@ class WordPressClient:
         # Filter out None, empty strings, and empty lists from params
         # to avoid WordPress/WooCommerce API validation errors
         # Phase K.2.1: Enhanced parameter filtering
-        def should_include(v):
-            """Check if value should be included in request."""
-            if v is None:
-                return False
-            if isinstance(v, str) and v.strip() == "":
-                return False
-            return not (isinstance(v, list) and len(v) == 0)
-
         if params:
-            params = {k: v for k, v in params.items() if should_include(v)}
+            params = {k: v for k, v in params.items() if _should_include(v)}
 
         # Filter None and empty values from JSON data for POST/PUT/PATCH requests
         if json_data:
-            json_data = {k: v for k, v in json_data.items() if should_include(v)}
+            json_data = {k: v for k, v in json_data.items() if _should_include(v)}
 
         # Make request with retry for transient errors. connect=5
         # short-circuits TCP/DNS failures in <10s (2 retries × 5s each
@@ -198,7 +269,7 @@ class WordPressClient:
         for attempt in range(_MAX_RETRIES + 1):
             try:
                 async with (
-                    aiohttp.ClientSession(timeout=timeout) as session,
+                    pooled_session(timeout=timeout) as session,
                     session.request(
                         method, url, params=params, json=json_data, data=data, headers=headers
                     ) as response,
@@ -236,7 +307,10 @@ class WordPressClient:
                         raise Exception(f"[{error_info['error_code']}] {error_info['message']}")
 
                     # Return JSON response
-                    return await response.json()
+                    body = await response.json()
+                    if return_headers:
+                        return body, {k.lower(): v for k, v in response.headers.items()}
+                    return body
 
             except (AuthenticationError, ConfigurationError):
                 raise  # Never retry auth/config errors
@@ -582,6 +656,148 @@ class WordPressClient:
             use_woocommerce=use_woocommerce,
         )
 
+    async def batch(
+        self,
+        requests: list[BatchRequest],
+        *,
+        concurrency: int = _BATCH_FALLBACK_CONCURRENCY,
+    ) -> list[BatchResult]:
+        """
+        Run many wp/v2 writes through ``POST /wp-json/batch/v1``.
+
+        Requests go out in chunks of 25 (the core limit), so 100 updates
+        cost 4 round-trips instead of 100. Never raises per item: each
+        result carries either the response body or an ``error`` string
+        in the same ``[CODE] message`` form that :meth:`request` raises.
+
+        Requests are sent one by one (at most ``concurrency`` in flight)
+        when the site has no batch route (WordPress < 5.6, or blocked),
+        when a route has not opted in to batching (``media`` in core,
+        or any route answering ``rest_batch_not_allowed``), when a batch
+        call fails as a whole, and for GET, which core does not batch. Both outcomes are
+        remembered per client so later calls skip the probe.
+
+        Args:
+            requests: Writes to run (endpoints relative to wp/v2)
+            concurrency: Max single requests in flight on fallback
+
+        Returns:
+            List of BatchResult, one per request, in request order
+        """
+        results: list[BatchResult | None] = [None] * len(requests)
+        singles: list[int] = []
+        batchable: list[int] = []
+        for i, req in enumerate(requests):
+            if req.method.upper() == "GET" or _route(req.endpoint) in self._batch_denied_routes:
+                singles.append(i)
+            else:
+                batchable.append(i)
+
+        for start in range(0, len(batchable), _BATCH_MAX_REQUESTS):
+            chunk = batchable[start : start + _BATCH_MAX_REQUESTS]
+            if self._batch_supported is False:
+                singles.extend(chunk)
+                continue
+            try:
+                responses = await self._send_batch([requests[i] for i in chunk])
+            except (AuthenticationError, ConnectionError) as e:
+                # Every remaining request would fail the same way
+                for i in batchable[start:]:
+                    results[i] = BatchResult(error=str(e))
+                break
+            except Exception as e:
+                if str(e).startswith(("[NOT_FOUND]", "[METHOD_NOT_ALLOWED]")):
+                    self._batch_supported = False
+                    self.logger.info("batch/v1 not available, using single requests")
+                else:
+                    self.logger.warning(f"Batch request failed, retrying items singly: {e}")
+                singles.extend(chunk)
+                continue
+
+            self._batch_supported = True
+            for i, (status, body) in zip(chunk, responses, strict=True):
+                if isinstance(body, dict) and body.get("code") == _BATCH_NOT_ALLOWED:
+                    self._batch_denied_routes.add(_route(requests[i].endpoint))
+                    singles.append(i)
+                elif status >= 400:
+                    info = self._parse_error_response(status, json.dumps(body))
+                    results[i] = BatchResult(
+                        body=body, error=f"[{info['error_code']}] {info['message']}"
+                    )
+                else:
+                    results[i] = BatchResult(body=body)
+
+        if singles:
+            sem = asyncio.Semaphore(max(1, concurrency))
+
+            async def one(i: int) -> None:
+                req = requests[i]
+                async with sem:
+                    try:
+                        body = await self.request(
+                            req.method, req.endpoint, params=req.params, json_data=req.json_data
+                        )
+                        results[i] = BatchResult(body=body)
+                    except Exception as e:  # noqa: BLE001 — relay any per-item failure
+                        results[i] = BatchResult(error=str(e))
+
+            await asyncio.gather(*(one(i) for i in sorted(singles)))
+
+        return results  # type: ignore[return-value]
+
+    async def _send_batch(self, requests: list[BatchRequest]) -> list[tuple[int, Any]]:
+        """POST one chunk to batch/v1 and return ``(status, body)`` per sub-request."""
+        payload = {
+            "validation": "normal",
+            "requests": [_batch_entry(req) for req in requests],
+        }
+        body = await self.request("POST", "batch/v1", json_data=payload, use_custom_namespace=True)
+        responses = body.get("responses") if isinstance(body, dict) else None
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            raise ValueError("Malformed batch/v1 response")
+        return [(int(r.get("status") or 500), r.get("body")) for r in responses]
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        per_page: int = 100,
+        use_woocommerce: bool = False,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every item of a paged collection.
+
+        Uses ``page``/``per_page`` and the ``X-WP-Total`` header; pages
+        after the first are fetched concurrently (see core.pagination).
+
+        Args:
+            endpoint: Collection endpoint (e.g. "posts", "products")
+            params: Query parameters (``page``/``per_page`` are overridden)
+            per_page: Page size (WordPress and WooCommerce cap it at 100)
+            use_woocommerce: Use WooCommerce API base
+            concurrency: Max pages in flight
+
+        Returns:
+            Async iterator of items
+        """
+
+        async def fetch(page: int) -> Page:
+            body, headers = await self.request(
+                "GET",
+                endpoint,
+                params={**(params or {}), "per_page": per_page, "page": page},
+                use_woocommerce=use_woocommerce,
+                return_headers=True,
+            )
+            return Page(
+                items=body if isinstance(body, list) else [],
+                total_pages=pages_for(headers.get("x-wp-total"), per_page),
+            )
+
+        return iter_numbered(fetch, per_page=per_page, concurrency=concurrency)
+
     async def check_woocommerce(self) -> dict[str, Any]:
         """
         Check if WooCommerce is installed and accessible.
@@ -612,7 +828,7 @@ class WordPressClient:
         """
         timeout = aiohttp.ClientTimeout(total=10)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with pooled_session(timeout=timeout) as session:
                 async with session.get(f"{self.site_url}/wp-json") as response:
                     if response.status == 200:
                         data = await response.json()
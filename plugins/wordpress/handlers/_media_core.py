@@ -10,16 +10,24 @@ exceeds the site's advertised ``upload_max_filesize``, prefer the companion
 ``php://input`` (bypasses ``upload_max_filesize``). On any failure from the
 companion route we fall back to the standard ``/wp/v2/media`` path so we
 never regress the default upload behaviour.
+
+``wp_raw_upload`` accepts either bytes or a :class:`FileUpload`; the latter
+streams the body from disk (chunked-upload spill files) so large uploads are
+never held in memory.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from typing import Any
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import IO, Any
 
 import aiohttp
 
+from core.http_transport import pooled_session
 from plugins.wordpress.client import WordPressClient
 from plugins.wordpress.handlers._media_security import (
     ALLOWED_MIMES,
@@ -42,6 +50,44 @@ _COMPANION_UPLOAD_ENDPOINT = "airano-mcp/v1/upload-chunk"
 _COMPANION_UPLOAD_AND_ATTACH_ENDPOINT = "airano-mcp/v1/upload-and-attach"
 
 
+class FileUpload:
+    """Upload body streamed from a file on disk.
+
+    ``len()`` is the file size, so size validation and route selection work
+    as for bytes; each request opens the file afresh (fallback routes re-send
+    the body).
+    """
+
+    def __init__(self, path: Path, size: int | None = None) -> None:
+        self.path = Path(path)
+        self.size = self.path.stat().st_size if size is None else size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def head(self, n: int = 4096) -> bytes:
+        """First ``n`` bytes, for MIME sniffing."""
+        with open(self.path, "rb") as f:
+            return f.read(n)
+
+
+@contextlib.asynccontextmanager
+async def _request_body(data: bytes | FileUpload) -> AsyncIterator[bytes | IO[bytes]]:
+    """Yield ``data`` as an aiohttp request body (an open file for FileUpload).
+
+    aiohttp reads file bodies in its executor and sets Content-Length from
+    the file size, so the upload streams without blocking the loop.
+    """
+    if isinstance(data, FileUpload):
+        f = await asyncio.to_thread(open, data.path, "rb")
+        try:
+            yield f
+        finally:
+            f.close()
+    else:
+        yield data
+
+
 async def _should_use_companion(client: WordPressClient, size: int) -> bool:
     """F.5a.7: decide whether to prefer the companion upload-chunk route.
 
@@ -102,7 +148,7 @@ async def _companion_has_upload_and_attach(client: WordPressClient) -> bool:
 
 async def _companion_upload_and_attach(
     client: WordPressClient,
-    data: bytes,
+    data: bytes | FileUpload,
     *,
     sniffed: str,
     disposition: str,
@@ -145,8 +191,8 @@ async def _companion_upload_and_attach(
     if idempotency_key:
         headers["Idempotency-Key"] = str(idempotency_key)
     timeout = aiohttp.ClientTimeout(total=_UPLOAD_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, data=data, headers=headers, params=params) as response:
+    async with _request_body(data) as body, pooled_session(timeout=timeout) as session:
+        async with session.post(url, data=body, headers=headers, params=params) as response:
             text = await response.text()
             if response.status >= 400:
                 raise UploadError(
@@ -166,7 +212,7 @@ async def _companion_upload_and_attach(
 
 async def _companion_raw_upload(
     client: WordPressClient,
-    data: bytes,
+    data: bytes | FileUpload,
     *,
     sniffed: str,
     disposition: str,
@@ -183,8 +229,8 @@ async def _companion_raw_upload(
         "Content-Disposition": disposition,
     }
     timeout = aiohttp.ClientTimeout(total=_UPLOAD_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, data=data, headers=headers) as response:
+    async with _request_body(data) as body, pooled_session(timeout=timeout) as session:
+        async with session.post(url, data=body, headers=headers) as response:
             text = await response.text()
             if response.status >= 400:
                 raise UploadError(
@@ -204,7 +250,7 @@ async def _companion_raw_upload(
 
 async def wp_raw_upload(
     client: WordPressClient,
-    data: bytes,
+    data: bytes | FileUpload,
     *,
     filename: str | None,
     mime_hint: str | None = None,
@@ -227,6 +273,8 @@ async def wp_raw_upload(
 ) -> dict[str, Any]:
     """Upload raw bytes to WP media library. Returns the attachment dict from WP.
 
+    ``data`` may be a :class:`FileUpload` to stream the body from disk.
+
     When the companion plugin advertises limits smaller than the payload, we
     POST to ``/airano-mcp/v1/upload-chunk`` first and only fall back to
     ``/wp/v2/media`` if the companion route errors.
@@ -237,7 +285,8 @@ async def wp_raw_upload(
     into one PHP request.
     """
     validate_size(data, max_bytes=max_bytes)
-    sniffed = sniff_mime(data, hint=mime_hint)
+    head = await asyncio.to_thread(data.head) if isinstance(data, FileUpload) else data
+    sniffed = sniff_mime(head, hint=mime_hint)
     validate_mime(sniffed, allowed=allowed_mimes)
 
     ascii_name, encoded = safe_filename(filename, mime=sniffed)
@@ -299,8 +348,8 @@ async def wp_raw_upload(
     }
 
     timeout = aiohttp.ClientTimeout(total=_UPLOAD_TIMEOUT)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, data=data, headers=headers) as response:
+    async with _request_body(data) as body, pooled_session(timeout=timeout) as session:
+        async with session.post(url, data=body, headers=headers) as response:
             text = await response.text()
             if response.status == 413:
                 raise UploadError(
@@ -384,7 +433,7 @@ async def fetch_url_bytes(
     headers = {"User-Agent": user_agent}
     timeout = aiohttp.ClientTimeout(total=timeout_sec)
 
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    async with pooled_session(timeout=timeout) as session:
         async with session.get(url, headers=headers, allow_redirects=True) as resp:
             if resp.status >= 400:
                 raise UploadError(
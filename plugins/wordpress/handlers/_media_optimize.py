@@ -10,12 +10,18 @@ type. Transparency is preserved; animated GIFs are still left untouched.
 
 Returns the (possibly reduced) bytes and the (possibly updated) MIME type.
 Non-raster types (pdf, svg, video, audio) pass through unchanged.
+
+JPEGs that will be downscaled are decoded in draft mode (libjpeg DCT
+scaling to 1/2, 1/4 or 1/8 while decoding), so a 24 MP photo is never fully
+decoded just to be shrunk to 2560 px. Handlers run :func:`optimize` in the
+CPU pool (``core.cpu_pool``), not on the event loop.
 """
 
 from __future__ import annotations
 
 import io
 import logging
+import math
 import os
 
 _logger = logging.getLogger("mcphub.wordpress.media.optimize")
@@ -107,6 +113,20 @@ def optimize(
 
     fmt = (img.format or "").upper()  # capture BEFORE exif_transpose strips .format
 
+    w, h = img.size
+    long_edge = max(w, h)
+
+    resized = False
+    if fmt == "JPEG" and long_edge > max_edge:
+        # Decode at the smallest DCT scale still >= the target size; the
+        # LANCZOS pass below trims it to exactly max_edge.
+        scale = max_edge / long_edge
+        try:
+            img.draft(None, (math.ceil(w * scale), math.ceil(h * scale)))
+            resized = img.size != (w, h)
+        except Exception:
+            pass
+
     try:
         img = ImageOps.exif_transpose(img) if strip_exif else img
     except Exception:
@@ -115,7 +135,6 @@ def optimize(
     w, h = img.size
     long_edge = max(w, h)
 
-    resized = False
     if long_edge > max_edge:
         scale = max_edge / long_edge
         new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
@@ -30,7 +30,7 @@ from plugins.wordpress.handlers._media_security import UploadError
 from plugins.wordpress.handlers.media import (
     _apply_metadata_and_attach,
     _format_upload_result,
-    _maybe_optimize,
+    _maybe_optimize_async,
 )
 
 _logger = logging.getLogger("mcphub.wordpress.ai_media")
@@ -204,7 +204,9 @@ class AIMediaHandler:
             from core.tool_rate_limiter import ToolRateLimitError, get_tool_rate_limiter
 
             try:
-                get_tool_rate_limiter().check("wordpress_generate_and_upload_image", self.user_id)
+                await get_tool_rate_limiter().check_async(
+                    "wordpress_generate_and_upload_image", self.user_id
+                )
             except ToolRateLimitError as e:
                 return json.dumps(e.to_dict(), indent=2)
 
@@ -259,8 +261,12 @@ class AIMediaHandler:
             )
             result = await provider_impl.generate(api_key, request)
 
-            data, mime_hint = _maybe_optimize(
-                result.data, result.mime, skip=skip_optimize, convert_to=convert_to
+            data, mime_hint = await _maybe_optimize_async(
+                result.data,
+                result.mime,
+                skip=skip_optimize,
+                convert_to=convert_to,
+                user=self.user_id or self.client.site_url,
             )
             # F.X.fix #7: stable idempotency key per logical call. A
             # client-side retry (after timeout) produces the same
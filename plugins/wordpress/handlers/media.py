@@ -2,7 +2,11 @@
 
 import base64 as _b64
 import binascii
+import hashlib
+import html
 import json
+import logging
+import re
 from typing import Any
 
 from core.media_audit import log_media_upload
@@ -19,6 +23,10 @@ from plugins.wordpress.handlers._media_security import (
     ssrf_check,
 )
 
+_logger = logging.getLogger("mcphub.wordpress.media")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def get_tool_specifications() -> list[dict[str, Any]]:
     """Return tool specifications for ToolGenerator"""
@@ -286,6 +294,114 @@ def _maybe_optimize(
     return optimize(data, mime_hint, convert_to=convert_to)
 
 
+async def _maybe_optimize_async(
+    data: bytes,
+    mime_hint: str | None,
+    *,
+    skip: bool,
+    convert_to: str | None = None,
+    user: str | None = None,
+) -> tuple[bytes, str | None]:
+    """``_maybe_optimize`` run in the shared CPU pool instead of on the event loop.
+
+    Payloads the optimizer would pass through untouched skip the pool. ``user``
+    keys the pool's per-user fair queue.
+    """
+    if skip:
+        return data, mime_hint
+    try:
+        from plugins.wordpress.handlers._media_optimize import (  # type: ignore
+            _RASTER_MIMES,
+            Image,
+            optimize,
+        )
+    except ImportError:
+        return data, mime_hint
+    if Image is None or (mime_hint and mime_hint not in _RASTER_MIMES):
+        return data, mime_hint
+
+    from core.cpu_pool import CpuPoolBusyError, get_cpu_pool
+
+    try:
+        return await get_cpu_pool().run(optimize, data, mime_hint, convert_to=convert_to, user=user)
+    except CpuPoolBusyError as e:
+        raise UploadError(
+            "OPTIMIZE_BUSY",
+            "Too many images are being optimized right now; retry shortly "
+            "or pass skip_optimize=true.",
+            {"queued": e.queued, "max": e.limit},
+        ) from e
+
+
+def _dedupe_variant(mime: str | None, *, skip: bool, convert_to: str | None = None) -> str:
+    """Optimizer settings that shape the uploaded bytes (part of the dedupe key)."""
+    from plugins.wordpress.handlers._media_optimize import _DEFAULT_CONVERT_TO, _RASTER_MIMES
+
+    if skip or (mime and mime not in _RASTER_MIMES):
+        return "raw"
+    return f"opt:{(convert_to or '').strip().lower() or _DEFAULT_CONVERT_TO}"
+
+
+async def _find_duplicate(
+    client: WordPressClient, digest: str, variant: str
+) -> dict[str, Any] | None:
+    """Return the attachment already holding this content on the site, if any.
+
+    The index entry is verified with a ``GET media/{id}``; attachments that
+    were deleted or trashed since are dropped from the index. Index and site
+    errors count as a miss so the caller simply uploads.
+    """
+    from core.media_dedupe import DEDUPE_ENABLED, get_media_dedupe_index
+
+    if not DEDUPE_ENABLED:
+        return None
+    index = get_media_dedupe_index()
+    try:
+        media_id = await index.lookup(client.site_url, digest, variant)
+        if media_id is None:
+            return None
+        try:
+            media = await client.get(f"media/{media_id}")
+        except Exception as e:
+            if str(e).startswith("[NOT_FOUND]"):
+                await index.forget(client.site_url, digest, variant)
+            return None
+        if not isinstance(media, dict) or media.get("status") == "trash":
+            await index.forget(client.site_url, digest, variant)
+            return None
+        await index.touch(client.site_url, digest, variant)
+        return media
+    except Exception as e:  # noqa: BLE001
+        _logger.debug("media dedupe lookup skipped: %s", e)
+        return None
+
+
+async def _remember_upload(
+    client: WordPressClient, digest: str, variant: str, media: dict[str, Any]
+) -> None:
+    """Index a fresh upload so identical content is reused next time. Best effort."""
+    from core.media_dedupe import DEDUPE_ENABLED, get_media_dedupe_index
+
+    if not DEDUPE_ENABLED or not media.get("id"):
+        return
+    try:
+        await get_media_dedupe_index().record(client.site_url, digest, variant, int(media["id"]))
+    except Exception as e:  # noqa: BLE001
+        _logger.debug("media dedupe record skipped: %s", e)
+
+
+async def _forget_media(client: WordPressClient, media_id: int) -> None:
+    """Drop index entries for a deleted attachment. Best effort."""
+    from core.media_dedupe import DEDUPE_ENABLED, get_media_dedupe_index
+
+    if not DEDUPE_ENABLED:
+        return
+    try:
+        await get_media_dedupe_index().forget_media(client.site_url, media_id)
+    except Exception as e:  # noqa: BLE001
+        _logger.debug("media dedupe forget skipped: %s", e)
+
+
 async def _apply_metadata_and_attach(
     client: WordPressClient,
     media: dict[str, Any],
@@ -296,6 +412,7 @@ async def _apply_metadata_and_attach(
     attach_to_post: int | None,
     set_featured: bool,
     wc_client: WordPressClient | None = None,
+    attach: bool = True,
 ) -> dict[str, Any]:
     """Apply metadata + attach to post / featured-image.
 
@@ -310,6 +427,9 @@ async def _apply_metadata_and_attach(
     route through the WC products endpoint via ``wc_client``. Both
     "metadata applied" and "featured set" steps are reported
     independently in the result dict.
+
+    ``attach=False`` leaves the attachment's parent post alone while still
+    setting it as ``attach_to_post``'s featured image (reused attachments).
     """
     status: dict[str, Any] = {
         "metadata_applied": False,
@@ -324,7 +444,8 @@ async def _apply_metadata_and_attach(
         status["featured_context"] = "companion_unified"
         return status
 
-    if any(v is not None for v in (title, alt_text, caption)) or attach_to_post is not None:
+    parent = attach_to_post if attach else None
+    if any(v is not None for v in (title, alt_text, caption)) or parent is not None:
         try:
             await wp_update_media_metadata(
                 client,
@@ -332,7 +453,7 @@ async def _apply_metadata_and_attach(
                 title=title,
                 alt_text=alt_text,
                 caption=caption,
-                post=attach_to_post,
+                post=parent,
             )
             status["metadata_applied"] = True
         except Exception as exc:  # noqa: BLE001
@@ -389,6 +510,60 @@ async def _apply_metadata_and_attach(
     return status
 
 
+def _plain_text(value: Any) -> str:
+    """Text of a REST field that may be a ``{"raw", "rendered"}`` HTML dict."""
+    if isinstance(value, dict):
+        value = value.get("raw", value.get("rendered"))
+    return html.unescape(_TAG_RE.sub("", value or "")).strip()
+
+
+async def _reuse_attachment(
+    client: WordPressClient,
+    media: dict[str, Any],
+    *,
+    title: str | None,
+    alt_text: str | None,
+    caption: str | None,
+    attach_to_post: int | None,
+    set_featured: bool,
+    wc_client: WordPressClient | None = None,
+) -> dict[str, Any]:
+    """:func:`_apply_metadata_and_attach` for an attachment found by dedupe.
+
+    The attachment may already be used elsewhere, so nothing it has is
+    changed: empty metadata fields are filled, differing ones are kept and
+    listed under ``metadata_kept``, and it is only attached to
+    ``attach_to_post`` when it has no parent yet (otherwise the parent is
+    reported as ``parent_kept``). Setting it as featured image only writes
+    to the target post, so that still happens.
+    """
+    fill: dict[str, str | None] = {"title": None, "alt_text": None, "caption": None}
+    kept: dict[str, dict[str, str]] = {}
+    for field, requested in (("title", title), ("alt_text", alt_text), ("caption", caption)):
+        if requested is None:
+            continue
+        current = _plain_text(media.get(field))
+        if not current:
+            fill[field] = requested
+        elif current != _plain_text(requested):
+            kept[field] = {"existing": current, "requested": requested}
+
+    parent = media.get("post") or None
+    status = await _apply_metadata_and_attach(
+        client,
+        media,
+        **fill,
+        attach_to_post=attach_to_post,
+        set_featured=set_featured,
+        wc_client=wc_client,
+        attach=parent is None,
+    )
+    status["metadata_kept"] = kept
+    if attach_to_post is not None and parent not in (None, attach_to_post):
+        status["parent_kept"] = parent
+    return status
+
+
 async def _set_featured_with_fallback(
     client: WordPressClient,
     target_id: int,
@@ -450,10 +625,16 @@ async def _set_featured_with_fallback(
     return None
 
 
-def _format_upload_result(media: dict[str, Any], *, source: str) -> dict[str, Any]:
+def _format_upload_result(
+    media: dict[str, Any],
+    *,
+    source: str,
+    deduplicated: bool = False,
+    reuse: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     title = media.get("title")
     rendered_title = title.get("rendered") if isinstance(title, dict) else title
-    return {
+    result = {
         "id": media["id"],
         "title": rendered_title or "",
         "url": media.get("source_url", ""),
@@ -463,6 +644,17 @@ def _format_upload_result(media: dict[str, Any], *, source: str) -> dict[str, An
         "source": source,
         "message": f"Media uploaded successfully (id={media['id']}).",
     }
+    if deduplicated:
+        result["deduplicated"] = True
+        result["message"] = f"Identical file already in the media library; reused id={media['id']}."
+        reuse = reuse or {}
+        if reuse.get("metadata_kept"):
+            result["metadata_kept"] = reuse["metadata_kept"]
+            result["message"] += " Its existing metadata was kept (see metadata_kept)."
+        if reuse.get("parent_kept") is not None:
+            result["attached_to"] = reuse["parent_kept"]
+            result["message"] += f" It stays attached to post {reuse['parent_kept']}."
+    return result
 
 
 class MediaHandler:
@@ -591,8 +783,39 @@ class MediaHandler:
                 )
 
             data, declared_ct, fname_guess = await fetch_url_bytes(url, max_bytes=DEFAULT_MAX_BYTES)
-            data, mime_hint = _maybe_optimize(
-                data, declared_ct, skip=skip_optimize, convert_to=convert_to
+            digest = hashlib.sha256(data).hexdigest()
+            variant = _dedupe_variant(declared_ct, skip=skip_optimize, convert_to=convert_to)
+            existing = await _find_duplicate(self.client, digest, variant)
+            if existing is not None:
+                reuse = await _reuse_attachment(
+                    self.client,
+                    existing,
+                    title=title,
+                    alt_text=alt_text,
+                    caption=caption,
+                    attach_to_post=attach_to_post,
+                    set_featured=set_featured,
+                )
+                log_media_upload(
+                    site=self.client.site_url,
+                    user_id=self.user_id,
+                    mime=existing.get("mime_type") or declared_ct,
+                    size_bytes=len(data),
+                    source="url",
+                    media_id=existing.get("id"),
+                    deduplicated=True,
+                )
+                return json.dumps(
+                    _format_upload_result(existing, source=url, deduplicated=True, reuse=reuse),
+                    indent=2,
+                )
+
+            data, mime_hint = await _maybe_optimize_async(
+                data,
+                declared_ct,
+                skip=skip_optimize,
+                convert_to=convert_to,
+                user=self.user_id or self.client.site_url,
             )
 
             media = await wp_raw_upload(
@@ -619,6 +842,7 @@ class MediaHandler:
                 attach_to_post=attach_to_post,
                 set_featured=set_featured,
             )
+            await _remember_upload(self.client, digest, variant, media)
 
             log_media_upload(
                 site=self.client.site_url,
@@ -652,7 +876,42 @@ class MediaHandler:
         """Upload a base64-encoded file to the WordPress media library."""
         try:
             raw = _decode_base64(data)
-            raw, mime_hint = _maybe_optimize(raw, mime, skip=skip_optimize, convert_to=convert_to)
+            digest = hashlib.sha256(raw).hexdigest()
+            variant = _dedupe_variant(mime, skip=skip_optimize, convert_to=convert_to)
+            existing = await _find_duplicate(self.client, digest, variant)
+            if existing is not None:
+                reuse = await _reuse_attachment(
+                    self.client,
+                    existing,
+                    title=title,
+                    alt_text=alt_text,
+                    caption=caption,
+                    attach_to_post=attach_to_post,
+                    set_featured=set_featured,
+                )
+                log_media_upload(
+                    site=self.client.site_url,
+                    user_id=self.user_id,
+                    mime=existing.get("mime_type") or mime,
+                    size_bytes=len(raw),
+                    source="base64",
+                    media_id=existing.get("id"),
+                    deduplicated=True,
+                )
+                return json.dumps(
+                    _format_upload_result(
+                        existing, source="base64", deduplicated=True, reuse=reuse
+                    ),
+                    indent=2,
+                )
+
+            raw, mime_hint = await _maybe_optimize_async(
+                raw,
+                mime,
+                skip=skip_optimize,
+                convert_to=convert_to,
+                user=self.user_id or self.client.site_url,
+            )
 
             media = await wp_raw_upload(
                 self.client,
@@ -675,6 +934,7 @@ class MediaHandler:
                 attach_to_post=attach_to_post,
                 set_featured=set_featured,
             )
+            await _remember_upload(self.client, digest, variant, media)
 
             log_media_upload(
                 site=self.client.site_url,
@@ -769,6 +1029,7 @@ class MediaHandler:
         try:
             params = {"force": "true" if force else "false"}
             result = await self.client.delete(f"media/{media_id}", params=params)
+            await _forget_media(self.client, media_id)
 
             message = f"Media {media_id} {'permanently deleted' if force else 'moved to trash'}"
             return json.dumps({"success": True, "message": message, "result": result}, indent=2)
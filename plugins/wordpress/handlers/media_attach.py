@@ -7,6 +7,7 @@ media by `id` (never pass external `src` — WC would re-download it).
 
 from __future__ import annotations
 
+import hashlib
 import json
 from typing import Any
 
@@ -22,7 +23,14 @@ from plugins.wordpress.handlers._media_security import (
     UploadError,
     ssrf_check,
 )
-from plugins.wordpress.handlers.media import _decode_base64, _maybe_optimize
+from plugins.wordpress.handlers.media import (
+    _decode_base64,
+    _dedupe_variant,
+    _find_duplicate,
+    _maybe_optimize_async,
+    _remember_upload,
+    _reuse_attachment,
+)
 
 
 def get_tool_specifications() -> list[dict[str, Any]]:
@@ -251,9 +259,30 @@ class MediaAttachHandler:
                     "BAD_SOURCE", f"source must be 'base64' or 'url', got '{source}'."
                 )
 
-            raw, mime_hint = _maybe_optimize(raw, mime_hint, skip=skip_optimize)
-            media = await wp_raw_upload(wp_client, raw, filename=filename, mime_hint=mime_hint)
-            if alt_text is not None:
+            digest = hashlib.sha256(raw).hexdigest()
+            variant = _dedupe_variant(mime_hint, skip=skip_optimize)
+            media = await _find_duplicate(wp_client, digest, variant)
+            deduplicated = media is not None
+            if media is None:
+                raw, mime_hint = await _maybe_optimize_async(
+                    raw, mime_hint, skip=skip_optimize, user=self.client.site_url
+                )
+                media = await wp_raw_upload(wp_client, raw, filename=filename, mime_hint=mime_hint)
+                await _remember_upload(wp_client, digest, variant, media)
+            metadata_kept: dict[str, Any] = {}
+            if deduplicated:
+                # Shared attachment: only fill alt text it doesn't have yet
+                reuse = await _reuse_attachment(
+                    wp_client,
+                    media,
+                    title=None,
+                    alt_text=alt_text,
+                    caption=None,
+                    attach_to_post=None,
+                    set_featured=False,
+                )
+                metadata_kept = reuse["metadata_kept"]
+            elif alt_text is not None:
                 await wp_update_media_metadata(wp_client, media["id"], alt_text=alt_text)
 
             # Chain into attach
@@ -261,15 +290,16 @@ class MediaAttachHandler:
                 product_id=product_id, media_ids=[media["id"]], role=role, mode=mode
             )
             attach = json.loads(attach_json)
-            return json.dumps(
-                {
-                    "media_id": media["id"],
-                    "media_url": media.get("source_url"),
-                    "product_id": product_id,
-                    "attach_result": attach,
-                },
-                indent=2,
-            )
+            result = {
+                "media_id": media["id"],
+                "media_url": media.get("source_url"),
+                "product_id": product_id,
+                "deduplicated": deduplicated,
+                "attach_result": attach,
+            }
+            if metadata_kept:
+                result["metadata_kept"] = metadata_kept
+            return json.dumps(result, indent=2)
         except UploadError as e:
             return json.dumps(e.to_dict(), indent=2)
         except Exception as e:
@@ -358,7 +388,29 @@ class MediaAttachHandler:
         # /wp/v2/media GET — needs WP creds. Caller has already
         # validated wp_media_client is present.
         wp_client = self.wp_media_client or self.client
+        # One collection GET covers up to 100 ids (batch/v1 doesn't take
+        # GETs); only ids it doesn't return are looked up one by one, so
+        # the error carries the per-item reason.
+        found: set[int] = set()
+        if len(media_ids) > 1:
+            for start in range(0, len(media_ids), 100):
+                chunk = media_ids[start : start + 100]
+                try:
+                    listed = await wp_client.get(
+                        "media",
+                        params={
+                            "include": ",".join(str(m) for m in chunk),
+                            "per_page": len(chunk),
+                            "_fields": "id",
+                        },
+                    )
+                except Exception:  # noqa: BLE001 — fall back to per-id GETs
+                    continue
+                if isinstance(listed, list):
+                    found.update(m.get("id") for m in listed if isinstance(m, dict))
         for mid in media_ids:
+            if mid in found:
+                continue
             try:
                 await wp_client.get(f"media/{mid}")
             except Exception as e:
@@ -8,9 +8,11 @@ Wraps stock ``wp/v2/media`` REST endpoints with two batch tools:
   of attachments in one call (useful for moving media between posts, or
   detaching from a deleted parent).
 
-Both tools use the existing authenticated REST client. They iterate
-serially with a small concurrency cap so a large batch doesn't flood a
-shared-hosting WP backend, but the whole call returns a single JSON
+Both tools go through ``WordPressClient.batch``. Core's attachments
+controller does not allow ``/wp-json/batch/v1``, so the client sends media
+writes as single requests with a small concurrency cap (a large batch
+doesn't flood a shared-hosting WP backend) without probing the batch
+endpoint first. The whole call returns a single JSON
 envelope with ``processed`` / ``errors`` / ``total`` — matching the
 shape used by F.18.2 bulk-meta.
 
@@ -19,17 +21,16 @@ Per-call cap: 100 attachment IDs.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from typing import Any
 
-from plugins.wordpress.client import WordPressClient
+from plugins.wordpress.client import BatchRequest, BatchResult, WordPressClient
 
 logger = logging.getLogger("mcphub.wordpress.media_bulk")
 
 _MAX_IDS_PER_CALL = 100
-_CONCURRENCY = 4  # parallel in-flight REST calls
+_CONCURRENCY = 4  # parallel in-flight REST calls (media routes never batch)
 
 
 def get_tool_specifications() -> list[dict[str, Any]]:
@@ -42,8 +43,8 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                 "attachments in a single call. Max 100 IDs per request. "
                 "Returns processed / errors / total. Uses stock "
                 "/wp/v2/media/{id} DELETE so no companion plugin is "
-                "required, but issues N requests (with a small concurrency "
-                "cap); for 1000+ attachments, paginate client-side."
+                "required; up to 4 deletes run in parallel. For 1000+ "
+                "attachments, paginate client-side."
             ),
             "schema": {
                 "type": "object",
@@ -154,20 +155,11 @@ class MediaBulkHandler:
             )
 
         params = {"force": "true" if force else "false"}
-        sem = asyncio.Semaphore(_CONCURRENCY)
-
-        processed: list[dict[str, Any]] = []
-        errors: list[dict[str, Any]] = []
-
-        async def _one(mid: int) -> None:
-            async with sem:
-                try:
-                    await self.client.delete(f"media/{mid}", params=params)
-                    processed.append({"id": mid})
-                except Exception as exc:  # noqa: BLE001
-                    errors.append({"id": mid, "error": str(exc)})
-
-        await asyncio.gather(*[_one(i) for i in ids])
+        results = await self.client.batch(
+            [BatchRequest("DELETE", f"media/{mid}", params=params) for mid in ids],
+            concurrency=_CONCURRENCY,
+        )
+        processed, errors = _split_results(ids, results)
 
         return json.dumps(
             {
@@ -221,22 +213,11 @@ class MediaBulkHandler:
                 indent=2,
             )
 
-        sem = asyncio.Semaphore(_CONCURRENCY)
-        processed: list[dict[str, Any]] = []
-        errors: list[dict[str, Any]] = []
-
-        async def _one(mid: int) -> None:
-            async with sem:
-                try:
-                    await self.client.post(
-                        f"media/{mid}",
-                        json_data={"post": target},
-                    )
-                    processed.append({"id": mid})
-                except Exception as exc:  # noqa: BLE001
-                    errors.append({"id": mid, "error": str(exc)})
-
-        await asyncio.gather(*[_one(i) for i in ids])
+        results = await self.client.batch(
+            [BatchRequest("POST", f"media/{mid}", json_data={"post": target}) for mid in ids],
+            concurrency=_CONCURRENCY,
+        )
+        processed, errors = _split_results(ids, results)
 
         return json.dumps(
             {
@@ -248,3 +229,17 @@ class MediaBulkHandler:
             },
             indent=2,
         )
+
+
+def _split_results(
+    ids: list[int], results: list[BatchResult]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Map per-item batch results onto the ``processed`` / ``errors`` lists."""
+    processed: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    for mid, result in zip(ids, results, strict=True):
+        if result.ok:
+            processed.append({"id": mid})
+        else:
+            errors.append({"id": mid, "error": result.error})
+    return processed, errors
@@ -10,10 +10,13 @@ Exposes four tools that wrap `core.upload_sessions.UploadSessionStore`:
 
 At `finish`, reuses the existing F.5a.1/.2 primitives: assembled bytes →
 optional Pillow optimization → `wp_raw_upload` → metadata/attach/featured.
+Payloads that won't be optimized (``skip_optimize`` or not a raster image)
+are streamed from the spill file instead of being read into memory.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64 as _b64
 import binascii
 import json
@@ -26,12 +29,16 @@ from core.upload_sessions import (
     get_upload_session_store,
 )
 from plugins.wordpress.client import WordPressClient
-from plugins.wordpress.handlers._media_core import wp_raw_upload
-from plugins.wordpress.handlers._media_security import UploadError
+from plugins.wordpress.handlers._media_core import FileUpload, wp_raw_upload
+from plugins.wordpress.handlers._media_security import UploadError, sniff_mime
 from plugins.wordpress.handlers.media import (
     _apply_metadata_and_attach,
+    _dedupe_variant,
+    _find_duplicate,
     _format_upload_result,
-    _maybe_optimize,
+    _maybe_optimize_async,
+    _remember_upload,
+    _reuse_attachment,
 )
 
 
@@ -167,6 +174,15 @@ def _decode_chunk(data_b64: str) -> bytes:
         raise UploadSessionError("BAD_BASE64", f"Invalid base64 chunk: {e}") from e
 
 
+def _is_optimizable(mime: str | None) -> bool:
+    """Whether ``_maybe_optimize_async`` could change a payload of this MIME type."""
+    try:
+        from plugins.wordpress.handlers._media_optimize import _RASTER_MIMES
+    except ImportError:
+        return False
+    return mime in _RASTER_MIMES
+
+
 class MediaChunkedHandler:
     """Chunked-upload tool handler for the WordPress plugin."""
 
@@ -231,7 +247,7 @@ class MediaChunkedHandler:
         from core.tool_rate_limiter import ToolRateLimitError, get_tool_rate_limiter
 
         try:
-            get_tool_rate_limiter().check(
+            await get_tool_rate_limiter().check_async(
                 "wordpress_upload_media_chunked_finish",
                 self.user_id if self.user_id != "admin" else None,
             )
@@ -239,22 +255,41 @@ class MediaChunkedHandler:
             return json.dumps(e.to_dict(), indent=2)
 
         try:
-            sess, assembled = await self.store.finalize(session_id)
-            data, mime_hint = _maybe_optimize(assembled, sess.mime, skip=skip_optimize)
-            media = await wp_raw_upload(
-                self.client,
-                data,
-                filename=sess.filename,
-                mime_hint=mime_hint or sess.mime,
-                # F.5a.8.5: single-call upload+metadata+attach+featured
-                # when the companion advertises it.
-                attach_to_post=attach_to_post,
-                set_featured=set_featured,
-                title=title,
-                alt_text=alt_text,
-                caption=caption,
-            )
-            await _apply_metadata_and_attach(
+            async with self.store.finalized(session_id) as sess:
+                source = FileUpload(sess.spill_path, sess.total_bytes)
+                mime = sess.mime or sniff_mime(await asyncio.to_thread(source.head))
+                variant = _dedupe_variant(mime, skip=skip_optimize)
+                existing = await _find_duplicate(self.client, sess.digest, variant)
+                if existing is not None:
+                    media = existing
+                else:
+                    if skip_optimize or not _is_optimizable(mime):
+                        # Stream straight from the spill file
+                        data, mime_hint = source, sess.mime
+                    else:
+                        assembled = await asyncio.to_thread(sess.spill_path.read_bytes)
+                        data, mime_hint = await _maybe_optimize_async(
+                            assembled, sess.mime, skip=False, user=self.user_id
+                        )
+                    media = await wp_raw_upload(
+                        self.client,
+                        data,
+                        filename=sess.filename,
+                        mime_hint=mime_hint or sess.mime,
+                        # The session cap already bounds chunked payloads
+                        max_bytes=self.store.max_session_bytes,
+                        # F.5a.8.5: single-call upload+metadata+attach+featured
+                        # when the companion advertises it.
+                        attach_to_post=attach_to_post,
+                        set_featured=set_featured,
+                        title=title,
+                        alt_text=alt_text,
+                        caption=caption,
+                    )
+                    await _remember_upload(self.client, sess.digest, variant, media)
+            deduplicated = existing is not None
+            apply = _reuse_attachment if deduplicated else _apply_metadata_and_attach
+            status = await apply(
                 self.client,
                 media,
                 title=title,
@@ -266,12 +301,18 @@ class MediaChunkedHandler:
             log_media_upload(
                 site=self.client.site_url,
                 user_id=self.user_id if self.user_id != "admin" else None,
-                mime=media.get("mime_type") or mime_hint or sess.mime,
-                size_bytes=len(data),
+                mime=media.get("mime_type") or (mime if deduplicated else mime_hint) or sess.mime,
+                size_bytes=sess.total_bytes if deduplicated else len(data),
                 source="chunked",
                 media_id=media.get("id"),
+                deduplicated=deduplicated,
+            )
+            return json.dumps(
+                _format_upload_result(
+                    media, source="chunked", deduplicated=deduplicated, reuse=status
+                ),
+                indent=2,
             )
-            return json.dumps(_format_upload_result(media, source="chunked"), indent=2)
         except UploadSessionError as e:
             return json.dumps(e.to_dict(), indent=2)
         except UploadError as e:
@@ -5,6 +5,7 @@ import json
 import re
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
 from plugins.wordpress.client import WordPressClient
 
 
@@ -67,6 +68,7 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                         "description": "Include content summary (first 500 chars) and word count in results. Default false to save tokens.",
                         "default": False,
                     },
+                    **fetch_all_properties(),
                 },
             },
             "scope": "read",
@@ -488,6 +490,8 @@ class PostsHandler:
         search: str | None = None,
         search_terms: list[str] | None = None,
         include_content: bool = False,
+        fetch_all: bool = False,
+        max_items: int | None = None,
     ) -> str:
         """
         List WordPress posts.
@@ -499,6 +503,9 @@ class PostsHandler:
             search: Search term to filter posts
             search_terms: Multiple search terms for parallel search with deduplication
             include_content: Include content summary and word count in results
+            fetch_all: Return every matching post (ignores page, per_page and
+                search_terms), up to max_items and the response size budget
+            max_items: Item cap for fetch_all
 
         Returns:
             JSON string with posts list
@@ -511,6 +518,43 @@ class PostsHandler:
                 "_embed": "true",  # Include author and featured image
             }
 
+            # Format response
+            def _format_post(post: dict) -> dict:
+                item = {
+                    "id": post["id"],
+                    "title": post["title"]["rendered"],
+                    "excerpt": post["excerpt"]["rendered"][:200],
+                    "status": post["status"],
+                    "date": post["date"],
+                    "author": post.get("_embedded", {})
+                    .get("author", [{}])[0]
+                    .get("name", "Unknown"),
+                    "link": post["link"],
+                }
+                if include_content:
+                    content_html = post.get("content", {}).get("rendered", "")
+                    item["content_summary"] = _strip_html(content_html, 500)
+                    item["word_count"] = _count_words(content_html)
+                return item
+
+            if fetch_all:
+                params = {"status": status, "_embed": "true", "search": search}
+                collected = await collect(
+                    self.client.iter_items("posts", params),
+                    max_items=max_items or MAX_ITEMS,
+                    transform=_format_post,
+                )
+                return json.dumps(
+                    {
+                        "total": collected["count"],
+                        "fetch_all": True,
+                        "truncated": collected["truncated"],
+                        "truncated_reason": collected["truncated_reason"],
+                        "posts": collected["items"],
+                    },
+                    indent=2,
+                )
+
             # Multi-search: parallel API calls with deduplication
             if search_terms and len(search_terms) > 0:
 
@@ -535,25 +579,6 @@ class PostsHandler:
                     params["search"] = search
                 posts = await self.client.get("posts", params=params)
 
-            # Format response
-            def _format_post(post: dict) -> dict:
-                item = {
-                    "id": post["id"],
-                    "title": post["title"]["rendered"],
-                    "excerpt": post["excerpt"]["rendered"][:200],
-                    "status": post["status"],
-                    "date": post["date"],
-                    "author": post.get("_embedded", {})
-                    .get("author", [{}])[0]
-                    .get("name", "Unknown"),
-                    "link": post["link"],
-                }
-                if include_content:
-                    content_html = post.get("content", {}).get("rendered", "")
-                    item["content_summary"] = _strip_html(content_html, 500)
-                    item["word_count"] = _count_words(content_html)
-                return item
-
             result = {
                 "total": len(posts),
                 "page": page,
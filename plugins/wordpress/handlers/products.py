@@ -5,6 +5,7 @@ import json
 import re
 from typing import Any
 
+from core.pagination import MAX_ITEMS, collect, fetch_all_properties
 from plugins.wordpress.client import WordPressClient
 
 
@@ -157,7 +158,9 @@ def get_tool_specifications() -> list[dict[str, Any]]:
                         "type": "boolean",
                         "description": "Include description summary (first 500 chars) and word count in results. Default false to save tokens.",
                         "default": False,
+                        **fetch_all_properties(),
                     },
+                    **fetch_all_properties(),
                 },
             },
             "scope": "read",
@@ -635,6 +638,8 @@ class ProductsHandler:
         search: str | None = None,
         search_terms: list[str] | None = None,
         include_content: bool = False,
+        fetch_all: bool = False,
+        max_items: int | None = None,
     ) -> str:
         """
         List WooCommerce products.
@@ -648,6 +653,9 @@ class ProductsHandler:
             search: Search term to filter products
             search_terms: Multiple search terms for parallel search with deduplication
             include_content: Include description summary and word count in results
+            fetch_all: Return every matching product (ignores page, per_page and
+                search_terms), up to max_items and the response size budget
+            max_items: Item cap for fetch_all
 
         Returns:
             JSON string with products list
@@ -662,30 +670,6 @@ class ProductsHandler:
             if stock_status:
                 params["stock_status"] = stock_status
 
-            # Multi-search: parallel API calls with deduplication
-            if search_terms and len(search_terms) > 0:
-
-                async def _search_single(term: str) -> list:
-                    p = {**params, "search": term}
-                    return await self.client.get("products", params=p, use_woocommerce=True)
-
-                batches = await asyncio.gather(
-                    *[_search_single(term) for term in search_terms], return_exceptions=True
-                )
-                seen_ids: set = set()
-                products: list = []
-                for batch in batches:
-                    if isinstance(batch, Exception):
-                        continue
-                    for product in batch:
-                        if product["id"] not in seen_ids:
-                            seen_ids.add(product["id"])
-                            products.append(product)
-            else:
-                if search:
-                    params["search"] = search
-                products = await self.client.get("products", params=params, use_woocommerce=True)
-
             # Format response
             def _format_product(p: dict) -> dict:
                 item = {
@@ -714,6 +698,49 @@ class ProductsHandler:
                     item["word_count"] = _count_words(desc_html)
                 return item
 
+            if fetch_all:
+                params = {k: v for k, v in params.items() if k not in ("page", "per_page")}
+                params["search"] = search
+                collected = await collect(
+                    self.client.iter_items("products", params, use_woocommerce=True),
+                    max_items=max_items or MAX_ITEMS,
+                    transform=_format_product,
+                )
+                return json.dumps(
+                    {
+                        "total": collected["count"],
+                        "fetch_all": True,
+                        "truncated": collected["truncated"],
+                        "truncated_reason": collected["truncated_reason"],
+                        "products": collected["items"],
+                    },
+                    indent=2,
+                )
+
+            # Multi-search: parallel API calls with deduplication
+            if search_terms and len(search_terms) > 0:
+
+                async def _search_single(term: str) -> list:
+                    p = {**params, "search": term}
+                    return await self.client.get("products", params=p, use_woocommerce=True)
+
+                batches = await asyncio.gather(
+                    *[_search_single(term) for term in search_terms], return_exceptions=True
+                )
+                seen_ids: set = set()
+                products: list = []
+                for batch in batches:
+                    if isinstance(batch, Exception):
+                        continue
+                    for product in batch:
+                        if product["id"] not in seen_ids:
+                            seen_ids.add(product["id"])
+                            products.append(product)
+            else:
+                if search:
+                    params["search"] = search
+                products = await self.client.get("products", params=params, use_woocommerce=True)
+
             result = {
                 "total": len(products),
                 "page": page,
@@ -182,6 +182,26 @@ def get_tool_specifications() -> list[dict[str, Any]]:
             },
             "scope": "write",
         },
+        # === BATCH (1 tool) ===
+        {
+            "name": "wp_cli_batch",
+            "method_name": "wp_cli_batch",
+            "description": "Run several WP-CLI maintenance commands in one round-trip (e.g. 'cache flush', 'transient delete --expired', 'db optimize'). Commands run in order; a failure does not stop the rest. Only fixed maintenance/info command lines are accepted.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "commands": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(WPCLIManager.BATCH_COMMANDS)},
+                        "description": "WP-CLI commands without the 'wp' prefix",
+                        "minItems": 1,
+                        "maxItems": WPCLIManager.MAX_BATCH,
+                    },
+                },
+                "required": ["commands"],
+            },
+            "scope": "write",
+        },
     ]
 
 
@@ -520,3 +540,33 @@ class WPCLIHandler:
             return json.dumps(
                 {"error": str(e), "message": f"Failed to update WordPress core: {str(e)}"}, indent=2
             )
+
+    # === BATCH ===
+
+    async def wp_cli_batch(self, commands: list[str]) -> str:
+        """
+        Run several WP-CLI maintenance commands in one exec round-trip.
+
+        Args:
+            commands: Commands from WPCLIManager.BATCH_COMMANDS, run in order
+
+        Returns:
+            JSON string with per-command results
+        """
+        try:
+            results = await self.wp_cli.execute_batch(commands)
+            failed = sum(1 for r in results if not r["success"])
+            return json.dumps(
+                {
+                    "status": "success" if not failed else "partial",
+                    "container": self.wp_cli.container_name,
+                    "succeeded": len(results) - failed,
+                    "failed": failed,
+                    "results": results,
+                },
+                indent=2,
+            )
+        except Exception as e:
+            return json.dumps(
+                {"error": str(e), "message": f"Failed to run WP-CLI batch: {str(e)}"}, indent=2
+            )
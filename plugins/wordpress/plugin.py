@@ -159,7 +159,7 @@ class WordPressPlugin(BasePlugin):
         # Advanced content handlers
         specs.extend(handlers.get_seo_specs())  # 4 tools
         specs.extend(handlers.get_menus_specs())  # 9 tools (incl. wp_navigation CRUD)
-        specs.extend(handlers.get_wp_cli_specs())  # 15 tools
+        specs.extend(handlers.get_wp_cli_specs())  # 16 tools
 
         # Note: WooCommerce specs moved to woocommerce plugin (Phase D.1)
         # Database / bulk / system specs live on wordpress_specialist
@@ -567,6 +567,11 @@ class WordPressPlugin(BasePlugin):
             return await self.wp_cli.wp_core_update(**kwargs)
         return '{"error": "WP-CLI not available. Container not configured."}'
 
+    async def wp_cli_batch(self, **kwargs):
+        if self.wp_cli:
+            return await self.wp_cli.wp_cli_batch(**kwargs)
+        return '{"error": "WP-CLI not available. Container not configured."}'
+
     # Database, bulk, and system operations live on wordpress_specialist
     # (companion-backed; legacy wordpress_advanced was sunset 2026-05-04).
 
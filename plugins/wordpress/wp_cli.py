@@ -4,6 +4,13 @@ WP-CLI Manager for WordPress Plugin
 Provides WP-CLI command execution capabilities for WordPress containers.
 Supports cache management, database operations, plugin/theme info, and more.
 
+Commands run through the Docker Engine API (``core.docker_api``) on a pooled
+daemon connection instead of ``docker`` CLI subprocesses. Successful
+container and WP-CLI checks are cached per container for
+``MCPHUB_WPCLI_CHECK_TTL_SEC`` seconds (default 60), shared by all manager
+instances, and :meth:`WPCLIManager.execute_batch` runs several maintenance
+commands in a single exec.
+
 Security:
 - Command validation against whitelist
 - Container existence verification
@@ -12,23 +19,46 @@ Security:
 - Graceful error handling
 """
 
-import asyncio
 import json
 import logging
+import os
+import re
+import shlex
+import time
+import uuid
 from typing import Any
 
+from core.docker_api import DockerAPIError, get_docker_client
+
+# How long a successful container / WP-CLI check is trusted
+CHECK_TTL = float(os.environ.get("MCPHUB_WPCLI_CHECK_TTL_SEC", "60"))
+
+# container name -> monotonic deadline; failures are never cached
+_container_ok_until: dict[str, float] = {}
+_wp_cli_ok_until: dict[str, float] = {}
+
+
+def clear_availability_cache(container_name: str | None = None) -> None:
+    """Forget cached availability checks for one container (or all)."""
+    if container_name is None:
+        _container_ok_until.clear()
+        _wp_cli_ok_until.clear()
+    else:
+        _container_ok_until.pop(container_name, None)
+        _wp_cli_ok_until.pop(container_name, None)
+
 
 class WPCLIManager:
     """
     Manages WP-CLI command execution for WordPress containers.
 
     This class provides a secure interface to execute WP-CLI commands
-    inside WordPress Docker containers via docker exec.
+    inside WordPress Docker containers via the Docker Engine API.
 
     Attributes:
         container_name: Docker container name (from Coolify)
         logger: Logger instance for this manager
-        wp_cli_available: Cached check of WP-CLI availability
+        wp_cli_available: Result of the last WP-CLI availability check
     """
 
     # Whitelist of safe WP-CLI commands (Phase 5.1 + 5.2 + 5.3)
@@ -56,6 +86,26 @@ class WPCLIManager:
         "core check-update",
     ]
 
+    # Exact command lines accepted by execute_batch. Unlike SAFE_COMMANDS
+    # these are not prefixes: batch callers cannot add arguments, so
+    # updates and search-replace stay behind their dry-run tools.
+    BATCH_COMMANDS = [
+        "cache flush",
+        "cache type",
+        "transient delete --all --expired",
+        "transient delete --expired",
+        "transient list --format=json",
+        "db check",
+        "db optimize",
+        "plugin list --format=json",
+        "theme list --format=json",
+        "plugin verify-checksums --all",
+        "core verify-checksums",
+        "core check-update --format=json",
+        "core version",
+    ]
+    MAX_BATCH = 10
+
     def __init__(self, container_name: str):
         """
         Initialize WP-CLI Manager.
@@ -65,96 +115,52 @@ class WPCLIManager:
         """
         self.container_name = container_name
         self.logger = logging.getLogger(f"WPCLIManager.{container_name}")
-        self.wp_cli_available: bool | None = None  # Cache WP-CLI check
+        self.wp_cli_available: bool | None = None
 
     async def _check_container_exists(self) -> bool:
         """
         Check if the Docker container exists and is running.
 
+        A successful check is cached for ``CHECK_TTL`` seconds.
+
         Returns:
             bool: True if container exists and is running, False otherwise
         """
-        try:
-            # First, test if we have Docker socket access
-            test_process = await asyncio.create_subprocess_exec(
-                "docker",
-                "version",
-                "--format",
-                "{{.Server.Version}}",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            test_stdout, test_stderr = await asyncio.wait_for(
-                test_process.communicate(), timeout=5.0
-            )
-
-            if test_process.returncode != 0:
-                error_msg = test_stderr.decode().strip()
-                self.logger.warning(
-                    f"Docker daemon not accessible for container '{self.container_name}': "
-                    f"{error_msg}. WP-CLI features will be unavailable. "
-                    f"Mount /var/run/docker.sock to enable WP-CLI."
-                )
-                return False
-
-            docker_version = test_stdout.decode().strip()
-            self.logger.debug(f"Docker access OK - Server version: {docker_version}")
-
-            # Now check for our specific container using exact name match
-            process = await asyncio.create_subprocess_exec(
-                "docker",
-                "ps",
-                "--all",
-                "--filter",
-                f"name=^{self.container_name}$",
-                "--format",
-                "{{.Names}}|{{.Status}}",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
-
-            if process.returncode != 0:
-                self.logger.error(f"Docker ps failed: {stderr.decode()}")
-                raise Exception(f"Docker ps command failed: {stderr.decode()}")
+        if _container_ok_until.get(self.container_name, 0.0) > time.monotonic():
+            return True
 
-            # Parse output
-            output = stdout.decode().strip()
+        docker = get_docker_client()
+        try:
+            info = await docker.inspect_container(self.container_name)
 
-            if not output:
+            if info is None:
                 # Container not found - get list of available containers for helpful error
-                list_process = await asyncio.create_subprocess_exec(
-                    "docker",
-                    "ps",
-                    "--all",
-                    "--format",
-                    "{{.Names}}",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                list_stdout, _ = await list_process.communicate()
-                available = list_stdout.decode().strip().split("\n") if list_stdout else []
-
+                available = await docker.container_names()
                 raise Exception(
                     f"Container '{self.container_name}' not found or not running. "
                     f"Please verify the container name in your configuration.\n\n"
                     f"Available containers (first 10):\n"
-                    + "\n".join(f"  - {name}" for name in available if name)
+                    + "\n".join(f"  - {name}" for name in available[:10] if name)
                 )
 
-            # Check container status
-            name, status = output.split("|", 1)
-            if "Up" not in status:
+            state = info.get("State") or {}
+            if not state.get("Running"):
                 raise Exception(
                     f"Container '{self.container_name}' exists but is not running. "
-                    f"Status: {status}"
+                    f"Status: {state.get('Status', 'unknown')}"
                 )
 
             self.logger.debug(f"Container '{self.container_name}' found and running")
+            _container_ok_until[self.container_name] = time.monotonic() + CHECK_TTL
             return True
 
+        except DockerAPIError as e:
+            self.logger.warning(
+                f"Docker daemon not accessible for container '{self.container_name}': "
+                f"{e}. WP-CLI features will be unavailable. "
+                f"Mount /var/run/docker.sock to enable WP-CLI."
+            )
+            return False
         except TimeoutError:
             self.logger.warning(
                 f"Docker command timed out for container '{self.container_name}'. "
@@ -169,41 +175,27 @@ class WPCLIManager:
         """
         Check if WP-CLI is installed in the container.
 
-        Caches the result to avoid repeated checks.
+        A successful check is cached for ``CHECK_TTL`` seconds.
 
         Returns:
             bool: True if WP-CLI is available
-
-        Raises:
-            Exception: If WP-CLI check fails
         """
-        # Return cached result if available
-        if self.wp_cli_available is not None:
-            return self.wp_cli_available
+        if _wp_cli_ok_until.get(self.container_name, 0.0) > time.monotonic():
+            self.wp_cli_available = True
+            return True
 
         try:
-            # Try to run wp --version
-            process = await asyncio.create_subprocess_exec(
-                "docker",
-                "exec",
-                self.container_name,
-                "wp",
-                "--version",
-                "--allow-root",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            result = await get_docker_client().exec(
+                self.container_name, ["wp", "--version", "--allow-root"], timeout=5.0
             )
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
-
-            if process.returncode == 0:
-                version = stdout.decode().strip()
-                self.logger.info(f"WP-CLI detected: {version}")
+            if result.exit_code == 0:
+                self.logger.info(f"WP-CLI detected: {result.stdout.strip()}")
+                _wp_cli_ok_until[self.container_name] = time.monotonic() + CHECK_TTL
                 self.wp_cli_available = True
                 return True
             else:
-                error_msg = stderr.decode().strip()
-                self.logger.warning(f"WP-CLI not available: {error_msg}")
+                self.logger.warning(f"WP-CLI not available: {result.stderr.strip()}")
                 self.wp_cli_available = False
                 return False
 
@@ -271,6 +263,20 @@ class WPCLIManager:
             # Not JSON, return as plain text
             return {"output": stdout, "message": stdout, "raw_output": stdout}
 
+    async def _ensure_ready(self) -> None:
+        """Raise unless the container is running and has WP-CLI installed."""
+        if not await self._check_container_exists():
+            raise Exception(
+                f"Container '{self.container_name}' not found or not running. "
+                f"Please verify the container name in your configuration."
+            )
+
+        if not await self._check_wp_cli_available():
+            raise Exception(
+                f"WP-CLI is not installed in container '{self.container_name}'. "
+                f"Please install WP-CLI in your WordPress container."
+            )
+
     async def _execute_wp_cli(
         self, command: str, timeout: float = 30.0, force_allow: bool = False
     ) -> dict[str, Any]:
@@ -295,48 +301,29 @@ class WPCLIManager:
                 f"Allowed: {', '.join(self.SAFE_COMMANDS)}"
             )
 
-        # 2. Check container exists
-        if not await self._check_container_exists():
-            raise Exception(
-                f"Container '{self.container_name}' not found or not running. "
-                f"Please verify the container name in your configuration."
-            )
-
-        # 3. Check WP-CLI is available
-        if not await self._check_wp_cli_available():
-            raise Exception(
-                f"WP-CLI is not installed in container '{self.container_name}'. "
-                f"Please install WP-CLI in your WordPress container."
-            )
+        # 2. Check container and WP-CLI (cached)
+        await self._ensure_ready()
 
-        # 4. Build docker exec command (split command into args to prevent shell injection)
-        cmd_parts = (
-            ["docker", "exec", self.container_name, "wp"] + command.split() + ["--allow-root"]
-        )
+        # 3. Build exec argv (split command into args; no shell involved)
+        cmd_parts = ["wp"] + command.split() + ["--allow-root"]
 
-        self.logger.info(f"Executing: {' '.join(cmd_parts)}")
+        self.logger.info(f"Executing in {self.container_name}: {' '.join(cmd_parts)}")
 
         try:
-            # 5. Execute command
-            process = await asyncio.create_subprocess_exec(
-                *cmd_parts, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-
-            # 6. Wait for completion with timeout
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            # 4. Execute command
+            result = await get_docker_client().exec(self.container_name, cmd_parts, timeout=timeout)
 
-            # 7. Check exit code
-            if process.returncode != 0:
-                error_msg = stderr.decode().strip()
+            # 5. Check exit code
+            if result.exit_code != 0:
+                error_msg = result.stderr.strip()
                 self.logger.error(f"WP-CLI command failed: {error_msg}")
                 raise Exception(f"WP-CLI error: {error_msg}")
 
-            # 8. Parse and return output
-            output = stdout.decode()
-            result = self._parse_wp_cli_output(output, command)
+            # 6. Parse and return output
+            parsed = self._parse_wp_cli_output(result.stdout, command)
 
             self.logger.debug(f"Command succeeded: {command}")
-            return result
+            return parsed
 
         except TimeoutError:
             self.logger.error(f"Command timed out after {timeout}s: {command}")
@@ -344,6 +331,10 @@ class WPCLIManager:
                 f"WP-CLI command timed out after {timeout} seconds. "
                 f"The operation may be taking too long."
             )
+        except DockerAPIError as e:
+            # Container may have gone away since the cached check
+            clear_availability_cache(self.container_name)
+            raise Exception(f"Failed to execute WP-CLI command: {e}")
         except Exception as e:
             # Re-raise with context
             if "WP-CLI" in str(e) or "Container" in str(e):
@@ -351,6 +342,86 @@ class WPCLIManager:
             else:
                 raise Exception(f"Failed to execute WP-CLI command: {str(e)}")
 
+    async def execute_batch(
+        self, commands: list[str], timeout: float = 120.0
+    ) -> list[dict[str, Any]]:
+        """
+        Run several maintenance commands in one exec round-trip.
+
+        The commands run in order inside a single ``sh -c``; a failing
+        command does not stop the ones after it. Each command must match
+        an entry of BATCH_COMMANDS exactly.
+
+        Args:
+            commands: WP-CLI commands (without 'wp' prefix)
+            timeout: Timeout for the whole batch in seconds (default: 120s)
+
+        Returns:
+            One dict per command: command, success, exit_code and either
+            output (parsed like _execute_wp_cli) or error
+
+        Raises:
+            Exception: On validation failures or if the batch cannot run
+        """
+        commands = [" ".join(command.split()) for command in commands]
+        if not commands:
+            raise Exception("No commands given.")
+        if len(commands) > self.MAX_BATCH:
+            raise Exception(f"Too many commands ({len(commands)}); at most {self.MAX_BATCH}.")
+        for command in commands:
+            if command not in self.BATCH_COMMANDS:
+                raise Exception(
+                    f"Command '{command}' is not allowed in a batch. "
+                    f"Allowed: {', '.join(self.BATCH_COMMANDS)}"
+                )
+
+        await self._ensure_ready()
+
+        # After each command, print its exit status behind a random marker on
+        # stdout and a bare marker on stderr, so both streams can be split.
+        marker = f"__mcphub_{uuid.uuid4().hex}__"
+        script = "; ".join(
+            f"{shlex.join(['wp', *command.split(), '--allow-root'])}; "
+            f"rc=$?; echo; echo {marker}$rc; echo {marker} >&2"
+            for command in commands
+        )
+
+        self.logger.info(f"Executing batch in {self.container_name}: {commands}")
+        try:
+            result = await get_docker_client().exec(
+                self.container_name, ["sh", "-c", script], timeout=timeout
+            )
+        except TimeoutError:
+            raise Exception(
+                f"WP-CLI batch timed out after {timeout} seconds. "
+                f"The operation may be taking too long."
+            )
+        except DockerAPIError as e:
+            clear_availability_cache(self.container_name)
+            raise Exception(f"Failed to execute WP-CLI batch: {e}")
+
+        # stdout: out0, rc0, out1, rc1, ..., trailing
+        stdout_parts = re.split(rf"\n{marker}(-?\d+)\n", result.stdout)
+        stderr_parts = result.stderr.split(f"{marker}\n")
+        if len(stdout_parts) != 2 * len(commands) + 1:
+            raise Exception(f"WP-CLI batch failed: {result.stderr.strip() or 'no output'}")
+
+        results: list[dict[str, Any]] = []
+        for i, command in enumerate(commands):
+            exit_code = int(stdout_parts[2 * i + 1])
+            entry: dict[str, Any] = {
+                "command": command,
+                "success": exit_code == 0,
+                "exit_code": exit_code,
+            }
+            if exit_code == 0:
+                entry["output"] = self._parse_wp_cli_output(stdout_parts[2 * i], command)
+            else:
+                stderr = stderr_parts[i] if i < len(stderr_parts) else ""
+                entry["error"] = stderr.strip() or stdout_parts[2 * i].strip()
+            results.append(entry)
+        return results
+
     async def execute_command(
         self, command: str, timeout: float = 30.0, force_allow: bool = True
     ) -> dict[str, Any]:
@@ -599,38 +670,19 @@ class WPCLIManager:
         message = result.get("message", "")
 
         # Get file size if export succeeded
-        # Try to check file size via docker exec
         try:
             # Try GNU stat first, fall back to BSD stat
-            process = await asyncio.create_subprocess_exec(
-                "docker",
-                "exec",
-                self.container_name,
-                "stat",
-                "-c",
-                "%s",
-                export_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            docker = get_docker_client()
+            stat = await docker.exec(
+                self.container_name, ["stat", "-c", "%s", export_path], timeout=5.0
             )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5.0)
-            if process.returncode != 0:
-                # BSD stat fallback
-                process = await asyncio.create_subprocess_exec(
-                    "docker",
-                    "exec",
-                    self.container_name,
-                    "stat",
-                    "-f",
-                    "%z",
-                    export_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+            if stat.exit_code != 0:
+                stat = await docker.exec(
+                    self.container_name, ["stat", "-f", "%z", export_path], timeout=5.0
                 )
-                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5.0)
 
-            if process.returncode == 0:
-                size_bytes = int(stdout.decode().strip())
+            if stat.exit_code == 0:
+                size_bytes = int(stat.stdout.strip())
                 # Convert to human readable
                 if size_bytes < 1024:
                     size_str = f"{size_bytes} B"
@@ -640,7 +692,7 @@ class WPCLIManager:
                     size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
             else:
                 size_str = "unknown"
-        except (ValueError, IndexError, OSError):
+        except (ValueError, IndexError, OSError, TimeoutError, DockerAPIError):
             size_str = "unknown"
 
         return {
@@ -9,9 +9,10 @@ the expected shape.
 
 Surface map:
 
-* **wp_bulk_post_update** — ``POST wp/v2/posts/{id}`` per item, fanned
-  out with concurrency=10 (mirror of the legacy ``wordpress_advanced``
-  bulk pattern). 50-item cap.
+* **wp_bulk_post_update** — ``POST wp/v2/posts/{id}`` per item, sent
+  25 at a time through ``/wp-json/batch/v1`` (``WordPressClient.batch``)
+  and fanned out with concurrency=10 where the site can't batch (mirror
+  of the legacy ``wordpress_advanced`` bulk pattern). 50-item cap.
 * **wp_bulk_term_update** — ``POST wp/v2/{taxonomy}/{id}`` per item,
   same shape. 50-item cap. ``taxonomy`` is the REST base
   (``categories`` / ``tags`` / custom rest_base).
@@ -32,14 +33,14 @@ Security rules (extending S-1…S-25):
 
 from __future__ import annotations
 
-import asyncio
 import re
 from typing import Any
 
-from plugins.wordpress.client import WordPressClient
+from plugins.wordpress.client import BatchRequest, WordPressClient
 
 # S-26 cap. Server doesn't add its own check — the cap is purely
-# client-side because each request is a separate stock-REST call.
+# client-side (batch/v1 only limits each round-trip to 25 sub-requests,
+# which WordPressClient.batch chunks under).
 _BULK_MAX_ITEMS = 50
 
 # Stock REST uses POST for create/update on the post / taxonomy
@@ -51,7 +52,7 @@ _UPDATE_METHOD = "POST"
 # would have produced it server-side. Lowercased, digits, ``_``, ``-``.
 _TAXONOMY_RE = re.compile(r"^[a-z0-9][a-z0-9_\-]{0,63}$")
 
-# Concurrency bound for the fan-out. Matches the legacy
+# Concurrency bound for the single-request fallback. Matches the legacy
 # ``wordpress_advanced`` pattern; keeps the WP server from getting
 # swamped on shared hosting.
 _FANOUT_CONCURRENCY = 10
@@ -214,8 +215,8 @@ def _validate_taxonomy(value: Any) -> str:
 class BulkHandler:
     """Bulk fan-out surface (F.19.3.2-.3) — post + term updates.
 
-    Each method runs N stock-REST requests in parallel (bounded at
-    concurrency=10) and returns the per-item status array. Per-item
+    Each method runs N stock-REST requests (batched, or in parallel
+    bounded at concurrency=10) and returns the per-item status array. Per-item
     failures don't fail the whole call — the caller gets
     ``{id, status:'error', error}`` for each one and ``status:'ok'``
     for the successes.
@@ -229,34 +230,31 @@ class BulkHandler:
         endpoint_template: str,
         updates: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        """Run the per-item fan-out with bounded concurrency.
+        """Run the per-item fan-out through the client's batch executor.
 
         ``endpoint_template`` is a format string that takes the item id —
         e.g. ``"posts/{id}"`` or ``"categories/{id}"``. Each item's
         non-``id`` fields are forwarded as the JSON body.
         """
-        sem = asyncio.Semaphore(_FANOUT_CONCURRENCY)
-        results: list[dict[str, Any]] = [None] * len(updates)  # type: ignore[list-item]
-
-        async def one(idx: int, item: dict[str, Any]) -> None:
-            item_id = int(item["id"])
+        ids = [int(item["id"]) for item in updates]
+        requests = []
+        for item_id, item in zip(ids, updates, strict=True):
             body = {k: v for k, v in item.items() if k != "id"}
-            async with sem:
-                try:
-                    await self.client.request(
-                        _UPDATE_METHOD,
-                        endpoint_template.format(id=item_id),
-                        json_data=body if body else None,
-                    )
-                    results[idx] = {"id": item_id, "status": "ok"}
-                except Exception as exc:  # noqa: BLE001 — relay any per-item failure
-                    results[idx] = {
-                        "id": item_id,
-                        "status": "error",
-                        "error": str(exc),
-                    }
-
-        await asyncio.gather(*(one(i, u) for i, u in enumerate(updates)))
+            requests.append(
+                BatchRequest(
+                    _UPDATE_METHOD,
+                    endpoint_template.format(id=item_id),
+                    json_data=body if body else None,
+                )
+            )
+        outcomes = await self.client.batch(requests, concurrency=_FANOUT_CONCURRENCY)
+
+        results: list[dict[str, Any]] = []
+        for item_id, outcome in zip(ids, outcomes, strict=True):
+            if outcome.ok:
+                results.append({"id": item_id, "status": "ok"})
+            else:
+                results.append({"id": item_id, "status": "error", "error": outcome.error})
         return results
 
     async def wp_bulk_post_update(
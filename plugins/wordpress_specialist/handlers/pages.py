@@ -43,6 +43,8 @@ All tools require Airano MCP Bridge v2.13.0+.
 
 from __future__ import annotations
 
+import json
+import re
 from typing import Any
 
 from plugins.wordpress.client import WordPressClient
@@ -559,128 +561,164 @@ class PagesHandler:
 # produced by the block editor itself (the only realistic input for
 # read-back). For freeform / classic-editor content it falls back to a
 # single ``core/freeform`` block with the original HTML.
+#
+# Opening and closing delimiters are matched by one regex in a single
+# left-to-right pass, and each block's innerHTML is joined once when it
+# closes, so parse time stays linear in the size of post_content however
+# deeply blocks nest. As in ``parse_blocks()``, ``innerContent`` holds a
+# ``None`` placeholder where each inner block sits; that is what lets
+# ``_serialize_blocks_python`` put a (possibly edited) tree back together.
 # ─────────────────────────────────────────────────────────────────────
 
+_BLOCK_DELIMITER_RE = re.compile(
+    r"<!--\s*(?:"
+    r"wp:(?P<name>[a-z0-9][a-z0-9_/-]*)\s*(?P<attrs>\{.*?\})?\s*(?P<void>/)?-->"
+    r"|/wp:(?P<closer>[a-z0-9][a-z0-9_/-]*)\s*-->"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Sequences the block editor escapes inside comment-delimiter JSON so
+# attributes can't terminate the comment or be mistaken for markup.
+_ATTR_ESCAPES = (
+    ("--", "\\u002d\\u002d"),
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("&", "\\u0026"),
+    ('\\"', "\\u0022"),
+)
+
+
+def _freeform_block(html: str) -> dict[str, Any]:
+    return {
+        "blockName": None,
+        "attrs": {},
+        "innerBlocks": [],
+        "innerHTML": html,
+        "innerContent": [html],
+    }
 
-def _parse_blocks_python(html: str) -> list[dict[str, Any]]:
-    import json
-    import re
 
+def _parse_blocks_python(html: str) -> list[dict[str, Any]]:
     if not html or "<!-- wp:" not in html:
         if not html:
             return []
-        return [
-            {
-                "blockName": None,
-                "attrs": {},
-                "innerBlocks": [],
-                "innerHTML": html,
-                "innerContent": [html],
-            }
-        ]
-
-    open_re = re.compile(
-        r"<!--\s*wp:([a-z0-9][a-z0-9_/-]*)\s*(\{.*?\})?\s*(/)?-->",
-        re.IGNORECASE | re.DOTALL,
-    )
-    close_re = re.compile(r"<!--\s*/wp:([a-z0-9][a-z0-9_/-]*)\s*-->", re.IGNORECASE)
+        return [_freeform_block(html)]
 
-    pos = 0
-    length = len(html)
     blocks: list[dict[str, Any]] = []
     stack: list[dict[str, Any]] = []
 
     def _attach(block: dict[str, Any]) -> None:
         if stack:
             stack[-1]["innerBlocks"].append(block)
+            stack[-1]["innerContent"].append(None)
         else:
             blocks.append(block)
 
-    while pos < length:
-        m_open = open_re.search(html, pos)
-        m_close = close_re.search(html, pos)
-
-        # Pick the earliest match.
-        next_open = m_open.start() if m_open else length
-        next_close = m_close.start() if m_close else length
-
-        if next_open == length and next_close == length:
-            # No more delimiters — flush the rest as freeform on the
-            # outer level (or innerHTML of the open block).
-            tail = html[pos:length]
-            if tail.strip():
-                if stack:
-                    stack[-1]["innerHTML"] += tail
-                    stack[-1]["innerContent"].append(tail)
-                else:
-                    blocks.append(
-                        {
-                            "blockName": None,
-                            "attrs": {},
-                            "innerBlocks": [],
-                            "innerHTML": tail,
-                            "innerContent": [tail],
-                        }
-                    )
-            break
-
-        if next_open <= next_close and m_open is not None:
-            # Free text before this open tag → inherit by current parent.
-            head = html[pos:next_open]
-            if head:
-                if stack:
-                    stack[-1]["innerHTML"] += head
+    def _close(block: dict[str, Any]) -> None:
+        block["innerHTML"] = "".join([c for c in block["innerContent"] if c is not None])
+        _attach(block)
+
+    pos = 0
+    for m in _BLOCK_DELIMITER_RE.finditer(html):
+        head = html[pos : m.start()]
+        pos = m.end()
+
+        if m.group("closer") is not None:
+            if stack:
+                if head:
                     stack[-1]["innerContent"].append(head)
-                else:
-                    if head.strip():
-                        blocks.append(
-                            {
-                                "blockName": None,
-                                "attrs": {},
-                                "innerBlocks": [],
-                                "innerHTML": head,
-                                "innerContent": [head],
-                            }
-                        )
-
-            name = m_open.group(1)
-            attrs_raw = m_open.group(2)
-            self_closing = m_open.group(3) is not None
-            attrs: dict[str, Any] = {}
-            if attrs_raw:
-                try:
-                    attrs = json.loads(attrs_raw)
-                except json.JSONDecodeError:
-                    attrs = {"_invalid_json": attrs_raw}
-            block_name = name if "/" in name else f"core/{name}"
-            block = {
-                "blockName": block_name,
-                "attrs": attrs,
-                "innerBlocks": [],
-                "innerHTML": "",
-                "innerContent": [],
-            }
-            pos = m_open.end()
-            if self_closing:
-                _attach(block)
-            else:
-                stack.append(block)
-        elif m_close is not None:
-            head = html[pos:next_close]
-            if head and stack:
-                stack[-1]["innerHTML"] += head
-                stack[-1]["innerContent"].append(head)
+                _close(stack.pop())
+            continue
+
+        # Free text before this open tag → inherit by current parent.
+        if head:
             if stack:
-                closing = stack.pop()
-                _attach(closing)
-            pos = m_close.end()
-        else:  # pragma: no cover — guarded by the length check above
-            break
+                stack[-1]["innerContent"].append(head)
+            elif head.strip():
+                blocks.append(_freeform_block(head))
+
+        name = m.group("name")
+        attrs_raw = m.group("attrs")
+        attrs: dict[str, Any] = {}
+        if attrs_raw:
+            try:
+                attrs = json.loads(attrs_raw)
+            except json.JSONDecodeError:
+                attrs = {"_invalid_json": attrs_raw}
+        block = {
+            "blockName": name if "/" in name else f"core/{name}",
+            "attrs": attrs,
+            "innerBlocks": [],
+            "innerHTML": "",
+            "innerContent": [],
+        }
+        if m.group("void") is not None:
+            _attach(block)
+        else:
+            stack.append(block)
+
+    # No more delimiters — flush the rest as freeform on the outer level
+    # (or innerHTML of the open block).
+    tail = html[pos:]
+    if tail.strip():
+        if stack:
+            stack[-1]["innerContent"].append(tail)
+        else:
+            blocks.append(_freeform_block(tail))
 
     # Anything left on the stack is a mismatched open — surface it
     # rather than silently dropping content.
     while stack:
-        unclosed = stack.pop()
-        _attach(unclosed)
+        _close(stack.pop())
 
     return blocks
+
+
+def _serialize_blocks_python(blocks: list[dict[str, Any]]) -> str:
+    """Inverse of ``_parse_blocks_python`` (block editor output format).
+
+    Top-level blocks are joined with a blank line, as the editor saves
+    them, so editor-produced post_content round-trips unchanged.
+    """
+    return "\n\n".join(_serialize_block(b) for b in blocks)
+
+
+def _serialize_block(block: dict[str, Any]) -> str:
+    inner_blocks = list(block.get("innerBlocks") or [])
+    content = block.get("innerContent")
+    if content is None:
+        # Hand-built block without placeholders: HTML first, children after
+        content = ([block["innerHTML"]] if block.get("innerHTML") else []) + [None] * len(
+            inner_blocks
+        )
+
+    children = iter(inner_blocks)
+    parts: list[str] = []
+    for chunk in content:
+        if chunk is None:
+            child = next(children, None)
+            if child is not None:
+                parts.append(_serialize_block(child))
+        else:
+            parts.append(chunk)
+    # Trees without placeholders (older wp_blocks_get output): keep the
+    # children rather than dropping them
+    parts.extend(_serialize_block(child) for child in children)
+    body = "".join(parts)
+
+    name = block.get("blockName")
+    if not name:
+        return body
+    if name.startswith("core/"):
+        name = name[len("core/") :]
+    attrs = block.get("attrs") or {}
+    opener = f"<!-- wp:{name} "
+    if attrs:
+        encoded = json.dumps(attrs, ensure_ascii=False, separators=(",", ":"))
+        for raw, escaped in _ATTR_ESCAPES:
+            encoded = encoded.replace(raw, escaped)
+        opener += encoded + " "
+    if not body:
+        return opener + "/-->"
+    return f"{opener}-->{body}<!-- /wp:{name} -->"
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Benchmark: Gutenberg block parser used by ``wp_blocks_get``.
+
+Compares the previous parser (``before``: re-runs an opener search and a
+closer search from the current position on every delimiter and grows
+``innerHTML`` by concatenation) with the single-pass tokenizer in
+:mod:`plugins.wordpress_specialist.handlers.pages` (``after``).
+
+The corpus in ``scripts/bench_data/gutenberg/`` is block-editor output of
+the kinds of pages the tool is used on (long-form article, landing page,
+product docs with WooCommerce/Yoast blocks). Each scenario scales it to a
+large post:
+
+- ``long``: the corpus repeated ``--repeat`` times at the top level
+- ``nested``: the corpus inside ``--depth`` nested group blocks
+- ``void-run``: one group holding ``--voids`` self-closing blocks
+  (reusable-block / query-loop heavy pages)
+
+Usage:
+    python scripts/bench_block_parser.py [--repeat 40] [--depth 200] [--voids 3000]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from plugins.wordpress_specialist.handlers.pages import (  # noqa: E402
+    _parse_blocks_python,
+    _serialize_blocks_python,
+)
+
+CORPUS_DIR = Path(__file__).resolve().parent / "bench_data" / "gutenberg"
+
+_OPEN_RE = re.compile(
+    r"<!--\s*wp:([a-z0-9][a-z0-9_/-]*)\s*(\{.*?\})?\s*(/)?-->", re.IGNORECASE | re.DOTALL
+)
+_CLOSE_RE = re.compile(r"<!--\s*/wp:([a-z0-9][a-z0-9_/-]*)\s*-->", re.IGNORECASE)
+
+
+def before(html: str) -> list[dict[str, Any]]:
+    """Pre-change parser (freeform fast path omitted; the corpus always has blocks)."""
+    pos, length = 0, len(html)
+    blocks: list[dict[str, Any]] = []
+    stack: list[dict[str, Any]] = []
+
+    def attach(block: dict[str, Any]) -> None:
+        (stack[-1]["innerBlocks"] if stack else blocks).append(block)
+
+    def text(chunk: str) -> None:
+        stack[-1]["innerHTML"] += chunk
+        stack[-1]["innerContent"].append(chunk)
+
+    def freeform(chunk: str) -> dict[str, Any]:
+        return {
+            "blockName": None,
+            "attrs": {},
+            "innerBlocks": [],
+            "innerHTML": chunk,
+            "innerContent": [chunk],
+        }
+
+    while pos < length:
+        m_open = _OPEN_RE.search(html, pos)
+        m_close = _CLOSE_RE.search(html, pos)
+        next_open = m_open.start() if m_open else length
+        next_close = m_close.start() if m_close else length
+        if next_open == length and next_close == length:
+            tail = html[pos:]
+            if tail.strip():
+                text(tail) if stack else blocks.append(freeform(tail))
+            break
+        if next_open <= next_close and m_open is not None:
+            head = html[pos:next_open]
+            if head:
+                if stack:
+                    text(head)
+                elif head.strip():
+                    blocks.append(freeform(head))
+            name, attrs_raw = m_open.group(1), m_open.group(2)
+            try:
+                attrs = json.loads(attrs_raw) if attrs_raw else {}
+            except json.JSONDecodeError:
+                attrs = {"_invalid_json": attrs_raw}
+            block = {
+                "blockName": name if "/" in name else f"core/{name}",
+                "attrs": attrs,
+                "innerBlocks": [],
+                "innerHTML": "",
+                "innerContent": [],
+            }
+            pos = m_open.end()
+            attach(block) if m_open.group(3) is not None else stack.append(block)
+        elif m_close is not None:
+            head = html[pos:next_close]
+            if head and stack:
+                text(head)
+            if stack:
+                attach(stack.pop())
+            pos = m_close.end()
+    while stack:
+        attach(stack.pop())
+    return blocks
+
+
+def group(inner: str) -> str:
+    return f'<!-- wp:group -->\n<div class="wp-block-group">{inner}</div>\n<!-- /wp:group -->'
+
+
+def build_scenarios(opts: argparse.Namespace) -> dict[str, str]:
+    docs = [p.read_text(encoding="utf-8") for p in sorted(CORPUS_DIR.glob("*.html"))]
+    corpus = "\n\n".join(docs)
+    nested = corpus
+    for _ in range(opts.depth):
+        nested = group(nested)
+    voids = "\n\n".join(f'<!-- wp:block {{"ref":{1000 + i}}} /-->' for i in range(opts.voids))
+    return {
+        "long": "\n\n".join([corpus] * opts.repeat),
+        "nested": nested,
+        "void-run": group(voids),
+    }
+
+
+def timed(fn, html: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=40)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--voids", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=3)
+    opts = parser.parse_args()
+
+    for name, html in build_scenarios(opts).items():
+        assert _serialize_blocks_python(_parse_blocks_python(html)) == html
+        before_ms = timed(before, html, opts.runs)
+        after_ms = timed(_parse_blocks_python, html, opts.runs)
+        print(
+            f"{name:9} {len(html) / 1024:8.0f} KiB  before {before_ms:9.1f} ms  "
+            f"after {after_ms:7.1f} ms  speedup {before_ms / after_ms:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
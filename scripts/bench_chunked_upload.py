@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Peak memory of a chunked media upload finished with ``skip_optimize``.
+
+Runs the real ``upload_media_chunked_*`` handler flow (SQLite session store,
+spill file, aiohttp upload) against a stub WordPress in a child process that
+discards the request body, and samples this process's RSS every 5 ms:
+
+- ``chunks``: while ``--size-mb`` of payload arrives in ``--chunk-mb``
+  base64 chunks;
+- ``finish``: during ``upload_media_chunked_finish`` (dedupe lookup, upload,
+  metadata).
+
+The finish streams the spill file, so its peak should stay near the chunk
+phase rather than grow with the payload (it used to read the whole file,
+then hold a second copy in the multipart body).
+
+RSS is read from ``/proc/self/status`` (Linux).
+
+Usage:
+    python scripts/bench_chunked_upload.py [--size-mb 200] [--chunk-mb 4]
+
+Reference run (200 MB PNG, 4 MB chunks; Python 3.11.7, aiosqlite 0.22.1)::
+
+    streaming finish        chunks peak 131.3 MB   finish peak 130.1 MB (+4.2 MB)
+    before (read + bytes)   chunks peak 128.0 MB   finish peak 706.3 MB (+592.8 MB)
+
+The ``before`` row is the same script on the tree before the finish
+streamed the spill file, with ``WP_MEDIA_MAX_MB=500`` (that code still
+applied the single-shot size limit to chunked uploads).
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.database import Database  # noqa: E402
+from core.http_transport import close_http_transport  # noqa: E402
+from core.upload_sessions import UploadSessionStore, set_upload_session_store  # noqa: E402
+from plugins.wordpress.client import WordPressClient  # noqa: E402
+from plugins.wordpress.handlers.media_chunked import MediaChunkedHandler  # noqa: E402
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class PeakRss:
+    """Samples RSS in a thread; ``peak`` is the highest value seen."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_mb())
+            time.sleep(self.interval)
+
+    def __enter__(self) -> "PeakRss":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_mb())
+
+
+def serve_stub_wordpress(port: int) -> None:
+    """Minimal WordPress: media POSTs are read in 64 KB pieces and dropped."""
+    from aiohttp import web
+
+    async def handle(request: web.Request) -> web.Response:
+        received = 0
+        async for piece in request.content.iter_chunked(64 * 1024):
+            received += len(piece)
+        if request.method == "GET":
+            return web.json_response([])
+        return web.json_response(
+            {
+                "id": 1,
+                "mime_type": "image/png",
+                "source_url": f"http://127.0.0.1:{port}/bench.png",
+                "media_details": {"filesize": received},
+            },
+            status=201,
+        )
+
+    app = web.Application(client_max_size=2**40)
+    app.router.add_route("*", "/{tail:.*}", handle)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, handle_signals=False)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run(size_mb: int, chunk_mb: int, port: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "bench.db"))
+        await db.initialize()
+        store = UploadSessionStore(db=db, spill_dir=Path(tmp) / "spill")
+        set_upload_session_store(store)
+        try:
+            await upload(store, size_mb, chunk_mb, port)
+        finally:
+            set_upload_session_store(None)
+            await close_http_transport()
+            await db.close()
+
+
+async def upload(store: UploadSessionStore, size_mb: int, chunk_mb: int, port: int) -> None:
+    client = WordPressClient(
+        site_url=f"http://127.0.0.1:{port}", username="bench", app_password="bench"
+    )
+    handler = MediaChunkedHandler(client, user_id="bench", store=store)
+
+    chunk_size = chunk_mb * 1024 * 1024
+    total = size_mb * 1024 * 1024 // chunk_size * chunk_size
+    # A PNG, so that skip_optimize (not the MIME type) is what avoids optimization
+    first = (PNG_SIGNATURE + bytes(chunk_size))[:chunk_size]
+    rest = bytes(chunk_size)
+    start_rss = rss_mb()
+    started = json.loads(
+        await handler.upload_media_chunked_start(
+            filename="bench.png", total_bytes=total, mime="image/png"
+        )
+    )
+    session_id = started["session_id"]
+
+    with PeakRss() as chunks_peak:
+        for index in range(total // chunk_size):
+            data = base64.b64encode(first if index == 0 else rest).decode()
+            out = json.loads(await handler.upload_media_chunked_chunk(session_id, index, data))
+            if "error_code" in out:
+                raise RuntimeError(f"chunk {index} failed: {out}")
+            del data
+
+    before_finish = rss_mb()
+    began = time.perf_counter()
+    with PeakRss() as finish_peak:
+        out = json.loads(await handler.upload_media_chunked_finish(session_id, skip_optimize=True))
+    elapsed = time.perf_counter() - began
+    if "error_code" in out:
+        raise RuntimeError(f"finish failed: {out}")
+
+    print(f"payload {total // 2**20} MB in {chunk_mb} MB chunks")
+    print(f"start           RSS {start_rss:7.1f} MB")
+    print(f"chunks   peak   RSS {chunks_peak.peak:7.1f} MB")
+    print(
+        f"finish   peak   RSS {finish_peak.peak:7.1f} MB"
+        f"   (+{finish_peak.peak - before_finish:.1f} MB, {elapsed:.1f} s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--chunk-mb", type=int, default=4)
+    opts = parser.parse_args()
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve_stub_wordpress, args=(port,), daemon=True)
+    server.start()
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        asyncio.run(run(opts.size_mb, opts.chunk_mb, port))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
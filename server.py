@@ -20,13 +20,13 @@ Sites are managed via the web dashboard and stored in SQLite (DB-based).
 """
 
 import base64
-import copy
 import logging
 import os
 import sys
 import time
 import warnings
 from datetime import UTC, datetime
+from functools import partial
 from typing import Optional
 
 from dotenv import find_dotenv, load_dotenv
@@ -38,7 +38,6 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="websocket
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
-from fastmcp.server.dependencies import get_http_headers
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse
@@ -58,6 +57,7 @@ from core import (
     set_api_key_context,
 )
 from core.capability_probe import api_site_capabilities, api_site_capabilities_badge
+from core.cpu_pool import get_cpu_pool
 from core.dashboard.routes import (
     # F.7b: Per-site tool visibility
     api_bulk_toggle_site_tools,
@@ -139,11 +139,12 @@ from core.dashboard.routes import (
     dashboard_user_oauth_clients_list,
 )
 from core.database import get_database, initialize_database
+from core.docker_api import close_docker_client
 from core.i18n import detect_language, get_all_translations
 
 # OAuth and CSRF (Phase E)
 from core.oauth import get_csrf_manager
-from plugins.ai_image.providers.openrouter import api_openrouter_models
+from core.rate_limiter import client_key
 
 # Configure logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -518,166 +519,15 @@ logger.info("Admin MCP instructions configured with site discovery")
 # === AUTHENTICATION MIDDLEWARE ===
 
 
-def extract_project_from_tool(tool_name: str) -> str:
-    """
-    Extract project_id from tool name.
-
-    Examples:
-        "wordpress_list_posts" -> "*" (unified tool, project via param)
-        "list_projects" -> "*" (system tool)
-        "get_rate_limit_stats" -> "*" (system tool)
-
-    Returns:
-        "*" for now (project is passed as parameter in unified architecture)
-    """
-    # In unified architecture, project is passed as parameter, not in tool name
-    # So we return "*" to indicate "any project" at this stage
-    # The actual project will be validated when the tool is executed
-    return "*"
-
-
-def extract_plugin_type_from_tool(tool_name: str) -> str | None:
-    """
-    Extract plugin type from tool name for tool visibility filtering.
-
-    Each API key should only see tools related to its plugin type.
-
-    Examples:
-        "wordpress_list_posts" -> "wordpress"
-        "wordpress_specialist_wp_db_size" -> "wordpress_specialist"
-        "wordpress_specialist_wp_bulk_post_update" -> "wordpress_specialist"
-        "gitea_list_repositories" -> "gitea"
-        "list_projects" -> None (system tool)
-        "manage_api_keys_list" -> None (system tool)
-
-    Returns:
-        Plugin type string or None for system tools
-    """
-    # Remove MCP namespace prefix if present (e.g., "mcp__mcp-hub__wordpress_...")
-    clean_name = tool_name
-    if tool_name.startswith("mcp__") and "__" in tool_name[5:]:
-        # Strip "mcp__{server-name}__" prefix
-        clean_name = tool_name.split("__", 2)[-1]
-
-    # Check for plugin types (order matters - check more specific first).
-    # The two-word ``wordpress_specialist`` variant must be checked
-    # before the bare ``wordpress_`` prefix. (``wordpress_advanced`` was
-    # sunset in F.19.3.2-.3.)
-    if clean_name.startswith("wordpress_specialist_"):
-        return "wordpress_specialist"
-    elif clean_name.startswith("wordpress_") or clean_name.startswith("woocommerce_"):
-        return "wordpress"
-    elif clean_name.startswith("gitea_"):
-        return "gitea"
-    elif clean_name.startswith("n8n_"):
-        return "n8n"
-    elif clean_name.startswith("supabase_"):
-        return "supabase"
-    elif clean_name.startswith("openpanel_"):
-        return "openpanel"
-    elif clean_name.startswith("ghost_"):
-        return "ghost"
-
-    # System tools (no plugin type)
-    return None
-
-
-def check_tool_visibility(tool_name: str, api_key_project_id: str) -> bool:
-    """
-    Check if API key has visibility to the requested tool.
-
-    Rules:
-    - Global API keys (project_id="*") see ALL tools
-    - Plugin-specific keys (project_id="wordpress_xxx") see only that plugin's tools
-    - System tools are visible to global keys only
-
-    Args:
-        tool_name: Name of the tool being accessed
-        api_key_project_id: project_id from API key
-
-    Returns:
-        True if tool is visible, False otherwise
-
-    Examples:
-        >>> check_tool_visibility("wordpress_list_posts", "wordpress_site1")
-        True
-        >>> check_tool_visibility("wordpress_specialist_wp_db_size", "wordpress_specialist_site1")
-        True
-        >>> check_tool_visibility("gitea_list_repos", "wordpress_site1")
-        False
-        >>> check_tool_visibility("list_projects", "wordpress_site1")
-        False  # System tools need global key
-        >>> check_tool_visibility("wordpress_list_posts", "*")
-        True  # Global key sees everything
-    """
-    # Global keys see everything
-    if api_key_project_id == "*":
-        return True
-
-    # Extract plugin type from tool name
-    tool_plugin_type = extract_plugin_type_from_tool(tool_name)
-
-    # System tools (no plugin type) - only visible to global keys
-    if tool_plugin_type is None:
-        return False
-
-    # Extract plugin type from API key project_id
-    # project_id format: "{plugin_type}_{site_id}" e.g. "wordpress_site1" or
-    # "wordpress_specialist_site1".
-    # IMPORTANT: list multi-word variants BEFORE the bare ``wordpress`` so the
-    # prefix match doesn't claim them as plain wordpress.
-    known_plugin_types = [
-        "wordpress_specialist",
-        "wordpress",
-        "gitea",
-        "n8n",
-        "supabase",
-        "ghost",
-    ]
-
-    key_plugin_type = None
-    for ptype in known_plugin_types:
-        if api_key_project_id.startswith(ptype + "_"):
-            key_plugin_type = ptype
-            break
-
-    if key_plugin_type is None:
-        # Fallback: extract first part before underscore
-        if "_" in api_key_project_id:
-            key_plugin_type = api_key_project_id.split("_")[0]
-        else:
-            key_plugin_type = api_key_project_id
-
-    # Check if plugin types match
-    return tool_plugin_type == key_plugin_type
-
-
-def determine_required_scope(tool_name: str) -> str:
-    """
-    Determine required scope for a tool.
-
-    Read operations: list, get, check
-    Write operations: create, update, delete, revoke, rotate
-    Admin operations: manage keys, system operations
-
-    Returns:
-        "read", "write", or "admin"
-    """
-    tool_lower = tool_name.lower()
-
-    # Admin operations
-    if any(x in tool_lower for x in ["manage_api_keys", "reset_rate_limit", "export_"]):
-        return "admin"
-
-    # Write operations
-    if any(
-        x in tool_lower
-        for x in ["create", "update", "delete", "revoke", "rotate", "upload", "flush"]
-    ):
-        return "write"
-
-    # Everything else is read
-    return "read"
+# Name-derived tool metadata lives in core.tool_meta; re-exported here for
+# existing ``from server import ...`` callers.
+from core.context import get_tool_call_context
+from core.tool_meta import (  # noqa: F401
+    check_tool_visibility,
+    determine_required_scope,
+    extract_plugin_type_from_tool,
+    extract_project_from_tool,
+)
 
 
 class UserAuthMiddleware(Middleware):
@@ -706,9 +556,9 @@ class UserAuthMiddleware(Middleware):
             ToolError: If authentication fails or token is missing/invalid
         """
         try:
-            # Get HTTP headers from the request
-            headers = get_http_headers()
-            auth_header = headers.get("authorization")
+            # Built once here and reused by the rest of the middleware chain
+            call = get_tool_call_context(context)
+            auth_header = call.auth_header
 
             # Check if Authorization header exists
             if not auth_header:
@@ -725,62 +575,19 @@ class UserAuthMiddleware(Middleware):
                 raise ToolError("Invalid Authorization format. Expected: 'Bearer <token>'")
 
             # Extract token from "Bearer <token>"
-            token = auth_header.removeprefix("Bearer ").strip()
+            token = call.bearer_token
 
             if not token:
                 logger.warning("Request rejected: Empty token")
                 raise ToolError("Invalid Authorization: Token is empty")
 
-            # Get tool information
-            # Extract tool name directly from context.message.name
-            # context.message is CallToolRequestParams which has 'name' and 'arguments' attributes
-            tool_name = "unknown"
-            try:
-                if hasattr(context, "message") and hasattr(context.message, "name"):
-                    tool_name = context.message.name
-                    logger.debug(f"Extracted tool_name: {tool_name}")
-            except Exception as e:
-                logger.warning(f"Failed to extract tool name: {e}")
-
-            project_id = extract_project_from_tool(tool_name)
-            required_scope = determine_required_scope(tool_name)
-
-            # Determine if this is a unified tool (takes site parameter)
-            # Unified tools will validate project access at execution time
-            # Note: FastMCP adds namespace prefix to tool names
-
-            # Check if this is a system tool first
-            SYSTEM_TOOLS = [
-                "list_projects",
-                "get_project_info",
-                "check_all_projects_health",
-                "get_project_health",
-                "get_system_metrics",
-                "get_system_uptime",
-                "get_rate_limit_stats",
-                "export_health_metrics",
-                "manage_api_keys_list",
-                "manage_api_keys_get_info",
-            ]
-            is_system_tool = any(tool_name.endswith(st) for st in SYSTEM_TOOLS)
-
-            # FALLBACK: If extraction fails, assume unified tool for safety
-            # This allows per-project API keys to work even if extraction fails
-            if tool_name == "unknown":
-                is_unified_tool = True
-            else:
-                # All plugin tools that have a 'site' parameter are unified tools
-                # They defer project access check to execution time
-                # Clean any MCP namespace prefix before checking
-                check_name = tool_name
-                if tool_name.startswith("mcp__") and "__" in tool_name[5:]:
-                    check_name = tool_name.split("__", 2)[-1]
-                is_unified_tool = (
-                    check_name.startswith("wordpress_")
-                    or check_name.startswith("wordpress_specialist_")
-                    or check_name.startswith("woocommerce_")
-                    or check_name.startswith("gitea_")
-                )
+            # Precomputed name-derived metadata (core.tool_meta)
+            tool_name = call.tool_name
+            meta = call.meta
+            project_id = meta.project_id
+            required_scope = meta.required_scope
+            is_system_tool = meta.is_system
+            is_unified_tool = meta.is_unified
 
             logger.debug(
                 f"Auth check: tool={tool_name}, project={project_id}, "
@@ -797,7 +604,7 @@ class UserAuthMiddleware(Middleware):
                 # - System tools: will validate below that key is global
                 skip_project_check = is_unified_tool or is_system_tool
 
-                key_id = api_key_manager.validate_key(
+                key_id = await api_key_manager.validate_key_async(
                     token,
                     project_id=project_id,
                     required_scope=required_scope,
@@ -870,8 +677,8 @@ class UserAuthMiddleware(Middleware):
 
                 if key:
                     # Check if API key has visibility to this tool
-                    if not check_tool_visibility(tool_name, key.project_id):
-                        plugin_type = extract_plugin_type_from_tool(tool_name)
+                    if not meta.visible_to(key.project_id):
+                        plugin_type = meta.plugin_type
                         logger.warning(
                             f"Tool visibility denied: Key {key_id} (project: {key.project_id}) "
                             f"attempted to access {plugin_type or 'system'} tool: {tool_name}"
@@ -957,28 +764,15 @@ class AuditLoggingMiddleware(Middleware):
         Returns:
             Result from the tool
         """
-        # Access tool information from context.message.params
-        tool_name = "unknown"
-        tool_args = {}
-
-        try:
-            if hasattr(context, "message") and hasattr(context.message, "params"):
-                params = context.message.params
-                tool_name = params.name if hasattr(params, "name") else "unknown"
-                tool_args = params.arguments if hasattr(params, "arguments") else {}
-        except Exception as e:
-            logger.warning(f"Failed to extract tool info from context: {e}")
+        call = get_tool_call_context(context)
+        tool_name = call.tool_name
+        tool_args = call.arguments
 
         # Extract site info from unified tools
-        site = tool_args.get("site") if "site" in tool_args else None
+        site = tool_args.get("site")
 
-        # Extract project_id from per-site tools
-        project_id = None
-        if "_site" in tool_name or "_" in tool_name:
-            # Per-site tool format: wordpress_site1_get_post
-            parts = tool_name.split("_")
-            if len(parts) >= 2 and parts[1].startswith("site"):
-                project_id = f"{parts[0]}_{parts[1]}"
+        # Extract project_id from per-site tools (wordpress_site1_get_post)
+        project_id = call.meta.per_site_project_id
 
         start_time = time.time()
         error_msg = None
@@ -1059,39 +853,15 @@ class RateLimitMiddleware(Middleware):
         Raises:
             ToolError: If rate limit is exceeded
         """
-        # Extract client ID from auth header
-        client_id = "unknown"
-        try:
-            headers = get_http_headers()
-            auth_header = headers.get("authorization", "")
-            if auth_header.startswith("Bearer "):
-                # Use the token as client ID (could hash for privacy in production)
-                client_id = auth_header.removeprefix("Bearer ").strip()
-        except Exception as e:
-            logger.warning(f"Failed to extract client ID: {e}")
+        call = get_tool_call_context(context)
 
-        # Extract tool information
-        tool_name = "unknown"
-        plugin_type = None
-        try:
-            if hasattr(context, "message") and hasattr(context.message, "params"):
-                params = context.message.params
-                tool_name = params.name if hasattr(params, "name") else "unknown"
-
-                # Determine plugin type from tool name
-                # Clean any MCP namespace prefix
-                tn = tool_name
-                if tool_name.startswith("mcp__") and "__" in tool_name[5:]:
-                    tn = tool_name.split("__", 2)[-1]
-                if tn.startswith("wordpress_"):
-                    plugin_type = "wordpress"
-                elif tool_name.startswith("woocommerce_"):
-                    plugin_type = "woocommerce"
-        except Exception as e:
-            logger.warning(f"Failed to extract tool info: {e}")
+        # Use the token as client ID (could hash for privacy in production)
+        client_id = call.bearer_token or "unknown"
+        tool_name = call.tool_name
+        plugin_type = call.meta.rate_limit_plugin_type
 
         # Check rate limit
-        allowed, message, retry_after = rate_limiter.check_rate_limit(
+        allowed, message, retry_after = await rate_limiter.check_rate_limit_async(
             client_id=client_id, tool_name=tool_name, plugin_type=plugin_type
         )
 
@@ -1099,7 +869,7 @@ class RateLimitMiddleware(Middleware):
             # Log rejection via audit logger
             try:
                 audit_logger.log_system_event(
-                    event=f"Rate limit exceeded for client {client_id[:8]}...",
+                    event=f"Rate limit exceeded for client {client_key(client_id)}",
                     details={
                         "tool_name": tool_name,
                         "plugin_type": plugin_type,
@@ -1159,37 +929,28 @@ class HealthMetricsMiddleware(Middleware):
         Returns:
             Result from the tool
         """
-        # Extract tool information
-        tool_name = "unknown"
-        tool_args = {}
+        call = get_tool_call_context(context)
+        tool_name = call.tool_name
+        tool_args = call.arguments
         project_id = None
-
-        try:
-            if hasattr(context, "message") and hasattr(context.message, "params"):
-                params = context.message.params
-                tool_name = params.name if hasattr(params, "name") else "unknown"
-                tool_args = params.arguments if hasattr(params, "arguments") else {}
-        except Exception as e:
-            logger.warning(f"Failed to extract tool info: {e}")
+        plugin_type = None
 
         # Extract project_id from unified tools (site parameter)
         if "site" in tool_args:
             site = tool_args["site"]
             # Resolve alias to full_id using site_manager
             try:
-                # Try to determine plugin type from tool name
-                plugin_type = tool_name.split("_")[0] if "_" in tool_name else "wordpress"
-                site_config = site_manager.get_site_config(plugin_type, site)
+                site_config = site_manager.get_site_config(call.meta.name_prefix, site)
                 project_id = site_config.get_full_id()
+                plugin_type = site_config.plugin_type
             except (ValueError, Exception):
                 # Fallback to site value if resolution fails
                 pass
 
         # Extract project_id from per-site tools (tool name)
-        if not project_id and "_" in tool_name:
-            parts = tool_name.split("_")
-            if len(parts) >= 2 and parts[1].startswith("site"):
-                project_id = f"{parts[0]}_{parts[1]}"
+        if not project_id and call.meta.per_site_project_id:
+            project_id = call.meta.per_site_project_id
+            plugin_type = call.meta.per_site_plugin_type
 
         # Skip tracking for system tools (no project_id)
         if not project_id:
@@ -1220,6 +981,8 @@ class HealthMetricsMiddleware(Middleware):
                     response_time_ms=response_time_ms,
                     success=success,
                     error_message=error_msg,
+                    tool_name=tool_name,
+                    plugin_type=plugin_type,
                 )
             except Exception as metric_error:
                 # Don't let metrics tracking errors break the tool call
@@ -1726,6 +1489,19 @@ def create_dynamic_tool(name: str, description: str, handler, input_schema: dict
     return dynamic_wrapper
 
 
+# (plugin_type, display name) in tool registration order
+_TOOL_PLUGINS = [
+    ("wordpress", "WordPress"),
+    ("woocommerce", "WooCommerce"),  # Phase D.1 - Split from WordPress Core
+    ("wordpress_specialist", "WordPress Specialist"),  # F.19.1 - companion-backed
+    ("gitea", "Gitea"),  # Phase C
+    ("n8n", "n8n"),  # Phase F
+    ("supabase", "Supabase"),  # Phase G - Self-Hosted
+    ("openpanel", "OpenPanel"),  # Phase H - Product Analytics
+    ("coolify", "Coolify"),  # Phase F.17 - Deployment Management
+]
+
+
 def register_project_tools():
     """
     Dynamically register all project tools from plugins.
@@ -1742,157 +1518,30 @@ def register_project_tools():
 
     logger.info("Generating tools with ToolGenerator...")
 
-    from plugins.wordpress.plugin import WordPressPlugin
-
-    # Generate tools for WordPress
-    logger.info("Generating WordPress tools from plugin specifications...")
-    try:
-        wordpress_tools = tool_generator.generate_tools(WordPressPlugin, "wordpress")
-        logger.info(f"Generated {len(wordpress_tools)} WordPress tools from ToolGenerator")
-
-        # Register WordPress tools in ToolRegistry
-        for tool_def in wordpress_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register WordPress tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate WordPress tools: {e}", exc_info=True)
-
-    # Generate tools for WooCommerce (Phase D.1 - Split from WordPress Core)
-    logger.info("Generating WooCommerce tools from plugin specifications...")
-    try:
-        from plugins.woocommerce.plugin import WooCommercePlugin
-
-        woocommerce_tools = tool_generator.generate_tools(WooCommercePlugin, "woocommerce")
-        logger.info(f"Generated {len(woocommerce_tools)} WooCommerce tools from ToolGenerator")
-
-        # Register WooCommerce tools in ToolRegistry
-        for tool_def in woocommerce_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register WooCommerce tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate WooCommerce tools: {e}", exc_info=True)
-
-    # F.19.1: Generate tools for WordPress Specialist (companion-backed,
-    # no Docker socket). Each registered plugin needs its own explicit
-    # tool-generation pass; the plugin registry alone doesn't trigger
-    # ToolGenerator. (The legacy wordpress_advanced plugin was sunset
-    # in F.19.3.2-.3 — wordpress_specialist now owns db inspection +
-    # bulk fan-out via companion v2.18.0.)
-    logger.info("Generating WordPress Specialist tools from plugin specifications...")
-    try:
-        from plugins.wordpress_specialist.plugin import WordPressSpecialistPlugin
-
-        wordpress_specialist_tools = tool_generator.generate_tools(
-            WordPressSpecialistPlugin, "wordpress_specialist"
-        )
-        logger.info(
-            f"Generated {len(wordpress_specialist_tools)} WordPress Specialist tools from ToolGenerator"
-        )
-
-        for tool_def in wordpress_specialist_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register WordPress Specialist tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate WordPress Specialist tools: {e}", exc_info=True)
-
-    # Generate tools for Gitea (Phase C)
-    logger.info("Generating Gitea tools from plugin specifications...")
-    try:
-        from plugins.gitea.plugin import GiteaPlugin
-
-        gitea_tools = tool_generator.generate_tools(GiteaPlugin, "gitea")
-        logger.info(f"Generated {len(gitea_tools)} Gitea tools from ToolGenerator")
-
-        # Register Gitea tools in ToolRegistry
-        for tool_def in gitea_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register Gitea tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate Gitea tools: {e}", exc_info=True)
-
-    # Generate tools for n8n (Phase F)
-    logger.info("Generating n8n tools from plugin specifications...")
-    try:
-        from plugins.n8n.plugin import N8nPlugin
-
-        n8n_tools = tool_generator.generate_tools(N8nPlugin, "n8n")
-        logger.info(f"Generated {len(n8n_tools)} n8n tools from ToolGenerator")
-
-        # Register n8n tools in ToolRegistry
-        for tool_def in n8n_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register n8n tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate n8n tools: {e}", exc_info=True)
-
-    # Generate tools for Supabase (Phase G - Self-Hosted)
-    logger.info("Generating Supabase tools from plugin specifications...")
-    try:
-        from plugins.supabase.plugin import SupabasePlugin
-
-        supabase_tools = tool_generator.generate_tools(SupabasePlugin, "supabase")
-        logger.info(f"Generated {len(supabase_tools)} Supabase tools from ToolGenerator")
-
-        # Register Supabase tools in ToolRegistry
-        for tool_def in supabase_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register Supabase tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate Supabase tools: {e}", exc_info=True)
-
-    # Generate tools for OpenPanel (Phase H - Product Analytics)
-    logger.info("Generating OpenPanel tools from plugin specifications...")
-    try:
-        from plugins.openpanel.plugin import OpenPanelPlugin
-
-        openpanel_tools = tool_generator.generate_tools(OpenPanelPlugin, "openpanel")
-        logger.info(f"Generated {len(openpanel_tools)} OpenPanel tools from ToolGenerator")
-
-        # Register OpenPanel tools in ToolRegistry
-        for tool_def in openpanel_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register OpenPanel tool {tool_def.name}: {e}")
-
-    except Exception as e:
-        logger.error(f"Failed to generate OpenPanel tools: {e}", exc_info=True)
+    # Specs come from the cached tool manifest; a plugin's modules are only
+    # imported when one of its tools is first called.
+    from core.tool_manifest import get_tool_specs
 
-    # Generate tools for Coolify (Phase F.17 - Deployment Management)
-    logger.info("Generating Coolify tools from plugin specifications...")
-    try:
-        from plugins.coolify.plugin import CoolifyPlugin
-
-        coolify_tools = tool_generator.generate_tools(CoolifyPlugin, "coolify")
-        logger.info(f"Generated {len(coolify_tools)} Coolify tools from ToolGenerator")
+    # F.19.1: Each registered plugin needs its own entry here; the plugin
+    # registry alone doesn't trigger ToolGenerator.
+    for plugin_type, label in _TOOL_PLUGINS:
+        logger.info(f"Generating {label} tools from plugin specifications...")
+        try:
+            plugin_tools = tool_generator.generate_tools_from_specs(
+                plugin_type,
+                get_tool_specs(plugin_type),
+                partial(plugin_registry.get_plugin_class, plugin_type),
+            )
+            logger.info(f"Generated {len(plugin_tools)} {label} tools from ToolGenerator")
 
-        # Register Coolify tools in ToolRegistry
-        for tool_def in coolify_tools:
-            try:
-                tool_registry.register(tool_def)
-            except Exception as e:
-                logger.error(f"Failed to register Coolify tool {tool_def.name}: {e}")
+            for tool_def in plugin_tools:
+                try:
+                    tool_registry.register(tool_def)
+                except Exception as e:
+                    logger.error(f"Failed to register {label} tool {tool_def.name}: {e}")
 
-    except Exception as e:
-        logger.error(f"Failed to generate Coolify tools: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Failed to generate {label} tools: {e}", exc_info=True)
 
     logger.info(f"Registered {tool_registry.get_count()} tools in ToolRegistry")
 
@@ -2584,7 +2233,7 @@ async def oauth_authorize_confirm(request: Request):
         try:
             # Path 1: Project API key (cmp_)
             if api_key.startswith("cmp_"):
-                key_id = api_key_manager.validate_key(
+                key_id = await api_key_manager.validate_key_async(
                     api_key,
                     project_id="*",
                     required_scope="read",
@@ -3295,6 +2944,7 @@ async def _get_system_info_impl() -> dict:
                     OAUTH_TRUSTED_DOMAINS if OAUTH_AUTH_MODE == "trusted_domains" else []
                 ),
             },
+            "cpu_pool": get_cpu_pool().stats(),
         }
     except Exception as e:
         logger.error(f"Error getting system info: {e}", exc_info=True)
@@ -4175,6 +3825,51 @@ def create_supabase_mcp():
     return supabase_mcp
 
 
+_PROJECT_TOOL_PREFIXES = {
+    "wordpress_specialist": "wordpress_specialist_",
+    "wordpress": "wordpress_",
+    "woocommerce": "woocommerce_",  # Phase D.1
+    "gitea": "gitea_",
+}
+
+
+def _project_tool_prefix(plugin_type: str) -> str:
+    """Tool name prefix for a plugin type's project endpoint."""
+    return _PROJECT_TOOL_PREFIXES.get(plugin_type, f"{plugin_type}_")
+
+
+# plugin_type -> (registry size, tool definitions)
+_project_tool_defs_cache: dict[str, tuple[int, list]] = {}
+
+
+def _project_tool_defs(plugin_type: str) -> list:
+    """Tool definitions exposed on a plugin type's project endpoints (memoized)."""
+    registry_size = tool_registry.get_count()
+    cached = _project_tool_defs_cache.get(plugin_type)
+    if cached is not None and cached[0] == registry_size:
+        return cached[1]
+
+    tool_prefix = _project_tool_prefix(plugin_type)
+    tool_defs = []
+    for tool_def in tool_registry.get_all():
+        tool_name = tool_def.name
+
+        # For wordpress plugin type, exclude wordpress_specialist_ and
+        # woocommerce_ tools (each has its own endpoint).
+        if plugin_type == "wordpress":
+            if tool_name.startswith("wordpress_specialist_"):
+                continue
+            if tool_name.startswith("woocommerce_"):
+                continue
+
+        # Check if tool matches this plugin type
+        if tool_name.startswith(tool_prefix):
+            tool_defs.append(tool_def)
+
+    _project_tool_defs_cache[plugin_type] = (registry_size, tool_defs)
+    return tool_defs
+
+
 def create_project_mcp(project_id: str, plugin_type: str, site_id: str, alias: str = None):
     """
     Create MCP instance for a specific project with site-locked tools.
@@ -4192,6 +3887,8 @@ def create_project_mcp(project_id: str, plugin_type: str, site_id: str, alias: s
 
     from fastmcp import FastMCP
 
+    from core.project_endpoints import site_locked_schema
+
     display_name = alias or project_id
 
     # Generate instructions for site-locked endpoint
@@ -4201,57 +3898,25 @@ def create_project_mcp(project_id: str, plugin_type: str, site_id: str, alias: s
     # Add authentication middleware (fix: endpoints must have auth)
     add_endpoint_middleware(project_mcp, f"Project:{display_name}")
 
-    # Determine tool prefix based on plugin type
-    if plugin_type == "wordpress_specialist":
-        tool_prefix = "wordpress_specialist_"
-    elif plugin_type == "wordpress":
-        tool_prefix = "wordpress_"
-    elif plugin_type == "woocommerce":  # Phase D.1
-        tool_prefix = "woocommerce_"
-    elif plugin_type == "gitea":
-        tool_prefix = "gitea_"
-    else:
-        tool_prefix = f"{plugin_type}_"
-
-    count = 0
-    for tool_def in tool_registry.get_all():
-        tool_name = tool_def.name
-
-        # For wordpress plugin type, exclude wordpress_specialist_ and
-        # woocommerce_ tools (each has its own endpoint).
-        if plugin_type == "wordpress":
-            if tool_name.startswith("wordpress_specialist_"):
-                continue
-            if tool_name.startswith("woocommerce_"):
-                continue
-
-        # Check if tool matches this plugin type
-        if not tool_name.startswith(tool_prefix):
-            continue
+    def make_site_locked_handler(handler, locked_site_id):
+        """Create a handler that always injects the locked site_id"""
 
-        # Create a site-locked wrapper
-        original_handler = tool_def.handler
+        @wraps(handler)
+        async def site_locked_handler(**kwargs):
+            # Always override the site parameter
+            kwargs["site"] = locked_site_id
+            return await handler(**kwargs)
 
-        def make_site_locked_handler(handler, locked_site_id):
-            """Create a handler that always injects the locked site_id"""
+        return site_locked_handler
 
-            @wraps(handler)
-            async def site_locked_handler(**kwargs):
-                # Always override the site parameter
-                kwargs["site"] = locked_site_id
-                return await handler(**kwargs)
-
-            return site_locked_handler
-
-        site_locked_handler = make_site_locked_handler(original_handler, site_id)
+    count = 0
+    for tool_def in _project_tool_defs(plugin_type):
+        site_locked_handler = make_site_locked_handler(tool_def.handler, site_id)
 
-        # Remove 'site' parameter from schema for per-project endpoints
-        # since it's auto-injected by the site_locked_handler
-        project_schema = copy.deepcopy(tool_def.input_schema)
-        if "properties" in project_schema:
-            project_schema["properties"].pop("site", None)
-        if "required" in project_schema and "site" in project_schema["required"]:
-            project_schema["required"].remove("site")
+        # The 'site' parameter is auto-injected by the site_locked_handler, so
+        # it is hidden from the schema (stripped once per tool, shared by all
+        # projects of this plugin type)
+        project_schema = site_locked_schema(tool_def.name, tool_def.input_schema)
 
         try:
             wrapped = create_dynamic_tool(
@@ -4266,16 +3931,39 @@ def create_project_mcp(project_id: str, plugin_type: str, site_id: str, alias: s
     return project_mcp
 
 
-def create_per_project_endpoints():
+def _mcp_transport_app(mcp_instance, transport: str):
+    """ASGI app of a FastMCP instance for the given transport."""
+    if hasattr(mcp_instance, "http_app"):
+        return mcp_instance.http_app()
+    if transport == "sse":
+        return mcp_instance.sse_app()
+    return mcp_instance.streamable_http_app()
+
+
+def _build_project_app(
+    project_id: str, plugin_type: str, site_id: str, alias: str | None, transport: str
+):
+    """Factory for a lazy project endpoint: build its FastMCP app."""
+    project_mcp = create_project_mcp(
+        project_id=project_id, plugin_type=plugin_type, site_id=site_id, alias=alias
+    )
+    return _mcp_transport_app(project_mcp, transport)
+
+
+def create_per_project_endpoints(transport: str = "streamable-http"):
     """
-    Create MCP endpoints for each discovered site.
+    Register MCP endpoints for each discovered site.
 
     Each site gets its own endpoint at /project/{alias_or_site_id}
-    with tools filtered and locked to that specific site.
+    with tools filtered and locked to that specific site. Endpoints are
+    lazy (:class:`core.project_endpoints.LazyProjectEndpoint`): the FastMCP
+    app is built on the first request and closed again when idle.
 
     Returns:
-        List of tuples: (mount_path, mcp_instance, display_name)
+        List of tuples: (mount_path, lazy ASGI app, display_name)
     """
+    from core.project_endpoints import LazyProjectEndpoint, get_project_endpoint_registry
+
     project_endpoints = []
 
     # Get all discovered sites
@@ -4285,8 +3973,9 @@ def create_per_project_endpoints():
         logger.info("No sites discovered, skipping per-project endpoints")
         return project_endpoints
 
-    logger.info(f"Creating per-project endpoints for {len(all_sites)} sites...")
+    logger.info(f"Registering per-project endpoints for {len(all_sites)} sites...")
 
+    registry = get_project_endpoint_registry()
     for site_info in all_sites:
         plugin_type = site_info["plugin_type"]
         site_id = site_info["site_id"]
@@ -4297,19 +3986,23 @@ def create_per_project_endpoints():
         path_suffix = alias if alias and alias != site_id else full_id
         mount_path = f"/project/{path_suffix}"
 
-        try:
-            project_mcp = create_project_mcp(
-                project_id=full_id, plugin_type=plugin_type, site_id=site_id, alias=alias
-            )
-            project_endpoints.append((mount_path, project_mcp, full_id))
-            logger.info(f"  ✓ {mount_path}/mcp: {full_id} ({plugin_type})")
-        except Exception as e:
-            logger.error(f"  ✗ Failed to create {mount_path}: {e}")
+        factory = partial(_build_project_app, full_id, plugin_type, site_id, alias, transport)
+        project_endpoints.append(
+            (mount_path, registry.add(LazyProjectEndpoint(full_id, factory)), full_id)
+        )
+        logger.info(f"  ✓ {mount_path}/mcp: {full_id} ({plugin_type}, lazy)")
 
-    logger.info(f"Created {len(project_endpoints)} per-project endpoints")
+    logger.info(f"Registered {len(project_endpoints)} per-project endpoints")
     return project_endpoints
 
 
+async def api_openrouter_models(request: Request):
+    """OpenRouter image-model catalog (imports the AI image providers on first use)."""
+    from plugins.ai_image.providers.openrouter import api_openrouter_models as handler
+
+    return await handler(request)
+
+
 def create_multi_endpoint_app(transport: str = "streamable-http"):
     """Create Starlette app with multiple MCP endpoints"""
     from contextlib import asynccontextmanager
@@ -4511,8 +4204,8 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
     n8n_mcp = create_n8n_mcp()  # Phase F
     supabase_mcp = create_supabase_mcp()  # Phase G
     openpanel_mcp = create_openpanel_mcp()  # Phase H
-    # Create per-project endpoints
-    project_endpoints = create_per_project_endpoints()
+    # Register per-project endpoints (built on first request)
+    project_apps = create_per_project_endpoints(transport)
 
     # Get the appropriate app for each transport
     # Use http_app() instead of deprecated streamable_http_app()
@@ -4527,12 +4220,6 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
         n8n_app = n8n_mcp.http_app()  # Phase F
         supabase_app = supabase_mcp.http_app()  # Phase G
         openpanel_app = openpanel_mcp.http_app()  # Phase H
-
-        # Get apps for project endpoints
-        project_apps = []
-        for mount_path, project_mcp, project_id in project_endpoints:
-            project_app = project_mcp.http_app()
-            project_apps.append((mount_path, project_app, project_id))
     except AttributeError:
         # Fallback to old API
         if transport == "sse":
@@ -4545,11 +4232,6 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
             n8n_app = n8n_mcp.sse_app()  # Phase F
             supabase_app = supabase_mcp.sse_app()  # Phase G
             openpanel_app = openpanel_mcp.sse_app()  # Phase H
-
-            project_apps = []
-            for mount_path, project_mcp, project_id in project_endpoints:
-                project_app = project_mcp.sse_app()
-                project_apps.append((mount_path, project_app, project_id))
         else:
             main_app = mcp.streamable_http_app()
             system_app = system_mcp.streamable_http_app()  # Phase X.3
@@ -4561,11 +4243,6 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
             supabase_app = supabase_mcp.streamable_http_app()  # Phase G
             openpanel_app = openpanel_mcp.streamable_http_app()  # Phase H
 
-            project_apps = []
-            for mount_path, project_mcp, project_id in project_endpoints:
-                project_app = project_mcp.streamable_http_app()
-                project_apps.append((mount_path, project_app, project_id))
-
     # Store all sub-apps for lifespan management
     sub_apps = [
         ("main", main_app),
@@ -4579,9 +4256,11 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
         ("openpanel", openpanel_app),  # Phase H
     ]
 
-    # Add project apps to sub_apps for lifespan management
-    for _mount_path, project_app, project_id in project_apps:
-        sub_apps.append((f"project:{project_id}", project_app))
+    # Project endpoints start their own lifespan when first used; the
+    # registry evicts idle ones and closes the rest on shutdown
+    from core.project_endpoints import get_project_endpoint_registry
+
+    project_registry = get_project_endpoint_registry()
 
     # Combined lifespan for all FastMCP http apps
     # This is REQUIRED for FastMCP's StreamableHTTPSessionManager task group
@@ -4640,10 +4319,34 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
         await upload_cleanup.start()
         logger.info("Upload-session cleanup task started")
 
+        # Persist batched API-key usage counters
+        from core.key_usage import UsageFlushTask
+
+        usage_flush = UsageFlushTask()
+        await usage_flush.start()
+
+        # Multi-worker mode: apply other workers' invalidations, publish metrics
+        from core.shared_state import SharedStateTask, get_shared_state
+
+        shared_state = get_shared_state()
+        shared_sync = SharedStateTask(shared_state) if shared_state is not None else None
+        if shared_sync is not None:
+            await shared_sync.start()
+            logger.info("Shared worker state sync started")
+
+        await project_registry.start()
+
         try:
             yield
         finally:
+            await project_registry.stop()
+            if shared_sync is not None:
+                await shared_sync.stop()
             await upload_cleanup.stop()
+            get_cpu_pool().shutdown()
+            await close_docker_client()
+            # Final usage flush runs before the database is closed below
+            await usage_flush.stop()
             # Stop health monitor background checks
             if hm:
                 await hm.stop_background_checks()
@@ -4656,6 +4359,20 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
                 except Exception as e:
                     logger.warning(f"Error during lifespan cleanup for {name}: {e}")
 
+            # Drain the audit log writer
+            try:
+                audit_logger.close()
+            except Exception as e:
+                logger.warning(f"Error closing audit log writer: {e}")
+
+            # Close pooled upstream HTTP connections
+            try:
+                from core.http_transport import close_http_transport
+
+                await close_http_transport()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP transport: {e}")
+
             # Close database connection
             try:
                 db = get_database()
@@ -5002,7 +4719,7 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
     logger.info("  /woocommerce/mcp         - WooCommerce (28 tools)")
     logger.info("  /wordpress-specialist/mcp - WordPress Specialist (51 tools, companion-backed)")
     logger.info("  /gitea/mcp               - Gitea (56 tools)")
-    logger.info("  /n8n/mcp                 - n8n Automation (56 tools)")
+    logger.info("  /n8n/mcp                 - n8n Automation (60 tools)")
     logger.info("  /supabase/mcp            - Supabase (70 tools)")
     logger.info("  /openpanel/mcp           - OpenPanel Analytics (73 tools)")
 
@@ -5027,6 +4744,11 @@ def create_multi_endpoint_app(transport: str = "streamable-http"):
     return app
 
 
+def create_worker_app():
+    """App factory for ``uvicorn --workers``; each worker builds its own app."""
+    return create_multi_endpoint_app(os.getenv("MCPHUB_TRANSPORT", "streamable-http"))
+
+
 def main():
     """Main entry point for the MCP server."""
     import argparse
@@ -5052,14 +4774,35 @@ def main():
     parser.add_argument(
         "--multi-endpoint", action="store_true", help="Enable multi-endpoint architecture (Phase X)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("MCPHUB_WORKERS", "1")),
+        help="Worker processes for HTTP transports (state is shared via data/shared_state.db)",
+    )
+    parser.add_argument(
+        "--import-report",
+        nargs="?",
+        type=int,
+        const=30,
+        metavar="TOP",
+        help="Print the slowest imports of server startup (python -X importtime) and exit",
+    )
 
     args = parser.parse_args()
 
+    if args.import_report is not None:
+        from core.import_report import print_report
+
+        print_report("server", top=args.import_report)
+        return
+
     logger.info("Starting MCP server...")
     logger.info(f"Transport: {args.transport}")
     if args.transport != "stdio":
         logger.info(f"Host: {args.host}")
         logger.info(f"Port: {args.port}")
+        logger.info(f"Workers: {args.workers}")
 
     try:
         if args.transport == "stdio":
@@ -5067,8 +4810,22 @@ def main():
             mcp.run(transport="stdio")
         elif args.multi_endpoint or os.getenv("MULTI_ENDPOINT", "true").lower() == "true":
             # Multi-endpoint mode (default for HTTP transports)
-            app = create_multi_endpoint_app(args.transport)
-            uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+            if args.workers > 1:
+                # Workers are separate processes; the env tells each one to
+                # use the shared limiter / cache / metrics store.
+                os.environ["MCPHUB_WORKERS"] = str(args.workers)
+                os.environ["MCPHUB_TRANSPORT"] = args.transport
+                uvicorn.run(
+                    "server:create_worker_app",
+                    factory=True,
+                    workers=args.workers,
+                    host=args.host,
+                    port=args.port,
+                    log_level="info",
+                )
+            else:
+                app = create_multi_endpoint_app(args.transport)
+                uvicorn.run(app, host=args.host, port=args.port, log_level="info")
         else:
             # Legacy single endpoint mode
             mcp.run(transport=args.transport, host=args.host, port=args.port)
@@ -5077,6 +4834,9 @@ def main():
     except Exception as e:
         logger.error(f"Server error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # stdio / single-endpoint modes have no lifespan flush
+        api_key_manager.flush_usage()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+"""Shared pytest setup."""
+
+import shutil
+import tempfile
+
+from core import audit_log
+
+_audit_dir: str | None = None
+
+
+def pytest_configure(config):
+    # server.py opens the global audit logger at import time; give it a
+    # scratch directory so test runs never write logs/audit.log* into the tree.
+    global _audit_dir
+    _audit_dir = tempfile.mkdtemp(prefix="mcphub-audit-")
+    audit_log._audit_logger = audit_log.AuditLogger(log_dir=_audit_dir)
+
+
+def pytest_unconfigure(config):
+    if audit_log._audit_logger is not None:
+        audit_log._audit_logger.close()
+    if _audit_dir is not None:
+        shutil.rmtree(_audit_dir, ignore_errors=True)
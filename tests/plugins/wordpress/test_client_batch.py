@@ -0,0 +1,95 @@
+"""WordPressClient.batch — batch/v1 chunking, result mapping and fallbacks."""
+
+from __future__ import annotations
+
+import pytest
+
+from plugins.wordpress.client import (
+    BatchRequest,
+    SiteUnreachableError,
+    WordPressClient,
+    _batch_entry,
+)
+
+
+@pytest.fixture
+def wp_client():
+    return WordPressClient(site_url="https://wp.example.com", username="u", app_password="p")
+
+
+def test_batch_entry_encodes_params_in_path():
+    entry = _batch_entry(
+        BatchRequest("delete", "media/5", params={"force": True, "x": ""}, json_data={"a": None})
+    )
+    assert entry == {"method": "DELETE", "path": "/wp/v2/media/5?force=true"}
+
+
+@pytest.mark.asyncio
+async def test_routes_not_allowed_in_batch_are_retried_singly(wp_client, monkeypatch):
+    calls: list[str] = []
+
+    async def _request(method, endpoint, params=None, json_data=None, **kw):
+        calls.append(endpoint)
+        if endpoint == "batch/v1":
+            return {
+                "responses": [
+                    (
+                        {
+                            "status": 400,
+                            "body": {"code": "rest_batch_not_allowed", "message": "Not allowed."},
+                        }
+                        if r["path"].startswith("/wp/v2/tags/")
+                        else {"status": 200, "body": {"id": 1}}
+                    )
+                    for r in json_data["requests"]
+                ]
+            }
+        return {"id": 2}
+
+    monkeypatch.setattr(wp_client, "request", _request)
+    results = await wp_client.batch(
+        [
+            BatchRequest("POST", "posts/1", json_data={"title": "a"}),
+            BatchRequest("POST", "tags/2", json_data={"name": "b"}),
+            BatchRequest("GET", "posts/3"),
+        ]
+    )
+    assert [r.body for r in results] == [{"id": 1}, {"id": 2}, {"id": 2}]
+    assert sorted(calls) == ["batch/v1", "posts/3", "tags/2"]
+
+    # The tags route is remembered and skips the batch endpoint next time
+    calls.clear()
+    await wp_client.batch([BatchRequest("POST", "tags/4", json_data={"name": "c"})])
+    assert calls == ["tags/4"]
+
+
+@pytest.mark.asyncio
+async def test_unreachable_site_fails_items_without_retrying_singly(wp_client, monkeypatch):
+    calls: list[str] = []
+
+    async def _request(method, endpoint, **kw):
+        calls.append(endpoint)
+        raise SiteUnreachableError("Cannot connect to https://wp.example.com.")
+
+    monkeypatch.setattr(wp_client, "request", _request)
+    results = await wp_client.batch([BatchRequest("DELETE", f"posts/{i}") for i in range(30)])
+    assert calls == ["batch/v1"]
+    assert all(not r.ok and "Cannot connect" in r.error for r in results)
+
+
+@pytest.mark.asyncio
+async def test_media_writes_skip_the_batch_endpoint(wp_client, monkeypatch):
+    calls: list[str] = []
+
+    async def _request(method, endpoint, json_data=None, **kw):
+        calls.append(endpoint)
+        if endpoint == "batch/v1":
+            return {"responses": [{"status": 200, "body": {}} for _ in json_data["requests"]]}
+        return {"id": 1}
+
+    monkeypatch.setattr(wp_client, "request", _request)
+    results = await wp_client.batch(
+        [BatchRequest("DELETE", "media/1"), BatchRequest("POST", "posts/2", json_data={"a": 1})]
+    )
+    assert all(r.ok for r in results)
+    assert sorted(calls) == ["batch/v1", "media/1"]
@@ -63,10 +63,9 @@ class TestMediaAttachHandler:
             patch.object(handler.client, "get", new=AsyncMock()) as mock_get,
             patch.object(handler.client, "put", new=AsyncMock()) as mock_put,
         ):
-            # media validation GETs + product GET
+            # media validation GET (one include= listing) + product GET
             mock_get.side_effect = [
-                {"id": 10},  # media/10 exists
-                {"id": 11},  # media/11 exists
+                [{"id": 10}, {"id": 11}],  # media?include=10,11
                 {"id": 50, "images": [{"id": 1}]},  # products/50
             ]
             mock_put.return_value = {
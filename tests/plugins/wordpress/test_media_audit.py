@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 from unittest.mock import MagicMock
 
@@ -115,20 +116,31 @@ async def test_url_upload_emits_one_audit_entry(wp_client, fake_audit, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_chunked_finish_emits_one_audit_entry(wp_client, fake_audit, monkeypatch):
+async def test_chunked_finish_emits_one_audit_entry(wp_client, fake_audit, monkeypatch, tmp_path):
     """Chunked finish should emit a media.upload entry with source='chunked'."""
+    from contextlib import asynccontextmanager
+
     from plugins.wordpress.handlers.media_chunked import MediaChunkedHandler
 
     _patch_wp_upload(monkeypatch)
 
-    # Stub the chunked store's finalize() to return assembled bytes.
+    # Stub the chunked store's finalized() to yield an assembled spill file.
+    spill = tmp_path / "sid.part"
+    spill.write_bytes(_PNG_1x1)
+
     class _FakeSession:
         filename = "big.png"
         mime = "image/png"
+        spill_path = spill
+        total_bytes = len(_PNG_1x1)
+        digest = hashlib.sha256(_PNG_1x1).hexdigest()
 
     class _FakeStore:
-        async def finalize(self, sid):
-            return _FakeSession(), _PNG_1x1
+        max_session_bytes = 500 * 1024 * 1024
+
+        @asynccontextmanager
+        async def finalized(self, sid):
+            yield _FakeSession()
 
     monkeypatch.setattr(
         "plugins.wordpress.handlers.media_chunked.wp_raw_upload",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
@@ -24,6 +25,28 @@ def handler(wp_client):
     return MediaBulkHandler(wp_client)
 
 
+def _serve(monkeypatch, client, handle):
+    """Answer single wp/v2 requests, routing each one to ``handle``.
+
+    ``handle(method, path, params, body)`` gets the wp/v2-relative path;
+    an exception becomes a ``[NOT_FOUND]`` error like ``client.request``
+    raises. Media writes must never reach batch/v1 (core does not allow
+    attachments in batches). Returns the list of ``(method, path)`` calls.
+    """
+    calls: list[tuple[str, str]] = []
+
+    async def _request(method, endpoint, params=None, json_data=None, **kw):
+        assert endpoint != "batch/v1", "media routes are not batchable in core"
+        calls.append((method, endpoint))
+        try:
+            return await handle(method, endpoint, params or {}, json_data)
+        except Exception as exc:  # noqa: BLE001
+            raise Exception(f"[NOT_FOUND] {exc}") from exc
+
+    monkeypatch.setattr(client, "request", _request)
+    return calls
+
+
 # ---------------------------------------------------------------------------
 # Spec
 # ---------------------------------------------------------------------------
@@ -67,24 +90,25 @@ def test_normalize_ids_drops_non_positive_and_garbage(handler):
 
 @pytest.mark.asyncio
 async def test_delete_rejects_empty_list(handler, wp_client, monkeypatch):
-    delete_mock = AsyncMock()
-    monkeypatch.setattr(wp_client, "delete", delete_mock)
+    request_mock = AsyncMock()
+    monkeypatch.setattr(wp_client, "request", request_mock)
 
     out = json.loads(await handler.bulk_delete_media([]))
     assert out["ok"] is False
     assert out["error"] == "invalid_request"
-    delete_mock.assert_not_called()
+    request_mock.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_delete_happy_path(handler, wp_client, monkeypatch):
     calls: list[tuple[str, dict]] = []
 
-    async def _delete(path, params=None):
-        calls.append((path, params or {}))
+    async def _delete(method, path, params, body):
+        assert method == "DELETE"
+        calls.append((path, params))
         return {"deleted": True}
 
-    monkeypatch.setattr(wp_client, "delete", _delete)
+    _serve(monkeypatch, wp_client, _delete)
 
     out = json.loads(await handler.bulk_delete_media([10, 20, 30], force=True))
     assert out["ok"] is True
@@ -101,12 +125,12 @@ async def test_delete_happy_path(handler, wp_client, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_delete_partial_failure(handler, wp_client, monkeypatch):
-    async def _delete(path, params=None):
+    async def _delete(method, path, params, body):
         if path == "media/20":
-            raise RuntimeError("HTTP 404 not found")
+            raise RuntimeError("Invalid post ID.")
         return {"deleted": True}
 
-    monkeypatch.setattr(wp_client, "delete", _delete)
+    _serve(monkeypatch, wp_client, _delete)
 
     out = json.loads(await handler.bulk_delete_media([10, 20, 30]))
     assert out["ok"] is False
@@ -114,18 +138,19 @@ async def test_delete_partial_failure(handler, wp_client, monkeypatch):
     assert out["processed"] == 2
     assert len(out["errors"]) == 1
     assert out["errors"][0]["id"] == 20
-    assert "404" in out["errors"][0]["error"]
+    assert out["errors"][0]["error"].startswith("[NOT_FOUND]")
+    assert "Invalid post ID." in out["errors"][0]["error"]
 
 
 @pytest.mark.asyncio
 async def test_delete_force_false_moves_to_trash(handler, wp_client, monkeypatch):
     captured: list[dict] = []
 
-    async def _delete(path, params=None):
-        captured.append(params or {})
+    async def _delete(method, path, params, body):
+        captured.append(params)
         return {}
 
-    monkeypatch.setattr(wp_client, "delete", _delete)
+    _serve(monkeypatch, wp_client, _delete)
     await handler.bulk_delete_media([1], force=False)
     assert captured[0]["force"] == "false"
 
@@ -138,7 +163,7 @@ async def test_delete_force_false_moves_to_trash(handler, wp_client, monkeypatch
 @pytest.mark.asyncio
 async def test_reassign_rejects_empty_ids(handler, wp_client, monkeypatch):
     post_mock = AsyncMock()
-    monkeypatch.setattr(wp_client, "post", post_mock)
+    monkeypatch.setattr(wp_client, "request", post_mock)
 
     out = json.loads(await handler.bulk_reassign_media([], target_post=5))
     assert out["ok"] is False
@@ -149,7 +174,7 @@ async def test_reassign_rejects_empty_ids(handler, wp_client, monkeypatch):
 @pytest.mark.asyncio
 async def test_reassign_rejects_negative_target(handler, wp_client, monkeypatch):
     post_mock = AsyncMock()
-    monkeypatch.setattr(wp_client, "post", post_mock)
+    monkeypatch.setattr(wp_client, "request", post_mock)
 
     out = json.loads(await handler.bulk_reassign_media([1], target_post=-1))
     assert out["ok"] is False
@@ -160,7 +185,7 @@ async def test_reassign_rejects_negative_target(handler, wp_client, monkeypatch)
 @pytest.mark.asyncio
 async def test_reassign_rejects_non_integer_target(handler, wp_client, monkeypatch):
     post_mock = AsyncMock()
-    monkeypatch.setattr(wp_client, "post", post_mock)
+    monkeypatch.setattr(wp_client, "request", post_mock)
 
     out = json.loads(await handler.bulk_reassign_media([1], target_post="abc"))  # type: ignore[arg-type]
     assert out["ok"] is False
@@ -172,11 +197,12 @@ async def test_reassign_rejects_non_integer_target(handler, wp_client, monkeypat
 async def test_reassign_happy_path(handler, wp_client, monkeypatch):
     calls: list[tuple[str, dict]] = []
 
-    async def _post(path, json_data=None, **kw):
-        calls.append((path, json_data or {}))
+    async def _post(method, path, params, body):
+        assert method == "POST"
+        calls.append((path, body))
         return {"id": 1, "post": 42}
 
-    monkeypatch.setattr(wp_client, "post", _post)
+    _serve(monkeypatch, wp_client, _post)
 
     out = json.loads(await handler.bulk_reassign_media([1, 2, 3], target_post=42))
     assert out["ok"] is True
@@ -191,11 +217,11 @@ async def test_reassign_happy_path(handler, wp_client, monkeypatch):
 async def test_reassign_detach_target_zero(handler, wp_client, monkeypatch):
     calls: list[dict] = []
 
-    async def _post(path, json_data=None, **kw):
-        calls.append(json_data or {})
+    async def _post(method, path, params, body):
+        calls.append(body)
         return {}
 
-    monkeypatch.setattr(wp_client, "post", _post)
+    _serve(monkeypatch, wp_client, _post)
     out = json.loads(await handler.bulk_reassign_media([1, 2], target_post=0))
     assert out["ok"] is True
     assert all(c == {"post": 0} for c in calls)
@@ -203,14 +229,69 @@ async def test_reassign_detach_target_zero(handler, wp_client, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_reassign_partial_failure_surfaces_errors(handler, wp_client, monkeypatch):
-    async def _post(path, json_data=None, **kw):
+    async def _post(method, path, params, body):
         if path == "media/7":
             raise RuntimeError("permission denied")
         return {}
 
-    monkeypatch.setattr(wp_client, "post", _post)
+    _serve(monkeypatch, wp_client, _post)
     out = json.loads(await handler.bulk_reassign_media([6, 7, 8], target_post=100))
     assert out["ok"] is False
     assert out["processed"] == 2
     assert len(out["errors"]) == 1
     assert out["errors"][0]["id"] == 7
+
+
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_delete_100_ids_runs_at_most_four_requests_at_once(handler, wp_client, monkeypatch):
+    in_flight = peak = 0
+
+    async def _delete(method, path, params, body):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"deleted": True}
+
+    calls = _serve(monkeypatch, wp_client, _delete)
+    out = json.loads(await handler.bulk_delete_media(list(range(1, 101))))
+    assert out["processed"] == 100
+    assert len(calls) == 100
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_rest_batch_not_allowed_falls_back_to_single_requests(
+    handler, wp_client, monkeypatch
+):
+    # As if the media route were not known up front: core answers every
+    # attachment sub-request with rest_batch_not_allowed
+    wp_client._batch_denied_routes.clear()
+    calls: list[tuple[str, dict | None]] = []
+
+    async def _request(method, endpoint, params=None, json_data=None, **kw):
+        calls.append((endpoint, params))
+        if endpoint == "batch/v1":
+            not_allowed = {"code": "rest_batch_not_allowed", "message": "Not allowed."}
+            return {"responses": [{"status": 400, "body": not_allowed}] * 3}
+        if endpoint == "media/2":
+            raise Exception("[NOT_FOUND] Invalid post ID.")
+        return {"deleted": True}
+
+    monkeypatch.setattr(wp_client, "request", _request)
+    out = json.loads(await handler.bulk_delete_media([1, 2, 3], force=True))
+    assert out["processed"] == 2
+    assert out["errors"] == [{"id": 2, "error": "[NOT_FOUND] Invalid post ID."}]
+    assert sorted(c[0] for c in calls) == ["batch/v1", "media/1", "media/2", "media/3"]
+    assert all(c[1] == {"force": "true"} for c in calls if c[0] != "batch/v1")
+
+    # Remembered: the next call goes straight to single requests
+    calls.clear()
+    await handler.bulk_delete_media([4])
+    assert [c[0] for c in calls] == ["media/4"]
@@ -21,6 +21,7 @@ from core.upload_sessions import (
     set_upload_session_store,
 )
 from plugins.wordpress.client import WordPressClient
+from plugins.wordpress.handlers._media_core import FileUpload
 from plugins.wordpress.handlers.media_chunked import MediaChunkedHandler
 
 _PNG_1x1 = _b64.b64decode(
@@ -173,6 +174,69 @@ class TestAppendAndFinalize:
         assert await store.get(sess.id) is None
 
 
+class TestStreamingFinalize:
+    @pytest.mark.asyncio
+    async def test_digest_is_maintained_across_restart(self, store: UploadSessionStore):
+        payload = b"0123456789" * 100
+        sess = await store.start(
+            user_id="alice",
+            filename="f.bin",
+            total_bytes=len(payload),
+            sha256=hashlib.sha256(payload).hexdigest(),
+        )
+        await store.append_chunk(sess.id, 0, payload[:400])
+        store._hashes.clear()  # As after a process restart
+        await store.append_chunk(sess.id, 1, payload[400:])
+        async with store.finalized(sess.id) as done:
+            assert done.digest == hashlib.sha256(payload).hexdigest()
+            assert done.spill_path.read_bytes() == payload
+        assert not done.spill_path.exists()
+        assert await store.get(sess.id) is None
+
+    @pytest.mark.asyncio
+    async def test_retried_chunk_replaces_torn_write(self, store: UploadSessionStore):
+        sess = await store.start(user_id="alice", filename="f.bin", total_bytes=6)
+        await store.append_chunk(sess.id, 0, b"abc")
+        with open(sess.spill_path, "ab") as f:
+            f.write(b"zz")  # Written, but the metadata update never landed
+        await store.append_chunk(sess.id, 1, b"def")
+        _, data = await store.finalize(sess.id)
+        assert data == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_sessions_do_not_share_a_lock(self, store: UploadSessionStore):
+        a = await store.start(user_id="alice", filename="a.bin", total_bytes=3)
+        b = await store.start(user_id="bob", filename="b.bin", total_bytes=3)
+        await store.append_chunk(a.id, 0, b"aaa")
+        async with store.finalized(a.id):
+            # A finalize in progress does not block another session
+            await asyncio.wait_for(store.append_chunk(b.id, 0, b"bbb"), timeout=1)
+        assert store._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_handler_streams_unoptimized_payload(self, handler: MediaChunkedHandler):
+        payload = b"%PDF-1.4 " + b"x" * 100
+        sid = json.loads(
+            await handler.upload_media_chunked_start(filename="doc.pdf", total_bytes=len(payload))
+        )["session_id"]
+        await handler.upload_media_chunked_chunk(sid, 0, _b64.b64encode(payload).decode())
+
+        seen = {}
+
+        async def fake_upload(client, data, **kwargs):
+            seen["data"] = data
+            seen["body"] = data.path.read_bytes()
+            return {"id": 7, "mime_type": "application/pdf"}
+
+        with patch(
+            "plugins.wordpress.handlers.media_chunked.wp_raw_upload", side_effect=fake_upload
+        ):
+            out = json.loads(await handler.upload_media_chunked_finish(session_id=sid))
+        assert out["id"] == 7
+        assert isinstance(seen["data"], FileUpload)
+        assert seen["body"] == payload
+
+
 class TestQuotaAndCleanup:
     @pytest.mark.asyncio
     async def test_quota_rejects_11th_session(self, store: UploadSessionStore):
@@ -244,6 +308,40 @@ class TestHandlerIntegration:
         assert out["id"] == 999
         assert out["source"] == "chunked"
 
+    @pytest.mark.asyncio
+    async def test_handler_dedupe_hit_is_audited(self, handler: MediaChunkedHandler):
+        start = await handler.upload_media_chunked_start(
+            filename="photo.png", total_bytes=len(_PNG_1x1)
+        )
+        sid = json.loads(start)["session_id"]
+        await handler.upload_media_chunked_chunk(sid, 0, _b64.b64encode(_PNG_1x1).decode())
+
+        existing = {"id": 77, "mime_type": "image/png", "source_url": "photo.png"}
+        logged: list[dict] = []
+        with (
+            patch(
+                "plugins.wordpress.handlers.media_chunked._find_duplicate",
+                AsyncMock(return_value=existing),
+            ),
+            patch(
+                "plugins.wordpress.handlers.media_chunked.log_media_upload",
+                lambda **kw: logged.append(kw),
+            ),
+        ):
+            out = json.loads(await handler.upload_media_chunked_finish(session_id=sid))
+        assert (out["id"], out["deduplicated"]) == (77, True)
+        assert logged == [
+            {
+                "site": "https://wp.example.com",
+                "user_id": "alice",
+                "mime": "image/png",
+                "size_bytes": len(_PNG_1x1),
+                "source": "chunked",
+                "media_id": 77,
+                "deduplicated": True,
+            }
+        ]
+
     @pytest.mark.asyncio
     async def test_handler_abort(self, handler: MediaChunkedHandler):
         start_out = json.loads(
@@ -0,0 +1,230 @@
+"""Content-addressed media dedupe (core/media_dedupe.py + upload handlers)."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+import pytest
+
+from core.database import Database
+from core.media_dedupe import MediaDedupeIndex, set_media_dedupe_index
+from plugins.wordpress.client import WordPressClient
+from plugins.wordpress.handlers.media import MediaHandler
+
+_PNG_1x1 = base64.b64decode(
+    b"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+_SITE = "https://wp.example.com"
+
+
+@pytest.fixture
+async def index(tmp_path):
+    db = Database(str(tmp_path / "dedupe.db"))
+    await db.initialize()
+    idx = MediaDedupeIndex(db=db)
+    set_media_dedupe_index(idx)
+    yield idx
+    set_media_dedupe_index(None)
+    await db.close()
+
+
+@pytest.fixture
+def wp_client():
+    return WordPressClient(site_url=_SITE, username="u", app_password="p")
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """Stub wp_raw_upload; returns the list of uploaded payloads."""
+    calls: list[bytes] = []
+
+    async def fake_upload(client, data, *, filename, mime_hint=None, **kw):
+        calls.append(data)
+        return {"id": 40 + len(calls), "mime_type": "image/png", "source_url": filename}
+
+    monkeypatch.setattr("plugins.wordpress.handlers.media.wp_raw_upload", fake_upload)
+    monkeypatch.setattr("core.audit_log.get_audit_logger", lambda: None)
+    return calls
+
+
+def _site_media(monkeypatch, client, existing: dict[int, dict]):
+    """Answer ``GET media/{id}`` from ``existing``; 404 for anything else."""
+
+    async def fake_get(endpoint, **kw):
+        media_id = int(endpoint.split("/")[1])
+        if media_id not in existing:
+            raise Exception("[NOT_FOUND] Invalid post ID.")
+        return existing[media_id]
+
+    monkeypatch.setattr(client, "get", fake_get)
+
+
+async def _upload(handler, **kw):
+    return json.loads(
+        await handler.upload_media_from_base64(
+            data=base64.b64encode(_PNG_1x1).decode(), filename="x.png", skip_optimize=True, **kw
+        )
+    )
+
+
+class TestMediaDedupeIndex:
+    async def test_record_lookup_forget(self, index):
+        assert await index.lookup(_SITE, "abc", "raw") is None
+        await index.record(_SITE, "abc", "raw", 7)
+        assert await index.lookup(_SITE, "abc", "raw") == 7
+        assert await index.lookup(_SITE, "abc", "opt:") is None
+        assert await index.lookup("https://other.test", "abc", "raw") is None
+
+        await index.record(_SITE, "abc", "raw", 9)
+        assert await index.lookup(_SITE, "abc", "raw") == 9
+        await index.forget(_SITE, "abc", "raw")
+        assert await index.lookup(_SITE, "abc", "raw") is None
+
+    async def test_forget_media_drops_all_variants(self, index):
+        await index.record(_SITE, "abc", "raw", 7)
+        await index.record(_SITE, "abc", "opt:webp", 7)
+        await index.record(_SITE, "def", "raw", 8)
+        assert await index.forget_media(_SITE, 7) == 2
+        assert await index.lookup(_SITE, "def", "raw") == 8
+
+
+class TestUploadDedupe:
+    async def test_identical_upload_reuses_attachment(self, index, wp_client, uploads, monkeypatch):
+        handler = MediaHandler(wp_client, user_id="alice")
+        first = await _upload(handler)
+        assert first["id"] == 41
+        assert "deduplicated" not in first
+
+        _site_media(monkeypatch, wp_client, {41: {"id": 41, "source_url": "x.png"}})
+        second = await _upload(handler)
+        assert second["id"] == 41
+        assert second["deduplicated"] is True
+        assert len(uploads) == 1
+
+    async def test_reused_upload_is_audited(self, index, wp_client, uploads, monkeypatch):
+        logged: list[dict] = []
+        monkeypatch.setattr(
+            "plugins.wordpress.handlers.media.log_media_upload", lambda **kw: logged.append(kw)
+        )
+        handler = MediaHandler(wp_client, user_id="alice")
+        await _upload(handler)
+        _site_media(
+            monkeypatch, wp_client, {41: {"id": 41, "mime_type": "image/png", "source_url": "x"}}
+        )
+        await _upload(handler, set_featured=False)
+
+        assert [entry.get("deduplicated", False) for entry in logged] == [False, True]
+        assert logged[1]["media_id"] == 41
+        assert logged[1]["size_bytes"] == len(_PNG_1x1)
+        assert logged[1]["user_id"] == "alice"
+
+    async def test_optimizer_settings_are_part_of_the_key(
+        self, index, wp_client, uploads, monkeypatch
+    ):
+        handler = MediaHandler(wp_client)
+        await _upload(handler)
+        monkeypatch.setattr(
+            "plugins.wordpress.handlers.media._maybe_optimize_async",
+            lambda data, mime, **kw: _passthrough(data, mime),
+        )
+        out = json.loads(
+            await handler.upload_media_from_base64(
+                data=base64.b64encode(_PNG_1x1).decode(), filename="x.png", convert_to="webp"
+            )
+        )
+        assert out["id"] == 42
+        assert len(uploads) == 2
+
+    async def test_deleted_attachment_is_uploaded_again(
+        self, index, wp_client, uploads, monkeypatch
+    ):
+        handler = MediaHandler(wp_client)
+        await _upload(handler)
+        _site_media(monkeypatch, wp_client, {})
+
+        out = await _upload(handler)
+        assert out["id"] == 42
+        assert "deduplicated" not in out
+        assert len(uploads) == 2
+
+    async def test_one_image_reused_for_two_posts(self, index, wp_client, uploads, monkeypatch):
+        existing: dict[int, dict] = {}
+        _site_media(monkeypatch, wp_client, existing)
+        posted: list[tuple[str, dict]] = []
+
+        async def fake_post(endpoint, json_data=None, **kw):
+            posted.append((endpoint, json_data))
+            return {}
+
+        monkeypatch.setattr(wp_client, "post", fake_post)
+        handler = MediaHandler(wp_client)
+        await _upload(
+            handler, title="Red shoe", alt_text="A red shoe", attach_to_post=10, set_featured=True
+        )
+        existing[41] = {
+            "id": 41,
+            "post": 10,
+            "title": {"rendered": "Red shoe"},
+            "alt_text": "A red shoe",
+            "caption": {"rendered": ""},
+            "source_url": "x.png",
+        }
+        posted.clear()
+
+        second = await _upload(
+            handler,
+            title="Blue shoe",
+            alt_text="A red shoe",
+            caption="Also in blue",
+            attach_to_post=20,
+            set_featured=True,
+        )
+        assert (second["id"], second["deduplicated"]) == (41, True)
+        # Only the empty caption is filled; title and parent post stay as they were
+        assert posted == [
+            ("media/41", {"caption": "Also in blue"}),
+            ("posts/20", {"featured_media": 41}),
+        ]
+        assert second["metadata_kept"] == {
+            "title": {"existing": "Red shoe", "requested": "Blue shoe"}
+        }
+        assert second["attached_to"] == 10
+        assert len(uploads) == 1
+
+    async def test_reused_unattached_image_is_attached(
+        self, index, wp_client, uploads, monkeypatch
+    ):
+        handler = MediaHandler(wp_client)
+        await _upload(handler)
+        _site_media(monkeypatch, wp_client, {41: {"id": 41, "post": None, "source_url": "x"}})
+        posted: list[tuple[str, dict]] = []
+
+        async def fake_post(endpoint, json_data=None, **kw):
+            posted.append((endpoint, json_data))
+            return {}
+
+        monkeypatch.setattr(wp_client, "post", fake_post)
+        out = await _upload(handler, attach_to_post=20)
+        assert posted == [("media/41", {"post": 20})]
+        assert "attached_to" not in out and "metadata_kept" not in out
+
+    async def test_index_failure_falls_back_to_upload(self, wp_client, uploads, monkeypatch):
+        class _Broken(MediaDedupeIndex):
+            async def lookup(self, *a):
+                raise RuntimeError("Database not initialized")
+
+            async def record(self, *a):
+                raise RuntimeError("Database not initialized")
+
+        set_media_dedupe_index(_Broken())
+        try:
+            handler = MediaHandler(wp_client)
+            assert (await _upload(handler))["id"] == 41
+            assert (await _upload(handler))["id"] == 42
+        finally:
+            set_media_dedupe_index(None)
+
+
+async def _passthrough(data, mime):
+    return data, mime
@@ -178,3 +178,11 @@ def test_maybe_optimize_skip_overrides_convert_to():
     out, mime = _maybe_optimize(src, "image/png", skip=True, convert_to="webp")
     assert out == src
     assert mime == "image/png"
+
+
+def test_draft_decoded_jpeg_keeps_exact_size_and_aspect():
+    # 5000 px long edge -> decoded at 1/4 scale, then resampled to max_edge
+    data = _make_jpeg(5000, 3333)
+    new_data, _ = optimize(data, "image/jpeg", max_edge=1000)
+    img = Image.open(io.BytesIO(new_data))
+    assert img.size == (1000, 667)
@@ -139,6 +139,8 @@ def test_validate_taxonomy_rejects_bad_shape():
 @pytest.fixture
 def client():
     c = WordPressClient(site_url="https://wp.example.com", username="u", app_password="p")
+    # Site without batch/v1: every item goes out as its own stock REST call
+    c._batch_supported = False
     c.request = AsyncMock(return_value={"id": 1})  # type: ignore[method-assign]
     return c
 
@@ -304,6 +306,37 @@ async def test_bulk_fanout_runs_concurrently_not_serially(handler, client, monke
     assert client.request.await_count == 10
 
 
+@pytest.mark.asyncio
+async def test_bulk_post_update_uses_batch_endpoint_when_available():
+    """On WP 5.6+ the 50 items go out as two batch/v1 calls of 25 + 25."""
+    c = WordPressClient(site_url="https://wp.example.com", username="u", app_password="p")
+
+    async def side_effect(method, endpoint, json_data=None, **kw):
+        assert (method, endpoint, kw["use_custom_namespace"]) == ("POST", "batch/v1", True)
+        return {
+            "responses": [
+                (
+                    {"status": 403, "body": {"code": "rest_cannot_edit", "message": "No."}}
+                    if r["path"] == "/wp/v2/posts/7"
+                    else {"status": 200, "body": {"id": 1}}
+                )
+                for r in json_data["requests"]
+            ]
+        }
+
+    c.request = AsyncMock(side_effect=side_effect)  # type: ignore[method-assign]
+    items = [{"id": i + 1, "status": "publish"} for i in range(50)]
+    result = await BulkHandler(c).wp_bulk_post_update(updates=items)
+
+    assert c.request.await_count == 2
+    sent = [r for a in c.request.await_args_list for r in a.kwargs["json_data"]["requests"]]
+    assert sent[0] == {"method": "POST", "path": "/wp/v2/posts/1", "body": {"status": "publish"}}
+    assert (result["ok"], result["errors"]) == (49, 1)
+    failed = next(r for r in result["results"] if r["status"] == "error")
+    assert failed["id"] == 7
+    assert failed["error"].startswith("[ACCESS_DENIED]")
+
+
 # ───── ``call`` import smoke (pytest discovery) ──────────────────────
 
 
@@ -11,11 +11,14 @@ Mocks ``WordPressClient.get`` and ``WordPressClient.post`` and asserts:
   oversized block array, oversized Elementor tree) before the wire
 * ``wp_blocks_get`` runs the block parser server-side in MCPHub —
   no companion route is consulted on reads
+* the block serializer round-trips editor output (the benchmark corpus
+  in ``scripts/bench_data/gutenberg``) and edited trees
 """
 
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
@@ -25,9 +28,14 @@ from plugins.wordpress_specialist.handlers.pages import (
     PagesHandler,
     _count_elementor_nodes,
     _parse_blocks_python,
+    _serialize_blocks_python,
     get_tool_specifications,
 )
 
+_CORPUS = sorted(
+    (Path(__file__).resolve().parents[3] / "scripts" / "bench_data" / "gutenberg").glob("*.html")
+)
+
 # ───── Tool spec contract ────────────────────────────────────────────
 
 
@@ -355,6 +363,56 @@ def test_parse_blocks_handles_self_closing_block():
     assert blocks[0]["innerBlocks"] == []
 
 
+def test_parse_blocks_marks_inner_block_positions():
+    html = (
+        '<!-- wp:group --><div class="wp-block-group">'
+        "<!-- wp:paragraph --><p>a</p><!-- /wp:paragraph -->"
+        "\n\n"
+        "<!-- wp:separator /-->"
+        "</div><!-- /wp:group -->"
+    )
+    group = _parse_blocks_python(html)[0]
+    assert group["innerContent"] == ['<div class="wp-block-group">', None, "\n\n", None, "</div>"]
+    assert group["innerHTML"] == '<div class="wp-block-group">\n\n</div>'
+    assert [b["blockName"] for b in group["innerBlocks"]] == ["core/paragraph", "core/separator"]
+
+
+def test_parse_blocks_handles_deep_nesting():
+    depth = 300
+    html = "<!-- wp:group --><div>" * depth + "<p>x</p>" + "</div><!-- /wp:group -->" * depth
+    node = _parse_blocks_python(html)[0]
+    for _ in range(depth - 1):
+        assert len(node["innerBlocks"]) == 1
+        node = node["innerBlocks"][0]
+    assert node["innerHTML"] == "<div><p>x</p></div>"
+    assert _serialize_blocks_python(_parse_blocks_python(html)) == html
+
+
+@pytest.mark.parametrize("path", _CORPUS, ids=lambda p: p.stem)
+def test_serialize_round_trips_editor_content(path):
+    html = path.read_text(encoding="utf-8")
+    assert _serialize_blocks_python(_parse_blocks_python(html)) == html
+
+
+def test_serialize_edited_tree():
+    html = (
+        '<!-- wp:heading {"level":2} -->\n<h2>Old</h2>\n<!-- /wp:heading -->\n\n'
+        "<!-- wp:separator /-->"
+    )
+    blocks = _parse_blocks_python(html)
+    blocks[0]["attrs"] = {"level": 3, "note": 'a--b <c> & "d"'}
+    blocks[0]["innerContent"] = ["\n<h3>New</h3>\n"]
+    blocks.append({"blockName": "acme/cta", "attrs": {}, "innerHTML": "<a>Go</a>"})
+    assert _serialize_blocks_python(blocks) == (
+        '<!-- wp:heading {"level":3,"note":"a\\u002d\\u002db \\u003cc\\u003e \\u0026 '
+        '\\u0022d\\u0022"} -->\n<h3>New</h3>\n<!-- /wp:heading -->\n\n'
+        "<!-- wp:separator /-->\n\n"
+        "<!-- wp:acme/cta --><a>Go</a><!-- /wp:acme/cta -->"
+    )
+    # The escaped attributes parse back to the same values
+    assert _parse_blocks_python(_serialize_blocks_python(blocks))[0]["attrs"] == blocks[0]["attrs"]
+
+
 # ───── Node counter ──────────────────────────────────────────────────
 
 
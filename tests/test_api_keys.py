@@ -6,6 +6,7 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -20,6 +21,7 @@ def temp_storage():
     yield storage_path
     # Cleanup
     Path(storage_path).unlink(missing_ok=True)
+    Path(storage_path + ".lock").unlink(missing_ok=True)
 
 
 @pytest.fixture
@@ -374,3 +376,196 @@ class TestAPIKeyInfo:
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestAPIKeyLookupIndex:
+    """Test prefix-indexed lookup and the verified-token cache."""
+
+    def test_new_key_stores_prefix(self, manager):
+        result = manager.create_key("wordpress_site1", "read")
+        key = manager.keys[result["key_id"]]
+        assert key.key_prefix == result["key"][4:12]
+
+    def test_validate_verifies_single_hash(self, manager):
+        created = [manager.create_key(f"wordpress_site{i}", "read") for i in range(5)]
+        target = created[-1]
+
+        calls = []
+        original = manager._verify_key
+
+        def counting_verify(api_key, key_hash):
+            calls.append(key_hash)
+            return original(api_key, key_hash)
+
+        manager._verify_key = counting_verify
+        key_id = manager.validate_key(
+            target["key"], project_id="wordpress_site4", required_scope="read"
+        )
+        assert key_id == target["key_id"]
+        assert len(calls) == 1
+
+    def test_verified_token_cache_skips_bcrypt(self, manager):
+        result = manager.create_key("wordpress_site1", "read")
+        assert manager.validate_key(result["key"], "wordpress_site1") == result["key_id"]
+
+        def fail_verify(*_args):
+            raise AssertionError("bcrypt should not run on a cache hit")
+
+        manager._verify_key = fail_verify
+        assert manager.validate_key(result["key"], "wordpress_site1") == result["key_id"]
+
+    def test_revoke_invalidates_cache(self, manager):
+        result = manager.create_key("wordpress_site1", "read")
+        manager.validate_key(result["key"], "wordpress_site1")
+        manager.revoke_key(result["key_id"])
+        assert manager._verified == {}
+        assert manager.validate_key(result["key"], "wordpress_site1") is None
+
+    def test_delete_removes_from_index(self, manager):
+        result = manager.create_key("wordpress_site1", "read")
+        manager.validate_key(result["key"], "wordpress_site1")
+        manager.delete_key(result["key_id"])
+        assert manager._prefix_index == {}
+        assert manager.validate_key(result["key"], "wordpress_site1") is None
+
+    def test_rotate_invalidates_old_token(self, manager):
+        result = manager.create_key("wordpress_site1", "write")
+        manager.validate_key(result["key"], "wordpress_site1")
+        new_keys = manager.rotate_keys("wordpress_site1")
+        assert manager.validate_key(result["key"], "wordpress_site1") is None
+        assert manager.validate_key(new_keys[0]["key"], "wordpress_site1") is not None
+
+    def test_index_rebuilt_on_load(self, manager, temp_storage):
+        result = manager.create_key("wordpress_site1", "read")
+        reloaded = APIKeyManager(storage_path=temp_storage)
+        assert reloaded.validate_key(result["key"], "wordpress_site1") == result["key_id"]
+
+    def test_legacy_entry_without_prefix_is_backfilled(self, manager, temp_storage):
+        result = manager.create_key("wordpress_site1", "read")
+        # Simulate a key written before the index existed
+        data = json.loads(Path(temp_storage).read_text())
+        data[result["key_id"]].pop("key_prefix")
+        Path(temp_storage).write_text(json.dumps(data))
+
+        reloaded = APIKeyManager(storage_path=temp_storage)
+        assert reloaded.keys[result["key_id"]].key_prefix is None
+        assert reloaded.validate_key(result["key"], "wordpress_site1") == result["key_id"]
+        assert reloaded.keys[result["key_id"]].key_prefix == result["key"][4:12]
+        on_disk = json.loads(Path(temp_storage).read_text())
+        assert on_disk[result["key_id"]]["key_prefix"] == result["key"][4:12]
+
+    async def test_validate_key_async_runs_bcrypt_in_thread(self, manager):
+        import threading
+
+        result = manager.create_key("wordpress_site1", "admin")
+        threads = []
+        original = manager._verify_key
+
+        def recording_verify(api_key, key_hash):
+            threads.append(threading.current_thread())
+            return original(api_key, key_hash)
+
+        manager._verify_key = recording_verify
+        key_id = await manager.validate_key_async(
+            result["key"], project_id="wordpress_site1", required_scope="write"
+        )
+        assert key_id == result["key_id"]
+        assert threads and threads[0] is not threading.main_thread()
+
+    async def test_get_key_by_token_async(self, manager):
+        result = manager.create_key("wordpress_site1", "read")
+        key = await manager.get_key_by_token_async(result["key"])
+        assert key is not None and key.key_id == result["key_id"]
+        assert await manager.get_key_by_token_async("cmp_doesnotexist") is None
+
+
+class TestAPIKeyUsageFlush:
+    """Test batched usage accounting."""
+
+    def test_validation_does_not_write(self, manager, temp_storage):
+        result = manager.create_key("wordpress_site1", "read")
+        mtime = Path(temp_storage).stat().st_mtime_ns
+
+        manager._save_keys = lambda: pytest.fail("validation must not save")
+        for _ in range(3):
+            assert manager.validate_key(result["key"], "wordpress_site1")
+        assert manager.keys[result["key_id"]].usage_count == 3
+        assert Path(temp_storage).stat().st_mtime_ns == mtime
+
+    def test_flush_persists_usage(self, manager, temp_storage):
+        result = manager.create_key("wordpress_site1", "read")
+        manager.validate_key(result["key"], "wordpress_site1")
+        manager.validate_key(result["key"], "wordpress_site1")
+
+        assert manager.flush_usage() is True
+        assert manager.flush_usage() is False
+        on_disk = json.loads(Path(temp_storage).read_text())
+        assert on_disk[result["key_id"]]["usage_count"] == 2
+        assert on_disk[result["key_id"]]["last_used_at"] is not None
+
+    async def test_flush_task_final_flush_on_stop(self, manager, temp_storage):
+        from core.key_usage import UsageFlushTask
+
+        result = manager.create_key("wordpress_site1", "read")
+        task = UsageFlushTask(interval_seconds=3600)
+        with patch("core.api_keys.get_api_key_manager", return_value=manager):
+            await task.start()
+            manager.validate_key(result["key"], "wordpress_site1")
+            await task.stop()
+        on_disk = json.loads(Path(temp_storage).read_text())
+        assert on_disk[result["key_id"]]["usage_count"] == 1
+
+
+class TestAPIKeyMultiWorker:
+    """Two managers on one file, as two worker processes would hold them."""
+
+    @pytest.fixture
+    def workers(self, temp_storage):
+        published = []
+        with patch("core.api_keys.publish_invalidation", lambda ch, key: published.append(key)):
+            yield APIKeyManager(temp_storage), APIKeyManager(temp_storage), published
+
+    def test_revoke_reaches_other_worker(self, workers):
+        a, b, published = workers
+        result = a.create_key("wordpress_site1", "read")
+        b.reload_keys(result["key_id"])
+        assert b.validate_key(result["key"], "wordpress_site1")  # now cached in b
+
+        a.revoke_key(result["key_id"])
+        assert published == [result["key_id"], result["key_id"]]
+        with patch("core.api_keys._api_key_manager", b):
+            from core.shared_state import _dispatch
+
+            _dispatch("api_key", result["key_id"])
+        assert b.validate_key(result["key"], "wordpress_site1") is None
+
+    def test_stale_flush_keeps_other_workers_changes(self, workers, temp_storage):
+        a, b, _ = workers
+        shared = a.create_key("wordpress_site1", "read")
+        b.reload_keys()
+        for _ in range(2):
+            a.validate_key(shared["key"], "wordpress_site1")
+        for _ in range(3):
+            b.validate_key(shared["key"], "wordpress_site1")
+
+        created = a.create_key("wordpress_site1", "write")
+        a.revoke_key(shared["key_id"])
+        assert a.flush_usage() is False  # a's own writes already saved its usage
+        assert b.flush_usage() is True  # b never saw the revoke or the new key
+
+        on_disk = json.loads(Path(temp_storage).read_text())
+        assert on_disk[shared["key_id"]]["revoked"] is True
+        assert on_disk[shared["key_id"]]["usage_count"] == 5
+        assert created["key_id"] in on_disk
+        assert b.validate_key(created["key"], "wordpress_site1")
+
+    def test_delete_on_other_worker_is_not_resurrected(self, workers, temp_storage):
+        a, b, _ = workers
+        result = a.create_key("wordpress_site1", "read")
+        b.reload_keys()
+        b.validate_key(result["key"], "wordpress_site1")
+        a.delete_key(result["key_id"])
+
+        b.flush_usage()
+        assert result["key_id"] not in json.loads(Path(temp_storage).read_text())
+        assert b.validate_key(result["key"], "wordpress_site1") is None
@@ -32,6 +32,7 @@ def temp_storage():
         storage_path = f.name
     yield storage_path
     Path(storage_path).unlink(missing_ok=True)
+    Path(storage_path + ".lock").unlink(missing_ok=True)
 
 
 @pytest.fixture
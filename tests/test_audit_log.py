@@ -0,0 +1,289 @@
+"""Tests for the audit logger's background writer (core/audit_log.py)."""
+
+import json
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from core.audit_log import AuditLogger, AuditLogWriter, EventType, LogLevel
+from core.audit_store import AuditLogStore
+
+
+@pytest.fixture
+def audit(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path), max_file_size_mb=1, backup_count=3)
+    yield logger
+    logger.close()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestAuditLogWriter:
+    def test_entries_written_off_caller_thread(self, audit, monkeypatch):
+        writers = []
+        original = AuditLogWriter._write_batch
+
+        def recording(self, batch):
+            writers.append(threading.current_thread())
+            return original(self, batch)
+
+        monkeypatch.setattr(AuditLogWriter, "_write_batch", recording)
+        audit.log_tool_call("wordpress_get_post", site="site1")
+        assert audit.flush()
+        assert writers and all(t is not threading.current_thread() for t in writers)
+        assert _lines(audit.log_file)[0]["tool_name"] == "wordpress_get_post"
+
+    def test_burst_is_group_committed(self, audit):
+        for i in range(200):
+            audit.log_system_event(f"event-{i}")
+        assert audit.flush()
+        stats = audit.get_writer_stats()
+        assert stats["written"] == 200
+        assert stats["batches"] < 200
+        events = [e["event"] for e in _lines(audit.log_file)]
+        assert events == [f"event-{i}" for i in range(200)]
+
+    def test_reads_do_not_wait_for_the_writer(self, audit, monkeypatch):
+        release = threading.Event()
+        original = AuditLogWriter._write_batch
+
+        def stalled(self, batch):
+            release.wait(5)
+            return original(self, batch)
+
+        monkeypatch.setattr(AuditLogWriter, "_write_batch", stalled)
+        audit.log_authentication(success=False, reason="bad key")
+        # Returns at once with what is on disk; the entry is still queued
+        assert audit.get_logs() == []
+        assert audit.get_statistics()["total_entries"] == 0
+
+        release.set()
+        assert audit.flush()
+        assert audit.get_recent_entries(limit=1)[0]["event_type"] == "authentication"
+
+    def test_rotation_by_file_size(self, tmp_path):
+        writer = AuditLogWriter(tmp_path / "audit.log", max_file_size=200, backup_count=2)
+        try:
+            for i in range(10):
+                writer.submit(json.dumps({"i": i, "pad": "x" * 50}) + "\n")
+                writer.flush()
+        finally:
+            writer.close()
+        assert writer.rotations > 0
+        assert (tmp_path / "audit.log.1").exists()
+        assert not (tmp_path / "audit.log.3").exists()
+        assert (tmp_path / "audit.log").stat().st_size <= 200
+
+    def test_workers_share_rotation_of_one_file(self, tmp_path):
+        # Two writers on one file, as two worker processes would have
+        log_file = tmp_path / "audit.log"
+        writers = [AuditLogWriter(log_file, max_file_size=300, backup_count=50) for _ in range(2)]
+        try:
+            for i in range(40):
+                writer = writers[i % 2]
+                writer.submit(json.dumps({"i": i, "pad": "x" * 50}) + "\n")
+                writer.flush()
+        finally:
+            for writer in writers:
+                writer.close()
+        segments = [log_file, *sorted(tmp_path.glob("audit.log.[0-9]*"))]
+        seen = sorted(entry["i"] for path in segments for entry in _lines(path))
+        assert seen == list(range(40))
+        assert all(path.stat().st_size <= 300 for path in segments)
+        assert sum(writer.rotations for writer in writers) > 0
+
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        writer = AuditLogWriter(
+            tmp_path / "audit.log", max_file_size=1 << 20, backup_count=1, queue_size=2
+        )
+        gate = threading.Event()
+        original = writer._write_batch
+
+        def slow(batch):
+            gate.wait(5)
+            original(batch)
+
+        writer._write_batch = slow
+        try:
+            results = [writer.submit(f'{{"i": {i}}}\n') for i in range(10)]
+            assert results.count(False) >= 1
+            assert writer.stats()["dropped"] == results.count(False)
+        finally:
+            gate.set()
+            writer.close()
+        assert writer.written + writer.dropped == 10
+
+    def test_close_drains_and_restarts(self, audit):
+        audit.log_system_event("before-close")
+        audit.close()
+        assert _lines(audit.log_file)[-1]["event"] == "before-close"
+        audit.log_system_event("after-close")
+        assert audit.flush()
+        assert _lines(audit.log_file)[-1]["event"] == "after-close"
+
+    @pytest.mark.parametrize("policy", ["never", "interval", "batch"])
+    def test_fsync_policies(self, tmp_path, policy, monkeypatch):
+        calls = []
+        monkeypatch.setattr("core.audit_log.os.fsync", lambda fd: calls.append(fd))
+        writer = AuditLogWriter(
+            tmp_path / "audit.log", max_file_size=1 << 20, backup_count=1, fsync_policy=policy
+        )
+        for i in range(3):
+            writer.submit(f'{{"i": {i}}}\n')
+            writer.flush()
+        writer.close()
+        if policy == "never":
+            assert calls == []
+        else:
+            assert calls
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            AuditLogWriter(tmp_path / "audit.log", 1024, 1, fsync_policy="sometimes")
+
+    def test_writer_stats_in_statistics(self, audit):
+        audit.log_system_event("x")
+        assert audit.flush()
+        stats = audit.get_statistics()
+        assert stats["writer"]["written"] == 1
+        assert stats["writer"]["dropped"] == 0
+
+
+class TestAuditLogStore:
+    def test_get_logs_returns_newest_in_order(self, audit):
+        for i in range(20):
+            audit.log_tool_call(f"tool_{i}", project_id="wordpress_site1")
+        assert audit.flush()
+        logs = audit.get_logs(limit=5)
+        assert [e["tool_name"] for e in logs] == [f"tool_{i}" for i in range(15, 20)]
+
+    def test_filters_use_indexed_columns(self, audit):
+        audit.log_tool_call("wordpress_get_post", project_id="wordpress_site1")
+        audit.log_tool_call("gitea_list_repos", project_id="gitea_main", error="boom")
+        audit.log_authentication(success=True, project_id="wordpress_site1")
+        assert audit.flush()
+
+        assert len(audit.get_logs(project_id="wordpress_site1")) == 2
+        assert [e["tool_name"] for e in audit.get_logs(tool_name="gitea_list_repos")] == [
+            "gitea_list_repos"
+        ]
+        assert len(audit.get_logs(event_type=EventType.AUTHENTICATION)) == 1
+        assert len(audit.get_logs(level=LogLevel.ERROR)) == 1
+        assert len(audit.get_logs(success_only=True)) == 2
+
+    def test_time_range_filter(self, audit):
+        audit.log_system_event("now")
+        assert audit.flush()
+        now = datetime.now(UTC)
+        assert len(audit.get_logs(start_time=now - timedelta(minutes=1))) == 1
+        assert audit.get_logs(end_time=now - timedelta(minutes=1)) == []
+
+    def test_cursor_pagination(self, audit):
+        for i in range(7):
+            audit.log_system_event(f"event-{i}")
+        assert audit.flush()
+        seen = []
+        cursor = None
+        while True:
+            page = audit.query_logs(cursor=cursor, limit=3)
+            seen.extend(e["event"] for e in page["entries"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [f"event-{i}" for i in range(6, -1, -1)]
+
+    def test_recent_entries_newest_first(self, audit):
+        audit.log_tool_call("first")
+        audit.log_tool_call("second")
+        assert audit.flush()
+        recent = audit.get_recent_entries(limit=1)
+        assert recent[0]["metadata"]["tool_name"] == "second"
+
+    def test_statistics_from_counters(self, audit):
+        audit.log_tool_call("ok_tool")
+        audit.log_tool_call("bad_tool", error="boom")
+        audit.log_system_event("startup")
+        assert audit.flush()
+        stats = audit.get_statistics()
+        assert stats["total_entries"] == 3
+        assert stats["by_type"] == {"tool_call": 2, "system": 1}
+        assert stats["by_level"] == {"INFO": 2, "ERROR": 1}
+        assert stats["success_rate"] == 50.0
+
+    def test_backfills_existing_segments(self, tmp_path):
+        def write(path, events):
+            path.write_text(
+                "".join(
+                    json.dumps(
+                        {
+                            "timestamp": datetime.now(UTC).isoformat(),
+                            "event_type": "system",
+                            "level": "INFO",
+                            "event": e,
+                        }
+                    )
+                    + "\n"
+                    for e in events
+                )
+            )
+
+        write(tmp_path / "audit.log.2", ["oldest"])
+        write(tmp_path / "audit.log.1", ["older"])
+        write(tmp_path / "audit.log", ["current"])
+
+        audit = AuditLogger(log_dir=str(tmp_path), backup_count=3)
+        try:
+            assert [e["event"] for e in audit.get_logs()] == ["oldest", "older", "current"]
+            # Re-opening does not import the files twice
+            audit.close()
+            again = AuditLogger(log_dir=str(tmp_path), backup_count=3)
+            assert again.get_statistics()["total_entries"] == 3
+            again.close()
+        finally:
+            audit.close()
+
+    def test_index_is_created_on_first_write(self, tmp_path):
+        audit = AuditLogger(log_dir=str(tmp_path))
+        try:
+            assert audit.get_logs() == []
+            assert audit.get_statistics()["total_entries"] == 0
+            assert list(tmp_path.iterdir()) == []
+
+            audit.log_system_event("startup")
+            assert audit.flush()
+            assert (tmp_path / "audit.log.index.db").exists()
+            assert audit.get_statistics()["total_entries"] == 1
+        finally:
+            audit.close()
+
+    def test_retention_prunes_and_adjusts_counters(self, tmp_path):
+        store = AuditLogStore(tmp_path / "index.db", max_rows=10)
+        try:
+            store.insert_batch(
+                {
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "event_type": "system",
+                    "level": "INFO",
+                }
+                for _ in range(12)
+            )
+            assert len(store) == 10
+            assert store.counters()["event_type"] == {"system": 10}
+        finally:
+            store.close()
+
+    def test_retention_counts_rows_of_all_workers(self, tmp_path):
+        stores = [AuditLogStore(tmp_path / "index.db", max_rows=10) for _ in range(2)]
+        entry = {"timestamp": datetime.now(UTC).isoformat(), "event_type": "system"}
+        try:
+            for _ in range(4):
+                for store in stores:
+                    store.insert_batch([entry] * 3)
+            assert len(stores[0]) <= 11
+            assert stores[1].counters()["event_type"] == {"system": len(stores[1])}
+        finally:
+            for store in stores:
+                store.close()
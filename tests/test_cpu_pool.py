@@ -0,0 +1,113 @@
+"""Tests for the bounded CPU worker pool (core/cpu_pool.py)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from core.cpu_pool import CpuPool, CpuPoolBusyError
+
+
+def _square(x):
+    return x * x
+
+
+class _Gate:
+    """Blocks worker threads until released, recording call order."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.order = []
+
+    def __call__(self, tag):
+        self.event.wait(5)
+        self.order.append(tag)
+        return tag
+
+
+@pytest.fixture
+def pool():
+    p = CpuPool(max_workers=1, max_queue=4, mode="thread")
+    yield p
+    p.shutdown()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestCpuPool:
+    async def test_runs_function_and_records_stats(self, pool):
+        assert await pool.run(_square, 7) == 49
+        stats = pool.stats()
+        assert stats["completed"] == 1
+        assert stats["running"] == 0
+        assert stats["queue_wait"]["count"] == 1
+        assert stats["run_time"]["count"] == 1
+
+    async def test_errors_propagate(self, pool):
+        with pytest.raises(TypeError):
+            await pool.run(_square, "x")
+        assert pool.stats()["failed"] == 1
+        assert await pool.run(_square, 3) == 9
+
+    async def test_users_are_served_round_robin(self, pool):
+        gate = _Gate()
+        blocker = asyncio.create_task(pool.run(gate, "first", user="a"))
+        await _settle()
+        tasks = [
+            asyncio.create_task(pool.run(gate, tag, user=user))
+            for tag, user in [("a1", "a"), ("a2", "a"), ("a3", "a"), ("b1", "b")]
+        ]
+        await _settle()
+        gate.event.set()
+        await asyncio.gather(blocker, *tasks)
+        assert gate.order == ["first", "a1", "b1", "a2", "a3"]
+
+    async def test_full_queue_rejects(self, pool):
+        gate = _Gate()
+        tasks = [asyncio.create_task(pool.run(gate, i)) for i in range(5)]
+        await _settle()
+        with pytest.raises(CpuPoolBusyError) as exc:
+            await pool.run(gate, "late")
+        assert exc.value.limit == 4
+        assert pool.stats()["rejected"] == 1
+        gate.event.set()
+        await asyncio.gather(*tasks)
+
+    async def test_cancelled_waiter_frees_its_place(self, pool):
+        gate = _Gate()
+        blocker = asyncio.create_task(pool.run(gate, "first"))
+        waiter = asyncio.create_task(pool.run(gate, "cancelled", user="a"))
+        await _settle()
+        assert pool.stats()["queued"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert pool.stats()["queued"] == 0
+
+        gate.event.set()
+        await blocker
+        assert await pool.run(_square, 2) == 4
+        assert gate.order == ["first"]
+
+    async def test_cancelled_caller_keeps_slot_until_job_finishes(self, pool):
+        gate = _Gate()
+        running = asyncio.create_task(pool.run(gate, "running", user="a"))
+        await _settle()
+        assert pool.stats()["running"] == 1
+
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        follower = asyncio.create_task(pool.run(gate, "follower", user="b"))
+        await _settle()
+        # The worker is still busy with the cancelled caller's job
+        assert (pool.stats()["running"], pool.stats()["queued"]) == (1, 1)
+
+        gate.event.set()
+        assert await follower == "follower"
+        assert gate.order == ["running", "follower"]
+        assert pool.stats()["running"] == 0
@@ -0,0 +1,219 @@
+"""Docker Engine API client (core/docker_api.py) and WP-CLI over it.
+
+A small aiohttp app on a Unix socket stands in for the Docker daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+import struct
+import subprocess
+
+import pytest
+from aiohttp import web
+
+from core.docker_api import DockerAPIError, DockerClient, _demux, set_docker_client
+from plugins.wordpress import wp_cli
+from plugins.wordpress.handlers.wp_cli import WPCLIHandler
+from plugins.wordpress.wp_cli import WPCLIManager, clear_availability_cache
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+class FakeDaemon:
+    """Records API calls; answers exec by running the command in a local shell."""
+
+    def __init__(self) -> None:
+        self.containers = {"wp-1": True, "stopped-1": False}
+        self.calls: list[str] = []
+        self.execs: dict[str, list[str]] = {}
+        self.exit_codes: dict[str, int] = {}
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/version", self.version)
+        app.router.add_get("/containers/json", self.list_containers)
+        app.router.add_get("/containers/{name}/json", self.inspect)
+        app.router.add_post("/containers/{name}/exec", self.create_exec)
+        app.router.add_post("/exec/{id}/start", self.start_exec)
+        app.router.add_get("/exec/{id}/json", self.inspect_exec)
+        return app
+
+    async def version(self, request):
+        self.calls.append("version")
+        return web.json_response({"Version": "27.0.0"})
+
+    async def list_containers(self, request):
+        self.calls.append("list")
+        return web.json_response([{"Names": [f"/{n}"]} for n in self.containers])
+
+    async def inspect(self, request):
+        name = request.match_info["name"]
+        self.calls.append(f"inspect:{name}")
+        if name not in self.containers:
+            return web.json_response({"message": f"No such container: {name}"}, status=404)
+        running = self.containers[name]
+        return web.json_response(
+            {"State": {"Running": running, "Status": "running" if running else "exited"}}
+        )
+
+    async def create_exec(self, request):
+        name = request.match_info["name"]
+        if name not in self.containers:
+            return web.json_response({"message": f"No such container: {name}"}, status=404)
+        body = await request.json()
+        exec_id = f"e{len(self.execs)}"
+        self.execs[exec_id] = body["Cmd"]
+        self.calls.append("exec")
+        return web.json_response({"Id": exec_id}, status=201)
+
+    async def start_exec(self, request):
+        exec_id = request.match_info["id"]
+        cmd = self.execs[exec_id]
+        if cmd[0] == "wp":
+            cmd = ["sh", "-c", shlex.join(cmd)]
+        # "wp" is a shell function printing its arguments; "fail" exits 1
+        script = (
+            'wp() { case "$1" in fail) echo "Error: no such command" >&2; return 1;; '
+            'core) [ "$2" = version ] && echo 6.5.2 && return 0;; esac; echo "ran $*"; }; ' + cmd[2]
+        )
+        proc = subprocess.run(["sh", "-c", script], capture_output=True)
+        self.exit_codes[exec_id] = proc.returncode
+        payload = _frame(1, proc.stdout) + _frame(2, proc.stderr)
+        return web.Response(body=payload, content_type="application/vnd.docker.raw-stream")
+
+    async def inspect_exec(self, request):
+        exec_id = request.match_info["id"]
+        return web.json_response({"ExitCode": self.exit_codes[exec_id], "Running": False})
+
+
+@pytest.fixture
+async def daemon(tmp_path):
+    fake = FakeDaemon()
+    runner = web.AppRunner(fake.app())
+    await runner.setup()
+    sock = str(tmp_path / "docker.sock")
+    await web.UnixSite(runner, sock).start()
+    client = DockerClient(socket_path=sock)
+    set_docker_client(client)
+    clear_availability_cache()
+    yield fake
+    set_docker_client(None)
+    clear_availability_cache()
+    await client.close()
+    await runner.cleanup()
+
+
+def test_demux_splits_streams():
+    payload = _frame(1, b"out1 ") + _frame(2, b"err") + _frame(1, b"out2")
+    assert _demux(payload) == (b"out1 out2", b"err")
+
+
+class TestDockerClient:
+    async def test_exec_collects_output_and_exit_code(self, daemon, tmp_path):
+        client = DockerClient(socket_path=str(tmp_path / "docker.sock"))
+        try:
+            result = await client.exec("wp-1", ["sh", "-c", "echo hi; echo oops >&2; exit 3"])
+        finally:
+            await client.close()
+        assert (result.exit_code, result.stdout, result.stderr) == (3, "hi\n", "oops\n")
+
+    async def test_inspect_missing_container_is_none(self, daemon, tmp_path):
+        client = DockerClient(socket_path=str(tmp_path / "docker.sock"))
+        try:
+            assert await client.inspect_container("nope") is None
+            assert await client.container_names() == ["wp-1", "stopped-1"]
+            with pytest.raises(DockerAPIError) as exc:
+                await client.exec("nope", ["true"])
+        finally:
+            await client.close()
+        assert exc.value.status == 404
+
+    async def test_unreachable_daemon(self, tmp_path):
+        client = DockerClient(socket_path=str(tmp_path / "missing.sock"))
+        try:
+            with pytest.raises(DockerAPIError, match="not reachable"):
+                await client.version()
+        finally:
+            await client.close()
+
+
+class TestWPCLIManager:
+    async def test_command_runs_through_exec(self, daemon):
+        result = await WPCLIManager("wp-1")._execute_wp_cli("cache flush")
+        assert result["output"] == "ran cache flush --allow-root"
+
+    async def test_availability_checks_are_cached_across_instances(self, daemon):
+        await WPCLIManager("wp-1")._execute_wp_cli("cache flush")
+        daemon.calls.clear()
+        await WPCLIManager("wp-1")._execute_wp_cli("db check")
+        assert daemon.calls == ["exec"]
+
+    async def test_failed_checks_are_not_cached(self, daemon):
+        daemon.containers["wp-2"] = False
+        with pytest.raises(Exception, match="not found or not running"):
+            await WPCLIManager("wp-2")._execute_wp_cli("cache flush")
+        daemon.containers["wp-2"] = True
+        assert (await WPCLIManager("wp-2")._execute_wp_cli("cache flush"))["output"]
+
+    async def test_checks_expire(self, daemon, monkeypatch):
+        monkeypatch.setattr(wp_cli, "CHECK_TTL", 0.0)
+        await WPCLIManager("wp-1")._execute_wp_cli("cache flush")
+        daemon.calls.clear()
+        await WPCLIManager("wp-1")._execute_wp_cli("cache flush")
+        assert daemon.calls == ["inspect:wp-1", "exec", "exec"]
+
+    async def test_wp_cli_error_is_reported(self, daemon):
+        with pytest.raises(Exception, match="WP-CLI error: Error: no such command"):
+            await WPCLIManager("wp-1")._execute_wp_cli("fail now", force_allow=True)
+
+
+class TestBatch:
+    async def test_batch_runs_in_one_exec(self, daemon):
+        manager = WPCLIManager("wp-1")
+        await manager._ensure_ready()
+        daemon.calls.clear()
+
+        results = await manager.execute_batch(
+            ["cache flush", "transient delete --expired", "db optimize", "core version"]
+        )
+        assert daemon.calls == ["exec"]
+        assert [r["command"] for r in results] == [
+            "cache flush",
+            "transient delete --expired",
+            "db optimize",
+            "core version",
+        ]
+        assert all(r["success"] for r in results)
+        assert results[2]["output"]["output"] == "ran db optimize --allow-root"
+        assert results[3]["output"]["output"] == "6.5.2"
+
+    async def test_failure_does_not_stop_the_rest(self, daemon, monkeypatch):
+        monkeypatch.setattr(WPCLIManager, "BATCH_COMMANDS", ["cache flush", "fail"])
+        results = await WPCLIManager("wp-1").execute_batch(["fail", "cache flush"])
+        assert results[0] == {
+            "command": "fail",
+            "success": False,
+            "exit_code": 1,
+            "error": "Error: no such command",
+        }
+        assert results[1]["success"] is True
+
+    @pytest.mark.parametrize(
+        "command", ["plugin update --all", "cache flush; rm -rf /", "db check --exec=phpinfo();"]
+    )
+    async def test_only_fixed_command_lines_are_accepted(self, daemon, command):
+        with pytest.raises(Exception, match="not allowed in a batch"):
+            await WPCLIManager("wp-1").execute_batch(["cache flush", command])
+        assert "exec" not in daemon.calls
+
+    async def test_handler_summarises_results(self, daemon):
+        handler = WPCLIHandler(WPCLIManager("wp-1"))
+        out = json.loads(await handler.wp_cli_batch(["cache flush", "db check"]))
+        assert (out["status"], out["succeeded"], out["failed"]) == ("success", 2, 0)
+
+        out = json.loads(await handler.wp_cli_batch([]))
+        assert "No commands given" in out["error"]
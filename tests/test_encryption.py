@@ -313,3 +313,94 @@ class TestSingleton:
         assert isinstance(enc, CredentialEncryption)
         # Should be the same as get_credential_encryption now
         assert get_credential_encryption() is enc
+
+
+class TestCredentialCache:
+    """Test the derived-key / plaintext cache."""
+
+    def test_derived_key_cached(self, encryption):
+        """HKDF runs once per scope while the entry is fresh."""
+        from unittest.mock import patch
+
+        import core.encryption as mod
+
+        with patch("core.encryption.HKDF", wraps=mod.HKDF) as hkdf:
+            encryption._derive_key("site_cached")
+            encryption._derive_key("site_cached")
+        assert hkdf.call_count == 1
+
+    def test_plaintext_cached_by_ciphertext(self, encryption):
+        """A repeated decrypt of the same ciphertext skips AES-GCM."""
+        from unittest.mock import patch
+
+        data = encryption.encrypt_credentials({"password": "p"}, "site_pt")
+        encryption.decrypt_credentials(data, "site_pt")
+        with patch("core.encryption.AESGCM") as aesgcm:
+            assert encryption.decrypt_credentials(data, "site_pt") == {"password": "p"}
+        aesgcm.assert_not_called()
+
+    def test_new_ciphertext_not_served_stale(self, encryption):
+        """Re-encrypted credentials decrypt to the new value."""
+        old = encryption.encrypt_credentials({"password": "old"}, "site_rot")
+        assert encryption.decrypt_credentials(old, "site_rot")["password"] == "old"
+        new = encryption.encrypt_credentials({"password": "new"}, "site_rot")
+        assert encryption.decrypt_credentials(new, "site_rot")["password"] == "new"
+
+    def test_returned_dict_is_a_copy(self, encryption):
+        """Mutating a result does not affect later decrypts."""
+        data = encryption.encrypt_credentials({"password": "p"}, "site_copy")
+        encryption.decrypt_credentials(data, "site_copy")["password"] = "changed"
+        assert encryption.decrypt_credentials(data, "site_copy")["password"] == "p"
+
+    def test_wrong_site_still_fails_when_cached(self, encryption):
+        """Cached plaintext for one site is never served to another."""
+        data = encryption.encrypt("secret", "site_a")
+        encryption.decrypt(data, "site_a")
+        with pytest.raises(InvalidTag):
+            encryption.decrypt(data, "site_b")
+
+    def test_invalidate_zeroizes_site_and_provider_scopes(self, encryption):
+        """invalidate() drops the site and its provider scopes, and wipes buffers."""
+        encryption.decrypt(encryption.encrypt("a", "site_x"), "site_x")
+        encryption.decrypt(
+            encryption.encrypt("b", "site_provider:site_x:openai"), "site_provider:site_x:openai"
+        )
+        encryption.decrypt(encryption.encrypt("c", "site_y"), "site_y")
+        buffers = [buf for buf, _ in encryption._key_cache._entries.values()]
+
+        assert encryption.invalidate("site_x") == 4
+        assert len(encryption._key_cache) == 1
+        assert len(encryption._plaintext_cache) == 1
+        wiped = [buf for buf in buffers if not any(buf)]
+        assert len(wiped) == 2
+
+    def test_ttl_expiry(self, encryption):
+        """Entries expire after the TTL."""
+        from unittest.mock import patch
+
+        with patch("core.encryption.time.monotonic", return_value=1000.0):
+            encryption._derive_key("site_ttl")
+        with patch("core.encryption.time.monotonic", return_value=1000.0 + 3600):
+            assert encryption._key_cache.get(("site_ttl", "")) is None
+        assert len(encryption._key_cache) == 0
+
+    def test_lru_bound(self, encryption):
+        """The cache never grows past max_entries."""
+        encryption._key_cache.max_entries = 2
+        for site in ("s1", "s2", "s3"):
+            encryption._derive_key(site)
+        assert len(encryption._key_cache) == 2
+        assert encryption._key_cache.get(("s1", "")) is None
+
+    def test_disabled_with_zero_ttl(self, encryption):
+        """TTL 0 turns caching off."""
+        encryption._key_cache.ttl = 0
+        encryption._derive_key("site_off")
+        assert len(encryption._key_cache) == 0
+
+    @pytest.mark.usefixtures("_clear_singleton")
+    def test_module_invalidate_without_singleton(self):
+        """invalidate_credential_cache is a no-op before initialization."""
+        from core.encryption import invalidate_credential_cache
+
+        invalidate_credential_cache("site_none")
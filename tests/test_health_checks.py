@@ -0,0 +1,150 @@
+"""Tests for concurrent fleet health checks (HealthMonitor.check_all_projects_health)."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from core.health import HealthMonitor, ProjectHealthStatus
+
+
+class _Sites:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def list_all_sites(self):
+        return [{"full_id": pid} for pid in self.ids]
+
+
+def _monitor(delays, **settings):
+    hm = HealthMonitor(site_manager=_Sites(list(delays)))
+    hm.check_concurrency = settings.get("concurrency", 10)
+    hm.check_host_timeout = settings.get("host_timeout", 5)
+    hm.check_deadline = settings.get("deadline", 5)
+    hm.calls = 0
+
+    async def fake_check(project_id, include_metrics=True):
+        hm.calls += 1
+        await asyncio.sleep(delays[project_id])
+        status = ProjectHealthStatus(
+            project_id=project_id,
+            healthy=True,
+            last_check=datetime.now(UTC),
+            response_time_ms=delays[project_id] * 1000,
+            error_rate_percent=0.0,
+        )
+        hm.latest_health_status[project_id] = status
+        return status
+
+    hm.check_project_health = fake_check
+    return hm
+
+
+class TestFleetHealth:
+    async def test_sites_checked_concurrently(self):
+        hm = _monitor({f"wordpress_site{i}": 0.2 for i in range(10)})
+        start = time.monotonic()
+        result = await hm.check_all_projects_health()
+        assert time.monotonic() - start < 1.0
+        assert result["summary"]["healthy"] == 10
+        assert result["summary"]["complete"] is True
+
+    async def test_concurrency_is_bounded(self):
+        hm = _monitor({f"s{i}": 0.05 for i in range(6)}, concurrency=2)
+        running = peak = 0
+        inner = hm.check_project_health
+
+        async def tracking(project_id, include_metrics=True):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await inner(project_id, include_metrics)
+            finally:
+                running -= 1
+
+        hm.check_project_health = tracking
+        await hm.check_all_projects_health()
+        assert peak == 2
+
+    async def test_per_host_timeout(self):
+        hm = _monitor({"fast": 0.01, "slow": 5}, host_timeout=0.1)
+        result = await hm.check_all_projects_health()
+        slow = result["projects"]["slow"]
+        assert slow["healthy"] is False
+        assert "timed out" in slow["recent_errors"][0]
+        assert result["projects"]["fast"]["healthy"] is True
+        assert hm.get_project_metrics("slow")["failed_requests"] == 1
+
+    async def test_global_deadline_returns_partial_results(self):
+        hm = _monitor({"fast": 0.01, "slow": 5}, host_timeout=10, deadline=0.2)
+        start = time.monotonic()
+        result = await hm.check_all_projects_health()
+        assert time.monotonic() - start < 1.0
+        assert result["summary"]["timed_out"] == 1
+        assert result["summary"]["complete"] is False
+        assert result["projects"]["slow"]["details"]["stale"] is True
+        assert result["projects"]["fast"]["healthy"] is True
+
+    async def test_deadline_reuses_last_known_status(self):
+        hm = _monitor({"slow": 5}, deadline=0.1)
+        hm.latest_health_status["slow"] = ProjectHealthStatus(
+            project_id="slow",
+            healthy=True,
+            last_check=datetime.now(UTC),
+            response_time_ms=50,
+            error_rate_percent=0,
+        )
+        result = await hm.check_all_projects_health()
+        assert result["projects"]["slow"]["healthy"] is True
+        assert result["projects"]["slow"]["details"]["stale"] is True
+
+    async def test_results_cached_and_shared(self):
+        hm = _monitor({"a": 0.01, "b": 0.01})
+        first = await hm.check_all_projects_health()
+        second = await hm.check_all_projects_health()
+        assert second is first
+        assert hm.calls == 2
+        assert hm.get_cached_fleet_health() is first
+
+        await hm.check_all_projects_health(max_age_seconds=0)
+        assert hm.calls == 4
+
+    async def test_concurrent_callers_join_one_sweep(self):
+        hm = _monitor({"a": 0.1, "b": 0.1})
+        r1, r2 = await asyncio.gather(
+            hm.check_all_projects_health(max_age_seconds=0),
+            hm.check_all_projects_health(max_age_seconds=0),
+        )
+        assert r1 is r2
+        assert hm.calls == 2
+
+    async def test_sweeps_with_and_without_metrics_are_kept_apart(self):
+        hm = _monitor({"a": 0.05})
+        bare, full = await asyncio.gather(
+            hm.check_all_projects_health(include_metrics=False, max_age_seconds=0),
+            hm.check_all_projects_health(include_metrics=True, max_age_seconds=0),
+        )
+        assert bare is not full
+        assert hm.calls == 2
+        assert await hm.check_all_projects_health(include_metrics=False) is bare
+        assert hm.get_cached_fleet_health(include_metrics=False) is bare
+        assert hm.get_cached_fleet_health() is full
+
+    async def test_check_errors_reported_per_site(self):
+        hm = _monitor({"ok": 0.01, "bad": 0.01})
+        inner = hm.check_project_health
+
+        async def flaky(project_id, include_metrics=True):
+            if project_id == "bad":
+                raise RuntimeError("boom")
+            return await inner(project_id, include_metrics)
+
+        hm.check_project_health = flaky
+        result = await hm.check_all_projects_health()
+        assert result["projects"]["bad"]["healthy"] is False
+        assert result["status"] == "degraded"
+
+    async def test_no_sites(self):
+        hm = _monitor({})
+        result = await hm.check_all_projects_health()
+        assert result["summary"]["total_projects"] == 0
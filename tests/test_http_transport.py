@@ -0,0 +1,103 @@
+"""Tests for the shared upstream HTTP transport (core/http_transport.py)."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.http_transport import (
+    HttpTransport,
+    close_http_transport,
+    get_http_transport,
+    pooled_session,
+    set_http_transport,
+)
+from plugins.wordpress.client import WordPressClient
+
+
+@pytest.fixture
+async def transport():
+    t = HttpTransport(limit=10, limit_per_host=4, ttl_dns_cache=60, keepalive_timeout=30)
+    set_http_transport(t)
+    yield t
+    await t.close()
+    set_http_transport(None)
+
+
+@pytest.fixture
+async def server():
+    """Local HTTP server that reports the client port of each request."""
+
+    async def peer(request: web.Request) -> web.Response:
+        return web.json_response({"port": request.transport.get_extra_info("peername")[1]})
+
+    app = web.Application()
+    app.router.add_get("/peer", peer)
+    app.router.add_get("/wp-json/wp/v2/posts", peer)
+    srv = TestServer(app)
+    await srv.start_server()
+    yield srv
+    await srv.close()
+
+
+class TestHttpTransport:
+    async def test_connector_is_shared_between_sessions(self, transport):
+        s1 = pooled_session()
+        s2 = pooled_session()
+        try:
+            assert s1.connector is s2.connector
+            assert s1.connector is transport.connector()
+        finally:
+            await s1.close()
+            await s2.close()
+        # Closing borrowed sessions must not close the pool
+        assert not transport.connector().closed
+
+    async def test_connector_settings(self, transport):
+        conn = transport.connector()
+        assert conn.limit == 10
+        assert conn.limit_per_host == 4
+        assert conn.use_dns_cache is True
+
+    async def test_keepalive_reuses_connection(self, transport, server):
+        url = str(server.make_url("/peer"))
+        ports = []
+        for _ in range(3):
+            async with pooled_session() as session, session.get(url) as resp:
+                ports.append((await resp.json())["port"])
+        assert len(set(ports)) == 1
+        assert transport.stats()["idle_connections"] == 1
+
+    async def test_per_call_session_kwargs_pass_through(self, transport):
+        import aiohttp
+
+        timeout = aiohttp.ClientTimeout(total=3)
+        async with pooled_session(timeout=timeout) as session:
+            assert session.timeout.total == 3
+
+    async def test_close_is_idempotent(self, transport):
+        conn = transport.connector()
+        await transport.close()
+        assert conn.closed
+        await transport.close()
+        assert transport.stats()["active"] is False
+
+    async def test_recreated_after_close(self, transport):
+        first = transport.connector()
+        await transport.close()
+        second = transport.connector()
+        assert second is not first
+        assert transport.stats()["connectors_created"] == 2
+
+    async def test_module_close_helper(self, transport):
+        conn = get_http_transport().connector()
+        await close_http_transport()
+        assert conn.closed
+
+
+class TestClientsUseSharedPool:
+    async def test_wordpress_requests_reuse_connection(self, transport, server):
+        client = WordPressClient(str(server.make_url("")), "admin", "app-pass")
+        first = await client.get("posts")
+        second = await client.get("posts")
+        assert first["port"] == second["port"]
+        assert transport.sessions_opened == 2
@@ -0,0 +1,158 @@
+"""Tests for rolling-window latency histograms (core/metrics.py) and HealthMonitor."""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.health import HealthMonitor
+from core.metrics import (
+    MAX_BUCKETS,
+    LatencyHistogram,
+    RollingWindow,
+    TieredWindow,
+    bucket_index,
+    bucket_upper_bound,
+)
+
+
+class TestLatencyHistogram:
+    def test_bucket_bounds_contain_value(self):
+        for value in (0.5, 1.0, 12.3, 250.0, 9_999.0):
+            idx = bucket_index(value)
+            assert bucket_upper_bound(idx - 1) < value <= bucket_upper_bound(idx) * 1.0000001
+
+    def test_out_of_range_values_are_clamped(self):
+        assert bucket_index(0) == 0
+        assert bucket_index(10**12) == MAX_BUCKETS - 1
+
+    def test_percentiles_within_relative_error(self):
+        hist = LatencyHistogram()
+        for v in range(1, 1001):
+            hist.record(float(v))
+        assert hist.count == 1000
+        assert hist.mean == pytest.approx(500.5)
+        for q, exact in ((50, 500), (95, 950), (99, 990)):
+            assert hist.percentile(q) == pytest.approx(exact, rel=0.1)
+        assert hist.percentile(100) == 1000
+
+    def test_merge_equals_combined_recording(self):
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for v in (1, 5, 20):
+            a.record(v)
+            both.record(v)
+        for v in (100, 400):
+            b.record(v)
+            both.record(v)
+        a.merge(b)
+        assert a.buckets == both.buckets
+        assert (a.count, a.min, a.max) == (5, 1, 400)
+
+    def test_memory_bounded_by_buckets(self):
+        hist = LatencyHistogram()
+        for i in range(50_000):
+            hist.record((i % 5000) * 0.37)
+        assert len(hist.buckets) <= MAX_BUCKETS
+
+
+class TestRollingWindow:
+    def test_old_slots_fall_out_of_window(self):
+        window = RollingWindow(slot_seconds=60, num_slots=5)
+        window.record(10, True, now=0)
+        window.record(20, False, now=130)
+        assert window.snapshot(60, now=130).requests == 1
+        assert window.snapshot(300, now=130).requests == 2
+        # Slot reused after a full rotation
+        window.record(30, True, now=300)
+        stats = window.snapshot(300, now=300)
+        assert stats.requests == 2
+        assert stats.errors == 1
+
+    def test_tiered_window_picks_resolution(self):
+        window = TieredWindow(retention_hours=24)
+        window.record(10, True, now=10_000)
+        window.record(10, True, now=10_000 - 7200)
+        assert window.snapshot(3600, now=10_000).requests == 1
+        assert window.snapshot(24 * 3600, now=10_000).requests == 2
+
+
+class TestHealthMonitorMetrics:
+    def test_project_metrics_report_percentiles(self):
+        hm = HealthMonitor()
+        for i in range(100):
+            hm.record_request("wordpress_site1", float(i + 1), success=i >= 10)
+        metrics = hm.get_project_metrics("wordpress_site1", hours=1)
+        assert metrics["total_requests"] == 100
+        assert metrics["failed_requests"] == 10
+        assert metrics["error_rate_percent"] == 10.0
+        rt = metrics["response_time"]
+        assert rt["min_ms"] == 1.0 and rt["max_ms"] == 100.0
+        assert rt["p50_ms"] == pytest.approx(50, rel=0.1)
+        assert rt["p99_ms"] == pytest.approx(99, rel=0.1)
+
+    def test_unknown_project(self):
+        assert HealthMonitor().get_project_metrics("nope")["total_requests"] == 0
+
+    def test_tool_and_plugin_breakdown(self):
+        hm = HealthMonitor()
+        hm.record_request(
+            "wordpress_site1", 10, True, tool_name="wordpress_get_post", plugin_type="wordpress"
+        )
+        hm.record_request(
+            "wordpress_site2",
+            30,
+            False,
+            "boom",
+            tool_name="wordpress_get_post",
+            plugin_type="wordpress",
+        )
+        hm.record_request("gitea_main", 5, True, tool_name="gitea_list_repos", plugin_type="gitea")
+
+        tool = hm.get_tool_metrics("wordpress_get_post")
+        assert tool["total_requests"] == 2
+        assert tool["error_rate_percent"] == 50.0
+        assert hm.get_plugin_metrics("gitea")["total_requests"] == 1
+        assert set(hm.get_metrics_breakdown("plugin")) == {"wordpress", "gitea"}
+
+    def test_recent_errors_and_last_request(self):
+        hm = HealthMonitor()
+        for i in range(8):
+            hm.record_request("wordpress_site1", 1, False, f"err-{i}")
+        metrics = hm.get_project_metrics("wordpress_site1")
+        assert metrics["recent_errors"] == [f"err-{i}" for i in range(3, 8)]
+        assert hm.last_request_at("wordpress_site1") is not None
+        assert hm.last_request_at("other") is None
+
+    def test_system_metrics(self):
+        hm = HealthMonitor()
+        for v in (10, 20, 30):
+            hm.record_request("wordpress_site1", v, True)
+        system = hm.get_system_metrics()
+        assert system.total_requests == 3
+        assert system.requests_per_minute == 3
+        assert system.average_response_time_ms == 20.0
+        assert system.p99_response_time_ms == 30.0
+
+    def test_only_failures_are_audited(self):
+        class FakeAudit:
+            def __init__(self):
+                self.events = []
+
+            def log_system_event(self, **kwargs):
+                self.events.append(kwargs)
+
+            def get_writer_stats(self):
+                return {}
+
+        audit = FakeAudit()
+        hm = HealthMonitor(audit_logger=audit)
+        hm.record_request("wordpress_site1", 5, True)
+        hm.record_request("wordpress_site1", 5, False, "boom")
+        assert len(audit.events) == 1
+
+    def test_windows_expire_with_time(self):
+        hm = HealthMonitor()
+        with patch("core.health.time.time", return_value=1_000_000.0):
+            hm.record_request("wordpress_site1", 5, True)
+        with patch("core.health.time.time", return_value=1_000_000.0 + 2 * 3600):
+            assert hm.get_project_metrics("wordpress_site1", hours=1)["total_requests"] == 0
+            assert hm.get_project_metrics("wordpress_site1", hours=24)["total_requests"] == 1
@@ -0,0 +1,219 @@
+"""Bounded-concurrency bulk operations (plugins/n8n/bulk.py) and the tools built on it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from plugins.n8n import bulk
+from plugins.n8n.client import (
+    N8nApiError,
+    N8nAuthError,
+    N8nClient,
+    N8nConnectionError,
+    N8nNotFoundError,
+    N8nValidationError,
+)
+from plugins.n8n.handlers.executions import delete_executions, delete_executions_by_filter
+from plugins.n8n.handlers.tags import delete_tags
+from plugins.n8n.handlers.variables import set_variables
+from plugins.n8n.handlers.workflows import activate_workflows_by_tag, deactivate_workflows_by_tag
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(bulk, "RETRY_BACKOFF", 0)
+
+
+class Tracker:
+    """Records peak concurrency of an async operation."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    async def __call__(self, item: str) -> str:
+        self.calls.append(item)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        return item.upper()
+
+
+async def test_results_in_order_with_bounded_concurrency():
+    op = Tracker()
+    items = [f"id{i}" for i in range(20)]
+    report = await bulk.run_bulk(items, op, concurrency=4)
+    assert report.ok
+    assert [r.key for r in report.results] == items
+    assert [r.value for r in report.results] == [i.upper() for i in items]
+    assert op.peak == 4
+
+
+async def test_transient_errors_are_retried_others_are_not():
+    attempts: dict[str, int] = {}
+
+    async def op(item: str) -> None:
+        attempts[item] = attempts.get(item, 0) + 1
+        if item == "flaky" and attempts[item] < 3:
+            raise N8nApiError("bad gateway", status_code=502)
+        if item == "down":
+            raise N8nConnectionError("reset")
+        if item == "missing":
+            raise N8nNotFoundError("gone")
+
+    report = await bulk.run_bulk(["flaky", "down", "missing", "fine"], op, retries=2)
+    assert [(r.key, r.ok, r.attempts) for r in report.results] == [
+        ("flaky", True, 3),
+        ("down", False, 3),
+        ("missing", False, 1),
+        ("fine", True, 1),
+    ]
+    assert report.failures() == [
+        {"id": "down", "error": "reset"},
+        {"id": "missing", "error": "gone"},
+    ]
+    assert report.abort_info() == {}
+
+
+async def test_auth_error_aborts_and_skips_the_rest():
+    calls: list[str] = []
+
+    async def op(item: str) -> None:
+        calls.append(item)
+        if item == "3":
+            raise N8nAuthError("key revoked")
+
+    report = await bulk.run_bulk([str(i) for i in range(10)], op, concurrency=2)
+    assert not report.ok
+    assert report.aborted is not None
+    assert len(calls) < 10
+    assert len(report.results) + len(report.skipped) == 10
+    assert report.abort_info()["aborted"]["error_code"] == "AUTH_FAILED"
+    assert report.abort_info()["skipped"] == report.skipped
+
+
+class FakeN8n(N8nClient):
+    def __init__(self) -> None:
+        super().__init__(site_url="https://n8n.test", api_key="k")
+        self.deleted: list[str] = []
+        self.variables = {"EXISTING": "old"}
+        self.workflows = [
+            {"id": "1", "name": "a", "active": False, "tags": ["nightly"]},
+            {"id": "2", "name": "b", "active": True, "tags": ["nightly"]},
+            {"id": "3", "name": "c", "active": False, "tags": ["nightly"]},
+            {"id": "4", "name": "d", "active": False, "tags": ["other"]},
+        ]
+        self.executions = [
+            {"id": "10", "stoppedAt": "2026-01-01T00:00:00.000Z"},
+            {"id": "11", "stoppedAt": None},
+            {"id": "12", "stoppedAt": "2020-05-01T00:00:00.000Z"},
+            {"id": "13", "stoppedAt": "2099-01-01T00:00:00.000Z"},
+        ]
+
+    async def delete_execution(self, execution_id):
+        if execution_id == "bad":
+            raise N8nNotFoundError(f"Execution {execution_id} not found")
+        self.deleted.append(execution_id)
+        return {}
+
+    async def delete_tag(self, tag_id):
+        if tag_id == "locked":
+            raise N8nAuthError("forbidden", status_code=403)
+        return {}
+
+    async def get_variable(self, key):
+        raise AssertionError("set_variables should not GET variables one by one")
+
+    def iter_items(self, endpoint, params=None, *, limit=250):
+        assert endpoint == "variables"
+
+        async def gen():
+            for key, value in self.variables.items():
+                yield {"key": key, "value": value}
+
+        return gen()
+
+    async def update_variable(self, key, value):
+        self.variables[key] = value
+
+    async def create_variable(self, key, value):
+        if key == "bad key":
+            raise N8nValidationError("invalid key")
+        self.variables[key] = value
+
+    def iter_workflows(self, active=None, tags=None, name=None):
+        async def gen():
+            for w in self.workflows:
+                if tags in w["tags"]:
+                    yield w
+
+        return gen()
+
+    async def activate_workflow(self, workflow_id):
+        if workflow_id == "3":
+            raise N8nValidationError("Workflow has no trigger node")
+        return {"id": workflow_id, "active": True}
+
+    async def deactivate_workflow(self, workflow_id):
+        return {"id": workflow_id, "active": False}
+
+    def iter_executions(self, workflow_id=None, status=None, project_id=None, include_data=False):
+        async def gen():
+            for e in self.executions:
+                yield e
+
+        return gen()
+
+
+class TestHandlers:
+    async def test_delete_executions(self):
+        client = FakeN8n()
+        out = json.loads(await delete_executions(client, ["1", "bad", "2"]))
+        assert out["success"] is False
+        assert (out["deleted_count"], out["deleted"]) == (2, ["1", "2"])
+        assert out["failed"] == [{"id": "bad", "error": "Execution bad not found"}]
+
+    async def test_delete_tags_aborts_on_auth_error(self):
+        out = json.loads(await delete_tags(FakeN8n(), ["locked"] + [str(i) for i in range(20)]))
+        assert out["success"] is False
+        assert out["aborted"]["status_code"] == 403
+        assert out["skipped"]
+        assert len(out["deleted"]) + len(out["failed"]) + len(out["skipped"]) == 21
+
+    async def test_set_variables_lists_once(self):
+        client = FakeN8n()
+        out = json.loads(
+            await set_variables(client, {"EXISTING": "new", "FRESH": "x", "bad key": "y"})
+        )
+        assert (out["created"], out["updated"]) == (["FRESH"], ["EXISTING"])
+        assert out["failed"] == [{"key": "bad key", "error": "invalid key"}]
+        assert client.variables == {"EXISTING": "new", "FRESH": "x"}
+
+    async def test_delete_executions_by_filter(self):
+        client = FakeN8n()
+        preview = json.loads(await delete_executions_by_filter(client, 30, dry_run=True))
+        assert preview["execution_ids"] == ["10", "12"]
+        assert preview["scanned"] == 4 and client.deleted == []
+
+        out = json.loads(await delete_executions_by_filter(client, 30, max_items=1))
+        assert (out["success"], out["deleted_count"], out["truncated"]) == (True, 1, True)
+        assert client.deleted == ["10"]
+
+    async def test_workflows_by_tag(self):
+        client = FakeN8n()
+        preview = json.loads(await activate_workflows_by_tag(client, "nightly", dry_run=True))
+        assert [w["id"] for w in preview["would_change"]] == ["1", "3"]
+
+        out = json.loads(await activate_workflows_by_tag(client, "nightly"))
+        assert (out["matched"], out["unchanged_count"]) == (3, 1)
+        assert out["changed"] == [{"id": "1", "name": "a"}]
+        assert out["failed"] == [{"id": "3", "error": "Workflow has no trigger node"}]
+
+        out = json.loads(await deactivate_workflows_by_tag(client, "nightly"))
+        assert out["success"] is True
+        assert out["changed"] == [{"id": "2", "name": "b"}]
@@ -0,0 +1,139 @@
+"""Shared, status-only execution polling (plugins/n8n/waiter.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from plugins.n8n import waiter
+from plugins.n8n.client import N8nClient, N8nConnectionError, N8nNotFoundError
+from plugins.n8n.handlers.executions import wait_for_execution
+
+
+class FakeN8n(N8nClient):
+    """Execution that reports ``running`` for ``polls_until_done`` status checks."""
+
+    def __init__(self, polls_until_done: int = 3, final: str = "success") -> None:
+        super().__init__(site_url="https://n8n.test", api_key="k")
+        self.polls_until_done = polls_until_done
+        self.final = final
+        self.calls: list[bool] = []
+        self.fail_next: Exception | None = None
+
+    async def get_execution(self, execution_id, include_data=True):
+        self.calls.append(include_data)
+        if self.fail_next is not None:
+            exc, self.fail_next = self.fail_next, None
+            raise exc
+        status_checks = self.calls.count(False)
+        done = status_checks >= self.polls_until_done
+        execution = {
+            "id": execution_id,
+            "status": self.final if done else "running",
+            "finished": done and self.final == "success",
+            "startedAt": "2026-01-01T00:00:00Z",
+        }
+        if include_data:
+            execution["data"] = {"resultData": {"error": {"message": "boom"}, "runData": {}}}
+        return execution
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(waiter, "POLL_MAX", 0.05)
+    yield
+    assert waiter._polls == {}
+
+
+async def test_polls_status_only_with_backoff(monkeypatch):
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(waiter, "POLL_MAX", 10)
+    monkeypatch.setattr(waiter.asyncio, "sleep", fake_sleep)
+    client = FakeN8n(polls_until_done=5)
+    outcome = await waiter.wait_for_execution(client, "1", timeout=5, poll_interval=2)
+    assert outcome.finished and outcome.checks == 5
+    assert client.calls == [False] * 5
+    assert sleeps == [2, 3, 4.5, 6.75]
+
+
+async def test_concurrent_waiters_share_one_poll():
+    client = FakeN8n(polls_until_done=3)
+    outcomes = await asyncio.gather(
+        *(waiter.wait_for_execution(client, "7", timeout=5, poll_interval=0.01) for _ in range(5))
+    )
+    assert all(o.finished for o in outcomes)
+    assert client.calls == [False] * 3
+
+    # Full data is fetched once, however many waiters ask for it
+    await asyncio.gather(*(o.full_execution() for o in outcomes))
+    assert client.calls == [False] * 3 + [True]
+
+
+async def test_waiters_with_different_api_keys_poll_separately():
+    first, second = FakeN8n(polls_until_done=3), FakeN8n(polls_until_done=3)
+    second.api_key = "other-key"
+    outcomes = await asyncio.gather(
+        waiter.wait_for_execution(first, "7", timeout=5, poll_interval=0.01),
+        waiter.wait_for_execution(second, "7", timeout=5, poll_interval=0.01),
+    )
+    assert all(o.finished for o in outcomes)
+    assert first.calls == second.calls == [False] * 3
+
+    await outcomes[1].full_execution()
+    assert (first.calls.count(True), second.calls.count(True)) == (0, 1)
+
+
+async def test_timeout_reports_last_status_and_stops_polling():
+    client = FakeN8n(polls_until_done=10_000)
+    outcome = await waiter.wait_for_execution(client, "9", timeout=0.05, poll_interval=0.01)
+    assert not outcome.finished
+    assert outcome.execution["status"] == "running"
+    checks = len(client.calls)
+    await asyncio.sleep(0.1)
+    assert len(client.calls) == checks
+
+
+async def test_connection_errors_are_retried_other_errors_end_the_wait():
+    client = FakeN8n(polls_until_done=2)
+    client.fail_next = N8nConnectionError("reset")
+    assert (await waiter.wait_for_execution(client, "3", timeout=5, poll_interval=0.01)).finished
+
+    client = FakeN8n()
+    client.fail_next = N8nNotFoundError("Execution 4 not found")
+    with pytest.raises(N8nNotFoundError):
+        await waiter.wait_for_execution(client, "4", timeout=5, poll_interval=0.01)
+
+
+class TestHandler:
+    async def test_success_fetches_no_data_unless_asked(self):
+        client = FakeN8n(polls_until_done=2)
+        out = json.loads(await wait_for_execution(client, "5", poll_interval=0.01))
+        assert (out["success"], out["final_status"], out["status_checks"]) == (True, "success", 2)
+        assert "data" not in out
+        assert True not in client.calls
+
+        client = FakeN8n(polls_until_done=1)
+        out = json.loads(await wait_for_execution(client, "6", include_data=True))
+        assert out["data"]["resultData"]["runData"] == {}
+        assert client.calls == [False, True]
+
+    async def test_error_status_includes_error_details(self):
+        client = FakeN8n(polls_until_done=1, final="error")
+        out = json.loads(await wait_for_execution(client, "8"))
+        assert out["final_status"] == "error"
+        assert out["error"] == {"message": "boom"}
+        assert "data" not in out
+
+    async def test_timeout(self):
+        client = FakeN8n(polls_until_done=10_000)
+        out = json.loads(await wait_for_execution(client, "2", timeout_seconds=0.05))
+        assert out["success"] is False
+        assert out["last_status"] == "running"
@@ -3,15 +3,35 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from core.oauth.schemas import AuthorizationCode, RefreshToken
-from core.oauth.storage import JSONStorage
+from core.oauth.schemas import AccessToken, AuthorizationCode, RefreshToken
+from core.oauth.storage import JSONStorage, SQLiteStorage, get_storage
 
 
-@pytest.fixture
-def storage():
+@pytest.fixture(params=[JSONStorage, SQLiteStorage])
+def storage(request):
     """Create temporary storage for tests"""
     with tempfile.TemporaryDirectory() as tmpdir:
-        yield JSONStorage(tmpdir)
+        backend = request.param(tmpdir)
+        yield backend
+        if isinstance(backend, SQLiteStorage):
+            backend.close()
+
+
+@pytest.fixture
+def sqlite_storage():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = SQLiteStorage(tmpdir)
+        yield backend
+        backend.close()
+
+
+def _access_token(token: str, expires_in: timedelta) -> AccessToken:
+    return AccessToken(
+        token=token,
+        client_id="client_1",
+        scope="read",
+        expires_at=datetime.now(UTC) + expires_in,
+    )
 
 
 def test_save_and_get_authorization_code(storage):
@@ -69,3 +89,86 @@ def test_refresh_token_revocation(storage):
     # Should return None
     retrieved = storage.get_refresh_token("refresh_token_123")
     assert retrieved is None
+
+
+def test_revoke_only_succeeds_once(storage):
+    """A second revocation reports False so rotation can detect races"""
+    storage.save_refresh_token(
+        RefreshToken(
+            token="rt_once",
+            client_id="client_1",
+            expires_at=datetime.now(UTC) + timedelta(days=7),
+        )
+    )
+
+    assert storage.revoke_refresh_token("rt_once")
+    assert not storage.revoke_refresh_token("rt_once")
+    assert storage.get_refresh_token("rt_once", include_revoked=True).revoked
+
+
+def test_revoke_client_refresh_tokens(storage):
+    expires = datetime.now(UTC) + timedelta(days=7)
+    for token, client_id in [("rt_a1", "a"), ("rt_a2", "a"), ("rt_b", "b")]:
+        storage.save_refresh_token(
+            RefreshToken(token=token, client_id=client_id, expires_at=expires)
+        )
+    storage.revoke_refresh_token("rt_a1")
+
+    assert storage.revoke_client_refresh_tokens("a") == 1
+    assert storage.get_refresh_token("rt_a2") is None
+    assert storage.get_refresh_token("rt_b").client_id == "b"
+    assert storage.revoke_client_refresh_tokens("a") == 0
+
+
+def test_sqlite_access_token_lookup(sqlite_storage):
+    sqlite_storage.save_access_token(_access_token("at_1", timedelta(hours=1)))
+
+    assert sqlite_storage.get_access_token("at_1").client_id == "client_1"
+    assert sqlite_storage.get_access_token("missing") is None
+
+
+def test_sqlite_writes_purge_expired_rows(sqlite_storage):
+    sqlite_storage.save_access_token(_access_token("at_old", timedelta(seconds=-5)))
+    sqlite_storage.save_access_token(_access_token("at_new", timedelta(hours=1)))
+
+    rows = sqlite_storage._conn.execute("SELECT token FROM oauth_access_tokens").fetchall()
+    assert [r[0] for r in rows] == ["at_new"]
+
+
+def test_sqlite_cleanup_expired(sqlite_storage):
+    sqlite_storage.save_refresh_token(
+        RefreshToken(
+            token="rt_old",
+            client_id="client_1",
+            expires_at=datetime.now(UTC) + timedelta(seconds=1),
+        )
+    )
+    sqlite_storage._conn.execute("UPDATE oauth_refresh_tokens SET expires_at = 0")
+
+    sqlite_storage.cleanup_expired()
+
+    count = sqlite_storage._conn.execute("SELECT COUNT(*) FROM oauth_refresh_tokens").fetchone()
+    assert count[0] == 0
+
+
+def test_sqlite_imports_legacy_json_files():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy = JSONStorage(tmpdir)
+        legacy.save_access_token(_access_token("at_legacy", timedelta(hours=1)))
+
+        backend = SQLiteStorage(tmpdir)
+        try:
+            assert backend.get_access_token("at_legacy") is not None
+        finally:
+            backend.close()
+
+
+def test_get_storage_defaults_to_sqlite(monkeypatch, tmp_path):
+    monkeypatch.delenv("OAUTH_STORAGE_TYPE", raising=False)
+    monkeypatch.setenv("OAUTH_STORAGE_PATH", str(tmp_path))
+
+    backend = get_storage()
+    try:
+        assert isinstance(backend, SQLiteStorage)
+    finally:
+        backend.close()
@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import tempfile
 
 import jwt
@@ -76,3 +77,39 @@ def test_refresh_token_reuse_detection(token_manager):
     # Attempt reuse
     with pytest.raises(SecurityError, match="reuse detected"):
         token_manager.rotate_refresh_token(refresh_token, "client")
+
+
+def test_reuse_revokes_the_clients_other_refresh_tokens(token_manager):
+    """A replayed token revokes every refresh token of its client, not others'"""
+    stolen = token_manager.generate_refresh_token("client", "at")
+    other_session = token_manager.generate_refresh_token("client", "at")
+    other_client = token_manager.generate_refresh_token("other", "at")
+    rotated = token_manager.rotate_refresh_token(stolen, "client")["refresh_token"]
+
+    # The client_id argument is not trusted: the token's owner is revoked
+    with pytest.raises(SecurityError, match="reuse detected"):
+        token_manager.rotate_refresh_token(stolen, "other")
+
+    for token in (rotated, other_session):
+        with pytest.raises(SecurityError):
+            token_manager.rotate_refresh_token(token, "client")
+    assert token_manager.rotate_refresh_token(other_client, "other")["refresh_token"]
+
+
+def test_failed_revocation_is_not_treated_as_reuse(token_manager, monkeypatch):
+    """A storage error during rotation must not revoke the client's tokens"""
+    refresh_token = token_manager.generate_refresh_token("client", "at")
+    other_session = token_manager.generate_refresh_token("client", "at")
+    storage = token_manager.storage
+
+    def locked(sql, params, table):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(storage, "_write_or_raise", locked)
+    with pytest.raises(sqlite3.OperationalError):
+        token_manager.rotate_refresh_token(refresh_token, "client")
+    monkeypatch.undo()
+
+    assert not storage.get_refresh_token(refresh_token).revoked
+    assert token_manager.rotate_refresh_token(other_session, "client")["refresh_token"]
+    assert token_manager.rotate_refresh_token(refresh_token, "client")["refresh_token"]
@@ -0,0 +1,169 @@
+"""Auto-pagination (core/pagination.py) and the client iterators built on it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from core.pagination import Page, collect, iter_cursor, iter_numbered, pages_for
+from plugins.gitea.client import GiteaClient
+from plugins.n8n.client import N8nClient
+from plugins.supabase.client import SupabaseClient
+from plugins.wordpress.client import WordPressClient
+from plugins.wordpress.handlers.posts import PostsHandler
+
+
+def _numbered(total: int, per_page: int, *, known: bool = True, log: list | None = None):
+    """Fake page-number API over ``range(total)``; tracks concurrency in ``log``."""
+    state = {"active": 0, "peak": 0}
+
+    async def fetch(page: int) -> Page:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        if log is not None:
+            log.append(page)
+        # Later pages answer faster, so ordering must not rely on completion
+        await asyncio.sleep(0.01 / page)
+        state["active"] -= 1
+        items = list(range(total))[(page - 1) * per_page : page * per_page]
+        return Page(items=items, total_pages=pages_for(total, per_page) if known else None)
+
+    return fetch, state
+
+
+async def _all(iterator) -> list:
+    return [item async for item in iterator]
+
+
+class TestIterNumbered:
+    async def test_known_total_fetches_concurrently_in_order(self):
+        fetch, state = _numbered(95, 10)
+        assert await _all(iter_numbered(fetch, per_page=10, concurrency=3)) == list(range(95))
+        assert state["peak"] == 3
+
+    async def test_unknown_total_stops_at_short_page(self):
+        log: list[int] = []
+        fetch, state = _numbered(25, 10, known=False, log=log)
+        assert await _all(iter_numbered(fetch, per_page=10)) == list(range(25))
+        assert log == [1, 2, 3]
+        assert state["peak"] == 1
+
+    async def test_early_stop_cancels_pending_pages(self):
+        log: list[int] = []
+        fetch, _ = _numbered(1000, 10, log=log)
+        result = await collect(iter_numbered(fetch, per_page=10, concurrency=2), max_items=15)
+        assert result["items"] == list(range(15))
+        assert result["truncated_reason"] == "max_items"
+        assert max(log) <= 4
+
+
+class TestIterCursor:
+    async def test_follows_next_cursor(self):
+        pages = {None: ([1, 2], "b"), "b": ([3], "c"), "c": ([4], None)}
+
+        async def fetch(cursor):
+            items, nxt = pages[cursor]
+            return Page(items=items, next_cursor=nxt)
+
+        assert await _all(iter_cursor(fetch)) == [1, 2, 3, 4]
+
+
+class TestCollect:
+    async def test_byte_budget(self):
+        async def items():
+            for i in range(100):
+                yield {"id": i, "pad": "x" * 90}
+
+        result = await collect(items(), max_items=None, max_bytes=1000)
+        assert 0 < result["count"] < 100
+        assert result["truncated_reason"] == "max_bytes"
+        assert len(json.dumps(result["items"])) <= 1000 + 2 * result["count"]
+
+    async def test_transform_and_complete(self):
+        async def items():
+            for i in range(3):
+                yield {"id": i, "big": "x" * 1000}
+
+        result = await collect(items(), max_bytes=100, transform=lambda d: d["id"])
+        assert result["items"] == [0, 1, 2]
+        assert result["truncated"] is False
+
+
+class TestClientIterators:
+    async def test_wordpress_uses_total_header(self, monkeypatch):
+        client = WordPressClient(site_url="https://wp.test", username="u", app_password="p")
+        calls = []
+
+        async def fake_request(method, endpoint, params=None, **kw):
+            assert kw["return_headers"] is True
+            calls.append(params["page"])
+            start = (params["page"] - 1) * params["per_page"]
+            return list(range(250))[start : start + params["per_page"]], {"x-wp-total": "250"}
+
+        monkeypatch.setattr(client, "request", fake_request)
+        assert await _all(client.iter_items("posts", {"status": "any"})) == list(range(250))
+        assert sorted(calls) == [1, 2, 3]
+
+    async def test_gitea_follows_server_page_cap(self, monkeypatch):
+        client = GiteaClient(site_url="https://git.test", token="t")
+
+        async def fake_request(method, endpoint, params=None, **kw):
+            cap = 20  # MAX_RESPONSE_ITEMS below the requested limit
+            start = (params["page"] - 1) * cap
+            return list(range(45))[start : start + cap], {"x-total-count": "45"}
+
+        monkeypatch.setattr(client, "request", fake_request)
+        assert await _all(client.iter_repositories()) == list(range(45))
+
+    async def test_supabase_follows_max_rows(self, monkeypatch):
+        client = SupabaseClient(base_url="https://sb.test", anon_key="a", service_role_key="s")
+        seen = []
+
+        async def fake_request(method, endpoint, params=None, headers_override=None, **kw):
+            seen.append((params["offset"], headers_override.get("Prefer")))
+            offset = params["offset"]
+            rows = list(range(250))[offset : offset + min(params["limit"], 100)]
+            return rows, {"content-range": f"{offset}-{offset + 99}/250"}
+
+        monkeypatch.setattr(client, "request", fake_request)
+        assert await _all(client.iter_rows("items", order="id.asc")) == list(range(250))
+        assert sorted(seen) == [(0, "count=exact"), (100, None), (200, None)]
+
+    async def test_n8n_cursor(self, monkeypatch):
+        client = N8nClient(site_url="https://n8n.test", api_key="k")
+
+        async def fake_request(method, endpoint, params=None, **kw):
+            if params["cursor"] is None:
+                return {"data": [{"id": "1"}], "nextCursor": "abc"}
+            return {"data": [{"id": "2"}], "nextCursor": None}
+
+        monkeypatch.setattr(client, "request", fake_request)
+        assert [w["id"] for w in await _all(client.iter_workflows(active=True))] == ["1", "2"]
+
+
+@pytest.mark.parametrize("max_items,expected", [(None, 3), (2, 2)])
+async def test_list_posts_fetch_all(monkeypatch, max_items, expected):
+    client = WordPressClient(site_url="https://wp.test", username="u", app_password="p")
+
+    async def fake_request(method, endpoint, params=None, **kw):
+        posts = [
+            {
+                "id": i,
+                "title": {"rendered": f"Post {i}"},
+                "excerpt": {"rendered": ""},
+                "status": "publish",
+                "date": "2026-01-01T00:00:00",
+                "link": f"https://wp.test/?p={i}",
+            }
+            for i in range(3)
+        ]
+        return posts, {"x-wp-total": "3"}
+
+    monkeypatch.setattr(client, "request", fake_request)
+    out = json.loads(await PostsHandler(client).list_posts(fetch_all=True, max_items=max_items))
+    assert out["fetch_all"] is True
+    assert out["total"] == expected
+    assert out["truncated"] is (expected < 3)
+    assert [p["title"] for p in out["posts"]] == [f"Post {i}" for i in range(expected)]
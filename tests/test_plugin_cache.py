@@ -0,0 +1,168 @@
+"""Tests for the plugin-instance cache (core/plugin_cache.py)."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.plugin_cache import (
+    PluginInstanceCache,
+    config_fingerprint,
+    get_plugin_instance_cache,
+    set_plugin_instance_cache,
+)
+from core.site_manager import SiteConfig, SiteManager
+from core.tool_generator import ToolGenerator
+from plugins.base import BasePlugin
+
+
+class _CountingFactory:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return object()
+
+
+@pytest.fixture
+def cache():
+    c = PluginInstanceCache(max_size=3, idle_ttl=60)
+    set_plugin_instance_cache(c)
+    yield c
+    set_plugin_instance_cache(None)
+
+
+class TestFingerprint:
+    def test_stable_across_key_order(self):
+        assert config_fingerprint({"a": 1, "b": 2}) == config_fingerprint({"b": 2, "a": 1})
+
+    def test_changes_with_credentials(self):
+        assert config_fingerprint({"app_password": "x"}) != config_fingerprint(
+            {"app_password": "y"}
+        )
+
+
+class TestPluginInstanceCache:
+    def test_hit_reuses_instance(self, cache):
+        factory = _CountingFactory()
+        a = cache.get_or_create("wordpress", "s1", {"url": "u"}, factory)
+        b = cache.get_or_create("wordpress", "s1", {"url": "u"}, factory)
+        assert a is b
+        assert factory.calls == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_credential_change_misses(self, cache):
+        factory = _CountingFactory()
+        a = cache.get_or_create("wordpress", "s1", {"app_password": "old"}, factory)
+        b = cache.get_or_create("wordpress", "s1", {"app_password": "new"}, factory)
+        assert a is not b
+        assert factory.calls == 2
+
+    def test_plugin_type_is_part_of_key(self, cache):
+        factory = _CountingFactory()
+        cache.get_or_create("wordpress", "s1", {}, factory)
+        cache.get_or_create("woocommerce", "s1", {}, factory)
+        assert factory.calls == 2
+
+    def test_lru_bound(self, cache):
+        factory = _CountingFactory()
+        for site in ("s1", "s2", "s3"):
+            cache.get_or_create("wordpress", site, {}, factory)
+        # Touch s1 so s2 becomes least recently used
+        cache.get_or_create("wordpress", "s1", {}, factory)
+        cache.get_or_create("wordpress", "s4", {}, factory)
+        assert len(cache) == 3
+        cache.get_or_create("wordpress", "s1", {}, factory)
+        assert factory.calls == 4
+        cache.get_or_create("wordpress", "s2", {}, factory)
+        assert factory.calls == 5
+
+    def test_idle_eviction(self, cache):
+        factory = _CountingFactory()
+        with patch("core.plugin_cache.time.monotonic", return_value=1000.0):
+            cache.get_or_create("wordpress", "s1", {}, factory)
+        with patch("core.plugin_cache.time.monotonic", return_value=1000.0 + 61):
+            cache.get_or_create("wordpress", "s2", {}, factory)
+        assert len(cache) == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_site(self, cache):
+        factory = _CountingFactory()
+        cache.get_or_create("wordpress", "s1", {"v": 1}, factory)
+        cache.get_or_create("wordpress_specialist", "s1", {"v": 1}, factory)
+        cache.get_or_create("wordpress", "s2", {"v": 1}, factory)
+        assert cache.invalidate_site("s1") == 2
+        assert len(cache) == 1
+
+    def test_factory_error_not_cached(self, cache):
+        def boom():
+            raise ValueError("bad config")
+
+        with pytest.raises(ValueError):
+            cache.get_or_create("wordpress", "s1", {}, boom)
+        assert len(cache) == 0
+
+    def test_disabled_when_size_zero(self):
+        c = PluginInstanceCache(max_size=0)
+        factory = _CountingFactory()
+        c.get_or_create("wordpress", "s1", {}, factory)
+        c.get_or_create("wordpress", "s1", {}, factory)
+        assert factory.calls == 2
+        assert len(c) == 0
+
+    def test_singleton(self):
+        set_plugin_instance_cache(None)
+        assert get_plugin_instance_cache() is get_plugin_instance_cache()
+        set_plugin_instance_cache(None)
+
+
+class _DummyPlugin(BasePlugin):
+    instances = 0
+
+    def __init__(self, config, project_id=None):
+        type(self).instances += 1
+        super().__init__(config, project_id)
+
+    def get_plugin_name(self) -> str:
+        return "dummy"
+
+    @staticmethod
+    def get_tool_specifications():
+        return [
+            {
+                "name": "ping",
+                "method_name": "ping",
+                "description": "Ping",
+                "schema": {"type": "object", "properties": {}},
+            }
+        ]
+
+    async def ping(self):
+        return id(self)
+
+
+class TestToolGeneratorReuse:
+    async def test_handler_reuses_plugin_instance(self, cache):
+        sm = SiteManager()
+        sm.register_site(SiteConfig(site_id="site1", plugin_type="dummy", url="https://a.test"))
+        tools = ToolGenerator(sm).generate_tools(_DummyPlugin, "dummy")
+        handler = tools[0].handler
+        _DummyPlugin.instances = 0
+
+        first = await handler(site="site1")
+        second = await handler(site="site1")
+
+        assert first == second
+        assert _DummyPlugin.instances == 1
+
+
+class TestSiteApiInvalidation:
+    async def test_delete_user_site_invalidates(self, cache):
+        from core.site_api import delete_user_site
+
+        cache.get_or_create("wordpress", "site-uuid-1", {}, _CountingFactory())
+        db = AsyncMock()
+        db.delete_site = AsyncMock(return_value=True)
+        with patch("core.database.get_database", return_value=db):
+            assert await delete_user_site("site-uuid-1", "user-1") is True
+        assert len(cache) == 0
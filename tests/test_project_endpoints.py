@@ -0,0 +1,186 @@
+"""Tests for lazy per-project endpoints (core/project_endpoints.py)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from core.project_endpoints import (
+    LazyProjectEndpoint,
+    ProjectEndpointRegistry,
+    clear_site_locked_schemas,
+    site_locked_schema,
+)
+
+
+class FakeApp:
+    """ASGI app with a lifespan that records whether it is running."""
+
+    def __init__(self):
+        self.running = False
+        self.lifespan_task = None
+        self.calls = 0
+
+    @asynccontextmanager
+    async def lifespan_handler(self, app):
+        self.running = True
+        self.lifespan_task = asyncio.current_task()
+        try:
+            yield
+        finally:
+            # Must exit in the task that entered (anyio task groups require it)
+            assert asyncio.current_task() is self.lifespan_task
+            self.running = False
+
+    async def __call__(self, scope, receive, send):
+        assert self.running
+        self.calls += 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+class Factory:
+    def __init__(self):
+        self.apps = []
+
+    def __call__(self):
+        app = FakeApp()
+        self.apps.append(app)
+        return app
+
+
+async def _request(endpoint):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await endpoint({"type": "http", "path": "/mcp"}, receive, send)
+    return sent
+
+
+@pytest.fixture(autouse=True)
+def _clear_schemas():
+    clear_site_locked_schemas()
+    yield
+    clear_site_locked_schemas()
+
+
+class TestSiteLockedSchema:
+    def test_strips_site(self):
+        schema = {
+            "type": "object",
+            "properties": {"site": {"type": "string"}, "post_id": {"type": "integer"}},
+            "required": ["site", "post_id"],
+        }
+        locked = site_locked_schema("wordpress_get_post", schema)
+        assert list(locked["properties"]) == ["post_id"]
+        assert locked["required"] == ["post_id"]
+        # Source schema is untouched
+        assert "site" in schema["properties"]
+        assert schema["required"] == ["site", "post_id"]
+
+    def test_shared_across_calls(self):
+        schema = {"properties": {"site": {}, "q": {}}, "required": ["site"]}
+        first = site_locked_schema("t", schema)
+        assert site_locked_schema("t", schema) is first
+
+    def test_recomputed_when_source_changes(self):
+        first = site_locked_schema("t", {"properties": {"site": {}, "a": {}}})
+        second = site_locked_schema("t", {"properties": {"site": {}, "b": {}}})
+        assert second is not first
+        assert list(second["properties"]) == ["b"]
+
+
+class TestLazyProjectEndpoint:
+    async def test_built_on_first_request_only(self):
+        factory = Factory()
+        endpoint = LazyProjectEndpoint("wordpress_site1", factory)
+        assert not endpoint.materialized
+        assert factory.apps == []
+
+        sent = await _request(endpoint)
+        await _request(endpoint)
+
+        assert sent[0]["status"] == 200
+        assert len(factory.apps) == 1
+        assert factory.apps[0].calls == 2
+        assert endpoint.materializations == 1
+        await endpoint.close()
+
+    async def test_concurrent_first_requests_build_once(self):
+        factory = Factory()
+        endpoint = LazyProjectEndpoint("wordpress_site1", factory)
+        await asyncio.gather(*(_request(endpoint) for _ in range(5)))
+        assert len(factory.apps) == 1
+        await endpoint.close()
+
+    async def test_close_stops_lifespan_and_rebuilds(self):
+        factory = Factory()
+        endpoint = LazyProjectEndpoint("wordpress_site1", factory)
+        await _request(endpoint)
+        assert await endpoint.close()
+        assert not factory.apps[0].running
+        assert not endpoint.materialized
+        assert not await endpoint.close()
+
+        await _request(endpoint)
+        assert len(factory.apps) == 2
+        await endpoint.close()
+
+    async def test_lifespan_failure_propagates(self):
+        class BrokenApp(FakeApp):
+            @asynccontextmanager
+            async def lifespan_handler(self, app):
+                raise RuntimeError("boom")
+                yield
+
+        endpoint = LazyProjectEndpoint("wordpress_site1", BrokenApp)
+        with pytest.raises(RuntimeError, match="boom"):
+            await endpoint.materialize()
+        assert not endpoint.materialized
+
+    async def test_lifespan_scope_is_ignored(self):
+        factory = Factory()
+        endpoint = LazyProjectEndpoint("wordpress_site1", factory)
+        await endpoint({"type": "lifespan"}, None, None)
+        assert factory.apps == []
+
+
+class TestProjectEndpointRegistry:
+    async def test_evicts_idle_endpoints(self):
+        registry = ProjectEndpointRegistry(idle_ttl=0.01)
+        factory = Factory()
+        endpoint = registry.add(LazyProjectEndpoint("wordpress_site1", factory))
+        untouched = registry.add(LazyProjectEndpoint("wordpress_site2", Factory()))
+        await _request(endpoint)
+
+        assert await registry.evict_idle() == 0
+        await asyncio.sleep(0.02)
+        assert await registry.evict_idle() == 1
+        assert not endpoint.materialized
+        assert not untouched.materialized
+        assert registry.stats() == {"registered": 2, "materialized": 0, "evictions": 1}
+
+    async def test_busy_endpoint_is_not_evicted(self):
+        registry = ProjectEndpointRegistry(idle_ttl=0.0001)
+        endpoint = registry.add(LazyProjectEndpoint("wordpress_site1", Factory()))
+        await endpoint.materialize()
+        endpoint.active_requests = 1
+        await asyncio.sleep(0.01)
+        assert await registry.evict_idle() == 0
+        endpoint.active_requests = 0
+        await registry.stop()
+        assert not endpoint.materialized
+
+    async def test_zero_ttl_disables_eviction(self):
+        registry = ProjectEndpointRegistry(idle_ttl=0)
+        endpoint = registry.add(LazyProjectEndpoint("wordpress_site1", Factory()))
+        await endpoint.materialize()
+        assert await registry.evict_idle() == 0
+        await registry.start()
+        await registry.stop()
+        assert not endpoint.materialized
@@ -1,8 +1,17 @@
 """Tests for Rate Limiter (core/rate_limiter.py)."""
 
+from unittest.mock import patch
+
 import pytest
 
-from core.rate_limiter import ClientRateLimitState, RateLimitConfig, RateLimiter, TokenBucket
+from core.rate_limiter import (
+    ClientRateLimitState,
+    RateLimitConfig,
+    RateLimiter,
+    SlidingWindowCounter,
+    TokenBucket,
+    client_key,
+)
 
 
 class TestRateLimitConfig:
@@ -74,6 +83,42 @@ class TestTokenBucket:
         assert wait > 0
 
 
+class TestSlidingWindowCounter:
+    """Test the sliding-window counter."""
+
+    def test_limit_within_window(self):
+        counter = SlidingWindowCounter(capacity=3, window=60.0, window_start=1000.0)
+        with patch("core.rate_limiter.time.time", return_value=1010.0):
+            assert [counter.consume() for _ in range(4)] == [True, True, True, False]
+            assert counter.get_available_tokens() == 0
+
+    def test_previous_window_weighs_in(self):
+        counter = SlidingWindowCounter(capacity=4, window=60.0, window_start=1000.0)
+        with patch("core.rate_limiter.time.time", return_value=1010.0):
+            for _ in range(4):
+                counter.consume()
+        # Halfway through the next window: 4 * 0.5 = 2 still count.
+        with patch("core.rate_limiter.time.time", return_value=1090.0):
+            assert counter.get_available_tokens() == 2
+            assert counter.consume() and counter.consume()
+            assert not counter.consume()
+            assert 0 < counter.get_wait_time() <= 30.0
+
+    def test_idle_after_two_windows(self):
+        counter = SlidingWindowCounter(capacity=4, window=60.0, window_start=1000.0)
+        with patch("core.rate_limiter.time.time", return_value=1010.0):
+            counter.consume()
+            assert not counter.is_idle()
+        with patch("core.rate_limiter.time.time", return_value=1125.0):
+            assert counter.is_idle()
+
+    def test_refund(self):
+        counter = SlidingWindowCounter(capacity=1, window=60.0)
+        assert counter.consume()
+        counter.refund()
+        assert counter.consume()
+
+
 class TestClientRateLimitState:
     """Test per-client rate limit state."""
 
@@ -130,7 +175,7 @@ class TestRateLimiter:
         limiter.check_rate_limit("client1")
         stats = limiter.get_client_stats("client1")
         assert stats is not None
-        assert stats["client_id"] == "client1"
+        assert stats["client_id"] == client_key("client1")
 
     def test_get_client_stats_unknown(self, limiter):
         assert limiter.get_client_stats("unknown") is None
@@ -162,3 +207,31 @@ class TestRateLimiter:
         limiter.configure_limits("n8n", per_minute=10, per_hour=50)
         assert limiter.plugin_configs["n8n"].per_minute == 10
         assert limiter.plugin_configs["n8n"].per_hour == 50
+
+    def test_clients_keyed_by_hash(self, limiter):
+        limiter.check_rate_limit("cmp_secret_token")
+        assert list(limiter.clients) == [client_key("cmp_secret_token")]
+        assert "cmp_secret_token" not in str(limiter.get_all_stats())
+        # Stats and reset accept the hashed key shown in stats, too
+        assert limiter.reset_client(client_key("cmp_secret_token")) is True
+
+    def test_explicit_config_applies_to_existing_state(self, limiter):
+        limiter.check_rate_limit("client1", config=RateLimitConfig(per_minute=5))
+        allowed, msg, _ = limiter.check_rate_limit("client1", config=RateLimitConfig(per_minute=1))
+        assert allowed is False
+        assert "per minute" in msg
+
+    def test_max_clients_drops_least_recent(self):
+        limiter = RateLimiter(max_clients=2)
+        for client in ("a", "b", "a", "c"):
+            limiter.check_rate_limit(client)
+        assert set(limiter.clients) == {client_key("a"), client_key("c")}
+
+    def test_idle_clients_evicted_on_schedule(self):
+        with patch("core.rate_limiter.time.time", return_value=1000.0):
+            limiter = RateLimiter(sweep_interval=0)
+            limiter.check_rate_limit("old")
+        # Two days later every window of "old" has drained.
+        with patch("core.rate_limiter.time.time", return_value=1000.0 + 2 * 86400 + 1):
+            limiter.check_rate_limit("new")
+        assert list(limiter.clients) == [client_key("new")]
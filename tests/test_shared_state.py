@@ -0,0 +1,218 @@
+"""Tests for cross-worker shared state (core/shared_state.py)."""
+
+import asyncio
+import time
+
+import pytest
+
+from core import shared_state
+from core.rate_limiter import RateLimitConfig, RateLimiter
+from core.shared_state import SharedState
+from core.tool_rate_limiter import PerToolRateLimiter, ToolRateLimitError
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two stores on one database, as two worker processes would open it."""
+    path = tmp_path / "shared_state.db"
+    a = SharedState(path, poll_interval=0)
+    b = SharedState(path, poll_interval=0)
+    yield a, b
+    a.close()
+    b.close()
+
+
+@pytest.fixture
+def handlers():
+    saved = dict(shared_state._handlers)
+    shared_state._handlers.clear()
+    yield shared_state._handlers
+    shared_state._handlers.clear()
+    shared_state._handlers.update(saved)
+
+
+class TestConsumeWindows:
+    def test_limit_is_shared_between_workers(self, workers):
+        a, b = workers
+        limits = [(3, 60.0)]
+        assert a.consume_windows("k", limits)[1] is None
+        assert b.consume_windows("k", limits)[1] is None
+        assert a.consume_windows("k", limits)[1] is None
+        counters, rejected = b.consume_windows("k", limits)
+        assert rejected == 0
+        assert counters[0].current == 3
+        assert counters[0].get_wait_time() > 0
+
+    def test_rejection_refunds_earlier_windows(self, workers):
+        a, _ = workers
+        limits = [(10, 60.0), (1, 3600.0)]
+        assert a.consume_windows("k", limits)[1] is None
+        counters, rejected = a.consume_windows("k", limits)
+        assert rejected == 1
+        assert counters[0].current == 1
+
+    def test_reset_windows_by_prefix(self, workers):
+        a, b = workers
+        a.consume_windows("mcp:x", [(1, 60.0)])
+        a.consume_windows("user:x", [(1, 60.0)])
+        assert b.reset_windows("mcp:") == 1
+        assert a.consume_windows("mcp:x", [(1, 60.0)])[1] is None
+        assert a.consume_windows("user:x", [(1, 60.0)])[1] == 0
+
+
+class TestInvalidations:
+    def test_poll_applies_other_workers_events(self, workers, handlers):
+        a, b = workers
+        seen = []
+        shared_state.subscribe_invalidation("user_key", seen.append)
+        a.publish("user_key", "key-1")
+        assert a.poll() == 0  # own events are skipped
+        assert b.poll() == 1
+        assert seen == ["key-1"]
+        assert b.poll() == 0
+
+    def test_new_worker_skips_old_events(self, workers, handlers, tmp_path):
+        a, _ = workers
+        a.publish("user_key", "key-1")
+        late = SharedState(a.db_path, poll_interval=0)
+        try:
+            assert late.poll() == 0
+        finally:
+            late.close()
+
+    def test_poll_is_throttled(self, workers, handlers):
+        a, b = workers
+        b.poll_interval = 60
+        b.poll()
+        a.publish("user_key", "key-1")
+        assert b.poll() == 0
+        assert b.poll(force=True) == 1
+
+    def test_failing_handler_does_not_stop_dispatch(self, workers, handlers):
+        a, b = workers
+        seen = []
+
+        def broken(_key):
+            raise ValueError("boom")
+
+        shared_state.subscribe_invalidation("credentials", broken)
+        shared_state.subscribe_invalidation("credentials", seen.append)
+        a.publish("credentials", "site-1")
+        b.poll()
+        assert seen == ["site-1"]
+
+    def test_module_helpers_are_noops_without_shared_state(self, handlers):
+        shared_state.set_shared_state(None)
+        shared_state.publish_invalidation("user_key", "key-1")
+        shared_state.poll_invalidations()
+
+
+class TestMetrics:
+    def test_aggregate_sums_live_workers(self, workers):
+        a, b = workers
+        a.put_metrics("health", {"total_requests": 5, "label": "x"})
+        totals = b.aggregate_metrics("health", {"total_requests": 2})
+        assert totals == {"total_requests": 7, "workers": 2}
+
+    def test_stale_snapshots_are_ignored(self, workers):
+        a, b = workers
+        a.put_metrics("health", {"total_requests": 5})
+        b.metrics_stale_after = -1
+        totals = b.aggregate_metrics("health", {"total_requests": 2})
+        assert totals == {"total_requests": 2, "workers": 1}
+
+    def test_purge_drops_drained_windows(self, workers):
+        a, _ = workers
+        a.consume_windows("k", [(1, 0.001)])
+        time.sleep(0.01)
+        a.purge()
+        count = a._conn.execute("SELECT COUNT(*) FROM rate_windows").fetchone()[0]
+        assert count == 0
+
+
+class TestSharedLimiters:
+    def test_rate_limiter_enforces_one_limit_across_workers(self, workers):
+        a, b = workers
+        config = RateLimitConfig(per_minute=2, per_hour=100, per_day=1000)
+        first = RateLimiter(shared=a)
+        second = RateLimiter(shared=b)
+        assert first.check_rate_limit("token", config=config)[0]
+        assert second.check_rate_limit("token", config=config)[0]
+        allowed, message, retry_after = first.check_rate_limit("token", config=config)
+        assert not allowed
+        assert "per minute" in message
+        assert retry_after > 0
+        stats = first.get_client_stats("token")
+        assert stats["available_tokens"]["per_minute"] == 0
+        b.put_metrics("rate_limiter", second.metrics_snapshot())  # as SharedStateTask does
+        totals = first.get_all_stats()["global"]
+        assert totals["total_requests"] == 3
+        assert totals["workers"] == 2
+
+    def test_namespaces_are_independent(self, workers):
+        a, _ = workers
+        config = RateLimitConfig(per_minute=1, per_hour=100, per_day=1000)
+        assert RateLimiter(shared=a).check_rate_limit("id", config=config)[0]
+        assert RateLimiter(namespace="user", shared=a).check_rate_limit("id", config=config)[0]
+
+    def test_reset_client_clears_shared_counters(self, workers):
+        a, b = workers
+        config = RateLimitConfig(per_minute=1, per_hour=100, per_day=1000)
+        first = RateLimiter(shared=a)
+        assert first.check_rate_limit("token", config=config)[0]
+        assert not RateLimiter(shared=b).check_rate_limit("token", config=config)[0]
+        assert first.reset_client("token")
+        assert RateLimiter(shared=b).check_rate_limit("token", config=config)[0]
+
+    def test_per_tool_limit_is_shared(self, workers):
+        a, b = workers
+        limits = {"expensive_tool": 1}
+        PerToolRateLimiter(limits, shared=a).check("expensive_tool", "user-1")
+        with pytest.raises(ToolRateLimitError) as exc:
+            PerToolRateLimiter(limits, shared=b).check("expensive_tool", "user-1")
+        assert exc.value.retry_after_seconds > 0
+
+    async def test_async_checks_wait_for_the_write_lock_off_the_loop(self, workers):
+        a, b = workers
+        config = RateLimitConfig(per_minute=1, per_hour=100, per_day=1000)
+        b._conn.execute("BEGIN IMMEDIATE")  # another worker mid-transaction
+        limiter = RateLimiter(shared=a)
+        check = asyncio.create_task(limiter.check_rate_limit_async("t", config=config))
+        tool = asyncio.create_task(
+            PerToolRateLimiter({"expensive_tool": 1}, shared=a).check_async("expensive_tool", "u")
+        )
+        await asyncio.sleep(0.05)  # the loop keeps running while both wait
+        assert not check.done() and not tool.done()
+        b._conn.execute("COMMIT")
+        assert (await check)[0]
+        await tool
+
+    async def test_loop_calls_do_not_queue_behind_a_waiting_write(self, workers, handlers):
+        a, b = workers
+        seen: list[str] = []
+        shared_state.subscribe_invalidation("user_key", seen.append)
+        b.publish("user_key", "before")
+        b._conn.execute("BEGIN IMMEDIATE")  # another worker mid-transaction
+        # This worker's rate check now waits for the lock in a thread
+        check = asyncio.create_task(a.consume_windows_async("k", [(5, 60.0)]))
+        await asyncio.sleep(0.05)
+
+        shared_state.set_shared_state(a)
+        try:
+            start = time.monotonic()
+            assert a.poll(force=True) == 1
+            assert a.aggregate_metrics("health", {"total_requests": 1})["workers"] == 1
+            shared_state.publish_invalidation("user_key", "after")
+            assert time.monotonic() - start < 0.5
+        finally:
+            shared_state.set_shared_state(None)
+        assert seen == ["before"]
+        assert not check.done()
+
+        b._conn.execute("COMMIT")
+        assert (await check)[1] is None
+        for _ in range(100):  # the publish lands once the lock is free
+            if b.poll(force=True):
+                break
+            await asyncio.sleep(0.01)
+        assert seen == ["before", "after"]
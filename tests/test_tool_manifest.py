@@ -0,0 +1,181 @@
+"""Tests for lazy plugin loading (plugins/base.py, core/tool_manifest.py, core/import_report.py)."""
+
+import sys
+import textwrap
+
+import pytest
+
+import plugins
+from core import tool_manifest
+from core.import_report import format_report, parse_importtime
+from core.site_manager import SiteConfig, SiteManager
+from core.tool_generator import ToolGenerator
+from plugins.base import PluginRegistry
+
+_PLUGIN_SOURCE = textwrap.dedent("""
+    from plugins.base import BasePlugin
+
+    class LazyDummyPlugin(BasePlugin):
+        def get_plugin_name(self):
+            return "lazydummy"
+
+        @staticmethod
+        def get_tool_specifications():
+            return [
+                {
+                    "name": "ping",
+                    "method_name": "ping",
+                    "description": "Ping",
+                    "schema": {"type": "object", "properties": {}},
+                }
+            ]
+
+        async def ping(self):
+            return "pong"
+    """)
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """A plugin module on sys.path that has not been imported yet."""
+    (tmp_path / "lazy_dummy_plugin.py").write_text(_PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_dummy_plugin"
+    sys.modules.pop("lazy_dummy_plugin", None)
+
+
+@pytest.fixture
+def registry(lazy_module, monkeypatch):
+    reg = PluginRegistry()
+    reg.register_lazy("lazydummy", f"{lazy_module}:LazyDummyPlugin")
+    monkeypatch.setattr(plugins, "registry", reg)
+    return reg
+
+
+@pytest.fixture
+def manifest_paths(tmp_path, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "plugin.py").write_text("x = 1\n")
+    monkeypatch.setattr(tool_manifest, "PLUGINS_DIR", src)
+    monkeypatch.setattr(tool_manifest, "MANIFEST_PATH", tmp_path / "tool_manifest.json")
+    tool_manifest.clear_manifest_cache()
+    yield src, tmp_path / "tool_manifest.json"
+    tool_manifest.clear_manifest_cache()
+
+
+class TestLazyRegistry:
+    def test_register_lazy_does_not_import(self, registry, lazy_module):
+        assert registry.is_registered("lazydummy")
+        assert registry.get_class_path("lazydummy") == f"{lazy_module}:LazyDummyPlugin"
+        assert lazy_module not in sys.modules
+
+    def test_get_plugin_class_imports_once(self, registry, lazy_module):
+        cls = registry.get_plugin_class("lazydummy")
+        assert cls.__name__ == "LazyDummyPlugin"
+        assert lazy_module in sys.modules
+        assert registry.get_plugin_class("lazydummy") is cls
+        instance = registry.create_instance("lazydummy", "p1", {"url": "https://a.test"})
+        assert isinstance(instance, cls)
+
+    def test_unknown_type(self, registry):
+        with pytest.raises(KeyError):
+            registry.get_plugin_class("nope")
+        with pytest.raises(KeyError):
+            registry.get_class_path("nope")
+
+    def test_package_registers_all_plugins_lazily(self):
+        assert len(plugins.registry.get_registered_types()) == 8
+        assert plugins.registry.get_class_path("gitea") == "plugins.gitea.plugin:GiteaPlugin"
+
+
+class TestToolManifest:
+    def test_build_and_reuse(self, registry, manifest_paths, lazy_module):
+        _, path = manifest_paths
+        specs = tool_manifest.get_tool_specs("lazydummy")
+        assert [s["name"] for s in specs] == ["ping"]
+        assert path.exists()
+
+        # A fresh process reads the manifest without importing the plugin
+        sys.modules.pop(lazy_module)
+        tool_manifest.clear_manifest_cache()
+        assert tool_manifest.get_tool_specs("lazydummy") == specs
+        assert lazy_module not in sys.modules
+
+    def test_stale_fingerprint_rebuilds(self, registry, manifest_paths, monkeypatch):
+        src, path = manifest_paths
+        tool_manifest.load_manifest()
+        first = path.read_text()
+
+        (src / "plugin.py").write_text("x = 22\n")
+        tool_manifest.clear_manifest_cache()
+        built = []
+        real_build = tool_manifest.build_manifest
+        monkeypatch.setattr(
+            tool_manifest, "build_manifest", lambda fp: built.append(fp) or real_build(fp)
+        )
+        tool_manifest.load_manifest()
+        assert len(built) == 1
+        assert path.read_text() != first
+
+    @pytest.mark.parametrize("plugin_type", plugins.registry.get_registered_types())
+    def test_every_registered_plugin_builds_specs(self, plugin_type):
+        # build_manifest logs and drops a plugin whose specs raise; catch that here
+        plugin_class = plugins.registry.get_plugin_class(plugin_type)
+        specs = plugin_class.get_tool_specifications()
+        assert specs
+        assert all(s["name"] and s["method_name"] and "schema" in s for s in specs)
+
+    def test_unwritable_manifest_still_loads(self, registry, manifest_paths, monkeypatch):
+        _, path = manifest_paths
+        monkeypatch.setattr(tool_manifest, "MANIFEST_PATH", path / "missing" / "m.json")
+        assert tool_manifest.get_tool_specs("lazydummy")[0]["name"] == "ping"
+
+    async def test_tools_import_plugin_on_first_call(self, registry, lazy_module):
+        sm = SiteManager()
+        sm.register_site(SiteConfig(site_id="site1", plugin_type="lazydummy", url="https://a.test"))
+        specs = [
+            {
+                "name": "ping",
+                "method_name": "ping",
+                "description": "Ping",
+                "schema": {"type": "object", "properties": {}},
+            }
+        ]
+        calls = []
+
+        def load_class():
+            calls.append(1)
+            return registry.get_plugin_class("lazydummy")
+
+        tools = ToolGenerator(sm).generate_tools_from_specs("lazydummy", specs, load_class)
+        assert tools[0].name == "lazydummy_ping"
+        assert lazy_module not in sys.modules
+
+        assert await tools[0].handler(site="site1") == "pong"
+        assert calls == [1]
+
+
+class TestImportReport:
+    OUTPUT = textwrap.dedent("""\
+        import time: self [us] | cumulative | imported package
+        import time:       120 |        120 |     _io
+        import time:       300 |        900 |   encodings
+        import time:        50 |       2000 | server
+        unrelated line
+        """)
+
+    def test_parse(self):
+        timings = parse_importtime(self.OUTPUT)
+        assert [(t.module, t.depth) for t in timings] == [
+            ("_io", 2),
+            ("encodings", 1),
+            ("server", 0),
+        ]
+        assert timings[2].cumulative_us == 2000
+
+    def test_report_ranks_by_cumulative(self):
+        report = format_report(parse_importtime(self.OUTPUT), top=2).splitlines()
+        assert report[1].endswith("server")
+        assert report[2].endswith("encodings")
+        assert len(report) == 4
@@ -0,0 +1,106 @@
+"""Tests for precomputed tool metadata and the shared tool-call context."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.context import get_tool_call_context
+from core.tool_meta import (
+    build_tool_meta,
+    check_tool_visibility,
+    clear_tool_meta,
+    get_tool_meta,
+    register_tool_meta,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_table():
+    clear_tool_meta()
+    yield
+    clear_tool_meta()
+
+
+class TestToolMeta:
+    def test_plugin_tool(self):
+        meta = build_tool_meta("wordpress_create_post")
+        assert meta.plugin_type == "wordpress"
+        assert meta.required_scope == "write"
+        assert meta.is_unified and not meta.is_system
+        assert meta.project_id == "*"
+        assert meta.rate_limit_plugin_type == "wordpress"
+
+    def test_specialist_before_wordpress(self):
+        assert build_tool_meta("wordpress_specialist_wp_db_size").plugin_type == (
+            "wordpress_specialist"
+        )
+
+    def test_namespaced_system_tool(self):
+        meta = build_tool_meta("mcp__mcp-hub__list_projects")
+        assert meta.is_system
+        assert meta.plugin_type is None
+        assert not meta.is_unified
+
+    def test_admin_scope(self):
+        assert build_tool_meta("manage_api_keys_create").required_scope == "admin"
+
+    def test_unknown_name_is_unified(self):
+        assert build_tool_meta("unknown").is_unified
+
+    def test_per_site_tool(self):
+        meta = build_tool_meta("wordpress_site1_get_post")
+        assert meta.per_site_project_id == "wordpress_site1"
+        assert meta.per_site_plugin_type == "wordpress"
+
+    @pytest.mark.parametrize(
+        "tool,key_project,visible",
+        [
+            ("wordpress_list_posts", "wordpress_site1", True),
+            ("wordpress_specialist_wp_db_size", "wordpress_specialist_site1", True),
+            ("wordpress_specialist_wp_db_size", "wordpress_site1", False),
+            ("gitea_list_repos", "wordpress_site1", False),
+            ("list_projects", "wordpress_site1", False),
+            ("list_projects", "*", True),
+        ],
+    )
+    def test_visibility(self, tool, key_project, visible):
+        assert check_tool_visibility(tool, key_project) is visible
+
+    def test_registered_meta_is_reused(self):
+        registered = register_tool_meta("gitea_list_repos")
+        assert get_tool_meta("gitea_list_repos") is registered
+
+
+class TestToolCallContext:
+    def _context(self, name="wordpress_list_posts", arguments=None):
+        message = SimpleNamespace(name=name, arguments=arguments or {"site": "blog"})
+        return SimpleNamespace(message=message)
+
+    def test_built_once_per_message(self):
+        reads = []
+
+        def read_header():
+            reads.append(1)
+            return "Bearer cmp_abc"
+
+        context = self._context()
+        first = get_tool_call_context(context, read_header)
+        second = get_tool_call_context(context, read_header)
+
+        assert first is second
+        assert len(reads) == 1
+        assert first.bearer_token == "cmp_abc"
+        assert first.arguments == {"site": "blog"}
+        assert first.meta is get_tool_meta("wordpress_list_posts")
+
+    def test_new_message_rebuilds(self):
+        first = get_tool_call_context(self._context(), lambda: None)
+        second = get_tool_call_context(self._context("gitea_list_repos"), lambda: None)
+        assert second is not first
+        assert second.tool_name == "gitea_list_repos"
+        assert second.bearer_token is None
+
+    def test_legacy_params_wrapper(self):
+        params = SimpleNamespace(name="n8n_list_workflows", arguments={})
+        context = SimpleNamespace(message=SimpleNamespace(params=params))
+        assert get_tool_call_context(context, lambda: None).tool_name == "n8n_list_workflows"
@@ -0,0 +1,139 @@
+"""Tests for the memoized tools/list payloads (core/tools_list_cache.py)."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.tools_list_cache import (
+    ToolsListCache,
+    bump_site_version,
+    encode_json,
+    get_tools_list_cache,
+    jsonrpc_result_bytes,
+    set_tools_list_cache,
+)
+from core.user_endpoints import _get_tools_list_result
+
+
+@pytest.fixture
+def cache():
+    c = ToolsListCache(ttl_seconds=60, max_entries=2)
+    set_tools_list_cache(c)
+    yield c
+    set_tools_list_cache(None)
+
+
+class TestEncoding:
+    def test_jsonrpc_splice_matches_json(self):
+        body = jsonrpc_result_bytes("abc", encode_json({"tools": [{"name": "ü"}]}))
+        assert json.loads(body) == {
+            "jsonrpc": "2.0",
+            "id": "abc",
+            "result": {"tools": [{"name": "ü"}]},
+        }
+
+    def test_null_id(self):
+        assert json.loads(jsonrpc_result_bytes(None, b"{}"))["id"] is None
+
+
+class TestToolsListCache:
+    def test_hit_after_put(self, cache):
+        cache.put("s1", "wordpress", ["write", "read"], 5, b"x", site_version=0)
+        assert cache.get("s1", "wordpress", ["read", "write"], 5) == b"x"
+        assert cache.stats()["hits"] == 1
+
+    def test_scopes_partition_entries(self, cache):
+        cache.put("s1", "wordpress", ["read"], 5, b"r", site_version=0)
+        assert cache.get("s1", "wordpress", ["admin"], 5) is None
+
+    def test_bump_invalidates_site_only(self, cache):
+        cache.put("s1", "wordpress", ["read"], 5, b"a", site_version=0)
+        cache.put("s2", "wordpress", ["read"], 5, b"b", site_version=0)
+        bump_site_version("s1")
+        assert cache.get("s1", "wordpress", ["read"], 5) is None
+        assert cache.get("s2", "wordpress", ["read"], 5) == b"b"
+
+    def test_put_at_stale_version_is_never_served(self, cache):
+        version = cache.site_version("s1")
+        cache.bump_site_version("s1")  # write lands while payload is built
+        cache.put("s1", "wordpress", ["read"], 5, b"old", site_version=version)
+        assert cache.get("s1", "wordpress", ["read"], 5) is None
+
+    def test_registry_growth_invalidates(self, cache):
+        cache.put("s1", "wordpress", ["read"], 5, b"a", site_version=0)
+        assert cache.get("s1", "wordpress", ["read"], 6) is None
+
+    def test_valid_for_caps_lifetime(self, cache):
+        cache.put("s1", "wordpress", ["read"], 5, b"a", site_version=0, valid_for=0)
+        assert cache.get("s1", "wordpress", ["read"], 5) is None
+
+    def test_lru_bound(self, cache):
+        for i in range(3):
+            cache.put(f"s{i}", "wordpress", ["read"], 5, b"a", site_version=0)
+        assert len(cache) == 2
+        assert cache.get("s0", "wordpress", ["read"], 5) is None
+
+    def test_zero_ttl_disables(self):
+        c = ToolsListCache(ttl_seconds=0)
+        c.put("s1", "wordpress", ["read"], 5, b"a", site_version=0)
+        assert c.get("s1", "wordpress", ["read"], 5) is None
+
+
+class TestInvalidationHooks:
+    async def test_database_writes_bump_version(self, tmp_path, cache):
+        from core.database import Database
+
+        db = Database(str(tmp_path / "t.db"))
+        await db.initialize()
+        try:
+            user = await db.create_user(
+                email="a@example.com", name="A", provider="github", provider_id="1"
+            )
+            site = await db.create_site(
+                user_id=user["id"],
+                plugin_type="wordpress",
+                alias="blog",
+                url="https://blog.example.com",
+                credentials=b"x",
+            )
+            site_id = site["id"]
+            before = cache.site_version(site_id)
+            await db.set_site_tool_toggle(site_id, "wordpress_list_posts", False)
+            await db.set_site_tool_scope(site_id, "read")
+            await db.delete_site_provider_key(site_id, "openai")
+            assert cache.site_version(site_id) == before + 3
+        finally:
+            await db.close()
+
+    def test_probe_cache_set_bumps_version(self, cache):
+        from core.capability_probe import _ProbeCache
+
+        probe = _ProbeCache(ttl_seconds=60)
+        probe.set("s1", {"routes": {}})
+        assert cache.site_version("s1") == 1
+        assert 0 < probe.expires_in("s1") <= 60
+        assert probe.expires_in("missing") is None
+
+
+class TestGetToolsListResult:
+    async def test_second_call_skips_pipeline(self, cache):
+        build = AsyncMock(return_value=[{"name": "wordpress_list_posts"}])
+        with patch("core.user_endpoints._get_visible_tools_for_site", build):
+            first = await _get_tools_list_result("s1", ["read"], "wordpress")
+            second = await _get_tools_list_result("s1", ["read"], "wordpress")
+        assert first is second
+        assert json.loads(first) == {"tools": [{"name": "wordpress_list_posts"}]}
+        assert build.await_count == 1
+
+    async def test_toggle_bump_rebuilds(self, cache):
+        build = AsyncMock(return_value=[])
+        with patch("core.user_endpoints._get_visible_tools_for_site", build):
+            await _get_tools_list_result("s1", ["read"], "wordpress")
+            bump_site_version("s1")
+            await _get_tools_list_result("s1", ["read"], "wordpress")
+        assert build.await_count == 2
+
+    def test_default_singleton(self):
+        set_tools_list_cache(None)
+        assert get_tools_list_cache() is get_tools_list_cache()
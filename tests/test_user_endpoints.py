@@ -1,7 +1,6 @@
 """Tests for per-user MCP endpoint handler (core/user_endpoints.py)."""
 
 import json
-import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,7 +8,8 @@ from starlette.requests import Request
 
 from core.settings import get_cached_rate_per_min
 from core.user_endpoints import (
-    _rate_limits,
+    _check_user_rate_limit,
+    _user_rate_limiter,
     user_mcp_handler,
 )
 
@@ -78,19 +78,19 @@ def _make_request_no_auth(
 @pytest.fixture(autouse=True)
 def _clear_rate_limits():
     """Clear the global rate limit tracking between tests."""
-    _rate_limits.clear()
+    _user_rate_limiter.reset_all()
     yield
-    _rate_limits.clear()
+    _user_rate_limiter.reset_all()
 
 
 @pytest.fixture(autouse=True)
 def _clear_tool_cache():
-    """No-op: the per-plugin tool schema cache was removed in F.7.
+    """Reset the memoized tools/list payloads so mocks differ per test."""
+    from core.tools_list_cache import set_tools_list_cache
 
-    Retained so the rest of the test fixtures stay unchanged; the scope-filter
-    pipeline runs on every ``tools/list`` call so there is nothing to clear.
-    """
+    set_tools_list_cache(None)
     yield
+    set_tools_list_cache(None)
 
 
 @pytest.fixture
@@ -165,6 +165,7 @@ def mock_tool_registry():
 
     registry = MagicMock()
     registry.get_by_plugin_type = MagicMock(return_value=[tool_def])
+    registry.get_count = MagicMock(return_value=1)
     # F.19.7.1: tools/call also looks up the tool by name — the universal
     # scope check then reads ``required_scope`` off the returned tool_def.
     # Without this wire-up ``get_by_name`` returns a fresh MagicMock and
@@ -179,6 +180,10 @@ def mock_tool_registry():
 @pytest.fixture
 def mock_plugin_registry():
     """Patch plugins.plugin_registry to return a mock."""
+    from core.plugin_cache import set_plugin_instance_cache
+
+    # Cached instances from earlier tests would bypass the mocked factory
+    set_plugin_instance_cache(None)
     mock_reg = MagicMock()
     mock_reg.is_registered = MagicMock(return_value=True)
 
@@ -633,9 +638,9 @@ class TestRateLimiting:
     @pytest.mark.unit
     async def test_rate_limit_exceeded(self, mock_key_mgr, mock_db):
         """Exceeding per-minute rate limit should return 429."""
-        # Fill the rate limit bucket
-        now = time.time()
-        _rate_limits["user-uuid-001"] = [now - i for i in range(get_cached_rate_per_min())]
+        # Fill the rate limit window
+        for _ in range(get_cached_rate_per_min()):
+            assert (await _check_user_rate_limit("user-uuid-001"))[0]
 
         request = _make_request(method_name="initialize")
         response = await user_mcp_handler(request)
@@ -59,6 +59,7 @@ def mock_db():
     )
     db.delete_api_key = AsyncMock(return_value=True)
     db.update_api_key_usage = AsyncMock()
+    db.update_api_key_usage_batch = AsyncMock()
     with patch("core.database.get_database", return_value=db):
         yield db
 
@@ -211,7 +212,7 @@ class TestKeyValidation:
 
     @pytest.mark.unit
     async def test_validate_key_updates_usage(self, key_mgr, mock_db):
-        """Successful validation should call update_api_key_usage."""
+        """Successful validation records usage in memory; flush writes one batch."""
         import bcrypt
 
         result = await key_mgr.create_key("user-uuid-001", "Usage Test")
@@ -227,7 +228,30 @@ class TestKeyValidation:
         }
 
         await key_mgr.validate_key(raw_key)
-        mock_db.update_api_key_usage.assert_called_with("key-uuid-001")
+        await key_mgr.validate_key(raw_key)  # cached
+        mock_db.update_api_key_usage.assert_not_called()
+        mock_db.update_api_key_usage_batch.assert_not_called()
+
+        assert await key_mgr.flush_usage() == 1
+        updates = mock_db.update_api_key_usage_batch.call_args.args[0]
+        assert [(key_id, uses) for key_id, uses, _ in updates] == [("key-uuid-001", 2)]
+
+        # Nothing pending: second flush is a no-op
+        assert await key_mgr.flush_usage() == 0
+        assert mock_db.update_api_key_usage_batch.call_count == 1
+
+    @pytest.mark.unit
+    async def test_flush_failure_keeps_counts(self, key_mgr, mock_db):
+        """A failed flush merges the counters back for the next attempt."""
+        key_mgr._record_usage("key-uuid-001")
+        mock_db.update_api_key_usage_batch.side_effect = RuntimeError("db locked")
+        assert await key_mgr.flush_usage() == 0
+
+        key_mgr._record_usage("key-uuid-001")
+        mock_db.update_api_key_usage_batch.side_effect = None
+        assert await key_mgr.flush_usage() == 1
+        updates = mock_db.update_api_key_usage_batch.call_args.args[0]
+        assert updates[0][:2] == ("key-uuid-001", 2)
 
 
 # ── Key Listing ──────────────────────────────────────────────
@@ -244,6 +268,15 @@ class TestKeyListing:
         assert "key_hash" not in keys[0]
         assert keys[0]["name"] == "Claude Desktop"
 
+    @pytest.mark.unit
+    async def test_list_keys_includes_unflushed_usage(self, key_mgr, mock_db):
+        """Pending usage is visible before it reaches the database."""
+        key_mgr._record_usage("key-uuid-001")
+        key_mgr._record_usage("key-uuid-001")
+        keys = await key_mgr.list_keys("user-uuid-001")
+        assert keys[0]["use_count"] == 2
+        assert keys[0]["last_used"] is not None
+
 
 # ── Key Deletion ─────────────────────────────────────────────
 